@@ -0,0 +1,191 @@
+"""Headless benchmark of every portal view at several data scales
+
+Renders each kantoor and klant view with Streamlit's AppTest against synthetic
+databases (see ``nova.synthetic``) and records wall time, peak Python memory and
+the number of elements emitted. Results are written as JSON so two runs can be
+compared:
+
+    python benchmarks/run_views.py --scales 10 1000 10000 --output benchmarks/results/current.json
+    python benchmarks/run_views.py --scales 10 --baseline benchmarks/results/current.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from nova.db import connect  # noqa: E402
+from nova.reference import invalidate_reference  # noqa: E402
+from nova.synthetic import generate  # noqa: E402
+from nova.views import VIEWS  # noqa: E402
+
+APP = ROOT / "app.py"
+DEFAULT_SCALES = [10, 1000, 10000]
+INVOICES_PER_CLIENT = 50
+JOURNAL_LINES_PER_CLIENT = 200
+
+
+def dataset(data_dir, clients, seed):
+    """Path of the synthetic database for a scale, generated on first use"""
+    path = Path(data_dir) / f"nova-{clients}-clients-seed{seed}.sqlite3"
+    if not path.exists():
+        print(f"generating {path.name} ...", file=sys.stderr)
+        generate(str(path), clients, clients * INVOICES_PER_CLIENT, clients * JOURNAL_LINES_PER_CLIENT, seed)
+    return path
+
+
+def busiest_client(path):
+    """Client with the most invoices; the klant views are measured for the worst case"""
+    conn = connect(path)
+    try:
+        return conn.execute(
+            "SELECT client_id FROM invoices GROUP BY client_id ORDER BY COUNT(*) DESC, client_id LIMIT 1"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def count_elements(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def run_view(portal_mode, view, client_id, timeout, trace=False):
+    """One fresh session rendering one view: (seconds, peak bytes, elements, error)
+
+    tracemalloc slows Python down considerably, so memory is measured in separate traced runs.
+    """
+    at = AppTest.from_file(str(APP), default_timeout=timeout)
+    at.session_state.portal_mode = portal_mode
+    at.session_state.current_view = view
+    if portal_mode == "klant":
+        at.session_state.selected_client = client_id
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    error = at.exception[0].message if at.exception else None
+    return elapsed, peak, count_elements(at._tree), error
+
+
+def benchmark(scales, repeat, data_dir, seed, timeout, views=None):
+    results = []
+    for clients in scales:
+        path = dataset(data_dir, clients, seed)
+        os.environ["NOVA_DB_PATH"] = str(path)
+        # The reference snapshot is process-wide and not tied to a database
+        invalidate_reference()
+        client_id = busiest_client(path)
+        for portal_mode, registry in VIEWS.items():
+            for view in registry:
+                if views and view not in views:
+                    continue
+                runs = [run_view(portal_mode, view, client_id, timeout) for _ in range(repeat + 1)]
+                runs.append(run_view(portal_mode, view, client_id, timeout, trace=True))
+                cold, warm = runs[0], runs[1:-1] or runs[:1]
+                result = {
+                    "clients": clients,
+                    "portal_mode": portal_mode,
+                    "view": view,
+                    "client_id": client_id if portal_mode == "klant" else None,
+                    "cold_ms": round(cold[0] * 1000, 1),
+                    "median_ms": round(statistics.median(r[0] for r in warm) * 1000, 1),
+                    "max_ms": round(max(r[0] for r in warm) * 1000, 1),
+                    "peak_memory_kb": round(runs[-1][1] / 1024),
+                    "elements": warm[-1][2],
+                    "error": next((r[3] for r in runs if r[3]), None),
+                }
+                results.append(result)
+                print(f"{clients:>6} {portal_mode:8} {view:18} {result['median_ms']:>9.1f} ms "
+                      f"{result['peak_memory_kb']:>8} kB {result['elements']:>5} el"
+                      f"{'  ERROR ' + result['error'] if result['error'] else ''}", file=sys.stderr)
+    return results
+
+
+def metadata(args):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "invoices_per_client": INVOICES_PER_CLIENT,
+        "journal_lines_per_client": JOURNAL_LINES_PER_CLIENT,
+    }
+
+
+def compare(baseline, results, threshold):
+    """Print the views whose median time changed by more than ``threshold`` (fraction) against a baseline"""
+    previous = {(r["clients"], r["portal_mode"], r["view"]): r for r in baseline["results"]}
+    regressions = 0
+    for result in results:
+        before = previous.get((result["clients"], result["portal_mode"], result["view"]))
+        if not before or not before["median_ms"]:
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1
+        if abs(change) >= threshold:
+            regressions += change > 0
+            print(f"{result['clients']:>6} {result['portal_mode']:8} {result['view']:18} "
+                  f"{before['median_ms']:>9.1f} -> {result['median_ms']:>9.1f} ms ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every NOVA view headless and record timings")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="client counts")
+    parser.add_argument("--repeat", type=int, default=3, help="warm runs per view after the cold run")
+    parser.add_argument("--views", nargs="*", help="only these views (both portals)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", default=str(ROOT / "data" / "benchmarks"))
+    parser.add_argument("--timeout", type=float, default=120, help="seconds per script run")
+    parser.add_argument("--output", help="JSON file to write (default: print to stdout)")
+    parser.add_argument("--baseline", help="earlier JSON result to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change reported by --baseline")
+    args = parser.parse_args()
+
+    # AppTest resets Streamlit's log level on every run; its bare-mode and deprecation
+    # warnings would drown the progress lines
+    logging.disable(logging.WARNING)
+    Path(args.data_dir).mkdir(parents=True, exist_ok=True)
+    results = benchmark(args.scales, args.repeat, args.data_dir, args.seed, args.timeout, args.views)
+    report = json.dumps({"meta": metadata(args), "results": results}, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+    if args.baseline:
+        regressions = compare(json.loads(Path(args.baseline).read_text(encoding="utf-8")), results, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
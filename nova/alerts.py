@@ -0,0 +1,230 @@
+"""Rule-based firm alerts computed from client metrics
+
+``RULES`` declares the checks: thresholds on a client metric (DSO, result YTD,
+cash against the cashflow buffer) and windows before a deadline (BTW periods,
+Vpb). Alerts are stored in firm_alerts with one row per client and rule, so a
+rule that keeps firing is not duplicated and an alert disappears as soon as its
+rule stops firing.
+
+Evaluation is incremental. Triggers put a client in ``alert_queue`` when its
+figures, BTW periods or documents change; a deadline rule schedules the client
+again for the day its alert starts or escalates. ``refresh_alerts()`` only
+evaluates queue entries that are due; ``start_refresher()`` runs it on a
+background thread, so pages only read firm_alerts and never write.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from nova.db import get_connection
+
+log = logging.getLogger(__name__)
+
+# Clients evaluated per refresh; the rest follows on the next one
+REFRESH_BATCH = 200
+# Seconds between two refreshes of the background thread
+REFRESH_INTERVAL = 30
+# Longest wait after failed refreshes in a row
+MAX_REFRESH_BACKOFF = 600
+
+PRIORITY = {"urgent": 0, "warning": 1, "info": 2}
+
+# ``above``/``below``: alert type per threshold on ``metric``, the most severe first.
+# ``deadlines``: alert type per number of days left, the most severe (smallest) first.
+RULES = [
+    {"rule": "dso", "metric": "dso", "above": [("urgent", 90), ("warning", 60)],
+     "message": "DSO gestegen naar {value:.0f} dagen"},
+    {"rule": "negatief_resultaat", "metric": "winst_ytd", "below": [("urgent", 0)],
+     "message": "Negatief resultaat YTD ({amount} verlies)"},
+    {"rule": "liquiditeit", "metric": "cash_buffer", "below": [("urgent", 0)],
+     "message": "Kassaldo {amount} onder de minimale buffer"},
+    {"rule": "liquiditeit_prognose", "metric": "forecast_buffer", "below": [("warning", 0)],
+     "message": "Liquiditeitsprobleem dreigt: saldo {detail} {amount} onder de minimale buffer"},
+    {"rule": "btw_deadline", "deadlines": "btw_deadlines", "within": [("urgent", 0), ("warning", 14)],
+     "message": "BTW {detail} deadline {when}"},
+    {"rule": "vpb_deadline", "deadlines": "vpb_deadlines", "within": [("urgent", 0), ("warning", 30)],
+     "message": "{detail} deadline {when}"},
+]
+
+# Deadline statuses that no longer need action
+DONE_STATUSES = {"ingediend", "betaald", "akkoord", "afgerond"}
+
+
+def _amount(value):
+    return f"€ {value:,.0f}".replace(",", ".")
+
+
+def _document(conn, client_id, kind):
+    row = conn.execute(
+        "SELECT data FROM documents WHERE client_id = ? AND kind = ? ORDER BY period DESC LIMIT 1", (client_id, kind)
+    ).fetchone()
+    return json.loads(row[0]) if row else {}
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def client_metrics(conn, client_id):
+    """Everything the rules look at for one client, or None when the client no longer exists"""
+    client = conn.execute(
+        "SELECT name, omzet_ytd, winst_ytd, openstaand FROM clients WHERE id = ?", (client_id,)
+    ).fetchone()
+    if client is None:
+        return None
+    cashflow = _document(conn, client_id, "cashflow")
+    min_buffer = cashflow.get("min_buffer", 0)
+    forecast = [m for m in cashflow.get("monthly_forecast", []) if m.get("type") == "forecast"]
+    lowest = min(forecast, key=lambda m: m["eind_saldo"], default=None)
+    btw = conn.execute(
+        "SELECT periode, deadline, status FROM btw_periods WHERE client_id = ? ORDER BY deadline", (client_id,)
+    ).fetchall()
+    vpb = _document(conn, client_id, "vpb").get("deadlines", [])
+    return {
+        "name": client["name"],
+        "dso": client["openstaand"] / client["omzet_ytd"] * 365 if client["omzet_ytd"] else None,
+        "winst_ytd": client["winst_ytd"],
+        "cash_buffer": cashflow["current_cash"] - min_buffer if "current_cash" in cashflow else None,
+        "forecast_buffer": (lowest["eind_saldo"] - min_buffer, lowest["maand"]) if lowest else None,
+        "btw_deadlines": [(row["periode"], row["deadline"]) for row in btw
+                          if (row["status"] or "").lower() not in DONE_STATUSES],
+        "vpb_deadlines": [(d["omschrijving"], d["deadline"]) for d in vpb
+                          if (d.get("status") or "").lower() not in DONE_STATUSES],
+    }
+
+
+def _threshold(rule, value):
+    detail = None
+    if isinstance(value, tuple):
+        value, detail = value
+    if value is None:
+        return None
+    for alert_type, limit in rule.get("above", []):
+        if value > limit:
+            return alert_type, rule["message"].format(value=value, amount=_amount(abs(value)), detail=detail)
+    for alert_type, limit in rule.get("below", []):
+        if value < limit:
+            return alert_type, rule["message"].format(value=value, amount=_amount(abs(value)), detail=detail)
+    return None
+
+
+def _deadline(rule, deadlines, today):
+    """Alert for the most pressing deadline, and the next date on which the outcome changes"""
+    best, recheck = None, None
+    for label, deadline in deadlines:
+        deadline = _parse_date(deadline)
+        if deadline is None:
+            continue
+        days_left = (deadline - today).days
+        for alert_type, window in rule["within"]:
+            if days_left <= window:
+                when = "verstreken" if days_left < 0 else "vandaag" if days_left == 0 else f"op {deadline:%d-%m-%Y}"
+                candidate = (PRIORITY[alert_type], days_left, alert_type,
+                             rule["message"].format(detail=label, when=when))
+                best = min(best, candidate) if best else candidate
+                break
+        # Entering a window and passing the deadline change the alert
+        changes = [deadline - timedelta(days=window) for _, window in rule["within"]] + [deadline + timedelta(days=1)]
+        for change in changes:
+            if change > today and (recheck is None or change < recheck):
+                recheck = change
+    return (best[2], best[3]) if best else None, recheck
+
+
+def evaluate(metrics, today):
+    """Fired alerts as {rule: (type, message)} and the date the client must be evaluated again"""
+    fired, recheck = {}, None
+    for rule in RULES:
+        if "deadlines" in rule:
+            alert, change = _deadline(rule, metrics[rule["deadlines"]], today)
+            if change and (recheck is None or change < recheck):
+                recheck = change
+        else:
+            alert = _threshold(rule, metrics[rule["metric"]])
+        if alert:
+            fired[rule["rule"]] = alert
+    return fired, recheck
+
+
+def evaluate_client(conn, client_id, today):
+    """Bring the rule alerts of one client in line with its metrics; runs in the caller's transaction"""
+    metrics = client_metrics(conn, client_id)
+    fired, recheck = evaluate(metrics, today) if metrics else ({}, None)
+    current = {row["rule"]: (row["type"], row["message"]) for row in conn.execute(
+        "SELECT rule, type, message FROM firm_alerts WHERE client_id = ? AND rule IS NOT NULL", (client_id,)
+    )}
+    stale = [rule for rule in current if rule not in fired]
+    conn.executemany("DELETE FROM firm_alerts WHERE client_id = ? AND rule = ?", [(client_id, r) for r in stale])
+    stamp = datetime.now().strftime("%d-%m-%Y %H:%M")
+    for rule, (alert_type, message) in fired.items():
+        if current.get(rule) == (alert_type, message):
+            continue
+        conn.execute(
+            "INSERT INTO firm_alerts (client_id, type, client, message, time, rule) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (client_id, rule) DO UPDATE SET type = excluded.type, message = excluded.message, "
+            "time = excluded.time",
+            (client_id, alert_type, metrics["name"], message, stamp, rule),
+        )
+    if metrics:
+        # The client card lists the messages, most severe first; skip the write when nothing changed
+        messages = json.dumps([message for _, message in sorted(fired.values(), key=lambda a: PRIORITY[a[0]])])
+        conn.execute("UPDATE clients SET alerts = ? WHERE id = ? AND alerts IS NOT ?", (messages, client_id, messages))
+    if recheck:
+        conn.execute("UPDATE alert_queue SET due = ? WHERE client_id = ?", (recheck.isoformat(), client_id))
+    else:
+        conn.execute("DELETE FROM alert_queue WHERE client_id = ?", (client_id,))
+    return fired
+
+
+def evaluate_due(conn, today=None, limit=REFRESH_BATCH):
+    """Evaluate the queued clients that are due, inside the caller's transaction; returns how many"""
+    today = today or date.today()
+    sql, params = "SELECT client_id FROM alert_queue WHERE due <= ? ORDER BY due", [today.isoformat()]
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    due = [row[0] for row in conn.execute(sql, params)]
+    for client_id in due:
+        evaluate_client(conn, client_id, today)
+    return len(due)
+
+
+def refresh_alerts(conn=None, today=None, limit=REFRESH_BATCH):
+    """Evaluate the due part of the queue in its own transaction"""
+    conn = conn or get_connection()
+    with conn:
+        return evaluate_due(conn, today, limit)
+
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def _refresh_loop(interval):
+    delay = interval
+    while True:
+        try:
+            refresh_alerts()
+        except Exception:
+            # Waiting longer after every failure in a row keeps a persistent error from flooding the log
+            log.exception("Alert refresh failed; retrying in %d s", delay)
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_REFRESH_BACKOFF)
+            continue
+        delay = interval
+        time.sleep(interval)
+
+
+def start_refresher(interval=REFRESH_INTERVAL):
+    """Evaluate the due queue entries every ``interval`` seconds on a daemon thread, once per process"""
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = threading.Thread(target=_refresh_loop, args=(interval,), name="nova-alerts", daemon=True)
+            _refresher.start()
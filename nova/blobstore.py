@@ -0,0 +1,232 @@
+"""Content-addressed storage of uploaded documents
+
+Every file is stored once, named by the SHA-256 of its content, in two levels of
+shard directories (``ab/cd/abcd...``) so no directory grows past a few thousand
+entries. Writing hashes the stream while copying it to a temporary file and then
+renames it into place; when the content is already stored the copy is dropped,
+so storage grows with unique documents, not with uploads. Reads are memory
+mapped: the PDF reader works on the mapping and the operating system pages in
+only what it touches.
+
+The table ``blobs`` counts the references to every stored file: triggers on
+ingest_jobs add one for each job with the file's hash and release it when the
+job is deleted. ``collect_garbage()`` removes files nobody references any more,
+after a grace period that covers an upload between writing its file and
+committing the job that references it.
+
+    python -m nova.blobstore --gc
+"""
+
+import argparse
+import contextlib
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from nova.db import connect, get_db_path, init_db
+
+CHUNK_BYTES = 1024 * 1024
+GRACE_SECONDS = 3600
+
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+def default_root():
+    """Stored documents of the current database: ``<name>.blobs`` next to the database file
+
+    Every database has a store of its own, because the garbage collector deletes
+    whatever its own ``blobs`` table does not reference.
+    """
+    path = get_db_path()
+    return path.with_name(f"{path.stem}.blobs")
+
+
+def legacy_root():
+    """The store that all databases in a directory shared before each got its own"""
+    return get_db_path().parent / "blobs"
+
+
+@contextlib.contextmanager
+def open_mapped(path):
+    """Read-only memory map of a file (bytes-like; an empty file gives b"")"""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            yield b""
+            return
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+class BlobStore:
+    """Files under ``root`` named by their SHA-256"""
+
+    def __init__(self, root=None):
+        self.root = Path(root or default_root())
+
+    def path(self, digest):
+        if not _DIGEST.fullmatch(digest or ""):
+            raise ValueError(f"geen geldige SHA-256: {digest!r}")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest):
+        return self.path(digest).exists()
+
+    def put(self, stream, max_bytes=None):
+        """Store a file object in chunks; returns (sha256, size). Content stored before is not written again"""
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        digest, size = hashlib.sha256(), 0
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".part", delete=False) as tmp:
+            try:
+                while chunk := stream.read(CHUNK_BYTES):
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ValueError(f"groter dan {max_bytes // (1024 * 1024)} MB")
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        digest = digest.hexdigest()
+        self._place(tmp.name, digest)
+        return digest, size
+
+    def adopt(self, file_path, digest, keep=False):
+        """Move a file whose hash is known into the store; ``keep`` links (or copies) it instead"""
+        if keep:
+            tmp_dir = self.root / "tmp"
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            tmp = tmp_dir / f"{digest}.{os.getpid()}.{threading.get_ident()}.part"
+            try:
+                os.link(file_path, tmp)
+            except OSError:
+                shutil.copyfile(file_path, tmp)
+            file_path = tmp
+        self._place(file_path, digest)
+        return self.path(digest)
+
+    def _place(self, file_path, digest):
+        path = self.path(digest)
+        if path.exists():
+            os.unlink(file_path)
+            # A fresh mtime keeps a garbage collection that is running right now off this file
+            os.utime(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(file_path, path)
+
+    def open(self, digest):
+        return open_mapped(self.path(digest))
+
+    def delete(self, digest):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path(digest))
+
+    def digests(self):
+        """Hashes of all stored files"""
+        for path in self.root.glob("??/??/*"):
+            if _DIGEST.fullmatch(path.name):
+                yield path.name
+
+
+def register(conn, digest, size):
+    """Record a stored file before the rows that reference it are inserted (in the same transaction)"""
+    conn.execute(
+        "INSERT INTO blobs (sha256, size, refs, created) VALUES (?, ?, 0, CAST(strftime('%s', 'now') AS INTEGER)) "
+        "ON CONFLICT (sha256) DO UPDATE SET size = excluded.size",
+        (digest, size),
+    )
+
+
+def adopt_uploads(conn, store):
+    """Move files of jobs that still point outside the store (the former upload directory) into it
+
+    Files in the shared store of earlier versions are linked rather than moved:
+    other databases in the same directory may reference them as well.
+    """
+    legacy = str(legacy_root()) + os.sep
+    rows = conn.execute(
+        "SELECT sha256, MIN(path) FROM ingest_jobs WHERE sha256 IS NOT NULL AND path IS NOT NULL "
+        "AND substr(path, 1, ?) != ? GROUP BY sha256",
+        (len(str(store.root)), str(store.root)),
+    ).fetchall()
+    for digest, old_path in rows:
+        if Path(old_path).exists():
+            size = Path(old_path).stat().st_size
+            path = store.adopt(old_path, digest, keep=old_path.startswith(legacy))
+        elif store.exists(digest):
+            path = store.path(digest)
+            size = path.stat().st_size
+        else:
+            continue
+        with conn:
+            register(conn, digest, size)
+            conn.execute("UPDATE ingest_jobs SET path = ? WHERE sha256 = ?", (str(path), digest))
+    return len(rows)
+
+
+def collect_garbage(conn, store=None, grace=GRACE_SECONDS, sweep=False):
+    """Delete files without references; returns the number removed
+
+    A file goes once its last reference was released more than ``grace``
+    seconds ago. ``sweep`` also walks the store for files the database does
+    not know (a crash between writing and registering) and stale temporary
+    files; it touches every directory, so it is left to ``--gc``.
+    """
+    store = store or BlobStore()
+    cutoff = time.time() - grace
+    removed = 0
+    for (digest,) in conn.execute(
+        "SELECT sha256 FROM blobs WHERE refs <= 0 AND COALESCE(released, created) < ?", (cutoff,)
+    ).fetchall():
+        path = store.path(digest)
+        # Written again by an upload whose job is not committed yet
+        if path.exists() and path.stat().st_mtime >= cutoff:
+            continue
+        with conn:
+            deleted = conn.execute("DELETE FROM blobs WHERE sha256 = ? AND refs <= 0", (digest,)).rowcount
+        if deleted:
+            store.delete(digest)
+            removed += 1
+    if sweep:
+        known = {row[0] for row in conn.execute("SELECT sha256 FROM blobs")}
+        for digest in list(store.digests()):
+            if digest not in known and store.path(digest).stat().st_mtime < cutoff:
+                store.delete(digest)
+                removed += 1
+        for tmp in (store.root / "tmp").glob("*.part"):
+            if tmp.stat().st_mtime < cutoff:
+                with contextlib.suppress(FileNotFoundError):
+                    tmp.unlink()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the NOVA document store")
+    parser.add_argument("--gc", action="store_true", help="delete unreferenced and unknown files")
+    parser.add_argument("--grace", type=int, default=GRACE_SECONDS,
+                        help="seconds a file is kept after its last reference is released")
+    args = parser.parse_args()
+    init_db(seed=False)
+    conn = connect()
+    store = BlobStore()
+    adopt_uploads(conn, store)
+    if args.gc:
+        print(f"{collect_garbage(conn, store, grace=args.grace, sweep=True)} bestand(en) verwijderd")
+    count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs WHERE refs > 0").fetchone()
+    print(f"{count} document(en), {size / (1024 * 1024):.1f} MB")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
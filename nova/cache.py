@@ -0,0 +1,85 @@
+"""Memoized query results keyed by client, arguments (period), data version and database
+
+Aggregates are cached per process and shared by all sessions. Every key carries
+the ``data_versions`` counters of the tables the result was computed from. Triggers
+bump those counters on every write to the client tables (``VERSIONED_TABLES`` in
+``nova.db``), so any change, by a view, a worker or the sync engine, makes the old
+entries unreachable and the next read recomputes; no time-based expiry is needed.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+from nova.db import data_versions, get_db_path
+from nova.reference import freeze
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class QueryCache:
+    """Thread-safe LRU mapping of cache keys to frozen results"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, client_id=None):
+        """Drop all entries, or only those of one client"""
+        with self._lock:
+            if client_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[1] == client_id]:
+                    del self._entries[key]
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+query_cache = QueryCache()
+
+_MISSING = object()
+
+
+def cached(*tables):
+    """Memoize a repository method ``(self, client_id, *args)`` on the versions of ``tables``
+
+    Results are frozen, since the same object is handed to every session.
+    """
+    def decorator(method):
+        name = f"{method.__module__}.{method.__qualname__}"
+
+        @functools.wraps(method)
+        def wrapper(self, client_id, *args, **kwargs):
+            # The database is part of the key: another database can reuse the client ids and version counters
+            key = (name, client_id, args, tuple(sorted(kwargs.items())), data_versions(self.conn, client_id, tables),
+                   str(get_db_path()))
+            result = query_cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = freeze(method(self, client_id, *args, **kwargs))
+                query_cache.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,194 @@
+"""RGS code prediction for purchase invoices, learned from booked invoices (ARIA)
+
+A multinomial naive Bayes model per client over a few features of each invoice:
+the normalized supplier name as a whole and its words, the IBAN and the order of
+magnitude of the amount. The whole-name and IBAN features learn the supplier's
+usual account; the words carry that over to suppliers the client has not booked
+before ("Energie", "Transport"). Where a client's own bookings say nothing about
+an invoice, the firm-wide model (all clients) decides.
+
+Bookings reach the models through ``rgs_bookings``, an append-only log filled by
+triggers on invoices (+1 for a booking, -1 when it is changed or removed). A model
+remembers the last log ``seq`` it has seen and adds only the newer rows when it
+is used again, so it never retrains from scratch. Scoring is one matrix lookup
+and sum for a whole batch of invoices.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from nova.identifiers import iban_key, supplier_key
+
+SMOOTHING = 0.1
+# Bookings behind a prediction before it is trusted: confidence is scaled by n / (n + EVIDENCE_PRIOR)
+EVIDENCE_PRIOR = 0.5
+MAX_MODELS = 512
+FIRM = None
+
+
+# Order of magnitude of the amount, the same in SQL as in magnitude()
+MAGNITUDE_SQL = ("CASE WHEN amount IS NULL OR amount = 0 THEN NULL "
+                 "ELSE length(CAST(CAST(abs(amount) AS INTEGER) AS TEXT)) - 1 END")
+
+
+def magnitude(amount):
+    return len(str(int(abs(amount)))) - 1 if amount else None
+
+
+def features(supplier_key_, iban=None, magnitude_=None):
+    """Feature tokens of one invoice from its normalized supplier name, IBAN and amount magnitude"""
+    tokens = []
+    if supplier_key_:
+        tokens.append("s:" + supplier_key_)
+        tokens += ["w:" + word for word in supplier_key_.split() if len(word) > 2]
+    if iban:
+        tokens.append("i:" + iban)
+    if magnitude_ is not None:
+        tokens.append(f"a:{magnitude_}")
+    return tokens
+
+
+class RgsModel:
+    """Token and class counts of one client (or the firm) and the log position they include"""
+
+    def __init__(self, client_id):
+        self.client_id = client_id
+        self.seq = 0
+        self.tokens = {}
+        self.classes = {}
+        self.categories = {}
+        self.counts = np.zeros((64, 8))
+        self.class_counts = np.zeros(8)
+        self.lock = threading.Lock()
+        self._log_probs = None
+
+    def _index(self, mapping, key, axis):
+        index = mapping.get(key)
+        if index is None:
+            index = mapping[key] = len(mapping)
+            if index >= self.counts.shape[axis]:
+                grow = [(0, 0), (0, 0)]
+                grow[axis] = (0, self.counts.shape[axis])
+                self.counts = np.pad(self.counts, grow)
+                if axis == 1:
+                    self.class_counts = np.pad(self.class_counts, (0, len(self.class_counts)))
+        return index
+
+    def learn(self, rows):
+        """Add (seq, supplier_key, iban, magnitude, rgs, category, weight) rows of the log"""
+        token_ids, class_ids, weights = [], [], []
+        for seq, key, iban, magnitude_, rgs, category, weight in rows:
+            if not weight:
+                continue
+            c = self._index(self.classes, rgs, 1)
+            if category:
+                self.categories[rgs] = category
+            self.class_counts[c] += weight
+            for token in features(key, iban, magnitude_):
+                token_ids.append(self._index(self.tokens, token, 0))
+                class_ids.append(c)
+                weights.append(weight)
+        if rows:
+            self.seq = max(self.seq, max(row[0] for row in rows))
+        if token_ids:
+            np.add.at(self.counts, (np.asarray(token_ids), np.asarray(class_ids)), weights)
+            self._log_probs = None
+
+    def refresh(self, conn):
+        """Learn the log rows written since the last refresh, summed per distinct feature set"""
+        where, params = "seq > ?", (self.seq,)
+        if self.client_id is not FIRM:
+            where, params = "client_id = ? AND seq > ?", (self.client_id, self.seq)
+        self.learn(conn.execute(
+            f"SELECT MAX(seq), supplier_key, iban, {MAGNITUDE_SQL} AS magnitude, rgs, MAX(category), SUM(weight) "
+            f"FROM rgs_bookings WHERE {where} GROUP BY supplier_key, iban, magnitude, rgs",
+            params,
+        ).fetchall())
+
+    def _probabilities(self):
+        if self._log_probs is None:
+            n_tokens, n_classes = len(self.tokens), len(self.classes)
+            counts = np.maximum(self.counts[:n_tokens, :n_classes], 0)
+            class_counts = np.maximum(self.class_counts[:n_classes], 0)
+            with np.errstate(divide="ignore"):
+                # Classes whose bookings were all undone can no longer be predicted
+                prior = np.where(class_counts > 0, np.log(class_counts) - np.log(max(class_counts.sum(), 1)), -np.inf)
+            likelihood = np.log(counts + SMOOTHING) - np.log(counts.sum(axis=0) + SMOOTHING * max(n_tokens, 1))
+            self._log_probs = (prior, likelihood, counts)
+        return self._log_probs
+
+    def score(self, token_lists):
+        """Per invoice: (class index or -1, posterior probability, bookings behind it)"""
+        n = len(token_lists)
+        if not self.classes or not n:
+            return np.full(n, -1), np.zeros(n), np.zeros(n)
+        prior, likelihood, counts = self._probabilities()
+        rows, ids, evidence = [], [], []
+        for row, tokens in enumerate(token_lists):
+            for token in tokens:
+                index = self.tokens.get(token)
+                if index is not None:
+                    rows.append(row)
+                    ids.append(index)
+                    evidence.append(not token.startswith("a:"))
+        rows, ids, evidence = np.asarray(rows, dtype=int), np.asarray(ids, dtype=int), np.asarray(evidence, dtype=bool)
+        scores = np.tile(prior, (n, 1))
+        np.add.at(scores, rows, likelihood[ids])
+        best = scores.argmax(axis=1)
+        with np.errstate(invalid="ignore"):
+            shifted = np.exp(scores - scores[np.arange(n), best][:, None])
+            posterior = 1 / shifted.sum(axis=1)
+        # Bookings of the predicted class behind the strongest supplier or IBAN token of each invoice
+        support = np.zeros(n)
+        if evidence.any():
+            np.maximum.at(support, rows[evidence], counts[ids[evidence], best[rows[evidence]]])
+        return np.where(np.isfinite(scores.max(axis=1)), best, -1), posterior, support
+
+
+# (database file, client id) -> model, least recently used first
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+def _database(conn):
+    """File of the connection's main database; a model's log position only means something there"""
+    return next(row[2] for row in conn.execute("PRAGMA database_list") if row[1] == "main")
+
+
+def _model(conn, client_id):
+    key = (_database(conn), client_id)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = _models[key] = RgsModel(client_id)
+        _models.move_to_end(key)
+        while len(_models) > MAX_MODELS:
+            _models.popitem(last=False)
+    with model.lock:
+        model.refresh(conn)
+    return model
+
+
+def predict_rgs(conn, client_id, invoices):
+    """Predicted {"rgs", "category", "confidence"} (or None) per invoice dict (supplier, iban, amount)
+
+    The client's model answers where its bookings back the prediction; the firm model
+    answers the rest.
+    """
+    invoices = list(invoices)
+    tokens = [features(supplier_key(inv.get("supplier")), iban_key(inv.get("iban")), magnitude(inv.get("amount")))
+              for inv in invoices]
+    results = [None] * len(invoices)
+    for model in (_model(conn, client_id), _model(conn, FIRM)):
+        with model.lock:
+            best, posterior, support = model.score(tokens)
+            names = list(model.classes)
+            categories = dict(model.categories)
+        confidence = posterior * support / (support + EVIDENCE_PRIOR)
+        for i in np.flatnonzero((best >= 0) & (support > 0)):
+            if results[i] is None:
+                rgs = names[best[i]]
+                results[i] = {"rgs": rgs, "category": categories.get(rgs), "confidence": round(float(confidence[i]), 3)}
+    return results
@@ -0,0 +1,32 @@
+"""Process-wide repository instances shared by the sidebar and every view
+
+The repositories hold no per-session state and resolve their SQLite connection
+per thread, so one instance per process is enough for all Streamlit sessions.
+"""
+
+from nova.repositories import (
+    ClientRepository, TeamRepository, AlertRepository, InvoiceRepository, IngestJobRepository, BankRepository,
+    CrmRepository, PurchaseRepository, EmployeeRepository, RgsRepository, BtwRepository,
+    SyncRepository, ClosingRepository, AnnualStatementRepository, DocumentRepository,
+)
+
+clients_repo = ClientRepository()
+team_repo = TeamRepository()
+alerts_repo = AlertRepository()
+invoices_repo = InvoiceRepository()
+ingest_jobs_repo = IngestJobRepository()
+bank_repo = BankRepository()
+crm_repo = CrmRepository()
+purchase_repo = PurchaseRepository()
+employees_repo = EmployeeRepository()
+rgs_repo = RgsRepository()
+btw_repo = BtwRepository()
+sync_repo = SyncRepository()
+closing_repo = ClosingRepository()
+annual_repo = AnnualStatementRepository()
+documents_repo = DocumentRepository()
+
+
+def get_client_by_id(client_id):
+    """Get client data by ID"""
+    return clients_repo.get(client_id) or clients_repo.first()  # Default to first client
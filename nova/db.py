@@ -0,0 +1,822 @@
+"""Embedded SQLite storage for the NOVA portal"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from nova.identifiers import iban_key, invoice_number_key, supplier_key
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "nova.sqlite3"
+
+# data_versions key for firm-wide tables (clients)
+FIRM_SCOPE = "*"
+
+SCHEMA = """
+-- Firm level
+CREATE TABLE IF NOT EXISTS team_members (
+    name TEXT PRIMARY KEY,
+    role TEXT,
+    clients INTEGER,
+    workload INTEGER,
+    avatar TEXT,
+    position INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS clients (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact TEXT,
+    kvk TEXT,
+    btw TEXT,
+    sector TEXT,
+    omzet_ytd REAL,
+    omzet_prev REAL,
+    winst_ytd REAL,
+    openstaand REAL,
+    status TEXT,
+    accountant TEXT,
+    alerts TEXT,
+    last_activity TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_clients_status ON clients(status);
+CREATE INDEX IF NOT EXISTS idx_clients_sector ON clients(sector);
+CREATE INDEX IF NOT EXISTS idx_clients_accountant ON clients(accountant);
+CREATE INDEX IF NOT EXISTS idx_clients_name ON clients(name);
+CREATE INDEX IF NOT EXISTS idx_clients_omzet ON clients(omzet_ytd);
+CREATE INDEX IF NOT EXISTS idx_clients_winst ON clients(winst_ytd);
+CREATE INDEX IF NOT EXISTS idx_clients_openstaand ON clients(openstaand);
+
+-- rule is set for alerts raised by nova.alerts (one per client and rule); priority orders the queue
+CREATE TABLE IF NOT EXISTS firm_alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id TEXT,
+    type TEXT,
+    client TEXT,
+    message TEXT,
+    time TEXT,
+    rule TEXT,
+    priority INTEGER GENERATED ALWAYS AS (CASE type WHEN 'urgent' THEN 0 WHEN 'warning' THEN 1 ELSE 2 END) VIRTUAL
+);
+CREATE INDEX IF NOT EXISTS idx_firm_alerts_type ON firm_alerts(type);
+CREATE INDEX IF NOT EXISTS idx_firm_alerts_client ON firm_alerts(client_id);
+CREATE INDEX IF NOT EXISTS idx_firm_alerts_priority ON firm_alerts(priority, id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_firm_alerts_rule ON firm_alerts(client_id, rule);
+
+-- Clients whose alert rules must be evaluated on or after ``due`` ('' = as soon as possible)
+CREATE TABLE IF NOT EXISTS alert_queue (
+    client_id TEXT PRIMARY KEY,
+    due TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_alert_queue_due ON alert_queue(due);
+
+CREATE TRIGGER IF NOT EXISTS alert_queue_clients_insert AFTER INSERT ON clients BEGIN
+    INSERT INTO alert_queue (client_id, due) VALUES (NEW.id, '') ON CONFLICT (client_id) DO UPDATE SET due = '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS alert_queue_clients_update AFTER UPDATE OF omzet_ytd, winst_ytd, openstaand ON clients
+BEGIN
+    INSERT INTO alert_queue (client_id, due) VALUES (NEW.id, '') ON CONFLICT (client_id) DO UPDATE SET due = '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS alert_queue_clients_delete AFTER DELETE ON clients BEGIN
+    INSERT INTO alert_queue (client_id, due) VALUES (OLD.id, '') ON CONFLICT (client_id) DO UPDATE SET due = '';
+END;
+
+-- Firm-wide totals and counts, kept up to date by the triggers below so the
+-- kantoor dashboard never scans clients or firm_alerts
+CREATE TABLE IF NOT EXISTS firm_summary (
+    metric TEXT PRIMARY KEY,
+    value REAL NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_clients_insert AFTER INSERT ON clients BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES
+        ('clients', 1), ('omzet_ytd', COALESCE(NEW.omzet_ytd, 0)), ('openstaand', COALESCE(NEW.openstaand, 0)),
+        ('status:' || NEW.status, 1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_clients_delete AFTER DELETE ON clients BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES
+        ('clients', -1), ('omzet_ytd', -COALESCE(OLD.omzet_ytd, 0)), ('openstaand', -COALESCE(OLD.openstaand, 0)),
+        ('status:' || OLD.status, -1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_clients_update AFTER UPDATE OF omzet_ytd, openstaand, status ON clients BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES
+        ('omzet_ytd', COALESCE(NEW.omzet_ytd, 0) - COALESCE(OLD.omzet_ytd, 0)),
+        ('openstaand', COALESCE(NEW.openstaand, 0) - COALESCE(OLD.openstaand, 0)),
+        ('status:' || OLD.status, -1), ('status:' || NEW.status, 1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_alerts_insert AFTER INSERT ON firm_alerts BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES ('alerts', 1), ('alerts:' || NEW.type, 1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_alerts_delete AFTER DELETE ON firm_alerts BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES ('alerts', -1), ('alerts:' || OLD.type, -1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS firm_summary_alerts_update AFTER UPDATE OF type ON firm_alerts BEGIN
+    INSERT INTO firm_summary (metric, value) VALUES ('alerts:' || OLD.type, -1), ('alerts:' || NEW.type, 1)
+    ON CONFLICT (metric) DO UPDATE SET value = value + excluded.value;
+END;
+
+-- Client level
+CREATE TABLE IF NOT EXISTS invoices (
+    client_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    supplier TEXT,
+    amount REAL,
+    vat REAL,
+    date TEXT,
+    due_date TEXT,
+    period TEXT,
+    status TEXT,
+    payment_status TEXT,
+    category TEXT,
+    rgs TEXT,
+    odoo_po TEXT,
+    iban TEXT,
+    bic TEXT,
+    PRIMARY KEY (client_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_invoices_status ON invoices(client_id, status);
+CREATE INDEX IF NOT EXISTS idx_invoices_status_date ON invoices(client_id, status, date);
+CREATE INDEX IF NOT EXISTS idx_invoices_payment ON invoices(client_id, payment_status, due_date);
+CREATE INDEX IF NOT EXISTS idx_invoices_period ON invoices(client_id, period);
+CREATE INDEX IF NOT EXISTS idx_invoices_rgs ON invoices(client_id, rgs);
+
+-- Uploaded documents handled by the background workers of nova.jobs; path is the stored file,
+-- status runs queued -> running -> done or failed (or is duplicate), result holds the extraction as JSON
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    batch TEXT,
+    filename TEXT,
+    path TEXT,
+    sha256 TEXT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    result TEXT,
+    error TEXT,
+    created TEXT,
+    started TEXT,
+    finished TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_client ON ingest_jobs(client_id, id);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_status ON ingest_jobs(status);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_batch ON ingest_jobs(batch);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_sha256 ON ingest_jobs(client_id, sha256);
+
+-- Stored documents of nova.blobstore by content hash, with the number of ingest jobs that
+-- reference them; released is when refs last dropped to 0 (unix time), the garbage collector
+-- removes the file a grace period later
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER,
+    refs INTEGER NOT NULL DEFAULT 0,
+    created INTEGER,
+    released INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_blobs_released ON blobs(refs, released);
+
+CREATE TRIGGER IF NOT EXISTS blobs_jobs_insert AFTER INSERT ON ingest_jobs WHEN NEW.sha256 IS NOT NULL BEGIN
+    INSERT INTO blobs (sha256, refs, created) VALUES (NEW.sha256, 1, CAST(strftime('%s', 'now') AS INTEGER))
+    ON CONFLICT (sha256) DO UPDATE SET refs = refs + 1, released = NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS blobs_jobs_update AFTER UPDATE OF sha256 ON ingest_jobs
+WHEN OLD.sha256 IS NOT NEW.sha256 BEGIN
+    UPDATE blobs SET refs = refs - 1,
+        released = CASE WHEN refs <= 1 THEN CAST(strftime('%s', 'now') AS INTEGER) END
+    WHERE sha256 = OLD.sha256;
+    INSERT INTO blobs (sha256, refs, created)
+    SELECT NEW.sha256, 1, CAST(strftime('%s', 'now') AS INTEGER) WHERE NEW.sha256 IS NOT NULL
+    ON CONFLICT (sha256) DO UPDATE SET refs = refs + 1, released = NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS blobs_jobs_delete AFTER DELETE ON ingest_jobs WHEN OLD.sha256 IS NOT NULL BEGIN
+    UPDATE blobs SET refs = refs - 1,
+        released = CASE WHEN refs <= 1 THEN CAST(strftime('%s', 'now') AS INTEGER) END
+    WHERE sha256 = OLD.sha256;
+END;
+
+-- Duplicate lookup keys (nova.duplicates) of booked invoices (source 'invoice',
+-- kept current by the triggers below) and analysed uploads (source 'upload',
+-- ref = ingest job id). simhash and its four 16-bit bands fingerprint the text
+-- of uploaded documents; near-identical documents share at least one band.
+--
+-- The invoice_index and rgs_bookings triggers normalize with the Python functions
+-- nova_supplier_key, nova_number_key and nova_iban_key (nova.identifiers). Only
+-- connections that have them can write to invoices: those of connect(), or any other
+-- sqlite3 connection after register_functions(conn). The sqlite3 shell cannot.
+CREATE TABLE IF NOT EXISTS invoice_index (
+    client_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    supplier_key TEXT,
+    number_key TEXT,
+    total_cents INTEGER,
+    invoice_date TEXT,
+    iban TEXT,
+    simhash INTEGER,
+    band0 INTEGER,
+    band1 INTEGER,
+    band2 INTEGER,
+    band3 INTEGER,
+    PRIMARY KEY (client_id, source, ref)
+);
+CREATE INDEX IF NOT EXISTS idx_invoice_index_number ON invoice_index(client_id, supplier_key, number_key);
+CREATE INDEX IF NOT EXISTS idx_invoice_index_number_total ON invoice_index(client_id, number_key, total_cents);
+CREATE INDEX IF NOT EXISTS idx_invoice_index_payment ON invoice_index(client_id, iban, total_cents, invoice_date);
+CREATE INDEX IF NOT EXISTS idx_invoice_index_band0 ON invoice_index(client_id, band0) WHERE band0 IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_invoice_index_band1 ON invoice_index(client_id, band1) WHERE band1 IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_invoice_index_band2 ON invoice_index(client_id, band2) WHERE band2 IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_invoice_index_band3 ON invoice_index(client_id, band3) WHERE band3 IS NOT NULL;
+
+CREATE TRIGGER IF NOT EXISTS invoice_index_insert AFTER INSERT ON invoices BEGIN
+    INSERT OR REPLACE INTO invoice_index (client_id, source, ref, supplier_key, number_key, total_cents, invoice_date, iban)
+    VALUES (NEW.client_id, 'invoice', NEW.id, nova_supplier_key(NEW.supplier), nova_number_key(NEW.id),
+            CAST(round((COALESCE(NEW.amount, 0) + COALESCE(NEW.vat, 0)) * 100) AS INTEGER), NEW.date,
+            nova_iban_key(NEW.iban));
+END;
+CREATE TRIGGER IF NOT EXISTS invoice_index_update AFTER UPDATE OF supplier, amount, vat, date, iban ON invoices BEGIN
+    UPDATE invoice_index SET supplier_key = nova_supplier_key(NEW.supplier),
+        total_cents = CAST(round((COALESCE(NEW.amount, 0) + COALESCE(NEW.vat, 0)) * 100) AS INTEGER),
+        invoice_date = NEW.date, iban = nova_iban_key(NEW.iban)
+    WHERE client_id = NEW.client_id AND source = 'invoice' AND ref = NEW.id;
+END;
+CREATE TRIGGER IF NOT EXISTS invoice_index_delete AFTER DELETE ON invoices BEGIN
+    DELETE FROM invoice_index WHERE client_id = OLD.client_id AND source = 'invoice' AND ref = OLD.id;
+END;
+
+-- Append-only log of RGS bookings that nova.classifier learns from: +1 for a booked
+-- invoice, -1 when it is changed or removed; models read the rows after the last seq they saw
+CREATE TABLE IF NOT EXISTS rgs_bookings (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id TEXT NOT NULL,
+    supplier_key TEXT,
+    iban TEXT,
+    amount REAL,
+    rgs TEXT NOT NULL,
+    category TEXT,
+    weight INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rgs_bookings_client ON rgs_bookings(client_id, seq);
+
+CREATE TRIGGER IF NOT EXISTS rgs_bookings_insert AFTER INSERT ON invoices WHEN NEW.rgs IS NOT NULL BEGIN
+    INSERT INTO rgs_bookings (client_id, supplier_key, iban, amount, rgs, category, weight)
+    VALUES (NEW.client_id, nova_supplier_key(NEW.supplier), nova_iban_key(NEW.iban), NEW.amount, NEW.rgs, NEW.category, 1);
+END;
+CREATE TRIGGER IF NOT EXISTS rgs_bookings_update AFTER UPDATE OF supplier, iban, amount, rgs, category ON invoices BEGIN
+    INSERT INTO rgs_bookings (client_id, supplier_key, iban, amount, rgs, category, weight)
+    SELECT OLD.client_id, nova_supplier_key(OLD.supplier), nova_iban_key(OLD.iban), OLD.amount, OLD.rgs, OLD.category, -1
+    WHERE OLD.rgs IS NOT NULL;
+    INSERT INTO rgs_bookings (client_id, supplier_key, iban, amount, rgs, category, weight)
+    SELECT NEW.client_id, nova_supplier_key(NEW.supplier), nova_iban_key(NEW.iban), NEW.amount, NEW.rgs, NEW.category, 1
+    WHERE NEW.rgs IS NOT NULL;
+END;
+CREATE TRIGGER IF NOT EXISTS rgs_bookings_delete AFTER DELETE ON invoices WHEN OLD.rgs IS NOT NULL BEGIN
+    INSERT INTO rgs_bookings (client_id, supplier_key, iban, amount, rgs, category, weight)
+    VALUES (OLD.client_id, nova_supplier_key(OLD.supplier), nova_iban_key(OLD.iban), OLD.amount, OLD.rgs, OLD.category, -1);
+END;
+
+-- Extraction result per file content and engine version, shared by all clients
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    sha256 TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created TEXT,
+    PRIMARY KEY (sha256, engine)
+);
+
+CREATE TABLE IF NOT EXISTS bank_accounts (
+    client_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT,
+    bank TEXT,
+    iban TEXT,
+    balance REAL,
+    type TEXT,
+    "limit" REAL,
+    position INTEGER,
+    PRIMARY KEY (client_id, key)
+);
+
+CREATE TABLE IF NOT EXISTS bank_mutations (
+    client_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    datum TEXT,
+    bank TEXT,
+    bedrag REAL,
+    omschrijving TEXT,
+    reden TEXT,
+    suggestie TEXT,
+    PRIMARY KEY (client_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS crm_deals (
+    client_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    client TEXT,
+    stage TEXT,
+    amount REAL,
+    probability INTEGER,
+    expected_close TEXT,
+    contact TEXT,
+    email TEXT,
+    phone TEXT,
+    notes TEXT,
+    PRIMARY KEY (client_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_crm_deals_stage ON crm_deals(client_id, stage);
+
+CREATE TABLE IF NOT EXISTS purchase_orders (
+    client_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    supplier TEXT,
+    amount REAL,
+    status TEXT,
+    date TEXT,
+    project TEXT,
+    PRIMARY KEY (client_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_status ON purchase_orders(client_id, status);
+
+-- Three-way matching input (nova.matching): ordered lines per PO, goods received per
+-- PO line, and the lines of purchase invoices; po_line is the PO line an invoice line
+-- bills, or NULL when only the product name links them
+CREATE TABLE IF NOT EXISTS purchase_order_lines (
+    client_id TEXT NOT NULL,
+    po_id TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    product TEXT,
+    quantity REAL,
+    unit_price REAL,
+    PRIMARY KEY (client_id, po_id, line)
+);
+
+CREATE TABLE IF NOT EXISTS goods_receipts (
+    client_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    po_id TEXT NOT NULL,
+    po_line INTEGER NOT NULL,
+    quantity REAL,
+    date TEXT,
+    PRIMARY KEY (client_id, id, po_id, po_line)
+);
+CREATE INDEX IF NOT EXISTS idx_goods_receipts_po ON goods_receipts(client_id, po_id, po_line);
+
+CREATE TABLE IF NOT EXISTS invoice_lines (
+    client_id TEXT NOT NULL,
+    invoice_id TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    po_line INTEGER,
+    product TEXT,
+    quantity REAL,
+    unit_price REAL,
+    PRIMARY KEY (client_id, invoice_id, line)
+);
+
+CREATE TABLE IF NOT EXISTS employees (
+    client_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    role TEXT,
+    salary REAL,
+    fte REAL,
+    position INTEGER,
+    PRIMARY KEY (client_id, name)
+);
+
+-- RGS ledger lines; statement is 'wv', 'activa' or 'passiva'
+CREATE TABLE IF NOT EXISTS rgs_lines (
+    client_id TEXT NOT NULL,
+    period TEXT NOT NULL,
+    statement TEXT NOT NULL,
+    code TEXT NOT NULL,
+    name TEXT,
+    amount REAL,
+    category TEXT,
+    position INTEGER,
+    PRIMARY KEY (client_id, period, statement, code)
+);
+CREATE INDEX IF NOT EXISTS idx_rgs_lines_code ON rgs_lines(code);
+
+CREATE TABLE IF NOT EXISTS btw_periods (
+    client_id TEXT NOT NULL,
+    periode TEXT NOT NULL,
+    status TEXT,
+    deadline TEXT,
+    btw_verschuldigd REAL,
+    btw_voorbelasting REAL,
+    btw_af_te_dragen REAL,
+    icp_leveringen REAL,
+    icp_verwervingen REAL,
+    position INTEGER,
+    PRIMARY KEY (client_id, periode)
+);
+CREATE INDEX IF NOT EXISTS idx_btw_periods_status ON btw_periods(client_id, status);
+
+CREATE TABLE IF NOT EXISTS sync_modules (
+    client_id TEXT NOT NULL,
+    naam TEXT NOT NULL,
+    status TEXT,
+    laatste_sync TEXT,
+    details TEXT,
+    items_pending INTEGER,
+    position INTEGER,
+    PRIMARY KEY (client_id, naam)
+);
+
+-- Odoo connection per client; clients without a row use the NOVA_ODOO_* environment settings
+CREATE TABLE IF NOT EXISTS odoo_connections (
+    client_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    database TEXT NOT NULL,
+    username TEXT NOT NULL,
+    api_key TEXT NOT NULL
+);
+
+-- Raw records pulled from Odoo by the sync engine; archived records keep active = 0,
+-- records deleted in Odoo stay behind as tombstones with deleted = 1
+CREATE TABLE IF NOT EXISTS odoo_records (
+    client_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    odoo_id INTEGER NOT NULL,
+    write_date TEXT,
+    active INTEGER NOT NULL DEFAULT 1,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    PRIMARY KEY (client_id, model, odoo_id)
+);
+CREATE INDEX IF NOT EXISTS idx_odoo_records_write_date ON odoo_records(client_id, model, write_date);
+
+-- Incremental sync cursor per client and model: the (write_date, id) of the last record stored
+CREATE TABLE IF NOT EXISTS sync_state (
+    client_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    watermark TEXT,
+    watermark_id INTEGER,
+    last_sync TEXT,
+    last_reconcile TEXT,
+    PRIMARY KEY (client_id, model)
+);
+
+CREATE TABLE IF NOT EXISTS closing_periods (
+    client_id TEXT NOT NULL,
+    period TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    deadline TEXT,
+    type TEXT,
+    position INTEGER,
+    PRIMARY KEY (client_id, period)
+);
+CREATE INDEX IF NOT EXISTS idx_closing_periods_status ON closing_periods(client_id, status);
+
+-- Checklist items for both the monthly closing ('closing') and the annual statement ('annual')
+CREATE TABLE IF NOT EXISTS checklist_items (
+    client_id TEXT NOT NULL,
+    checklist TEXT NOT NULL,
+    period TEXT NOT NULL,
+    id TEXT NOT NULL,
+    category TEXT,
+    task TEXT,
+    description TEXT,
+    status TEXT,
+    responsible_agent TEXT,
+    odoo_module TEXT,
+    automated INTEGER,
+    completion_date TEXT,
+    notes TEXT,
+    position INTEGER,
+    PRIMARY KEY (client_id, checklist, period, id)
+);
+CREATE INDEX IF NOT EXISTS idx_checklist_items_status ON checklist_items(client_id, checklist, period, status);
+
+CREATE TABLE IF NOT EXISTS closing_issues (
+    client_id TEXT NOT NULL,
+    period TEXT NOT NULL,
+    id TEXT NOT NULL,
+    type TEXT,
+    severity TEXT,
+    title TEXT,
+    description TEXT,
+    amount REAL,
+    route_to_agent TEXT,
+    status TEXT,
+    created_date TEXT,
+    action TEXT,
+    PRIMARY KEY (client_id, period, id)
+);
+CREATE INDEX IF NOT EXISTS idx_closing_issues_status ON closing_issues(client_id, period, status);
+
+CREATE TABLE IF NOT EXISTS closing_history (
+    client_id TEXT NOT NULL,
+    period TEXT NOT NULL,
+    name TEXT,
+    result REAL,
+    budget REAL,
+    variance_pct REAL,
+    days_to_close INTEGER,
+    issues_found INTEGER,
+    PRIMARY KEY (client_id, period)
+);
+
+CREATE TABLE IF NOT EXISTS annual_statements (
+    client_id TEXT NOT NULL,
+    boekjaar TEXT NOT NULL,
+    status TEXT,
+    company_size TEXT,
+    data TEXT,
+    PRIMARY KEY (client_id, boekjaar)
+);
+CREATE INDEX IF NOT EXISTS idx_annual_statements_status ON annual_statements(status);
+
+-- Nested report documents (cashflow, vpb, investeringen, ...) stored as JSON per client and period
+CREATE TABLE IF NOT EXISTS documents (
+    client_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    period TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    PRIMARY KEY (client_id, kind, period)
+);
+
+-- General ledger lines (one row per debit or credit posting)
+CREATE TABLE IF NOT EXISTS journal_lines (
+    client_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    move TEXT,
+    journal TEXT,
+    date TEXT,
+    period TEXT,
+    rgs TEXT,
+    description TEXT,
+    debit REAL,
+    credit REAL,
+    PRIMARY KEY (client_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_journal_lines_period ON journal_lines(client_id, period);
+CREATE INDEX IF NOT EXISTS idx_journal_lines_rgs ON journal_lines(client_id, rgs);
+
+-- Change counter per client and table; bumped by every write so cached aggregates can be invalidated
+CREATE TABLE IF NOT EXISTS data_versions (
+    client_id TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (client_id, table_name)
+);
+
+-- Writes to the tables the alert rules read (see nova.alerts) queue the client for evaluation
+CREATE TRIGGER IF NOT EXISTS alert_queue_versions_insert AFTER INSERT ON data_versions
+WHEN NEW.table_name IN ('btw_periods', 'documents') BEGIN
+    INSERT INTO alert_queue (client_id, due) VALUES (NEW.client_id, '') ON CONFLICT (client_id) DO UPDATE SET due = '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS alert_queue_versions_update AFTER UPDATE ON data_versions
+WHEN NEW.table_name IN ('btw_periods', 'documents') BEGIN
+    INSERT INTO alert_queue (client_id, due) VALUES (NEW.client_id, '') ON CONFLICT (client_id) DO UPDATE SET due = '';
+END;
+
+-- The clients table itself is firm-wide and versioned under client_id '*' (FIRM_SCOPE)
+CREATE TRIGGER IF NOT EXISTS data_versions_clients_insert AFTER INSERT ON clients BEGIN
+    INSERT INTO data_versions (client_id, table_name, version) VALUES ('*', 'clients', 1)
+    ON CONFLICT (client_id, table_name) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS data_versions_clients_delete AFTER DELETE ON clients BEGIN
+    INSERT INTO data_versions (client_id, table_name, version) VALUES ('*', 'clients', 1)
+    ON CONFLICT (client_id, table_name) DO UPDATE SET version = version + 1;
+END;
+
+-- Not for the alerts column: nova.alerts rewrites it, and nothing cached on the clients version reads it
+DROP TRIGGER IF EXISTS data_versions_clients_update;
+CREATE TRIGGER data_versions_clients_update AFTER UPDATE OF
+    id, name, contact, kvk, btw, sector, omzet_ytd, omzet_prev, winst_ytd, openstaand, status, accountant, last_activity
+ON clients BEGIN
+    INSERT INTO data_versions (client_id, table_name, version) VALUES ('*', 'clients', 1)
+    ON CONFLICT (client_id, table_name) DO UPDATE SET version = version + 1;
+END;
+"""
+
+# Client tables read by cached results (nova.cache, nova.planner) and the alert rules; every
+# insert, update and delete bumps the table's data_versions counter for the client
+VERSIONED_TABLES = (
+    "annual_statements", "bank_accounts", "bank_mutations", "btw_periods", "checklist_items", "closing_periods",
+    "crm_deals", "documents", "goods_receipts", "invoice_lines", "invoices", "odoo_records",
+    "purchase_order_lines", "purchase_orders", "sync_modules",
+)
+
+SCHEMA += "".join(f"""
+CREATE TRIGGER IF NOT EXISTS data_versions_{table}_{event.lower()} AFTER {event} ON {table} BEGIN
+    INSERT INTO data_versions (client_id, table_name, version) VALUES ({row}.client_id, '{table}', 1)
+    ON CONFLICT (client_id, table_name) DO UPDATE SET version = version + 1;
+END;
+""" for table in VERSIONED_TABLES for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")))
+
+# Columns added after the first release: (table, column, definition). Added to existing
+# databases before SCHEMA runs, so its indexes and triggers can rely on them
+COLUMN_MIGRATIONS = [
+    ("firm_alerts", "rule", "TEXT"),
+    ("firm_alerts", "priority",
+     "INTEGER GENERATED ALWAYS AS (CASE type WHEN 'urgent' THEN 0 WHEN 'warning' THEN 1 ELSE 2 END) VIRTUAL"),
+    ("ingest_jobs", "batch", "TEXT"),
+    ("ingest_jobs", "path", "TEXT"),
+    ("ingest_jobs", "sha256", "TEXT"),
+]
+
+_local = threading.local()
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+def get_db_path():
+    """Resolve the database file, overridable with NOVA_DB_PATH"""
+    return Path(os.environ.get("NOVA_DB_PATH", DEFAULT_DB_PATH))
+
+
+def connect(path=None):
+    """Open a new connection with the NOVA pragmas applied"""
+    path = Path(path or get_db_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    # INSERT OR REPLACE only fires the delete triggers (firm_summary) with this on
+    conn.execute("PRAGMA recursive_triggers=ON")
+    register_functions(conn)
+    return conn
+
+
+def register_functions(conn):
+    """Add the SQL functions the invoices triggers call; required for every connection that writes invoices"""
+    conn.create_function("nova_supplier_key", 1, supplier_key, deterministic=True)
+    conn.create_function("nova_number_key", 1, invoice_number_key, deterministic=True)
+    conn.create_function("nova_iban_key", 1, iban_key, deterministic=True)
+
+
+def get_connection():
+    """Return the connection owned by the current thread"""
+    path = str(get_db_path())
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "path", None) != path:
+        init_db(path)
+        conn = connect(path)
+        _local.conn = conn
+        _local.path = path
+    return conn
+
+
+def init_db(path=None, seed=True):
+    """Create the schema and seed demo data once per process"""
+    path = str(path or get_db_path())
+    if path in _initialized:
+        return
+    with _init_lock:
+        if path in _initialized:
+            return
+        conn = connect(path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            migrated = migrate_columns(conn)
+            conn.executescript(SCHEMA)
+            if "firm_alerts" in migrated:
+                # The hand-written alerts make way for those of the rules in nova.alerts, evaluated for every client
+                from nova.alerts import evaluate_due
+                conn.execute("DELETE FROM firm_alerts WHERE rule IS NULL")
+                conn.execute("INSERT OR IGNORE INTO alert_queue (client_id, due) SELECT id, '' FROM clients")
+                evaluate_due(conn, limit=None)
+                conn.commit()
+            if not conn.execute("SELECT 1 FROM invoice_index WHERE source = 'invoice' LIMIT 1").fetchone():
+                # Databases created before the duplicate index existed
+                rebuild_invoice_index(conn)
+                conn.commit()
+            if (not conn.execute("SELECT 1 FROM rgs_bookings LIMIT 1").fetchone()
+                    and conn.execute("SELECT 1 FROM invoices WHERE rgs IS NOT NULL LIMIT 1").fetchone()):
+                # Databases created before the booking log existed
+                rebuild_rgs_bookings(conn)
+                conn.commit()
+            if (not conn.execute("SELECT 1 FROM blobs LIMIT 1").fetchone()
+                    and conn.execute("SELECT 1 FROM ingest_jobs WHERE sha256 IS NOT NULL LIMIT 1").fetchone()):
+                # Databases created before the document store existed
+                rebuild_blobs(conn)
+                conn.commit()
+            if migrated or conn.execute("SELECT COUNT(*) FROM firm_summary").fetchone()[0] == 0:
+                # Databases created before the summary triggers existed; after a migration the triggers
+                # above have already touched the table, so emptiness no longer tells
+                rebuild_firm_summary(conn)
+                conn.commit()
+            if seed:
+                from nova.seed import seed_demo_data
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0] == 0:
+                    seed_demo_data(conn)
+                conn.commit()
+        finally:
+            conn.close()
+        _initialized.add(path)
+
+
+def insert_rows(conn, table, rows, replace=False):
+    """Bulk insert a list of dicts; dict and list values are stored as JSON"""
+    rows = list(rows)
+    if not rows:
+        return 0
+    columns = list(rows[0].keys())
+    quoted = ", ".join(f'"{c}"' for c in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    verb = "INSERT OR REPLACE" if replace else "INSERT"
+    conn.executemany(
+        f"{verb} INTO {table} ({quoted}) VALUES ({placeholders})",
+        ([_encode(row.get(c)) for c in columns] for row in rows),
+    )
+    return len(rows)
+
+
+def migrate_columns(conn):
+    """Add the COLUMN_MIGRATIONS missing from existing tables; returns the tables that changed"""
+    migrated = set()
+    for table, column, definition in COLUMN_MIGRATIONS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+        if existing and column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            migrated.add(table)
+    conn.commit()
+    return migrated
+
+
+def rebuild_firm_summary(conn):
+    """Recompute firm_summary from scratch; the triggers keep it current afterwards"""
+    conn.execute("DELETE FROM firm_summary")
+    conn.execute(
+        "INSERT INTO firm_summary (metric, value) "
+        "SELECT 'clients', COUNT(*) FROM clients "
+        "UNION ALL SELECT 'omzet_ytd', COALESCE(SUM(omzet_ytd), 0) FROM clients "
+        "UNION ALL SELECT 'openstaand', COALESCE(SUM(openstaand), 0) FROM clients "
+        "UNION ALL SELECT 'status:' || status, COUNT(*) FROM clients GROUP BY status "
+        "UNION ALL SELECT 'alerts', COUNT(*) FROM firm_alerts "
+        "UNION ALL SELECT 'alerts:' || type, COUNT(*) FROM firm_alerts GROUP BY type"
+    )
+
+
+def rebuild_invoice_index(conn):
+    """Index all booked invoices from scratch; the triggers keep invoice_index current afterwards"""
+    conn.execute("DELETE FROM invoice_index WHERE source = 'invoice'")
+    conn.execute(
+        "INSERT INTO invoice_index (client_id, source, ref, supplier_key, number_key, total_cents, invoice_date, iban) "
+        "SELECT client_id, 'invoice', id, nova_supplier_key(supplier), nova_number_key(id), "
+        "CAST(round((COALESCE(amount, 0) + COALESCE(vat, 0)) * 100) AS INTEGER), date, nova_iban_key(iban) "
+        "FROM invoices"
+    )
+
+
+def rebuild_rgs_bookings(conn):
+    """Log every booked invoice once; the triggers append later changes"""
+    conn.execute("DELETE FROM rgs_bookings")
+    conn.execute(
+        "INSERT INTO rgs_bookings (client_id, supplier_key, iban, amount, rgs, category, weight) "
+        "SELECT client_id, nova_supplier_key(supplier), nova_iban_key(iban), amount, rgs, category, 1 "
+        "FROM invoices WHERE rgs IS NOT NULL ORDER BY client_id, date"
+    )
+
+
+def rebuild_blobs(conn):
+    """Count the references of every stored document; the triggers keep refs current afterwards"""
+    conn.execute("DELETE FROM blobs")
+    conn.execute(
+        "INSERT INTO blobs (sha256, refs, created) "
+        "SELECT sha256, COUNT(*), CAST(strftime('%s', 'now') AS INTEGER) FROM ingest_jobs "
+        "WHERE sha256 IS NOT NULL GROUP BY sha256"
+    )
+
+
+def firm_summary(conn):
+    """All summary metrics: clients, omzet_ytd, openstaand, status:<status>, alerts and alerts:<type>"""
+    return dict(conn.execute("SELECT metric, value FROM firm_summary").fetchall())
+
+
+def data_versions(conn, client_id, tables):
+    """Current version of each table for a client; tables never written are at 0"""
+    placeholders = ", ".join("?" for _ in tables)
+    versions = dict(conn.execute(
+        f"SELECT table_name, version FROM data_versions WHERE client_id = ? AND table_name IN ({placeholders})",
+        (client_id, *tables),
+    ).fetchall())
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+def _encode(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return int(value)
+    return value
@@ -0,0 +1,139 @@
+"""Duplicate and near-duplicate detection for incoming invoices
+
+Every booked invoice and every analysed upload has a row in invoice_index with
+normalized lookup keys (see ``nova.identifiers``). ``find_duplicates()`` checks
+an extracted invoice against it with a handful of indexed equality lookups, so
+the cost does not grow with the number of historical invoices:
+
+- same supplier and invoice number;
+- same invoice number and amount (supplier name written differently);
+- same IBAN, amount and invoice date (e.g. a credit-card copy with another number);
+- near-identical document text: the 64-bit SimHash of the text differs in at most
+  ``MAX_DISTANCE`` bits. The hash is split into four 16-bit bands; two hashes that
+  close always share a band, so only documents with an equal band are compared.
+  Numbers weigh more than words, so a copy with a stamp or a reworded label stays
+  close while an invoice with other amounts moves away. A monthly invoice with a
+  fixed amount (rent) is textually a copy too; a different invoice date tells
+  them apart.
+
+The extraction step computes the fingerprint (``simhash``) because it needs the
+document text; this module needs only the connection it is given.
+"""
+
+import hashlib
+import re
+
+from nova.identifiers import iban_key, invoice_number_key, supplier_key
+
+BANDS = 4
+BAND_BITS = 16
+MAX_DISTANCE = 3
+SHINGLE_WORDS = 3
+NUMBER_WEIGHT = 4
+
+# (reason, query): checked in this order, one finding per earlier document
+RULES = [
+    ("zelfde leverancier en factuurnummer",
+     "supplier_key = :supplier_key AND number_key = :number_key"),
+    ("zelfde factuurnummer en bedrag",
+     "number_key = :number_key AND total_cents = :total_cents"),
+    ("zelfde IBAN, bedrag en factuurdatum",
+     "iban = :iban AND total_cents = :total_cents AND invoice_date = :invoice_date"),
+]
+
+
+def simhash(text):
+    """64-bit SimHash of the word 3-shingles and the numbers of a text; None for texts too short to compare"""
+    words = re.findall(r"\w+", (text or "").lower())
+    if len(words) < SHINGLE_WORDS:
+        return None
+    features = {}
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = " ".join(words[i:i + SHINGLE_WORDS])
+        features[shingle] = features.get(shingle, 0) + 1
+    for word in words:
+        if any(ch.isdigit() for ch in word):
+            features["#" + word] = features.get("#" + word, 0) + NUMBER_WEIGHT
+    weights = [0] * 64
+    for feature, weight in features.items():
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def _bands(fingerprint):
+    return [fingerprint >> (BAND_BITS * i) & ((1 << BAND_BITS) - 1) for i in range(BANDS)]
+
+
+def _signed(fingerprint):
+    # SQLite integers are signed 64-bit
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def _keys(fields):
+    total = fields.get("total")
+    if total is None and fields.get("amount") is not None:
+        total = fields["amount"] + (fields.get("vat") or 0)
+    return {
+        "supplier_key": supplier_key(fields.get("supplier")),
+        "number_key": invoice_number_key(fields.get("invoice_number")),
+        "total_cents": round(total * 100) if total is not None else None,
+        "invoice_date": fields.get("date"),
+        "iban": iban_key(fields.get("iban")),
+    }
+
+
+def _label(conn, source, ref):
+    if source == "invoice":
+        return f"factuur {ref}"
+    row = conn.execute("SELECT filename FROM ingest_jobs WHERE id = ?", (ref,)).fetchone()
+    return f"upload {row[0]}" if row else f"upload {ref}"
+
+
+def find_duplicates(conn, client_id, fields, fingerprint=None, exclude=None):
+    """Earlier invoices and uploads of the client that this invoice likely duplicates
+
+    ``exclude`` is the (source, ref) of the document itself when it is already
+    indexed. Returns [{"source", "ref", "label", "reason"}], strongest reason first.
+    """
+    keys = _keys(fields)
+    found = {}
+    for reason, condition in RULES:
+        params = re.findall(r":(\w+)", condition)
+        if any(keys[name] is None for name in params):
+            continue
+        for source, ref in conn.execute(
+            f"SELECT source, ref FROM invoice_index WHERE client_id = :client_id AND {condition} LIMIT 10",
+            dict(keys, client_id=client_id),
+        ):
+            found.setdefault((source, ref), reason)
+    if fingerprint is not None:
+        bands = _bands(fingerprint)
+        union = " UNION ".join(
+            f"SELECT source, ref, simhash, invoice_date FROM invoice_index WHERE client_id = ? AND band{i} = ?"
+            for i in range(BANDS)
+        )
+        params = [value for i in range(BANDS) for value in (client_id, bands[i])]
+        for source, ref, other, other_date in conn.execute(union, params):
+            if keys["invoice_date"] and other_date and keys["invoice_date"] != other_date:
+                continue
+            if bin((other & ((1 << 64) - 1)) ^ fingerprint).count("1") <= MAX_DISTANCE:
+                found.setdefault((source, ref), "vrijwel identieke inhoud")
+    found.pop(exclude, None)
+    return [
+        {"source": source, "ref": ref, "label": _label(conn, source, ref), "reason": reason}
+        for (source, ref), reason in found.items()
+    ]
+
+
+def index_upload(conn, client_id, job_id, fields, fingerprint=None):
+    """Add or refresh an analysed upload in invoice_index; runs inside the caller's transaction"""
+    keys = _keys(fields)
+    bands = _bands(fingerprint) if fingerprint is not None else [None] * BANDS
+    conn.execute(
+        "INSERT OR REPLACE INTO invoice_index (client_id, source, ref, supplier_key, number_key, total_cents, "
+        "invoice_date, iban, simhash, band0, band1, band2, band3) VALUES (?, 'upload', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (client_id, str(job_id), keys["supplier_key"], keys["number_key"], keys["total_cents"], keys["invoice_date"],
+         keys["iban"], _signed(fingerprint) if fingerprint is not None else None, *bands),
+    )
@@ -0,0 +1,385 @@
+"""Invoice field extraction for uploaded documents (ARIA)
+
+Runs in the worker processes of ``nova.jobs``, never in a Streamlit script run, so
+this module must stay importable without the database or Streamlit.
+
+Fields come from the text layer of the PDF (``nova.pdf``) and the layout of its
+lines: a label ("Factuurnummer", "Totaal te betalen", "BTW 21%") takes its value
+from the rest of its cell, the cells to its right or the cell below it. IBAN and
+BTW-nummer are accepted on their check digits, and subtotal, VAT and total are
+reconciled with each other, which sets the confidence of each field. Scans and
+photos have no text layer; they come back without fields (there is no OCR) and
+need manual entry.
+
+The result also carries the SimHash ``fingerprint`` of the text for the
+near-duplicate check of ``nova.duplicates``. It depends only on the file's bytes
+and ``ENGINE_VERSION``, so
+``nova.jobs`` caches it by content hash; bump the version when the heuristics
+change.
+"""
+
+import re
+import statistics
+from datetime import date, timedelta
+
+from nova.blobstore import open_mapped
+from nova.duplicates import simhash
+from nova.identifiers import IBAN_LENGTHS, btw_valid, iban_valid, normalize_btw, normalize_iban
+from nova.pdf import PdfError, read_pages
+
+ENGINE_VERSION = "pdf-2"
+
+FIELDS = ("supplier", "invoice_number", "date", "due_date", "amount", "vat", "vat_rate", "total",
+          "iban", "btw_number", "kvk", "rgs", "rgs_name")
+# Fields that make up the overall confidence; a missing one counts as 0
+KEY_FIELDS = ("supplier", "invoice_number", "date", "amount", "vat", "total", "iban")
+
+# ============================================
+# VALUES
+# ============================================
+
+_AMOUNT = re.compile(
+    r"(?<![\w.,])(-)?(?:(\d{1,3}(?:\.\d{3})+|\d+),(\d{2}|-)|(\d{1,3}(?:,\d{3})+|\d+)\.(\d{2}))(?![\d%]|[.,]\d|\s*%)"
+)
+MONTHS = {
+    "januari": 1, "jan": 1, "februari": 2, "feb": 2, "maart": 3, "mrt": 3, "april": 4, "apr": 4, "mei": 5,
+    "juni": 6, "jun": 6, "juli": 7, "jul": 7, "augustus": 8, "aug": 8, "september": 9, "sep": 9, "sept": 9,
+    "oktober": 10, "okt": 10, "november": 11, "nov": 11, "december": 12, "dec": 12,
+}
+_DATE = re.compile(
+    r"\b(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})\b"
+    r"|\b(\d{4})-(\d{2})-(\d{2})\b"
+    r"|\b(\d{1,2})\s+(" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?\s+(\d{4})\b",
+    re.I,
+)
+_IBAN = re.compile(r"\b([A-Z]{2}\d{2}(?:\s?[A-Z0-9]{4}){2,7}(?:\s?[A-Z0-9]{1,3})?)\b")
+_BTW = re.compile(r"\bNL\s?\d{3}\.?\d{3}\.?\d{3}\.?\s?B\s?\.?\d{2}\b", re.I)
+_KVK = re.compile(r"\b(?:kvk|k\.v\.k\.?|kamer van koophandel|coc)(?:[\s-]*(?:nr|nummer|no)\.?)?\s*:?\s*(\d{8})\b", re.I)
+_TOKEN = re.compile(r"[A-Za-z0-9][A-Za-z0-9./_-]*")
+
+
+def parse_amounts(text):
+    """Amounts in Dutch (1.234,56 or 1.234,-) or English (1,234.56) notation, left to right"""
+    values = []
+    for match in _AMOUNT.finditer(text):
+        sign, nl_int, nl_dec, en_int, en_dec = match.groups()
+        if nl_int is not None:
+            value = float(nl_int.replace(".", "") + "." + (nl_dec if nl_dec != "-" else "00"))
+        else:
+            value = float(en_int.replace(",", "") + "." + en_dec)
+        values.append(-value if sign else value)
+    return values
+
+
+def parse_date(text):
+    """First date in the text as ISO string (day-month-year, ISO or written Dutch month)"""
+    for match in _DATE.finditer(text):
+        g = match.groups()
+        try:
+            if g[0]:
+                return date(int(g[2]), int(g[1]), int(g[0])).isoformat()
+            if g[3]:
+                return date(int(g[3]), int(g[4]), int(g[5])).isoformat()
+            return date(int(g[8]), MONTHS[g[7].lower()], int(g[6])).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _invoice_number(text):
+    match = _TOKEN.search(text.lstrip(" :#.-"))
+    token = match.group().rstrip(".") if match else ""
+    if 3 <= len(token) <= 30 and re.search(r"\d", token) and not parse_date(token) and not parse_amounts(token):
+        return token
+    return None
+
+
+def _iban(text):
+    for match in _IBAN.finditer(text.upper()):
+        iban = normalize_iban(match.group(1))
+        iban = iban[:IBAN_LENGTHS.get(iban[:2], len(iban))]
+        if iban_valid(iban):
+            return iban
+    return None
+
+
+# ============================================
+# LAYOUT
+# ============================================
+
+INVOICE_NUMBER_LABEL = re.compile(
+    r"\b(factuur\s*(?:nummer|nr\.?|no\.?)|factuurnr\.?|notanummer|invoice\s*(?:number|no\.?|nr\.?|#))\s*:?", re.I
+)
+INVOICE_DATE_LABEL = re.compile(r"\b(factuurdatum|invoice\s+date)\b\s*:?", re.I)
+DATE_LABEL = re.compile(r"\b(datum|date)\b\s*:?", re.I)
+DUE_DATE_LABEL = re.compile(
+    r"\b(vervaldatum|vervaldag|uiterlijk(?:\s+te)?\s+betalen(?:\s+op|\s+voor)?|te\s+betalen\s+voor"
+    r"|betalen\s+voor|due\s+date|payment\s+due)\b\s*:?", re.I
+)
+PAYMENT_TERM = re.compile(r"betalingstermijn\s*:?\s*(\d{1,3})\s*dagen|binnen\s+(\d{1,3})\s+dagen", re.I)
+SUBTOTAL_LABEL = re.compile(
+    r"\b(sub-?totaal|subtotal|totaal\s+excl\w*|excl\w*\.?\s+btw|netto(?:\s*bedrag)?|bedrag\s+excl\w*|net\s+amount)", re.I
+)
+TOTAL_LABEL = re.compile(
+    r"\b(totaal\s+te\s+betalen|te\s+betalen(?:\s+bedrag)?|totaal\s+incl\w*|totaalbedrag|eindtotaal"
+    r"|amount\s+due|total\s+due|balance\s+due)", re.I
+)
+GENERIC_TOTAL_LABEL = re.compile(r"\b(totaal|total)\b", re.I)
+VAT_LABEL = re.compile(r"\b(btw|b\.t\.w\.|vat|omzetbelasting)\b", re.I)
+VAT_ID_LABEL = re.compile(r"(btw|vat)[\s.-]*(nummer|nr|no|id|identificatie|reg)|omzetbelastingnummer", re.I)
+VAT_RATE = re.compile(r"(\d{1,2}(?:[.,]\d)?)\s*%")
+REVERSE_CHARGE = re.compile(r"btw\s+verlegd|verleggingsregeling|reverse\s+charge", re.I)
+ADDRESSEE_LABEL = re.compile(
+    r"^\s*(aan|t\.a\.v\.?|factuuradres|afleveradres|klant|debiteur|bill\s+to|invoice\s+to)\b", re.I
+)
+CUSTOMER_MARK = re.compile(r"\b(uw|klant|afnemer|your)\b", re.I)
+LEGAL_FORM = re.compile(r"(?<!\w)(b\.\s?v\.?|bv|n\.\s?v\.?|v\.o\.f\.?|vof|c\.v\.|holding|gmbh|ltd|bvba|sarl)(?!\w)", re.I)
+POSTCODE = re.compile(r"\b\d{4}\s?[A-Z]{2}\b")
+
+
+def _overlaps(a, b):
+    return a.x0 <= b.x1 and b.x0 <= a.x1
+
+
+def _near_label(lines, label, parse):
+    """(value, confidence, line index) for each label match: rest of the cell, cells to the right, cell below"""
+    for index, (page, line) in enumerate(lines):
+        for position, cell in enumerate(line.cells):
+            match = label.search(cell.text)
+            if not match:
+                continue
+            value = parse(cell.text[match.end():])
+            if value is not None:
+                yield value, 0.95, index
+                continue
+            value = next((v for v in map(parse, (c.text for c in line.cells[position + 1:])) if v is not None), None)
+            if value is not None:
+                yield value, 0.9, index
+                continue
+            for below_page, below in lines[index + 1:index + 3]:
+                if below_page != page:
+                    break
+                value = next((parse(c.text) for c in below.cells if _overlaps(c, cell) and parse(c.text) is not None), None)
+                if value is not None:
+                    yield value, 0.8, index
+                    break
+
+
+def _first(candidates, factor=1.0):
+    for value, confidence, _ in candidates:
+        return value, round(confidence * factor, 2)
+    return None
+
+
+def _line_amount(lines, index, cell_position):
+    """Right-most amount from the label cell onwards, else the right-most amount of the next line"""
+    page, line = lines[index]
+    amounts = [a for c in line.cells[cell_position:] for a in parse_amounts(c.text)]
+    if amounts:
+        return amounts[-1], 0.9
+    if index + 1 < len(lines) and lines[index + 1][0] == page:
+        amounts = [a for c in lines[index + 1][1].cells for a in parse_amounts(c.text)]
+        if amounts:
+            return amounts[-1], 0.7
+    return None
+
+
+def _close(a, b):
+    return abs(a - b) <= max(0.02, 0.002 * abs(b))
+
+
+def _totals(lines):
+    """Subtotal, VAT, VAT rate and total, reconciled with each other"""
+    found = {"subtotal": [], "total": [], "generic_total": [], "vat": []}
+    reverse_charge = False
+    for index, (_, line) in enumerate(lines):
+        reverse_charge = reverse_charge or bool(REVERSE_CHARGE.search(line.text))
+        for position, cell in enumerate(line.cells):
+            if SUBTOTAL_LABEL.search(cell.text):
+                kind = "subtotal"
+            elif TOTAL_LABEL.search(cell.text):
+                kind = "total"
+            elif VAT_LABEL.search(cell.text) and not VAT_ID_LABEL.search(cell.text):
+                kind = "vat"
+            elif GENERIC_TOTAL_LABEL.search(cell.text):
+                kind = "generic_total"
+            else:
+                continue
+            amount = _line_amount(lines, index, position)
+            if amount is not None:
+                rate = VAT_RATE.search(cell.text)
+                found[kind].append((amount[0], amount[1], rate.group(1).replace(",", ".") if rate else None,
+                                    bool(GENERIC_TOTAL_LABEL.search(cell.text))))
+            break
+
+    def best(items):
+        # Totals close the document: prefer amounts on the label's own line, then the bottom-most
+        if not items:
+            return None
+        top = max(confidence for _, confidence, _, _ in items)
+        return next((value, confidence) for value, confidence, _, _ in reversed(items) if confidence == top)
+
+    subtotal = best(found["subtotal"])
+    total = best(found["total"]) or best(found["generic_total"])
+    vat, vat_rate = None, None
+    vat_lines = found["vat"]
+    if vat_lines:
+        summed = [item for item in vat_lines if item[3]]
+        if summed:
+            vat = (summed[-1][0], summed[-1][1])
+        else:
+            # One line per rate; a rate printed twice (e.g. summary and table) counts once
+            per_rate = {}
+            for value, confidence, rate, _ in vat_lines:
+                per_rate[rate] = (value, confidence)
+            vat = (round(sum(v for v, _ in per_rate.values()), 2), min(c for _, c in per_rate.values()))
+            rates = [rate for rate in per_rate if rate is not None]
+            vat_rate = float(rates[0]) if len(rates) == 1 else None
+    elif reverse_charge:
+        vat, vat_rate = (0.0, 0.85), 0.0
+
+    if subtotal and vat and total:
+        if _close(subtotal[0] + vat[0], total[0]):
+            subtotal, vat, total = (subtotal[0], 0.98), (vat[0], 0.98), (total[0], 0.98)
+        else:
+            subtotal, vat, total = [(v, round(c * 0.7, 2)) for v, c in (subtotal, vat, total)]
+    elif total and vat:
+        subtotal = (round(total[0] - vat[0], 2), round(min(total[1], vat[1]) * 0.9, 2))
+    elif subtotal and vat:
+        total = (round(subtotal[0] + vat[0], 2), round(min(subtotal[1], vat[1]) * 0.9, 2))
+    elif subtotal and total and total[0] >= subtotal[0]:
+        vat = (round(total[0] - subtotal[0], 2), round(min(subtotal[1], total[1]) * 0.9, 2))
+    if vat_rate and subtotal and vat and _close(subtotal[0] * vat_rate / 100, vat[0]):
+        vat = (vat[0], max(vat[1], 0.95))
+    return {"amount": subtotal, "vat": vat, "total": total,
+            "vat_rate": (vat_rate, vat[1]) if vat_rate is not None and vat else None}
+
+
+def _in_addressee(index, cell, addressee):
+    """Cell in the few lines under an "Aan:"/"Factuuradres" label, or right of it on its line"""
+    for label_index, label in addressee:
+        if 0 < index - label_index <= 4 and _overlaps(label, cell):
+            return True
+        if index == label_index and cell is not label and label.x1 <= cell.x0:
+            return True
+    return False
+
+
+def _supplier(pages_lines):
+    """Name in the letterhead: large type, a legal form, top of the first page, not in the addressee block"""
+    if not pages_lines:
+        return None
+    page, lines = pages_lines[0]
+    sizes = [cell.size for line in lines for cell in line.cells]
+    if not sizes:
+        return None
+    largest, median = max(sizes), statistics.median(sizes)
+    addressee = []
+    best = None
+    for index, line in enumerate(lines):
+        for cell in line.cells:
+            if ADDRESSEE_LABEL.search(cell.text):
+                addressee.append((index, cell))
+    for index, line in enumerate(lines):
+        for cell in line.cells:
+            text = re.split(r"\s[|–-]\s|,", cell.text)[0].strip(" :")
+            letters = sum(ch.isalpha() for ch in text)
+            if letters < 3 or len(text) > 60 or re.search(r"factuur|invoice|^(aan|t\.a\.v)\b", text, re.I) \
+                    or parse_amounts(text) or parse_date(text) or POSTCODE.search(text) or _iban(text) \
+                    or re.search(r"\d{3,}", text) or ":" in cell.text.rstrip(":"):
+                continue
+            score = 0
+            score += 2 if cell.size >= largest else 1 if cell.size > median else 0
+            score += 2 if LEGAL_FORM.search(text) else 0
+            score += 1 if line.y >= 0.75 * page.height else 0
+            if _in_addressee(index, cell, addressee):
+                score -= 3
+            if best is None or score > best[1]:
+                best = (text, score)
+    if best is None or best[1] < 2:
+        return None
+    return best[0], round(min(0.9, 0.45 + 0.1 * best[1]), 2)
+
+
+def _identifier(lines, pattern, label, parse):
+    """(labelled, value) of an identifier pattern, labelled lines first; the customer's own numbers are skipped"""
+    candidates = []
+    for _, line in lines:
+        if CUSTOMER_MARK.search(line.text):
+            continue
+        for match in pattern.finditer(line.text):
+            value = parse(match)
+            if value is not None:
+                candidates.append((bool(label.search(line.text)), value))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: c[0])
+
+
+def _fields(pages):
+    """(value, confidence) per field found in the text lines of the pages"""
+    lines = [(number, line) for number, page in enumerate(pages) for line in page.lines]
+    fields = {}
+    fields["invoice_number"] = _first(_near_label(lines, INVOICE_NUMBER_LABEL, _invoice_number))
+    fields["date"] = _first(_near_label(lines, INVOICE_DATE_LABEL, parse_date)) \
+        or _first(_near_label(lines, DATE_LABEL, parse_date), factor=0.85)
+    fields["due_date"] = _first(_near_label(lines, DUE_DATE_LABEL, parse_date))
+    if fields["due_date"] is None and fields["date"] is not None:
+        term = next((PAYMENT_TERM.search(line.text) for _, line in lines if PAYMENT_TERM.search(line.text)), None)
+        if term:
+            due = date.fromisoformat(fields["date"][0]) + timedelta(days=int(term.group(1) or term.group(2)))
+            fields["due_date"] = (due.isoformat(), 0.75)
+    fields.update(_totals(lines))
+    fields["supplier"] = _supplier([(page, page.lines) for page in pages])
+
+    iban = _identifier(lines, _IBAN, re.compile(r"iban|rekening|bank", re.I), lambda m: _iban(m.group(1)))
+    fields["iban"] = (iban[1], 0.98 if iban[0] else 0.9) if iban else None
+    btw = _identifier(lines, _BTW, VAT_LABEL, lambda m: normalize_btw(m.group()))
+    if btw:
+        fields["btw_number"] = (btw[1], (0.95 if btw[0] else 0.9) if btw_valid(btw[1]) else 0.5)
+    kvk = _identifier(lines, _KVK, _KVK, lambda m: m.group(1))
+    fields["kvk"] = (kvk[1], 0.95) if kvk else None
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+def overall_confidence(field_confidence):
+    """Mean confidence of the key fields"""
+    return round(sum(field_confidence.get(name, 0) for name in KEY_FIELDS) / len(KEY_FIELDS), 2)
+
+
+def _result(found, pages, text_layer, note=None, fingerprint=None):
+    confidence = {name: found[name][1] for name in found}
+    result = {
+        "engine": ENGINE_VERSION,
+        "text_layer": text_layer,
+        "pages": pages,
+        "fingerprint": fingerprint,
+        "fields": {name: found[name][0] if name in found else None for name in FIELDS},
+        "field_confidence": confidence,
+        "confidence": overall_confidence(confidence),
+    }
+    if note:
+        result["note"] = note
+    return result
+
+
+def extract_invoice(filename, content):
+    """Detected invoice fields with a confidence per field and overall (between 0 and 1)"""
+    if not content:
+        raise ValueError("leeg bestand")
+    if b"%PDF" not in content[:1024]:
+        return _result({}, 0, False, note="geen tekstlaag (scan of foto): gegevens handmatig invullen")
+    try:
+        pages = read_pages(content)
+    except PdfError as exc:
+        raise ValueError(f"PDF niet leesbaar ({exc})") from exc
+    if not any(page.lines for page in pages):
+        return _result({}, len(pages), False, note="PDF zonder tekstlaag (scan): gegevens handmatig invullen")
+    text = "\n".join(line.text for page in pages for line in page.lines)
+    return _result(_fields(pages), len(pages), True, fingerprint=simhash(text))
+
+
+def extract_invoice_file(path):
+    """``extract_invoice`` for a stored upload, read through a memory map instead of a copy"""
+    with open_mapped(path) as content:
+        return extract_invoice(path, content)
@@ -0,0 +1,107 @@
+"""Check digits and normalized keys of the identifiers found on invoices
+
+The ``*_key`` functions are also registered as SQLite functions by
+``nova.db.connect`` (``nova_supplier_key`` etc.), so triggers index invoices
+with exactly the same normalization as the Python side.
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+
+# IBAN length per country, for the countries Dutch SMEs mostly deal with
+IBAN_LENGTHS = {
+    "NL": 18, "BE": 16, "DE": 22, "FR": 27, "LU": 20, "GB": 22, "IE": 22, "ES": 24, "IT": 27, "AT": 20,
+    "DK": 18, "PL": 28, "PT": 25, "CH": 21, "SE": 24, "FI": 18, "NO": 15, "CZ": 24,
+}
+
+
+def normalize_iban(value):
+    """Upper case without spaces"""
+    return re.sub(r"\s+", "", value or "").upper()
+
+
+def iban_valid(value):
+    """ISO 13616 check: known length for the country and mod 97 of the rearranged number equals 1"""
+    iban = normalize_iban(value)
+    if not re.fullmatch(r"[A-Z]{2}\d{2}[A-Z0-9]{10,30}", iban):
+        return False
+    if IBAN_LENGTHS.get(iban[:2], len(iban)) != len(iban):
+        return False
+    digits = "".join(str(int(c, 36)) for c in iban[4:] + iban[:4])
+    return int(digits) % 97 == 1
+
+
+# Expected length per country code as a 26 x 26 table for ibans_valid; 0 where any length is accepted
+_IBAN_LENGTH_TABLE = np.zeros(26 * 26, dtype=np.int64)
+for _country, _length in IBAN_LENGTHS.items():
+    _IBAN_LENGTH_TABLE[(ord(_country[0]) - 65) * 26 + ord(_country[1]) - 65] = _length
+
+
+def ibans_valid(values):
+    """``iban_valid`` for many values at once; returns a boolean array
+
+    The IBANs are laid out as a byte matrix and mod 97 is carried column by
+    column, so the work per character is one array operation for all of them.
+    """
+    ibans = [normalize_iban(value) for value in values]
+    if not ibans:
+        return np.zeros(0, dtype=bool)
+    lengths = np.fromiter((len(iban) for iban in ibans), dtype=np.int64, count=len(ibans))
+    chars = np.frombuffer(np.array([iban[:34].encode("ascii", "replace") for iban in ibans], dtype="S34").tobytes(),
+                          dtype=np.uint8).reshape(len(ibans), 34).astype(np.int64)
+    digit = (chars >= 48) & (chars <= 57)
+    letter = (chars >= 65) & (chars <= 90)
+    used = np.arange(34) < lengths[:, None]
+    valid = ((lengths >= 14) & (lengths <= 34) & letter[:, 0] & letter[:, 1] & digit[:, 2] & digit[:, 3]
+             & ((digit | letter) | ~used).all(axis=1))
+    country = np.where(valid, (chars[:, 0] - 65) * 26 + chars[:, 1] - 65, 0)
+    expected = _IBAN_LENGTH_TABLE[country]
+    valid &= (expected == 0) | (expected == lengths)
+    # Mod 97 of the BBAN followed by country code and check digits, letters counting as two digits (A = 10)
+    numbers = np.where(letter, chars - 55, chars - 48)
+    remainder = np.zeros(len(ibans), dtype=np.int64)
+    for column in [*range(4, 34), *range(4)]:
+        step = np.where(letter[:, column], remainder * 100, remainder * 10) + numbers[:, column]
+        remainder = np.where(used[:, column], step % 97, remainder)
+    return valid & (remainder == 1)
+
+
+def normalize_btw(value):
+    """NL123456789B01 form of a Dutch VAT number"""
+    return re.sub(r"[\s.]+", "", value or "").upper()
+
+
+def btw_valid(value):
+    """Dutch VAT number: eleven-test of the 9 digits (companies) or mod 97 (sole traders since 2020)"""
+    btw = normalize_btw(value)
+    if not re.fullmatch(r"NL\d{9}B\d{2}", btw):
+        return False
+    digits = btw[2:11]
+    if sum(int(d) * w for d, w in zip(digits[:8], range(9, 1, -1))) % 11 == int(digits[8]):
+        return True
+    return int("2321" + digits + "11" + btw[12:]) % 97 == 1
+
+
+# Legal forms and filler dropped from supplier names before comparing
+SUPPLIER_NOISE = re.compile(r"\b(b ?v|n ?v|v ?o ?f|c ?v|bvba|gmbh|ltd|inc|sarl|en|the|de|het)\b")
+
+
+def supplier_key(name):
+    """Lower-case supplier name without accents, punctuation or legal form"""
+    if not name:
+        return None
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    text = re.sub(r"[^a-z0-9& ]+", " ", text.replace(".", ""))
+    return " ".join(SUPPLIER_NOISE.sub(" ", text).split()) or None
+
+
+def invoice_number_key(number):
+    """Invoice number without separators, e.g. F2024-009, f 2024/009 -> F2024009"""
+    key = re.sub(r"[^A-Z0-9]", "", (number or "").upper())
+    return key or None
+
+
+def iban_key(value):
+    return normalize_iban(value) or None
@@ -0,0 +1,299 @@
+"""Background processing of uploaded documents
+
+``submit()`` takes one upload or hundreds (loose files or ZIP archives), streams
+every file into the document store (``nova.blobstore``, one copy per distinct
+content) and records it in ingest_jobs under one batch id: queued, duplicate
+(same content as an earlier upload of the client) or failed (unsupported, too
+large, unreadable archive).
+The script run that accepted the upload returns at once.
+
+Queued jobs go to a pool of ``NOVA_JOB_WORKERS`` threads (default: one per CPU).
+A thread claims its job with a conditional update and hands the file path to a
+process pool of the same size, so CPU-bound extraction of several files runs in
+parallel outside the Streamlit server process; the thread stores the result or
+the error and the views poll the table. Jobs that were queued or running when
+the server stopped are picked up again when the pool starts, and documents no
+job references any more are removed.
+
+Handler results depend only on the file's content, so they are kept in
+extraction_cache by sha256 and handler version: a file seen before (by any
+client) skips the process pool. Client-specific steps, such as the RGS code
+learned by ``nova.classifier`` and the duplicate check of ``nova.duplicates``, run
+afterwards on the worker thread.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+import zipfile
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+
+from nova.blobstore import BlobStore, adopt_uploads, collect_garbage, register
+from nova.classifier import predict_rgs
+from nova.data import invoices_repo
+from nova.db import get_connection
+from nova.duplicates import find_duplicates, index_upload
+from nova.extraction import ENGINE_VERSION, extract_invoice_file, overall_confidence
+from nova.identifiers import supplier_key
+from nova.metrics import track
+from nova.reference import rgs_name
+
+log = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get("NOVA_JOB_WORKERS", os.cpu_count() or 4))
+
+
+def _complete_invoice(conn, job, result):
+    """Supplier name from earlier invoices, the learned RGS code, then the duplicate check against them"""
+    client_id, fields, confidence = job["client_id"], result["fields"], result["field_confidence"]
+    booking = invoices_repo.booking_history(client_id, iban=fields["iban"])
+    # The IBAN's history fills in a supplier the document did not yield or confirms the one it did;
+    # a name read from the document is never replaced (one IBAN can serve several trade names)
+    if booking and fields.get("supplier") and supplier_key(fields["supplier"]) != supplier_key(booking["supplier"]):
+        booking = None
+    if booking:
+        fields["supplier"] = fields.get("supplier") or booking["supplier"]
+        confidence["supplier"] = max(confidence.get("supplier") or 0, 0.95)
+    prediction = predict_rgs(conn, client_id, [fields])[0]
+    if prediction:
+        fields["rgs"], fields["rgs_name"] = prediction["rgs"], rgs_name(prediction["rgs"], prediction["category"])
+        confidence["rgs"] = prediction["confidence"]
+    if booking or prediction:
+        result["confidence"] = overall_confidence(confidence)
+    # Check and index in one write transaction, so two copies in one batch cannot both miss each other
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result["duplicates"] = find_duplicates(
+            conn, client_id, fields, result.get("fingerprint"), exclude=("upload", str(job["id"]))
+        )
+        index_upload(conn, client_id, job["id"], fields, result.get("fingerprint"))
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    return result
+
+
+# kind: (agent, action, handler(path) -> JSON-serialisable result, handler version for the cache,
+#        complete(conn, job, result) -> result or None); handlers run in the process pool
+HANDLERS = {
+    "invoice": ("ARIA", "factuur_analyse", extract_invoice_file, ENGINE_VERSION, _complete_invoice),
+}
+
+PENDING_STATUSES = ("queued", "running")
+
+UPLOAD_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png"}
+MAX_FILE_BYTES = 25 * 1024 * 1024
+
+_pool = None
+_processes = None
+_pool_lock = threading.Lock()
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _resume(pool):
+    """Adopt files of the former upload directory, rerun the jobs left behind, then collect garbage"""
+    try:
+        conn, store = get_connection(), BlobStore()
+        adopt_uploads(conn, store)
+        # Jobs submitted meanwhile may be listed too; a job that is already claimed is skipped
+        for (job_id,) in conn.execute("SELECT id FROM ingest_jobs WHERE status = 'queued' ORDER BY id").fetchall():
+            pool.submit(run_job, job_id)
+        collect_garbage(conn, store)
+    except Exception:
+        log.exception("Resuming the job queue failed")
+
+
+def executor():
+    """The shared worker pool; starting it requeues the work a previous server left behind
+
+    Resuming walks the upload and document directories, so it runs on the pool as
+    well instead of holding up the upload that started it.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="nova-job")
+            conn = get_connection()
+            with conn:
+                conn.execute("UPDATE ingest_jobs SET status = 'queued', started = NULL WHERE status = 'running'")
+            pool.submit(_resume, pool)
+            _pool = pool
+        return _pool
+
+
+def _process_pool():
+    global _processes
+    with _pool_lock:
+        if _processes is None:
+            # spawn: forking the multi-threaded server process is not safe
+            _processes = ProcessPoolExecutor(max_workers=JOB_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _processes
+
+
+def _discard_process_pool(processes):
+    """Shut a broken pool down and let the next job start a fresh one (once, whichever job notices first)"""
+    global _processes
+    with _pool_lock:
+        if _processes is processes:
+            _processes = None
+    processes.shutdown(wait=False, cancel_futures=True)
+
+
+def _entries(files):
+    """(name, file object or error) per uploaded file, with ZIP archives expanded"""
+    for upload in files:
+        if not upload.name.lower().endswith(".zip"):
+            yield upload.name, upload
+            continue
+        try:
+            archive = zipfile.ZipFile(upload)
+        except zipfile.BadZipFile:
+            yield upload.name, ValueError("geen geldig ZIP-archief")
+            continue
+        with archive:
+            for info in archive.infolist():
+                name = info.filename.rsplit("/", 1)[-1]
+                # Folders and the metadata macOS adds to archives
+                if info.is_dir() or not name or name.startswith(".") or info.filename.startswith("__MACOSX/"):
+                    continue
+                with archive.open(info) as stream:
+                    yield name, stream
+
+
+def submit(client_id, kind, files):
+    """Store uploaded files and queue the new ones for the handler of ``kind``; returns the batch id"""
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    pool = executor()
+    conn = get_connection()
+    store = BlobStore()
+    batch, seen, rows, sizes = uuid.uuid4().hex, {}, [], {}
+    # Files go to disk before the transaction, so other writers are not held up by the copying
+    for name, stream in _entries(files):
+        path = digest = None
+        suffix = Path(name).suffix.lower()
+        if isinstance(stream, Exception):
+            status, error = "failed", str(stream)
+        elif suffix not in UPLOAD_EXTENSIONS:
+            status, error = "failed", "bestandstype niet ondersteund"
+        else:
+            try:
+                digest, size = store.put(stream, MAX_FILE_BYTES)
+                path, sizes[digest] = store.path(digest), size
+            except (OSError, ValueError, zipfile.BadZipFile) as exc:
+                status, error = "failed", str(exc)
+            else:
+                earlier = seen.get(digest)
+                if earlier is None:
+                    row = conn.execute(
+                        "SELECT filename FROM ingest_jobs WHERE client_id = ? AND sha256 = ? "
+                        "AND status NOT IN ('failed', 'duplicate') LIMIT 1",
+                        (client_id, digest),
+                    ).fetchone()
+                    earlier = row[0] if row else None
+                if earlier is None:
+                    status, error, seen[digest] = "queued", None, name
+                else:
+                    status, error = "duplicate", f"zelfde inhoud als {earlier}"
+        rows.append((client_id, kind, batch, name, str(path) if path else None, digest, status, error, _now()))
+    queued = []
+    with conn:
+        for digest, size in sizes.items():
+            register(conn, digest, size)
+        for row in rows:
+            job_id = conn.execute(
+                "INSERT INTO ingest_jobs (client_id, kind, batch, filename, path, sha256, status, error, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            ).lastrowid
+            if row[6] == "queued":
+                queued.append(job_id)
+    for job_id in queued:
+        pool.submit(run_job, job_id)
+    return batch
+
+
+def _cached(conn, digest, version):
+    row = conn.execute(
+        "SELECT result FROM extraction_cache WHERE sha256 = ? AND engine = ?", (digest, version)
+    ).fetchone() if digest else None
+    return json.loads(row[0]) if row else None
+
+
+def _store_cached(conn, digest, version, result):
+    if digest:
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO extraction_cache (sha256, engine, result, created) VALUES (?, ?, ?, ?)",
+                (digest, version, json.dumps(result), _now()),
+            )
+
+
+def _run_isolated(handler, path):
+    """Run a handler in a process of its own, so a crash can only be this file's"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as processes:
+        return processes.submit(handler, path).result()
+
+
+def run_job(job_id, isolated=False):
+    """Claim and process one job on the calling (worker) thread; a job claimed elsewhere is skipped
+
+    ``isolated`` runs the handler in a process of its own; that is how a job caught in a
+    crash of the shared pool is retried.
+    """
+    conn = get_connection()
+    with conn:
+        claimed = conn.execute(
+            "UPDATE ingest_jobs SET status = 'running', started = ? WHERE id = ? AND status = 'queued'",
+            (_now(), job_id),
+        ).rowcount
+    if not claimed:
+        return
+    job = conn.execute("SELECT id, client_id, kind, path, sha256 FROM ingest_jobs WHERE id = ?", (job_id,)).fetchone()
+    agent, action, handler, version, complete = HANDLERS[job["kind"]]
+    try:
+        if not job["path"]:
+            raise FileNotFoundError("bestand ontbreekt")
+        with track(agent, action):
+            result = _cached(conn, job["sha256"], version)
+            if result is None:
+                if isolated:
+                    result = _run_isolated(handler, job["path"])
+                else:
+                    processes = _process_pool()
+                    result = processes.submit(handler, job["path"]).result()
+                _store_cached(conn, job["sha256"], version, result)
+        if complete:
+            result = complete(conn, job, result)
+    except (BrokenProcessPool, CancelledError):
+        # A worker process died (e.g. out of memory). Every job in flight on the shared pool
+        # ends up here, not just the one that crashed it, so each gets one isolated retry;
+        # jobs still waiting for a process were cancelled when the broken pool was shut down
+        if not isolated:
+            _discard_process_pool(processes)
+            with conn:
+                conn.execute("UPDATE ingest_jobs SET status = 'queued', started = NULL WHERE id = ?", (job_id,))
+            executor().submit(run_job, job_id, True)
+            return
+        status, result, error = "failed", None, "analyseproces afgebroken"
+    except Exception as exc:
+        status, result, error = "failed", None, str(exc) or type(exc).__name__
+    else:
+        status, result, error = "done", json.dumps(result), None
+    with conn:
+        conn.execute(
+            "UPDATE ingest_jobs SET status = ?, result = ?, error = ?, finished = ? WHERE id = ?",
+            (status, result, error, _now(), job_id),
+        )
@@ -0,0 +1,149 @@
+"""Three-way matching of purchase invoice lines against PO lines and goods receipts (ARIA)
+
+A whole batch (a client's month, or everything) is matched at once with pandas
+hash joins instead of per-invoice lookups:
+
+- every invoice line is joined to its PO line on supplier, PO number and PO line
+  number; a line without a PO line number is linked by product name within the PO;
+- received quantities are summed per PO line and joined on PO number and line;
+- a running total of the invoiced quantity per PO line, in invoice date order,
+  catches a PO line that is billed twice over several invoices.
+
+A line is an exception when it has no PO, the PO or PO line is not found, the PO
+belongs to another supplier, the unit price is outside ``price_tolerance`` or more
+is invoiced than ordered. It is a partial match when it is fine except that the
+goods are not (fully) received yet; otherwise it matches. An invoice gets the
+worst status of its lines. Supplier names and PO numbers are compared on the
+keys of ``nova.identifiers``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from nova.identifiers import invoice_number_key, supplier_key
+
+PRICE_TOLERANCE = 0.02     # relative deviation of the unit price from the PO
+QUANTITY_TOLERANCE = 0.0   # relative over-billing allowed on ordered and received quantities
+CENT = 0.005
+
+STATUSES = ("match", "partial", "exception")
+STATUS_LABELS = {"match": "Gematcht", "partial": "Gedeeltelijk", "exception": "Uitzondering"}
+# Line findings in order of precedence; a line reports the first that applies
+REASONS = (
+    "geen inkooporder",
+    "inkooporder onbekend",
+    "inkooporder van andere leverancier",
+    "regel niet op inkooporder",
+    "prijs wijkt af",
+    "meer gefactureerd dan besteld",
+    "nog niet ontvangen",
+    "meer gefactureerd dan ontvangen",
+)
+
+INVOICE_LINE_COLUMNS = ["invoice_id", "line", "supplier", "po_id", "po_line", "product", "quantity", "unit_price",
+                        "date", "period"]
+PO_LINE_COLUMNS = ["po_id", "line", "supplier", "product", "quantity", "unit_price"]
+RECEIPT_COLUMNS = ["po_id", "po_line", "quantity"]
+
+
+def _product_key(name):
+    return " ".join(name.lower().split()) or None
+
+
+def _codes(columns, function):
+    """Shared integer codes of ``function(value)`` for several columns; -1 where there is no key
+
+    The key function runs once per distinct value and the joins compare integers.
+    """
+    value_codes, values = pd.factorize(pd.concat(columns, ignore_index=True).astype(object))
+    keys = {}
+    lookup = []
+    for value in values:
+        key = function(value)
+        lookup.append(-1 if key is None else keys.setdefault(key, len(keys)))
+    codes = np.append(np.asarray(lookup, dtype=np.int64), -1)[value_codes]
+    return np.split(codes, np.cumsum([len(column) for column in columns])[:-1])
+
+
+def match_lines(invoice_lines, po_lines, receipts, price_tolerance=PRICE_TOLERANCE,
+                quantity_tolerance=QUANTITY_TOLERANCE):
+    """Match invoice lines against PO lines and receipts; returns (lines, invoices) DataFrames
+
+    Inputs are row sequences (or DataFrames) with the ``*_COLUMNS`` fields.
+    Receipts may be one row per delivery or already summed per PO line.
+    """
+    inv = pd.DataFrame(invoice_lines, columns=INVOICE_LINE_COLUMNS)
+    po = pd.DataFrame(po_lines, columns=PO_LINE_COLUMNS)
+    rec = pd.DataFrame(receipts, columns=RECEIPT_COLUMNS)
+    inv["supplier_key"], po["supplier_key"] = _codes([inv["supplier"], po["supplier"]], supplier_key)
+    inv["po_key"], po["po_key"], rec["po_key"] = _codes([inv["po_id"], po["po_id"], rec["po_id"]], invoice_number_key)
+    inv["product_key"], po["product_key"] = _codes([inv["product"], po["product"]], _product_key)
+    for frame, columns in ((inv, ["po_line", "quantity", "unit_price"]), (po, ["line", "quantity", "unit_price"]),
+                           (rec, ["po_line", "quantity"])):
+        frame[columns] = frame[columns].astype(float)
+
+    # Lines without a PO line number: the PO line with the same product
+    by_product = (po[po["product_key"] >= 0].drop_duplicates(["po_key", "product_key"])
+                  [["po_key", "product_key", "line"]].rename(columns={"line": "product_line"}))
+    inv = inv.merge(by_product, on=["po_key", "product_key"], how="left")
+    inv["po_line"] = inv["po_line"].fillna(inv["product_line"])
+
+    ordered = po.rename(columns={"line": "po_line", "quantity": "ordered", "unit_price": "po_price"})
+    lines = inv.merge(ordered[["supplier_key", "po_key", "po_line", "ordered", "po_price"]],
+                      on=["supplier_key", "po_key", "po_line"], how="left", indicator="found")
+    received = rec.groupby(["po_key", "po_line"], as_index=False)["quantity"].sum()
+    lines = lines.merge(received.rename(columns={"quantity": "received"}), on=["po_key", "po_line"], how="left")
+    lines["received"] = lines["received"].fillna(0.0)
+    lines["invoiced_to_date"] = (lines.sort_values(["date", "invoice_id", "line"])
+                                 .groupby(["po_key", "po_line"])["quantity"].cumsum())
+
+    po_suppliers = po.drop_duplicates("po_key").set_index("po_key")["supplier_key"]
+    supplier, po_key = lines["supplier_key"].to_numpy(), lines["po_key"].to_numpy()
+    found = (lines["found"] == "both").to_numpy() & (supplier >= 0)
+    no_po = po_key < 0
+    unknown_po = ~no_po & ~np.isin(po_key, po_suppliers.index.to_numpy())
+    other_supplier = ~no_po & ~unknown_po & (lines["po_key"].map(po_suppliers).to_numpy() != supplier)
+    unknown_line = ~found & ~no_po & ~unknown_po & ~other_supplier
+
+    price, po_price = lines["unit_price"].to_numpy(), lines["po_price"].to_numpy()
+    billed, received = lines["invoiced_to_date"].to_numpy(), lines["received"].to_numpy()
+    quantity_margin = 1 + quantity_tolerance
+    with np.errstate(invalid="ignore", divide="ignore"):
+        price_off = found & (np.abs(price - po_price) > price_tolerance * np.abs(po_price) + CENT)
+        over_ordered = found & (billed > lines["ordered"].to_numpy() * quantity_margin + 1e-9)
+        not_received = found & (received <= 0)
+        short = found & ~not_received & (billed > received * quantity_margin + 1e-9)
+        lines["price_deviation"] = np.where(found & (po_price != 0), price / po_price - 1, np.nan)
+
+    findings = [no_po, unknown_po, other_supplier, unknown_line, price_off, over_ordered, not_received, short]
+    exception = no_po | unknown_po | other_supplier | unknown_line | price_off | over_ordered
+    lines["status"] = np.select([exception, not_received | short], ["exception", "partial"], "match")
+    reason_codes = np.select(findings, range(1, len(REASONS) + 1), 0)
+    lines["reason"] = np.asarray(("", *REASONS), dtype=object)[reason_codes]
+    lines["amount"] = lines["quantity"] * lines["unit_price"]
+    lines = lines.drop(columns=["found", "product_line", "supplier_key", "po_key", "product_key"])
+    return lines, _per_invoice(lines, reason_codes)
+
+
+def _per_invoice(lines, reason_codes):
+    """One row per invoice: line count, amount, worst line status and the distinct reasons"""
+    rank = lines["status"].map({status: i for i, status in enumerate(STATUSES)})
+    invoices = (lines.assign(rank=rank).groupby("invoice_id", sort=False)
+                .agg(supplier=("supplier", "first"), po_id=("po_id", "first"), date=("date", "first"),
+                     period=("period", "first"), lines=("line", "size"), amount=("amount", "sum"),
+                     rank=("rank", "max")))
+    invoices["status"] = np.asarray(STATUSES, dtype=object)[invoices.pop("rank").to_numpy(dtype=int)]
+    # Distinct reasons per invoice as a bit set, spelled out once per distinct set
+    flagged = pd.DataFrame({"invoice_id": lines["invoice_id"].to_numpy(), "bit": 1 << reason_codes})
+    bits = flagged[reason_codes > 0].drop_duplicates().groupby("invoice_id")["bit"].sum()
+    texts = {mask: ", ".join(text for i, text in enumerate(REASONS, start=1) if mask >> i & 1)
+             for mask in bits.unique()}
+    invoices["reasons"] = bits.map(texts)
+    invoices["reasons"] = invoices["reasons"].fillna("")
+    return invoices.reset_index()
+
+
+def status_counts(invoices):
+    """Number of invoices per status, every status present"""
+    counts = invoices["status"].value_counts()
+    return {status: int(counts.get(status, 0)) for status in STATUSES}
@@ -0,0 +1,165 @@
+"""In-process telemetry of agent actions: rolling counters and latency histograms
+
+Every agent action is recorded with ``track()`` (or ``record()``) under the agent
+name from ``AI_AGENTS``. Per agent the store keeps three ring buffers: 60 one-second
+slots (last minute), 60 one-minute slots (last hour) and 24 one-hour slots (last
+day). A slot holds the number of actions, the errors, the summed processing time
+and a latency histogram with logarithmic buckets, so recording is O(1) and a
+percentile over a window merges at most 60 small histograms. Slots that fall
+out of their window are reused, so memory stays constant.
+
+The store lives in the Streamlit server process and starts empty on a restart.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# Latency buckets: 10 per decade from 1 ms; the last bucket also holds everything slower
+BUCKET_BASE = 0.001
+BUCKETS_PER_DECADE = 10
+BUCKETS = 60
+
+# name: (number of slots, slot width in seconds)
+WINDOWS = {
+    "minute": (60, 1),
+    "hour": (60, 60),
+    "day": (24, 3600),
+}
+
+
+def bucket_index(seconds):
+    if seconds <= BUCKET_BASE:
+        return 0
+    return min(BUCKETS - 1, math.ceil(math.log10(seconds / BUCKET_BASE) * BUCKETS_PER_DECADE))
+
+
+def bucket_upper(index):
+    """Upper bound in seconds of a latency bucket"""
+    return BUCKET_BASE * 10 ** (index / BUCKETS_PER_DECADE)
+
+
+class _Slot:
+    __slots__ = ("epoch", "count", "errors", "busy", "histogram")
+
+    def __init__(self, epoch):
+        self.epoch = epoch
+        self.count = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.histogram = [0] * BUCKETS
+
+
+class _Ring:
+    """Fixed number of time slots; a slot is reset when its time comes round again"""
+
+    def __init__(self, slots, width):
+        self.width = width
+        self.slots = [None] * slots
+
+    def add(self, now, seconds, ok, bucket):
+        epoch = int(now // self.width)
+        index = epoch % len(self.slots)
+        slot = self.slots[index]
+        if slot is None or slot.epoch != epoch:
+            slot = self.slots[index] = _Slot(epoch)
+        slot.count += 1
+        slot.errors += not ok
+        slot.busy += seconds
+        slot.histogram[bucket] += 1
+
+    def live(self, now):
+        epoch = int(now // self.width)
+        return [s for s in self.slots if s is not None and epoch - s.epoch < len(self.slots)]
+
+
+def percentile(histogram, fraction):
+    """Upper bound of the bucket holding the given fraction of the samples, or None without samples"""
+    total = sum(histogram)
+    if not total:
+        return None
+    rank = math.ceil(fraction * total)
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if seen >= rank:
+            return bucket_upper(index)
+    return bucket_upper(BUCKETS - 1)
+
+
+class MetricsStore:
+    """Thread-safe rolling metrics per agent"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._agents = {}
+        self._actions = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent, action, seconds, ok=True):
+        now = self.clock()
+        bucket = bucket_index(seconds)
+        with self._lock:
+            rings = self._agents.get(agent)
+            if rings is None:
+                rings = self._agents[agent] = {name: _Ring(*spec) for name, spec in WINDOWS.items()}
+            for ring in rings.values():
+                ring.add(now, seconds, ok, bucket)
+            key = (agent, action)
+            self._actions[key] = self._actions.get(key, 0) + 1
+
+    def summary(self, agent, window="hour"):
+        """Counts, error rate, throughput, busy share and p50/p95/p99 latency (seconds) over a window"""
+        slots_count, width = WINDOWS[window]
+        span = slots_count * width
+        histogram = [0] * BUCKETS
+        count = errors = 0
+        busy = 0.0
+        with self._lock:
+            rings = self._agents.get(agent)
+            for slot in rings[window].live(self.clock()) if rings else []:
+                count += slot.count
+                errors += slot.errors
+                busy += slot.busy
+                histogram = [a + b for a, b in zip(histogram, slot.histogram)]
+        return {
+            "count": count,
+            "errors": errors,
+            "error_rate": errors / count if count else 0.0,
+            "per_minute": count / (span / 60),
+            # Share of the window the agent was busy; near or above 1 it is a bottleneck
+            "busy": busy / span,
+            "p50": percentile(histogram, 0.50),
+            "p95": percentile(histogram, 0.95),
+            "p99": percentile(histogram, 0.99),
+        }
+
+    def actions(self):
+        """Total number of recorded actions per (agent, action) since start"""
+        with self._lock:
+            return dict(self._actions)
+
+    def reset(self):
+        with self._lock:
+            self._agents.clear()
+            self._actions.clear()
+
+
+metrics = MetricsStore()
+
+
+def record(agent, action, seconds, ok=True):
+    metrics.record(agent, action, seconds, ok)
+
+
+@contextmanager
+def track(agent, action):
+    """Record the duration of the block as one action; an exception counts as an error and is re-raised"""
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        metrics.record(agent, action, time.perf_counter() - started, ok)
@@ -0,0 +1,4 @@
+"""Odoo integration: JSON-RPC client, sync engine and a local stand-in server"""
+
+from nova.odoo.client import OdooClient, OdooError, get_client, settings_from_env
+from nova.odoo.sync import SYNC_MODELS, SyncEngine
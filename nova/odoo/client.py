@@ -0,0 +1,161 @@
+"""Odoo JSON-RPC client with a pooled, persistent HTTP session"""
+
+import itertools
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_PAGE_SIZE = 2000
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT = 60
+
+
+class OdooError(Exception):
+    """Raised when Odoo answers a call with a JSON-RPC error"""
+
+
+class OdooClient:
+    """Thin JSON-RPC wrapper around Odoo's external API"""
+
+    def __init__(self, url, database, username, api_key, pool_size=DEFAULT_POOL_SIZE,
+                 page_size=DEFAULT_PAGE_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.url = url.rstrip("/")
+        self.database = database
+        self.username = username
+        self.api_key = api_key
+        self.page_size = page_size
+        self.timeout = timeout
+        self._uid = None
+        self._uid_lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        # One keep-alive pool shared by every thread that uses this client
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def call(self, service, method, *args):
+        """Perform one JSON-RPC call and return its result"""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": list(args)},
+            "id": next(self._ids),
+        }
+        response = self.session.post(f"{self.url}/jsonrpc", json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        if body.get("error"):
+            error = body["error"]
+            message = (error.get("data") or {}).get("message") or error.get("message", "Unknown Odoo error")
+            raise OdooError(message)
+        return body.get("result")
+
+    @property
+    def uid(self):
+        """User id, authenticated lazily on first use"""
+        if self._uid is None:
+            with self._uid_lock:
+                if self._uid is None:
+                    uid = self.call("common", "login", self.database, self.username, self.api_key)
+                    if not uid:
+                        raise OdooError(f"Login failed for {self.username} on {self.database}")
+                    self._uid = uid
+        return self._uid
+
+    def execute_kw(self, model, method, args=None, kwargs=None):
+        return self.call("object", "execute_kw", self.database, self.uid, self.api_key,
+                         model, method, args or [], kwargs or {})
+
+    def search_count(self, model, domain=None, context=None):
+        return self.execute_kw(model, "search_count", [domain or []], {"context": context or {}})
+
+    def search(self, model, domain=None, context=None):
+        """Ids of all matching records"""
+        return self.execute_kw(model, "search", [domain or []], {"context": context or {}})
+
+    def search_read(self, model, domain=None, fields=None, limit=None, order="id asc", context=None):
+        kwargs = {"fields": fields or [], "order": order, "context": context or {}}
+        if limit:
+            kwargs["limit"] = limit
+        return self.execute_kw(model, "search_read", [domain or []], kwargs)
+
+    def iter_pages(self, model, domain=None, fields=None, page_size=None):
+        """Yield all matching records page by page
+
+        Pages are keyed on the record id instead of an OFFSET, so every page
+        costs Odoo the same index lookup no matter how deep into the model we are.
+        """
+        page_size = page_size or self.page_size
+        last_id = 0
+        while True:
+            page = self.search_read(model, list(domain or []) + [("id", ">", last_id)], fields, limit=page_size)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
+    def iter_changes(self, model, since=None, fields=None, page_size=None, context=None):
+        """Yield records changed after the ``(write_date, id)`` cursor ``since``, oldest first
+
+        Paging on the same (write_date, id) order means a record edited while we
+        page moves behind the cursor and is picked up later in the same pass.
+        """
+        page_size = page_size or self.page_size
+        cursor = since
+        while True:
+            domain = []
+            if cursor:
+                write_date, last_id = cursor
+                domain = ["|", ("write_date", ">", write_date),
+                          "&", ("write_date", "=", write_date), ("id", ">", last_id)]
+            page = self.search_read(model, domain, fields, limit=page_size, order="write_date asc, id asc",
+                                    context=context)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            cursor = (page[-1]["write_date"], page[-1]["id"])
+
+
+# ============================================
+# CLIENT POOL
+# ============================================
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(url, database, username, api_key, **options):
+    """Return a shared client so the HTTP pool survives Streamlit reruns"""
+    key = (url, database, username)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.api_key != api_key:
+            client = OdooClient(url, database, username, api_key, **options)
+            _clients[key] = client
+        return client
+
+
+def settings_from_env():
+    """Fallback connection settings from NOVA_ODOO_* environment variables"""
+    url = os.environ.get("NOVA_ODOO_URL")
+    if not url:
+        return None
+    return {
+        "url": url,
+        "database": os.environ.get("NOVA_ODOO_DB", ""),
+        "username": os.environ.get("NOVA_ODOO_USER", ""),
+        "api_key": os.environ.get("NOVA_ODOO_API_KEY", ""),
+    }
@@ -0,0 +1,217 @@
+"""Local stand-in for an Odoo server, speaking just enough JSON-RPC for the sync engine
+
+Run it with ``python -m nova.odoo.fake_server --port 8069 --records 5000`` and point
+NOVA_ODOO_URL at it, or start it in-process with ``FakeOdooServer(...).start()``.
+"""
+
+import argparse
+import json
+import random
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nova.odoo.sync import SYNC_MODELS
+
+FAKE_UID = 2
+
+_OPERATORS = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+}
+
+
+def _parse(domain, i):
+    """Compile the prefix-notation domain term starting at ``i``"""
+    term = domain[i]
+    if term == "!":
+        inner, j = _parse(domain, i + 1)
+        return (lambda r: not inner(r)), j
+    if term in ("&", "|"):
+        left, j = _parse(domain, i + 1)
+        right, k = _parse(domain, j)
+        if term == "&":
+            return (lambda r: left(r) and right(r)), k
+        return (lambda r: left(r) or right(r)), k
+    field, op, value = term
+    return (lambda r: _OPERATORS[op](r.get(field), value)), i + 1
+
+
+def compile_domain(domain):
+    """Predicate for an Odoo domain; top-level terms are implicitly AND-ed"""
+    predicates, i = [], 0
+    while i < len(domain):
+        predicate, i = _parse(domain, i)
+        predicates.append(predicate)
+    return lambda record: all(p(record) for p in predicates)
+
+
+def demo_records(count=1000, seed=42):
+    """Generate ``count`` records for every synced model"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    partners = [[i, f"Relatie {i}"] for i in range(1, 201)]
+    records = {}
+    for model in SYNC_MODELS:
+        rows = []
+        for i in range(1, count + 1):
+            stamp = (base + timedelta(minutes=rng.randint(0, 525600))).strftime("%Y-%m-%d %H:%M:%S")
+            row = {"id": i, "name": f"{model.split('.')[-1].upper()}/{i:06d}", "write_date": stamp,
+                   "partner_id": rng.choice(partners)}
+            if SYNC_MODELS[model].get("archivable"):
+                row["active"] = True
+            if model == "account.move":
+                untaxed = round(rng.uniform(50, 25000), 2)
+                row.update(move_type=rng.choice(["out_invoice", "in_invoice", "entry"]), amount_untaxed=untaxed,
+                           amount_tax=round(untaxed * 0.21, 2), amount_total=round(untaxed * 1.21, 2),
+                           state=rng.choice(["draft", "posted"]), payment_state=rng.choice(["paid", "not_paid"]))
+            elif model == "crm.lead":
+                row.update(expected_revenue=rng.randint(5000, 500000), probability=rng.randint(5, 100))
+            elif model == "purchase.order":
+                row.update(amount_total=round(rng.uniform(100, 50000), 2), state=rng.choice(["draft", "purchase"]))
+            rows.append(row)
+        records[model] = rows
+    return records
+
+
+class FakeOdooServer:
+    """Threaded HTTP server answering /jsonrpc from in-memory records"""
+
+    def __init__(self, records=None, host="127.0.0.1", port=0, database="nova", username="admin",
+                 api_key="admin"):
+        self.records = records if records is not None else demo_records()
+        self.database = database
+        self.username = username
+        self.api_key = api_key
+        self.calls = []
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def update_record(self, model, record_id, **values):
+        """Change a record the way Odoo would, bumping its write_date"""
+        with self._lock:
+            for record in self.records[model]:
+                if record["id"] == record_id:
+                    record.update(values, write_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                    return record
+        raise KeyError(record_id)
+
+    def delete_record(self, model, record_id):
+        """Hard-delete a record; only an id reconciliation can notice this"""
+        with self._lock:
+            self.records[model] = [r for r in self.records[model] if r["id"] != record_id]
+
+    def dispatch(self, service, method, args):
+        with self._lock:
+            self.calls.append((service, method, args[3] if service == "object" else None))
+        if service == "common" and method in ("login", "authenticate"):
+            database, username, api_key = args[:3]
+            ok = (database, username, api_key) == (self.database, self.username, self.api_key)
+            return FAKE_UID if ok else False
+        if service == "object" and method == "execute_kw":
+            database, uid, api_key, model, model_method = args[:5]
+            if uid != FAKE_UID or api_key != self.api_key:
+                raise PermissionError("Access denied")
+            params = args[5] if len(args) > 5 else []
+            kwargs = args[6] if len(args) > 6 else {}
+            return self.execute(model, model_method, params, kwargs)
+        raise ValueError(f"Unsupported call {service}.{method}")
+
+    def execute(self, model, method, params, kwargs):
+        rows = self.records.get(model)
+        if rows is None:
+            raise ValueError(f"Object {model} doesn't exist")
+        domain = params[0] if params else kwargs.get("domain", [])
+        predicate = compile_domain(domain)
+        active_test = (kwargs.get("context") or {}).get("active_test", True)
+        matched = [r for r in rows if (not active_test or r.get("active", True)) and predicate(r)]
+        if method == "search_count":
+            return len(matched)
+        if method not in ("search_read", "search"):
+            raise ValueError(f"Method {method} is not supported")
+        # Stable sorts from the last key to the first give a multi-column ORDER BY
+        for clause in reversed((kwargs.get("order") or "id asc").split(",")):
+            parts = clause.split()
+            matched.sort(key=lambda r: r.get(parts[0]) or 0, reverse=len(parts) > 1 and parts[1].lower() == "desc")
+        offset = kwargs.get("offset", 0)
+        limit = kwargs.get("limit")
+        matched = matched[offset:offset + limit if limit else None]
+        if method == "search":
+            return [r["id"] for r in matched]
+        fields = kwargs.get("fields")
+        if fields:
+            return [{"id": r["id"], **{f: r.get(f, False) for f in fields}} for r in matched]
+        return matched
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like a real Odoo behind a proxy
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                params = body.get("params", {})
+                try:
+                    reply = {"result": server.dispatch(params.get("service"), params.get("method"),
+                                                       params.get("args", []))}
+                except Exception as exc:
+                    reply = {"error": {"code": 200, "message": "Odoo Server Error",
+                                       "data": {"name": type(exc).__name__, "message": str(exc)}}}
+                payload = json.dumps({"jsonrpc": "2.0", "id": body.get("id"), **reply}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in Odoo JSON-RPC server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8069)
+    parser.add_argument("--records", type=int, default=1000, help="records per model")
+    args = parser.parse_args()
+    server = FakeOdooServer(demo_records(args.records), host=args.host, port=args.port)
+    print(f"Fake Odoo on {server.url} (db=nova, user=admin, key=admin)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
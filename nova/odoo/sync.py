@@ -0,0 +1,158 @@
+"""Concurrent pull of Odoo models into the NOVA database"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from nova.db import insert_rows
+
+# Models pulled from Odoo and the module name shown on the Odoo Boekhouding page
+SYNC_MODELS = {
+    "account.move": {
+        "module": "Grootboek",
+        "fields": ["name", "move_type", "partner_id", "invoice_date", "invoice_date_due", "amount_untaxed",
+                   "amount_tax", "amount_total", "amount_residual", "state", "payment_state", "write_date"],
+    },
+    "account.bank.statement": {
+        "module": "Bankrekeningen",
+        "fields": ["name", "date", "journal_id", "balance_start", "balance_end_real", "write_date"],
+    },
+    "crm.lead": {
+        "module": "CRM",
+        "fields": ["name", "partner_id", "stage_id", "expected_revenue", "probability", "date_deadline",
+                   "active", "write_date"],
+        "archivable": True,
+    },
+    "purchase.order": {
+        "module": "Inkooporders",
+        "fields": ["name", "partner_id", "amount_total", "state", "date_order", "write_date"],
+    },
+    "hr.employee": {
+        "module": "Salarisadministratie",
+        "fields": ["name", "job_title", "department_id", "work_email", "active", "write_date"],
+        "archivable": True,
+    },
+}
+
+DEFAULT_WORKERS = len(SYNC_MODELS)
+
+# How often the id reconciliation that detects hard deletes runs per model
+RECONCILE_INTERVAL = timedelta(hours=24)
+
+
+class SyncEngine:
+    """Fetch models in parallel over one pooled client and store them per client
+
+    Each model resumes from the (write_date, id) watermark stored in sync_state,
+    so a run only transfers records changed since the previous one. HTTP reads
+    run on a thread pool; all SQLite writes stay on the calling thread so the
+    engine can share the caller's connection.
+    """
+
+    def __init__(self, client, conn, max_workers=DEFAULT_WORKERS, reconcile_interval=RECONCILE_INTERVAL):
+        self.client = client
+        self.conn = conn
+        self.max_workers = max_workers
+        self.reconcile_interval = reconcile_interval
+
+    def state(self, client_id, model):
+        row = self.conn.execute(
+            "SELECT watermark, watermark_id, last_reconcile FROM sync_state WHERE client_id = ? AND model = ?",
+            (client_id, model),
+        ).fetchone()
+        return dict(row) if row else {"watermark": None, "watermark_id": None, "last_reconcile": None}
+
+    def fetch_model(self, model, since=None, reconcile=False):
+        """Read the records of one model changed after ``since``, plus all live ids when reconciling"""
+        spec = SYNC_MODELS[model]
+        # Archived records are only visible with active_test off; they come back as tombstones
+        context = {"active_test": False} if spec.get("archivable") else {}
+        records = []
+        for page in self.client.iter_changes(model, since=since, fields=spec["fields"], context=context):
+            records.extend(page)
+        live_ids = set(self.client.search(model, context=context)) if reconcile else None
+        return records, live_ids
+
+    def sync(self, client_id, models=None, full=False):
+        """Pull the given models (default: all) and return a result per model
+
+        ``full`` ignores the stored watermarks and re-reads everything.
+        """
+        models = list(models or SYNC_MODELS)
+        now = datetime.now()
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(models))) as pool:
+            started = {}
+            for model in models:
+                state = self.state(client_id, model)
+                since = None if full or not state["watermark"] else (state["watermark"], state["watermark_id"])
+                reconcile = full or since is None or state["last_reconcile"] is None or \
+                    now - datetime.fromisoformat(state["last_reconcile"]) >= self.reconcile_interval
+                future = pool.submit(self.fetch_model, model, since, reconcile)
+                started[future] = (model, since is not None, time.perf_counter())
+            for future in as_completed(started):
+                model, incremental, t0 = started[future]
+                try:
+                    records, live_ids = future.result()
+                except Exception as exc:
+                    results[model] = {"status": "error", "records": 0, "deleted": 0, "error": str(exc)}
+                else:
+                    deleted = self.store(client_id, model, records, live_ids, now)
+                    results[model] = {"status": "ok", "records": len(records), "deleted": deleted,
+                                      "incremental": incremental,
+                                      "seconds": round(time.perf_counter() - t0, 2)}
+                self.update_module(client_id, model, results[model])
+        return results
+
+    def store(self, client_id, model, records, live_ids, now):
+        """Upsert changed records, tombstone deleted ones and advance the watermark in one transaction"""
+        rows = [
+            {"client_id": client_id, "model": model, "odoo_id": r["id"], "write_date": r.get("write_date"),
+             "active": r.get("active", True) is not False, "deleted": 0, "data": json.dumps(r)}
+            for r in records
+        ]
+        deleted = 0
+        with self.conn:
+            insert_rows(self.conn, "odoo_records", rows, replace=True)
+            if live_ids is not None:
+                local_ids = [row[0] for row in self.conn.execute(
+                    "SELECT odoo_id FROM odoo_records WHERE client_id = ? AND model = ? AND deleted = 0",
+                    (client_id, model),
+                )]
+                gone = [(client_id, model, odoo_id) for odoo_id in local_ids if odoo_id not in live_ids]
+                self.conn.executemany(
+                    "UPDATE odoo_records SET deleted = 1 WHERE client_id = ? AND model = ? AND odoo_id = ?", gone
+                )
+                deleted = len(gone)
+            self.conn.execute(
+                "INSERT INTO sync_state (client_id, model, watermark, watermark_id, last_sync, last_reconcile) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (client_id, model) DO UPDATE SET "
+                "watermark = COALESCE(excluded.watermark, watermark), "
+                "watermark_id = COALESCE(excluded.watermark_id, watermark_id), "
+                "last_sync = excluded.last_sync, "
+                "last_reconcile = COALESCE(excluded.last_reconcile, last_reconcile)",
+                (client_id, model,
+                 records[-1].get("write_date") if records else None,
+                 records[-1]["id"] if records else None,
+                 now.isoformat(timespec="seconds"),
+                 now.isoformat(timespec="seconds") if live_ids is not None else None),
+            )
+        return deleted
+
+    def update_module(self, client_id, model, result):
+        module = SYNC_MODELS[model]["module"]
+        if result["status"] == "ok":
+            status = "ok"
+            records, deleted = (f"{result[key]:,}".replace(",", ".") for key in ("records", "deleted"))
+            details = f"{records} gewijzigd, {deleted} verwijderd"
+        else:
+            status, details = "error", f"Synchronisatie mislukt: {result['error']}"
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO sync_modules (client_id, naam, status, laatste_sync, details, items_pending, position) "
+                "VALUES (?, ?, ?, ?, ?, 0, (SELECT COALESCE(MAX(position), -1) + 1 FROM sync_modules WHERE client_id = ?)) "
+                "ON CONFLICT (client_id, naam) DO UPDATE SET status = excluded.status, "
+                "laatste_sync = excluded.laatste_sync, details = excluded.details, items_pending = 0",
+                (client_id, module, status, datetime.now().strftime("%d-%m-%Y %H:%M"), details, client_id),
+            )
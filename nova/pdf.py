@@ -0,0 +1,708 @@
+"""Positioned text from the text layer of PDF files, using only the standard library
+
+Covers what accounting packages and office software write for invoices: objects
+found by scanning the file (so broken cross references do not matter), object
+streams, Flate/ASCIIHex/ASCII85 compression, the page tree with inherited
+resources, form XObjects, simple fonts (standard encodings with Differences)
+and composite fonts through their ToUnicode CMap. Scanned pages have no text
+layer and come back empty; there is no OCR.
+
+``read_pages()`` returns per page the text lines from top to bottom; a line is a
+list of cells (runs of text separated by a wide gap) with their x-range and font
+size, which is what the layout heuristics of ``nova.extraction`` work on.
+"""
+
+import base64
+import binascii
+import math
+import re
+import zlib
+from collections import namedtuple
+
+Ref = namedtuple("Ref", "num gen")
+Cell = namedtuple("Cell", "x0 x1 text size")
+
+
+class PdfError(ValueError):
+    """Not a PDF or not readable; the (Dutch) message is shown with the failed upload"""
+
+
+class Name(str):
+    pass
+
+
+class Operator(str):
+    pass
+
+
+class Stream:
+    def __init__(self, attrs, raw):
+        self.attrs = attrs
+        self.raw = raw
+
+
+class Line:
+    def __init__(self, y, cells):
+        self.y = y
+        self.cells = cells
+        self.text = "  ".join(cell.text for cell in cells)
+
+
+class Page:
+    def __init__(self, width, height, lines):
+        self.width = width
+        self.height = height
+        self.lines = lines
+
+
+# ============================================
+# TOKENS AND OBJECTS
+# ============================================
+
+_TOKEN = re.compile(rb"""
+    (?P<space>[\x00\t\n\x0c\r ]+)
+  | (?P<comment>%[^\r\n]*)
+  | (?P<dict_open><<) | (?P<dict_close>>>)
+  | (?P<array_open>\[) | (?P<array_close>\])
+  | (?P<name>/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*)
+  | (?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?![^\x00\t\n\x0c\r ()<>\[\]{}/%]))
+  | (?P<hex><[0-9A-Fa-f\x00\t\n\x0c\r ]*>)
+  | (?P<string>\()
+  | (?P<keyword>[^\x00\t\n\x0c\r ()<>\[\]{}/%]+)
+  | (?P<other>.)
+""", re.X | re.S)
+
+_ESCAPES = {ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\f",
+            ord("("): b"(", ord(")"): b")", ord("\\"): b"\\"}
+_END_MARKER = object()
+_INLINE_IMAGE_END = re.compile(rb"[\x00\t\n\x0c\r ]EI(?=[\x00\t\n\x0c\r ]|$)")
+
+
+def _literal(data, pos):
+    """Literal string starting after its opening parenthesis; returns (bytes, position after it)"""
+    out, depth, i, size = bytearray(), 1, pos, len(data)
+    while i < size:
+        c = data[i]
+        if c == 0x5C:
+            i += 1
+            if i >= size:
+                break
+            c = data[i]
+            if c in _ESCAPES:
+                out += _ESCAPES[c]
+            elif 0x30 <= c <= 0x37:
+                digits = data[i:i + 3]
+                length = 1
+                while length < len(digits) and 0x30 <= digits[length] <= 0x37:
+                    length += 1
+                out.append(int(digits[:length], 8) & 0xFF)
+                i += length - 1
+            elif c == 0x0D:
+                if data[i + 1:i + 2] == b"\n":
+                    i += 1
+            elif c != 0x0A:
+                out.append(c)
+        elif c == 0x28:
+            depth += 1
+            out.append(c)
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+            out.append(c)
+        else:
+            out.append(c)
+        i += 1
+    return bytes(out), size
+
+
+def _name(raw):
+    return Name(re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes([int(m.group(1), 16)]), raw[1:]).decode("latin-1"))
+
+
+def tokens(data, pos=0):
+    """(value, end position) for every token; values are numbers, Name, bytes, Operator or structure markers"""
+    size = len(data)
+    while pos < size:
+        match = _TOKEN.match(data, pos)
+        kind, pos = match.lastgroup, match.end()
+        if kind in ("space", "comment"):
+            continue
+        if kind == "number":
+            raw = match.group()
+            yield (float(raw) if b"." in raw else int(raw)), pos
+        elif kind == "name":
+            yield _name(match.group()), pos
+        elif kind == "string":
+            value, pos = _literal(data, pos)
+            yield value, pos
+        elif kind == "hex":
+            digits = re.sub(rb"[^0-9A-Fa-f]", b"", match.group())
+            yield binascii.unhexlify(digits + b"0" * (len(digits) % 2)), pos
+        elif kind == "keyword":
+            word = match.group().decode("latin-1")
+            if word == "ID":
+                # Inline image data is binary; continue after its EI
+                end = _INLINE_IMAGE_END.search(data, pos)
+                pos = end.end() if end else size
+                yield Operator("EI"), pos
+            else:
+                yield Operator(word), pos
+        elif kind != "other":
+            yield kind, pos
+
+
+def _constant(word):
+    return {"true": True, "false": False, "null": None}.get(word, word)
+
+
+def parse_value(token_iter, stop=("endobj", "stream")):
+    """Parse one object from a token iterator; returns (value, terminating keyword or None, position)"""
+    stack, pos = [], 0
+    for token, pos in token_iter:
+        if token in ("dict_open", "array_open"):
+            stack.append((_END_MARKER, token))
+        elif token in ("dict_close", "array_close"):
+            items = []
+            while stack and not (isinstance(stack[-1], tuple) and stack[-1] and stack[-1][0] is _END_MARKER):
+                items.append(stack.pop())
+            if not stack:
+                raise PdfError("onvolledige structuur")
+            stack.pop()
+            items.reverse()
+            if token == "dict_close":
+                stack.append({items[i]: items[i + 1] for i in range(0, len(items) - 1, 2) if isinstance(items[i], Name)})
+            else:
+                stack.append(items)
+        elif isinstance(token, Operator):
+            if token == "R" and len(stack) >= 2 and isinstance(stack[-1], int) and isinstance(stack[-2], int):
+                gen, num = stack.pop(), stack.pop()
+                stack.append(Ref(num, gen))
+            elif token in stop:
+                return (stack[-1] if stack else None), str(token), pos
+            else:
+                stack.append(_constant(token))
+        else:
+            stack.append(token)
+        if len(stack) == 1 and not (isinstance(stack[0], tuple) and stack[0] and stack[0][0] is _END_MARKER) \
+                and stop == ():
+            return stack[0], None, pos
+    return (stack[-1] if stack else None), None, pos
+
+
+# ============================================
+# DOCUMENT
+# ============================================
+
+_OBJECT = re.compile(rb"(?<![0-9])(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+obj\b")
+_STREAM_START = re.compile(rb"\r?\n|\r")
+_ENCRYPT = re.compile(rb"/Encrypt[\x00\t\n\x0c\r ]+(?:\d+[\x00\t\n\x0c\r ]+\d+[\x00\t\n\x0c\r ]+R|<<)")
+_ROOT = re.compile(rb"/Root[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R")
+
+
+def _decode_filters(data, filters, parms):
+    if not isinstance(filters, list):
+        filters = [filters] if filters else []
+    if not isinstance(parms, list):
+        parms = [parms] * len(filters)
+    for name, parm in zip(filters, parms):
+        if name in ("FlateDecode", "Fl"):
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:
+                # Salvage what decompresses; some writers leave trailing garbage
+                data = zlib.decompressobj().decompress(data)
+            if isinstance(parm, dict) and parm.get("Predictor", 1) >= 10:
+                data = _png_unpredict(data, parm.get("Columns", 1) * parm.get("Colors", 1))
+        elif name in ("ASCIIHexDecode", "AHx"):
+            digits = re.sub(rb"[^0-9A-Fa-f]", b"", data.split(b">")[0])
+            data = binascii.unhexlify(digits + b"0" * (len(digits) % 2))
+        elif name in ("ASCII85Decode", "A85"):
+            data = data.strip()
+            if data.startswith(b"<~"):
+                data = data[2:]
+            data = base64.a85decode(data.split(b"~>")[0], adobe=False, ignorechars=b" \t\n\r\x0b\x0c")
+        else:
+            raise PdfError(f"compressie {name} niet ondersteund")
+    return data
+
+
+def _png_unpredict(data, columns):
+    rows, previous, out = [data[i:i + columns + 1] for i in range(0, len(data), columns + 1)], bytearray(columns), bytearray()
+    for row in rows:
+        kind, row = row[0], bytearray(row[1:].ljust(columns, b"\0"))
+        for i in range(columns):
+            left = row[i - 1] if i else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                corner = previous[i - 1] if i else 0
+                p = left + up - corner
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - corner)
+                row[i] = (row[i] + (left if pa <= pb and pa <= pc else up if pb <= pc else corner)) & 0xFF
+        out += row
+        previous = row
+    return bytes(out)
+
+
+class Document:
+    """Objects of a PDF file, parsed on first use"""
+
+    def __init__(self, data):
+        if b"%PDF" not in data[:1024]:
+            raise PdfError("geen PDF-bestand")
+        if _ENCRYPT.search(data):
+            # Strings and streams would need RC4/AES decryption
+            raise PdfError("beveiligd met wachtwoord of versleuteling")
+        self.data = data
+        self._offsets = {}
+        self._cache = {}
+        for match in _OBJECT.finditer(data):
+            # Later definitions win: incremental updates append new versions
+            self._offsets[int(match.group(1))] = match.end()
+        self._in_streams = {}
+        self._index_object_streams()
+
+    def _index_object_streams(self):
+        for num in list(self._offsets):
+            value = self.resolve(Ref(num, 0))
+            if isinstance(value, Stream) and value.attrs.get("Type") == "ObjStm":
+                try:
+                    data = self.stream_data(value)
+                except (PdfError, ValueError, zlib.error):
+                    continue
+                first, count = value.attrs.get("First"), value.attrs.get("N")
+                if not isinstance(first, int) or not isinstance(count, int):
+                    continue
+                header = [t for t, _ in tokens(data[:first])][:count * 2]
+                for i in range(0, len(header) - 1, 2):
+                    if isinstance(header[i], int) and isinstance(header[i + 1], int) and header[i] not in self._offsets:
+                        self._in_streams[header[i]] = (data, first + header[i + 1])
+
+    def resolve(self, value, expect=None):
+        """Follow references; missing objects, and objects that are not of the ``expect`` type, are None"""
+        seen = 0
+        while isinstance(value, Ref):
+            seen += 1
+            if seen > 32:
+                return None
+            value = self._object(value.num)
+        if expect is not None and not isinstance(value, expect):
+            return None
+        return value
+
+    def _object(self, num):
+        if num in self._cache:
+            return self._cache[num]
+        self._cache[num] = None
+        if num in self._offsets:
+            value = self._parse_at(self.data, self._offsets[num], allow_stream=True)
+        elif num in self._in_streams:
+            data, offset = self._in_streams[num]
+            value = self._parse_at(data, offset, allow_stream=False)
+        else:
+            value = None
+        self._cache[num] = value
+        return value
+
+    def _parse_at(self, data, offset, allow_stream):
+        try:
+            # Objects inside an object stream are not delimited, so stop after the first value
+            value, end_word, pos = parse_value(tokens(data, offset),
+                                               stop=("endobj", "stream", "obj") if allow_stream else ())
+        except (PdfError, ValueError, IndexError):
+            return None
+        if end_word == "stream" and isinstance(value, dict):
+            start = pos
+            newline = _STREAM_START.match(data, start)
+            if newline:
+                start = newline.end()
+            length = self.resolve(value.get("Length"), int)
+            end = start + length if isinstance(length, int) else -1
+            if end < start or not data[end:end + 32].lstrip().startswith(b"endstream"):
+                end = data.find(b"endstream", start)
+                end = len(data) if end < 0 else end
+                # Strip the end-of-line before endstream
+                if data[end - 2:end] == b"\r\n":
+                    end -= 2
+                elif data[end - 1:end] in (b"\n", b"\r"):
+                    end -= 1
+            return Stream(value, data[start:end])
+        return value
+
+    def stream_data(self, stream):
+        return _decode_filters(stream.raw, self.resolve(stream.attrs.get("Filter")),
+                               self.resolve(stream.attrs.get("DecodeParms")))
+
+    def catalog(self):
+        # The last trailer (or cross-reference stream) names the current root
+        for match in reversed(list(_ROOT.finditer(self.data))):
+            root = self.resolve(Ref(int(match.group(1)), int(match.group(2))), dict)
+            if root:
+                return root
+        for num in list(self._offsets) + list(self._in_streams):
+            value = self.resolve(Ref(num, 0))
+            if isinstance(value, dict) and value.get("Type") == "Catalog":
+                return value
+        raise PdfError("documentstructuur ontbreekt")
+
+    def pages(self):
+        """(page dictionary, inherited resources, media box) in document order"""
+        result, seen = [], set()
+
+        def walk(node, resources, box):
+            node = self.resolve(node, dict)
+            if node is None or id(node) in seen:
+                return
+            seen.add(id(node))
+            resources = self.resolve(node.get("Resources"), dict) or resources
+            box = self.resolve(node.get("MediaBox"), list) or box
+            if node.get("Type") == "Pages" or "Kids" in node:
+                for kid in self.resolve(node.get("Kids"), list) or []:
+                    walk(kid, resources, box)
+            else:
+                result.append((node, resources or {}, box))
+
+        walk(self.catalog().get("Pages"), {}, [0, 0, 612, 792])
+        return result
+
+
+# ============================================
+# FONTS
+# ============================================
+
+# Glyph names in Differences arrays that are not a single character
+GLYPH_NAMES = {
+    "space": " ", "exclam": "!", "quotedbl": '"', "numbersign": "#", "dollar": "$", "percent": "%",
+    "ampersand": "&", "quotesingle": "'", "quoteright": "’", "quoteleft": "‘", "parenleft": "(",
+    "parenright": ")", "asterisk": "*", "plus": "+", "comma": ",", "hyphen": "-", "minus": "-", "period": ".",
+    "slash": "/", "colon": ":", "semicolon": ";", "less": "<", "equal": "=", "greater": ">", "question": "?",
+    "at": "@", "bracketleft": "[", "backslash": "\\", "bracketright": "]", "underscore": "_", "bar": "|",
+    "braceleft": "{", "braceright": "}", "endash": "–", "emdash": "—", "bullet": "•", "Euro": "€", "euro": "€",
+    "eacute": "é", "egrave": "è", "euml": "ë", "ecircumflex": "ê", "iuml": "ï", "oacute": "ó", "ouml": "ö",
+    "uuml": "ü", "aacute": "á", "agrave": "à", "ccedilla": "ç", "degree": "°", "section": "§",
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "six": "6", "seven": "7",
+    "eight": "8", "nine": "9", "nbspace": " ", "quotedblleft": "“", "quotedblright": "”",
+}
+ENCODINGS = {"WinAnsiEncoding": "cp1252", "MacRomanEncoding": "mac_roman", "StandardEncoding": "latin-1",
+             "PDFDocEncoding": "latin-1"}
+
+
+def _glyph(name):
+    if name in GLYPH_NAMES:
+        return GLYPH_NAMES[name]
+    if len(name) == 1:
+        return name
+    match = re.fullmatch(r"uni([0-9A-Fa-f]{4})|u([0-9A-Fa-f]{4,6})", name)
+    if match:
+        return chr(int(match.group(1) or match.group(2), 16))
+    return ""
+
+
+def _utf16(raw):
+    return raw.decode("utf-16-be", "ignore") if len(raw) >= 2 else raw.decode("latin-1")
+
+
+def parse_cmap(data):
+    """(code byte lengths, {code bytes: text}) from a ToUnicode CMap"""
+    mapping, lengths = {}, set()
+    for block in re.findall(rb"begincodespacerange(.*?)endcodespacerange", data, re.S):
+        for low in re.findall(rb"<([0-9A-Fa-f]+)>\s*<[0-9A-Fa-f]+>", block):
+            lengths.add(len(low) // 2)
+    for block in re.findall(rb"beginbfchar(.*?)endbfchar", data, re.S):
+        for src, dst in re.findall(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>", block):
+            mapping[binascii.unhexlify(src)] = _utf16(binascii.unhexlify(dst))
+    for block in re.findall(rb"beginbfrange(.*?)endbfrange", data, re.S):
+        for low, high, dst in re.findall(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[[^\]]*\])", block):
+            size, start, stop = len(low) // 2, int(low, 16), int(high, 16)
+            if stop - start > 0xFFFF:
+                continue
+            if dst.startswith(b"["):
+                for offset, item in enumerate(re.findall(rb"<([0-9A-Fa-f]*)>", dst)):
+                    mapping[(start + offset).to_bytes(size, "big")] = _utf16(binascii.unhexlify(item))
+            else:
+                raw = binascii.unhexlify(dst[1:-1])
+                base = int.from_bytes(raw, "big") if raw else 0
+                for offset in range(stop - start + 1):
+                    mapping[(start + offset).to_bytes(size, "big")] = \
+                        _utf16((base + offset).to_bytes(max(len(raw), 2), "big"))
+    return lengths or {1}, mapping
+
+
+class Font:
+    """Maps the codes of a shown string to text and advance widths (in 1/1000 of the font size)"""
+
+    def __init__(self, doc, attrs):
+        attrs = attrs if isinstance(attrs, dict) else {}
+        self.composite = attrs.get("Subtype") == "Type0"
+        self.code_lengths, self.unicode = {2} if self.composite else {1}, {}
+        to_unicode = doc.resolve(attrs.get("ToUnicode"), Stream)
+        if to_unicode is not None:
+            try:
+                lengths, self.unicode = parse_cmap(doc.stream_data(to_unicode))
+                if self.composite:
+                    self.code_lengths = lengths
+            except (PdfError, ValueError, zlib.error):
+                pass
+        self.codec, self.differences = "cp1252", {}
+        encoding = doc.resolve(attrs.get("Encoding"))
+        if isinstance(encoding, dict):
+            self.codec = ENCODINGS.get(encoding.get("BaseEncoding"), self.codec)
+            code = 0
+            for item in doc.resolve(encoding.get("Differences"), list) or []:
+                if isinstance(item, int):
+                    code = item
+                elif isinstance(item, Name):
+                    self.differences[code] = _glyph(item)
+                    code += 1
+        elif isinstance(encoding, Name):
+            self.codec = ENCODINGS.get(encoding, self.codec)
+        self.widths, self.default_width = {}, 500
+        if self.composite:
+            descendant = doc.resolve((doc.resolve(attrs.get("DescendantFonts"), list) or [None])[0], dict) or {}
+            self.default_width = doc.resolve(descendant.get("DW"), (int, float)) or 1000
+            items, i = doc.resolve(descendant.get("W"), list) or [], 0
+            while i + 1 < len(items):
+                first, second = items[i], doc.resolve(items[i + 1])
+                if not isinstance(first, int):
+                    break
+                if isinstance(second, list):
+                    for offset, width in enumerate(second):
+                        self.widths[first + offset] = width
+                    i += 2
+                elif isinstance(second, int) and i + 2 < len(items):
+                    for code in range(first, min(second, first + 0xFFFF) + 1):
+                        self.widths[code] = items[i + 2]
+                    i += 3
+                else:
+                    break
+        else:
+            first = doc.resolve(attrs.get("FirstChar"), int) or 0
+            for offset, width in enumerate(doc.resolve(attrs.get("Widths"), list) or []):
+                self.widths[first + offset] = doc.resolve(width)
+
+    def decode(self, raw):
+        """[(text, width, is single-byte space)] per code"""
+        out, i, lengths = [], 0, sorted(self.code_lengths)
+        while i < len(raw):
+            for length in lengths:
+                code = raw[i:i + length]
+                if code in self.unicode or length == lengths[-1]:
+                    break
+            i += len(code)
+            number = int.from_bytes(code, "big")
+            if code in self.unicode:
+                text = self.unicode[code]
+            elif self.composite:
+                text = ""
+            elif number in self.differences:
+                text = self.differences[number]
+            else:
+                text = code.decode(self.codec, "replace")
+            width = self.widths.get(number, self.default_width)
+            out.append((text, width if isinstance(width, (int, float)) else self.default_width,
+                        len(code) == 1 and number == 32))
+        return out
+
+
+# ============================================
+# CONTENT STREAMS
+# ============================================
+
+IDENTITY = (1, 0, 0, 1, 0, 0)
+MAX_FORM_DEPTH = 8
+
+
+def _multiply(m1, m2):
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (a1 * a2 + b1 * c2, a1 * b2 + b1 * d2, c1 * a2 + d1 * c2, c1 * b2 + d1 * d2,
+            e1 * a2 + f1 * c2 + e2, e1 * b2 + f1 * d2 + f2)
+
+
+class _TextState:
+    def __init__(self):
+        self.ctm = IDENTITY
+        self.font = None
+        self.size = 0
+        self.char_spacing = 0
+        self.word_spacing = 0
+        self.scale = 1
+        self.leading = 0
+        self.rise = 0
+
+    def copy(self):
+        other = _TextState()
+        other.__dict__.update(self.__dict__)
+        return other
+
+
+def _runs(doc, content, resources, state, runs, depth=0):
+    """Append (x0, x1, y, size, text) per shown string of a content stream"""
+    fonts_attrs = doc.resolve(resources.get("Font"), dict) or {}
+    xobjects = doc.resolve(resources.get("XObject"), dict) or {}
+    fonts, stack, operands = {}, [], []
+    tm = tlm = IDENTITY
+
+    def show(raw):
+        nonlocal tm
+        font = state.font
+        if font is None or not isinstance(raw, bytes):
+            return
+        trm = _multiply(tm, state.ctm)
+        vertical = math.hypot(trm[2], trm[3]) or 1
+        size = abs(state.size) * vertical
+        x0, y = trm[4], trm[5] + state.rise * vertical
+        text, advance = [], 0.0
+        for chars, width, is_space in font.decode(raw):
+            text.append(chars)
+            advance += (width / 1000 * state.size + state.char_spacing + (state.word_spacing if is_space else 0)) \
+                * state.scale
+        tm = _multiply((1, 0, 0, 1, advance, 0), tm)
+        x1 = _multiply(tm, state.ctm)[4]
+        joined = "".join(text)
+        if joined.strip():
+            runs.append((min(x0, x1), max(x0, x1), y, size, joined))
+
+    def next_line(tx, ty):
+        nonlocal tm, tlm
+        tlm = _multiply((1, 0, 0, 1, tx, ty), tlm)
+        tm = tlm
+
+    for token, _ in tokens(content):
+        if not isinstance(token, Operator) or token in ("true", "false", "null"):
+            if token in ("dict_open", "dict_close", "array_open", "array_close"):
+                operands.append(token)
+            else:
+                operands.append(_constant(token) if isinstance(token, Operator) else token)
+            continue
+        args = operands
+        operands = []
+        if token == "TJ":
+            items = []
+            depth_marker = 0
+            for item in args:
+                if item == "array_open":
+                    depth_marker += 1
+                elif item == "array_close":
+                    depth_marker -= 1
+                elif depth_marker:
+                    items.append(item)
+            for item in items:
+                if isinstance(item, bytes):
+                    show(item)
+                elif isinstance(item, (int, float)):
+                    tm = _multiply((1, 0, 0, 1, -item / 1000 * state.size * state.scale, 0), tm)
+            continue
+        numbers = [a for a in args if isinstance(a, (int, float))]
+        try:
+            if token == "q":
+                stack.append(state.copy())
+            elif token == "Q":
+                if stack:
+                    state = stack.pop()
+            elif token == "cm" and len(numbers) == 6:
+                state.ctm = _multiply(tuple(numbers), state.ctm)
+            elif token == "BT":
+                tm = tlm = IDENTITY
+            elif token == "Tf" and args:
+                name = next((a for a in args if isinstance(a, Name)), None)
+                if name not in fonts:
+                    fonts[name] = Font(doc, doc.resolve(fonts_attrs.get(name), dict))
+                state.font = fonts[name]
+                state.size = numbers[-1] if numbers else state.size
+            elif token == "Tc" and numbers:
+                state.char_spacing = numbers[-1]
+            elif token == "Tw" and numbers:
+                state.word_spacing = numbers[-1]
+            elif token == "Tz" and numbers:
+                state.scale = numbers[-1] / 100
+            elif token == "TL" and numbers:
+                state.leading = numbers[-1]
+            elif token == "Ts" and numbers:
+                state.rise = numbers[-1]
+            elif token == "Td" and len(numbers) >= 2:
+                next_line(numbers[-2], numbers[-1])
+            elif token == "TD" and len(numbers) >= 2:
+                state.leading = -numbers[-1]
+                next_line(numbers[-2], numbers[-1])
+            elif token == "Tm" and len(numbers) >= 6:
+                tm = tlm = tuple(numbers[-6:])
+            elif token == "T*":
+                next_line(0, -state.leading)
+            elif token == "Tj" and args:
+                show(args[-1])
+            elif token == "'" and args:
+                next_line(0, -state.leading)
+                show(args[-1])
+            elif token == '"' and len(args) >= 3:
+                state.word_spacing, state.char_spacing = numbers[0], numbers[1]
+                next_line(0, -state.leading)
+                show(args[-1])
+            elif token == "Do" and args and depth < MAX_FORM_DEPTH:
+                form = doc.resolve(xobjects.get(args[-1]), Stream)
+                if form is not None and form.attrs.get("Subtype") == "Form":
+                    inner = state.copy()
+                    matrix = doc.resolve(form.attrs.get("Matrix"), list)
+                    if isinstance(matrix, list) and len(matrix) == 6:
+                        inner.ctm = _multiply(tuple(matrix), inner.ctm)
+                    _runs(doc, doc.stream_data(form), doc.resolve(form.attrs.get("Resources"), dict) or resources,
+                          inner, runs, depth + 1)
+        except (PdfError, ValueError, TypeError, ZeroDivisionError, zlib.error):
+            continue
+
+
+def _lines(runs):
+    """Group runs into lines (top to bottom) of cells (left to right)"""
+    lines = []
+    for x0, x1, y, size, text in sorted(runs, key=lambda r: (-round(r[2], 1), r[0])):
+        tolerance = max(1.0, 0.35 * size)
+        line = next((line for line in lines[-3:] if abs(line[0] - y) <= tolerance), None)
+        if line is None:
+            line = [y, []]
+            lines.append(line)
+        line[1].append((x0, x1, text, size))
+    result = []
+    for y, items in lines:
+        cells = []
+        for x0, x1, text, size in sorted(items):
+            if cells:
+                last = cells[-1]
+                gap = x0 - last.x1
+                if gap < 1.2 * max(size, last.size):
+                    separator = " " if gap > 0.15 * size and not last.text.endswith(" ") and not text.startswith(" ") else ""
+                    cells[-1] = Cell(last.x0, max(x1, last.x1), last.text + separator + text, max(size, last.size))
+                    continue
+            cells.append(Cell(x0, x1, text, size))
+        cells = [Cell(c.x0, c.x1, " ".join(c.text.split()), c.size) for c in cells if c.text.strip()]
+        if cells:
+            result.append(Line(y, cells))
+    return result
+
+
+def read_pages(data, max_pages=20):
+    """Text lines per page, top to bottom; raises PdfError for files that are not readable PDFs"""
+    doc = Document(data)
+    pages = []
+    for node, resources, box in doc.pages()[:max_pages]:
+        contents = doc.resolve(node.get("Contents"))
+        parts = contents if isinstance(contents, list) else [contents]
+        content = b""
+        for part in parts:
+            part = doc.resolve(part)
+            if isinstance(part, Stream):
+                try:
+                    content += doc.stream_data(part) + b"\n"
+                except (PdfError, ValueError, zlib.error):
+                    continue
+        runs = []
+        _runs(doc, content, resources, _TextState(), runs)
+        box = [v for v in (doc.resolve(box, list) or []) if isinstance(v, (int, float))]
+        width, height = (box[2] - box[0], box[3] - box[1]) if len(box) == 4 else (612, 792)
+        pages.append(Page(width, height, _lines(runs)))
+    return pages
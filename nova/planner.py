@@ -0,0 +1,138 @@
+"""Client workload estimates and a capacity-aware assignment of clients to the team
+
+Hours per client per month follow from its invoice volume, the open items of
+its open closing checklists and the remaining stages of its annual statement.
+``plan()`` spreads the clients over the team with the longest-processing-time
+heuristic (biggest clients first, each to the least utilised member), keeping a
+client with its current accountant while that stays close to the team average,
+so a rebalance suggests few moves. 2,000 clients over 40 people take a few
+milliseconds once the estimates are known.
+"""
+
+import heapq
+import threading
+
+from nova.db import get_connection, get_db_path
+from nova.reference import ANNUAL_STATEMENT_WORKFLOW, freeze
+
+# Estimate per client per month
+BASE_HOURS = 3.0
+INVOICE_HOURS = 4 / 60 / 12  # four minutes per invoice on file, spread over the year
+CHECKLIST_ITEM_HOURS = 0.25
+# Work left in an annual statement stage; a statement needs its own and all later stages
+STAGE_HOURS = {"concept": 16, "review_accountant": 6, "review_bestuur": 2, "vaststelling_ava": 1, "deponering": 1,
+               "afgerond": 0}
+
+# Client hours available per month, by role
+ROLE_CAPACITY = {"Managing Partner": 60, "Senior Accountant": 110, "Accountant": 120, "Junior Accountant": 120,
+                 "Fiscalist": 90}
+DEFAULT_CAPACITY = 100
+
+# A client stays with its accountant while that keeps them below this multiple of the team's utilisation
+STICKINESS = 1.1
+
+_STAGES = [stage["id"] for stage in ANNUAL_STATEMENT_WORKFLOW["stages"]]
+REMAINING_STAGE_HOURS = {stage: sum(STAGE_HOURS.get(s, 0) for s in _STAGES[i:]) for i, stage in enumerate(_STAGES)}
+
+# Tables the estimate reads; a change to any of them recomputes it
+WORKLOAD_TABLES = ("clients", "invoices", "checklist_items", "closing_periods", "annual_statements")
+
+
+def client_hours(conn):
+    """Estimated hours per month for every client, from three grouped queries"""
+    hours = {row[0]: BASE_HOURS for row in conn.execute("SELECT id FROM clients")}
+    for client_id, count in conn.execute("SELECT client_id, COUNT(*) FROM invoices GROUP BY client_id"):
+        if client_id in hours:
+            hours[client_id] += count * INVOICE_HOURS
+    for client_id, count in conn.execute(
+        "SELECT ci.client_id, COUNT(*) FROM checklist_items ci "
+        "JOIN closing_periods cp ON cp.client_id = ci.client_id AND cp.period = ci.period "
+        "WHERE ci.checklist = 'closing' AND cp.status = 'open' AND ci.status NOT IN ('completed', 'not_applicable') "
+        "GROUP BY ci.client_id"
+    ):
+        if client_id in hours:
+            hours[client_id] += count * CHECKLIST_ITEM_HOURS
+    for client_id, status in conn.execute("SELECT client_id, status FROM annual_statements WHERE status != 'afgerond'"):
+        if client_id in hours:
+            hours[client_id] += REMAINING_STAGE_HOURS.get(status, 0)
+    return hours
+
+
+def team_capacity(members):
+    return {member["name"]: ROLE_CAPACITY.get(member["role"], DEFAULT_CAPACITY) for member in members}
+
+
+def loads(hours, assignment, capacity):
+    """Hours per member for an assignment; clients of unknown members are left out"""
+    result = dict.fromkeys(capacity, 0.0)
+    for client_id, member in assignment.items():
+        if member in result:
+            result[member] += hours.get(client_id, 0)
+    return result
+
+
+def plan(hours, capacity, current=None):
+    """Balanced {client_id: member}; with ``current`` clients stay put unless that unbalances the team
+
+    Members without capacity get no clients; without any capacity at all the plan is empty.
+    """
+    current = current or {}
+    capacity = {member: hours_ for member, hours_ in capacity.items() if hours_ > 0}
+    if not capacity:
+        return {}
+    target = sum(hours.values()) / max(sum(capacity.values()), 1)
+    load = dict.fromkeys(capacity, 0.0)
+    assignment, remaining = {}, []
+    # Biggest clients first: keep each with its accountant while that stays near the team average
+    for client_id in sorted(hours, key=lambda c: (-hours[c], c)):
+        member = current.get(client_id)
+        if member in capacity and (load[member] + hours[client_id]) / capacity[member] <= target * STICKINESS:
+            load[member] += hours[client_id]
+            assignment[client_id] = member
+        else:
+            remaining.append(client_id)
+    # The rest, still biggest first, each to the member with the lowest utilisation (LPT)
+    heap = [(load[member] / capacity[member], member) for member in capacity]
+    heapq.heapify(heap)
+    for client_id in remaining:
+        _, member = heapq.heappop(heap)
+        load[member] += hours[client_id]
+        heapq.heappush(heap, (load[member] / capacity[member], member))
+        assignment[client_id] = member
+    return assignment
+
+
+def suggest(client_hours_needed, member_loads, capacity):
+    """Member with the lowest utilisation after taking on a new client, and that utilisation; (None, None)
+    when nobody has capacity"""
+    options = [((member_loads[m] + client_hours_needed) / capacity[m], m) for m in capacity if capacity[m] > 0]
+    if not options:
+        return None, None
+    utilisation, member = min(options)
+    return member, utilisation
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def workload(conn=None):
+    """Client hours and current assignment, recomputed only when the underlying tables changed"""
+    conn = conn or get_connection()
+    placeholders = ", ".join("?" for _ in WORKLOAD_TABLES)
+    version = tuple(conn.execute(
+        f"SELECT COALESCE(SUM(version), 0), COUNT(*) FROM data_versions WHERE table_name IN ({placeholders})",
+        WORKLOAD_TABLES,
+    ).fetchone())
+    key = (str(get_db_path()), version)
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+    result = freeze({
+        "hours": client_hours(conn),
+        "current": dict(conn.execute("SELECT id, accountant FROM clients").fetchall()),
+    })
+    with _cache_lock:
+        _cache.clear()
+        _cache[key] = result
+    return result
@@ -0,0 +1,157 @@
+"""Opt-in timing of page renders, data access and Streamlit emissions
+
+A profile is collected per script run while profiling is on (``NOVA_PROFILE=1`` or
+the sidebar toggle). Spans are recorded only inside ``run()``, so with profiling
+off the instrumented calls cost one context-variable lookup. Finished runs are
+appended as JSON lines to a rotating log (``NOVA_PROFILE_LOG``, default
+``data/profile.log``).
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+DEFAULT_LOG_PATH = Path(__file__).resolve().parent.parent / "data" / "profile.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+
+# Span categories, in the order the breakdown panel shows them
+CATEGORIES = {
+    "data": "Data access",
+    "render": "Streamlit emissies (markdown, charts)",
+    "view": "Sidebar en views (totaal)",
+}
+
+_current = contextvars.ContextVar("nova_profile", default=None)
+_log = None
+_log_lock = threading.Lock()
+
+
+class Profile:
+    """Spans of one script run"""
+
+    def __init__(self, label):
+        self.label = label
+        self.records = []
+        self.total = 0.0
+        self._open = set()
+
+    def summary(self):
+        """Seconds and call count per category; 'other' is view time not spent in data or emissions"""
+        totals = {category: [0.0, 0] for category in CATEGORIES}
+        for category, _, seconds in self.records:
+            totals.setdefault(category, [0.0, 0])
+            totals[category][0] += seconds
+            totals[category][1] += 1
+        totals["other"] = [max(0.0, totals["view"][0] - totals["data"][0] - totals["render"][0]), 0]
+        return totals
+
+    def slowest(self, limit=15):
+        """Slowest spans, with repeated names aggregated"""
+        grouped = {}
+        for category, name, seconds in self.records:
+            entry = grouped.setdefault((category, name), [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+        rows = [(category, name, seconds, calls) for (category, name), (seconds, calls) in grouped.items()]
+        return sorted(rows, key=lambda row: -row[2])[:limit]
+
+
+def env_enabled():
+    return os.environ.get("NOVA_PROFILE", "").lower() in ("1", "true", "yes", "on")
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def run(label, enabled=True):
+    """Collect spans for the code in the block; yields the Profile, or None when disabled"""
+    if not enabled:
+        yield None
+        return
+    profile = Profile(label)
+    token = _current.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total = time.perf_counter() - started
+        _current.reset(token)
+        write_log(profile)
+
+
+@contextmanager
+def span(category, name):
+    """Time a block; nested spans of the same category are folded into the outer one"""
+    profile = _current.get()
+    if profile is None or category in profile._open:
+        yield
+        return
+    profile._open.add(category)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile._open.discard(category)
+        profile.records.append((category, name, time.perf_counter() - started))
+
+
+def timed(category, name):
+    """Decorator form of ``span``"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return function(*args, **kwargs)
+            with span(category, name):
+                return function(*args, **kwargs)
+
+        wrapper.__wrapped_by_profiler__ = True
+        return wrapper
+
+    return decorator
+
+
+def instrument(module, names, category="render", prefix=None):
+    """Wrap module-level functions (e.g. ``st.markdown``) in place; safe to call on every rerun"""
+    prefix = prefix or module.__name__
+    for name in names:
+        function = getattr(module, name)
+        if not getattr(function, "__wrapped_by_profiler__", False):
+            setattr(module, name, timed(category, f"{prefix}.{name}")(function))
+
+
+def _logger():
+    global _log
+    with _log_lock:
+        if _log is not None:
+            return _log
+        path = Path(os.environ.get("NOVA_PROFILE_LOG", DEFAULT_LOG_PATH))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        log = logging.getLogger("nova.profiling")
+        log.setLevel(logging.INFO)
+        log.propagate = False
+        handler = RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        _log = log
+        return _log
+
+
+def write_log(profile):
+    _logger().info(json.dumps({
+        "time": datetime.now().isoformat(timespec="milliseconds"),
+        "label": profile.label,
+        "total_ms": round(profile.total * 1000, 2),
+        "records": [[category, name, round(seconds * 1000, 3)] for category, name, seconds in profile.records],
+    }))
@@ -0,0 +1,304 @@
+"""Static reference tables shared by every client and session
+
+The tables are frozen at import time (read-only mappings and tuples), so one copy
+serves every Streamlit session in the process and no view can change it for the
+others. ``reference_data()`` bundles them with lookups that come from the
+database into a versioned snapshot that is built once and can be invalidated.
+Views read the tables through the snapshot (or ``rgs_name``/``vpb_tarieven``), so
+an invalidation reaches every page on its next run; the module constants are for
+code that runs outside a page, such as the data generator.
+"""
+
+import threading
+from types import MappingProxyType
+
+from nova.db import get_connection
+
+# Bump when the tables below change; cached snapshots of an older version are rebuilt
+REFERENCE_VERSION = 2
+
+
+def freeze(value):
+    """Deep read-only copy: dicts become mappingproxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# Firm profile
+FIRM_INFO = {
+    "name": "FID Finance",
+    "location": "Amsterdam",
+    "employees": 12,
+    "clients": 45
+}
+
+# Financial year shown in the client reports (P&L, balans, Vpb)
+CURRENT_BOEKJAAR = "2024"
+
+# Vennootschapsbelasting brackets per financial year
+VPB_TARIEVEN = {
+    "2024": {
+        "schijf_1": {"grens": 200000, "percentage": 19},
+        "schijf_2": {"grens": None, "percentage": 25.8}
+    }
+}
+
+# AI Agents (inclusive/international names)
+AI_AGENTS = {
+    "ARIA": {
+        "full_name": "AI Recognition & Invoice Assistant",
+        "role": "Factuurverwerking",
+        "color": "#14b8a6",
+        "description": "Herkent en verwerkt inkomende facturen automatisch",
+        "odoo_link": "Sales & Purchase Orders"
+    },
+    "NOVA": {
+        "full_name": "Numerical Operations & Verification Agent",
+        "role": "Documentanalyse", 
+        "color": "#8b5cf6",
+        "description": "Analyseert contracten en financiële documenten",
+        "odoo_link": "Voorraad & Projecten"
+    },
+    "SAGE": {
+        "full_name": "Strategic Advisory & Guidance Engine",
+        "role": "Fiscaal Advies",
+        "color": "#f59e0b",
+        "description": "Geeft proactief fiscaal en belastingadvies",
+        "odoo_link": "HR & Payroll"
+    },
+    "LUNA": {
+        "full_name": "Lookout & Understanding for Numerical Analysis",
+        "role": "Forecasting",
+        "color": "#3b82f6",
+        "description": "Maakt voorspellingen en scenario-analyses",
+        "odoo_link": "CRM Pipeline"
+    },
+    "ALEX": {
+        "full_name": "Advisory Liaison & Expert eXchange",
+        "role": "Klantvragen",
+        "color": "#ec4899",
+        "description": "Beantwoordt vragen en geeft uitleg",
+        "odoo_link": "Alle Modules"
+    },
+    "MIRA": {
+        "full_name": "Monthly Intelligence & Reconciliation Agent",
+        "role": "Periodeafsluiting",
+        "color": "#06b6d4",
+        "description": "Bewaakt maand-/kwartaalafsluitingen, signaleert budgetafwijkingen en coördineert checklist",
+        "odoo_link": "Accounting & Reconciliation"
+    },
+    "VERA": {
+        "full_name": "Verification & Evaluation for Reporting Assurance",
+        "role": "Jaarrekening",
+        "color": "#7c3aed",
+        "description": "Stelt jaarrekeningen op volgens NL wet- en regelgeving, begeleidt goedkeuringsproces en KvK-deponering",
+        "odoo_link": "Accounting & Financial Reports"
+    }
+}
+
+# ============================================
+# ANNUAL STATEMENT REFERENCE DATA (VERA Agent)
+# ============================================
+
+# Company size classification according to Dutch law (BW2 Title 9)
+# Thresholds as of 2024 (updated periodically by EU directives)
+COMPANY_SIZE_THRESHOLDS = {
+    "micro": {
+        "name": "Micro-onderneming",
+        "balanstotaal_max": 450000,
+        "netto_omzet_max": 900000,
+        "werknemers_max": 10,
+        "requirements": {
+            "balans": "Verkort",
+            "wv_rekening": "Verkort",
+            "toelichting": "Zeer beperkt",
+            "bestuursverslag": "Niet verplicht",
+            "accountantsverklaring": "Niet verplicht",
+            "publicatie": "Alleen verkort balans",
+            "sbr_taxonomy": "NT16"
+        },
+        "description": "Voldoet aan minimaal 2 van 3 criteria: balanstotaal ≤ €450.000, netto-omzet ≤ €900.000, werknemers ≤ 10"
+    },
+    "klein": {
+        "name": "Kleine rechtspersoon",
+        "balanstotaal_max": 7500000,
+        "netto_omzet_max": 15000000,
+        "werknemers_max": 50,
+        "requirements": {
+            "balans": "Verkort toegestaan",
+            "wv_rekening": "Verkort toegestaan",
+            "toelichting": "Beperkt",
+            "bestuursverslag": "Niet verplicht",
+            "accountantsverklaring": "Niet verplicht",
+            "publicatie": "Verkort balans + beperkte toelichting",
+            "sbr_taxonomy": "NT16"
+        },
+        "description": "Voldoet aan minimaal 2 van 3 criteria: balanstotaal ≤ €7,5M, netto-omzet ≤ €15M, werknemers ≤ 50"
+    },
+    "middelgroot": {
+        "name": "Middelgrote rechtspersoon",
+        "balanstotaal_max": 25000000,
+        "netto_omzet_max": 50000000,
+        "werknemers_max": 250,
+        "requirements": {
+            "balans": "Volledig",
+            "wv_rekening": "Verkort toegestaan",
+            "toelichting": "Uitgebreid",
+            "bestuursverslag": "Verplicht",
+            "accountantsverklaring": "Verplicht (beoordelingsverklaring toegestaan)",
+            "publicatie": "Volledig (zonder WV mag)",
+            "sbr_taxonomy": "NT16"
+        },
+        "description": "Voldoet aan minimaal 2 van 3 criteria: balanstotaal ≤ €25M, netto-omzet ≤ €50M, werknemers ≤ 250"
+    },
+    "groot": {
+        "name": "Grote rechtspersoon",
+        "balanstotaal_max": None,
+        "netto_omzet_max": None,
+        "werknemers_max": None,
+        "requirements": {
+            "balans": "Volledig",
+            "wv_rekening": "Volledig",
+            "toelichting": "Volledig",
+            "bestuursverslag": "Verplicht + uitgebreid",
+            "accountantsverklaring": "Verplicht (controleverklaring)",
+            "publicatie": "Volledig inclusief WV",
+            "sbr_taxonomy": "NT16"
+        },
+        "description": "Overschrijdt 2 van 3 criteria van middelgrote rechtspersoon op twee opeenvolgende balansdata"
+    }
+}
+
+# Annual statement workflow stages
+ANNUAL_STATEMENT_WORKFLOW = {
+    "stages": [
+        {
+            "id": "concept",
+            "name": "Concept Opstellen",
+            "description": "Initiële jaarrekening wordt opgesteld door VERA",
+            "responsible": "VERA",
+            "requires_approval": False,
+            "next_stage": "review_accountant"
+        },
+        {
+            "id": "review_accountant",
+            "name": "Review Accountant",
+            "description": "Controle en beoordeling door de accountant",
+            "responsible": "Accountant",
+            "requires_approval": True,
+            "approval_roles": ["Senior Accountant", "Managing Partner"],
+            "next_stage": "review_bestuur"
+        },
+        {
+            "id": "review_bestuur",
+            "name": "Review Bestuur",
+            "description": "Review en ondertekening door het bestuur/directie",
+            "responsible": "Bestuur",
+            "requires_approval": True,
+            "approval_roles": ["Directeur", "Bestuurder"],
+            "next_stage": "vaststelling_ava"
+        },
+        {
+            "id": "vaststelling_ava",
+            "name": "Vaststelling AVA",
+            "description": "Goedkeuring en vaststelling door de Algemene Vergadering van Aandeelhouders",
+            "responsible": "AVA",
+            "requires_approval": True,
+            "approval_roles": ["Aandeelhouders"],
+            "next_stage": "deponering"
+        },
+        {
+            "id": "deponering",
+            "name": "Deponering KvK",
+            "description": "Indiening bij de Kamer van Koophandel via SBR",
+            "responsible": "VERA",
+            "requires_approval": False,
+            "next_stage": "afgerond"
+        },
+        {
+            "id": "afgerond",
+            "name": "Afgerond",
+            "description": "Jaarrekening is gepubliceerd en gedeponeerd",
+            "responsible": None,
+            "requires_approval": False,
+            "next_stage": None
+        }
+    ]
+}
+
+# KvK Submission status options
+KVK_SUBMISSION_STATUSES = {
+    "concept": {"label": "Concept", "color": "#64748b", "icon": "📝"},
+    "validating": {"label": "Valideren", "color": "#3b82f6", "icon": "🔄"},
+    "ready_to_submit": {"label": "Klaar voor indiening", "color": "#f59e0b", "icon": "📤"},
+    "submitted": {"label": "Ingediend", "color": "#8b5cf6", "icon": "📨"},
+    "processing": {"label": "In behandeling KvK", "color": "#06b6d4", "icon": "⏳"},
+    "geaccepteerd": {"label": "Geaccepteerd", "color": "#10b981", "icon": "✅"},
+    "afgewezen": {"label": "Afgewezen", "color": "#ef4444", "icon": "❌"},
+    "correctie_nodig": {"label": "Correctie nodig", "color": "#f59e0b", "icon": "⚠️"}
+}
+
+FIRM_INFO = freeze(FIRM_INFO)
+AI_AGENTS = freeze(AI_AGENTS)
+VPB_TARIEVEN = freeze(VPB_TARIEVEN)
+COMPANY_SIZE_THRESHOLDS = freeze(COMPANY_SIZE_THRESHOLDS)
+ANNUAL_STATEMENT_WORKFLOW = freeze(ANNUAL_STATEMENT_WORKFLOW)
+KVK_SUBMISSION_STATUSES = freeze(KVK_SUBMISSION_STATUSES)
+
+
+# ============================================
+# SHARED SNAPSHOT
+# ============================================
+
+_snapshot = None
+_generation = 0
+_lock = threading.Lock()
+
+
+def _load_rgs_names():
+    """RGS code -> account name, as used in the client ledgers"""
+    rows = get_connection().execute("SELECT code, MIN(name) FROM rgs_lines GROUP BY code ORDER BY code")
+    return {code: name for code, name in rows}
+
+
+def reference_data():
+    """Frozen snapshot of all reference tables, built once per process and version"""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and snapshot["version"] == (REFERENCE_VERSION, _generation):
+        return snapshot
+    with _lock:
+        if _snapshot is None or _snapshot["version"] != (REFERENCE_VERSION, _generation):
+            _snapshot = freeze({
+                "version": (REFERENCE_VERSION, _generation),
+                "firm_info": FIRM_INFO,
+                "ai_agents": AI_AGENTS,
+                "vpb_tarieven": VPB_TARIEVEN,
+                "company_size_thresholds": COMPANY_SIZE_THRESHOLDS,
+                "annual_statement_workflow": ANNUAL_STATEMENT_WORKFLOW,
+                "kvk_submission_statuses": KVK_SUBMISSION_STATUSES,
+                "rgs_names": _load_rgs_names(),
+            })
+        return _snapshot
+
+
+def invalidate_reference():
+    """Drop the shared snapshot, e.g. after the RGS scheme was updated; the next read rebuilds it"""
+    global _snapshot, _generation
+    with _lock:
+        _generation += 1
+        _snapshot = None
+
+
+def rgs_name(code, default=None):
+    """Account name of an RGS code"""
+    return reference_data()["rgs_names"].get(code, default)
+
+
+def vpb_tarieven(boekjaar=CURRENT_BOEKJAAR):
+    """Vpb brackets of a financial year, falling back to the current one"""
+    tarieven = reference_data()["vpb_tarieven"]
+    return tarieven.get(boekjaar, tarieven[CURRENT_BOEKJAAR])
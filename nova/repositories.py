@@ -0,0 +1,471 @@
+"""Per-entity repositories on top of the NOVA SQLite store"""
+
+import json
+
+from nova.cache import cached
+from nova.db import firm_summary, get_connection
+from nova.matching import PRICE_TOLERANCE, QUANTITY_TOLERANCE, match_lines, status_counts
+from nova.profiling import timed
+
+
+def _records(frame):
+    """DataFrame rows as dicts, with None for missing values"""
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+class Repository:
+    """Base repository; subclasses list the columns that hold JSON or are storage-only"""
+
+    json_columns = ()
+    hidden_columns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Public query methods show up as data-access spans when profiling is on
+        for name, value in list(vars(cls).items()):
+            if callable(value) and not name.startswith("_"):
+                setattr(cls, name, timed("data", f"{cls.__name__}.{name}")(value))
+
+    def __init__(self, conn=None):
+        self._conn = conn
+
+    @property
+    def conn(self):
+        """Explicit connection if one was given, else this thread's shared connection"""
+        return self._conn or get_connection()
+
+    def _decode(self, row):
+        if row is None:
+            return None
+        data = dict(row)
+        for column in self.hidden_columns:
+            data.pop(column, None)
+        for column in self.json_columns:
+            if data.get(column) is not None:
+                data[column] = json.loads(data[column])
+        return data
+
+    def _fetch_all(self, sql, params=()):
+        return [self._decode(row) for row in self.conn.execute(sql, params)]
+
+    def _fetch_one(self, sql, params=()):
+        return self._decode(self.conn.execute(sql, params).fetchone())
+
+    def _scalar(self, sql, params=(), default=0):
+        row = self.conn.execute(sql, params).fetchone()
+        return row[0] if row and row[0] is not None else default
+
+    def _counts(self, sql, params=()):
+        return {row[0]: row[1] for row in self.conn.execute(sql, params)}
+
+
+# ============================================
+# KANTOOR (FIRM) LEVEL
+# ============================================
+
+class ClientRepository(Repository):
+    json_columns = ("alerts",)
+
+    def get(self, client_id):
+        """Get client data by ID"""
+        return self._fetch_one("SELECT * FROM clients WHERE id = ?", (client_id,))
+
+    def first(self):
+        """First client in the portfolio, used as default selection"""
+        return self._fetch_one("SELECT * FROM clients ORDER BY id LIMIT 1")
+
+    def id_by_name(self, name):
+        return self._scalar("SELECT id FROM clients WHERE name = ?", (name,), default=None)
+
+    def totals(self):
+        """Portfolio totals, read from the trigger-maintained firm_summary"""
+        summary = firm_summary(self.conn)
+        return {"count": int(summary.get("clients", 0)), "omzet_ytd": summary.get("omzet_ytd", 0),
+                "openstaand": summary.get("openstaand", 0)}
+
+    def status_counts(self):
+        summary = firm_summary(self.conn)
+        return {status: int(summary.get(f"status:{status}", 0)) for status in ("green", "yellow", "red")}
+
+    def distinct(self, column):
+        """Distinct values for a filterable column"""
+        if column not in ("sector", "accountant", "status"):
+            raise ValueError(f"Cannot list distinct values of {column}")
+        return [row[0] for row in self.conn.execute(f"SELECT DISTINCT {column} FROM clients ORDER BY {column}")]
+
+    # Columns the portfolio grid can sort on; each has an index
+    sort_columns = ("name", "omzet_ytd", "winst_ytd", "openstaand")
+
+    @staticmethod
+    def _filters(status, sector, accountant):
+        where, params = [], []
+        for column, value in (("status", status), ("sector", sector), ("accountant", accountant)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(where) if where else ""), params
+
+    def assign(self, assignment):
+        """Give clients a new accountant; ``assignment`` maps client id to team member name"""
+        with self.conn:
+            self.conn.executemany("UPDATE clients SET accountant = ? WHERE id = ?",
+                                  [(member, client_id) for client_id, member in assignment.items()])
+
+    def count(self, status=None, sector=None, accountant=None):
+        """Number of clients matching the given filters"""
+        where, params = self._filters(status, sector, accountant)
+        return self._scalar(f"SELECT COUNT(*) FROM clients{where}", params)
+
+    def list(self, status=None, sector=None, accountant=None, limit=None, offset=0, order_by="id", descending=False):
+        """Clients matching the given filters, sorted on ``order_by`` and paged with limit/offset"""
+        if order_by != "id" and order_by not in self.sort_columns:
+            raise ValueError(f"Cannot sort clients on {order_by}")
+        where, params = self._filters(status, sector, accountant)
+        direction = "DESC" if descending else "ASC"
+        sql = f"SELECT * FROM clients{where} ORDER BY {order_by} {direction}, id {direction}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return self._fetch_all(sql, params)
+
+
+class TeamRepository(Repository):
+    hidden_columns = ("position",)
+
+    def list(self):
+        return self._fetch_all("SELECT * FROM team_members ORDER BY position")
+
+
+class AlertRepository(Repository):
+    hidden_columns = ("priority",)
+
+    def list(self, alert_type=None, limit=None):
+        """Alerts by priority (urgent first), oldest first within a priority"""
+        sql, params = "SELECT * FROM firm_alerts", []
+        if alert_type is not None:
+            sql += " WHERE type = ?"
+            params.append(alert_type)
+        sql += " ORDER BY priority, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._fetch_all(sql, params)
+
+    def counts(self):
+        """Number of alerts per type plus the overall total"""
+        summary = firm_summary(self.conn)
+        result = {t: int(summary.get(f"alerts:{t}", 0)) for t in ("urgent", "warning", "info")}
+        result["total"] = int(summary.get("alerts", 0))
+        return result
+
+
+# ============================================
+# KLANT (CLIENT) LEVEL
+# ============================================
+
+class InvoiceRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def list(self, client_id, status=None, payment_status=None):
+        sql, params = "SELECT * FROM invoices WHERE client_id = ?", [client_id]
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        if payment_status is not None:
+            sql += " AND payment_status = ?"
+            params.append(payment_status)
+        return self._fetch_all(sql + " ORDER BY id", params)
+
+    def status_counts(self, client_id):
+        return self._counts("SELECT status, COUNT(*) FROM invoices WHERE client_id = ? GROUP BY status", (client_id,))
+
+    def status_page(self, client_id, status, limit, offset=0):
+        """Invoice count per status plus one page of the invoices with ``status``, newest first
+
+        One statement: the grouped counts are joined to the page, so each status
+        appears once with its count and the selected status once per page row.
+        """
+        counts, page = {}, []
+        for row in self.conn.execute(
+            "SELECT c.status AS count_status, c.n, p.* FROM "
+            "(SELECT status, COUNT(*) AS n FROM invoices WHERE client_id = ? GROUP BY status) c "
+            "LEFT JOIN (SELECT * FROM invoices WHERE client_id = ? AND status = ? "
+            "ORDER BY date DESC, id DESC LIMIT ? OFFSET ?) p ON p.status = c.status "
+            "ORDER BY p.date DESC, p.id DESC",
+            (client_id, client_id, status, limit, offset),
+        ):
+            counts[row["count_status"]] = row["n"]
+            if row["id"] is not None:
+                invoice = self._decode(row)
+                del invoice["count_status"], invoice["n"]
+                page.append(invoice)
+        return {"counts": counts, "invoices": page}
+
+    @cached("invoices")
+    def outstanding_summary(self, client_id, as_of):
+        """Count, total incl. VAT and number overdue on ``as_of`` of the invoices still to be paid"""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(amount + vat), 0), COALESCE(SUM(due_date < ?), 0) "
+            "FROM invoices WHERE client_id = ? AND payment_status = 'openstaand'",
+            (as_of, client_id),
+        ).fetchone()
+        return {"count": row[0], "total": row[1], "overdue": row[2]}
+
+    def booking_history(self, client_id, iban=None, supplier=None):
+        """Supplier, category and RGS code of the latest invoice with the same IBAN, else the same supplier name"""
+        for column, value in (("iban", iban), ("supplier", supplier)):
+            if not value:
+                continue
+            row = self._fetch_one(
+                f"SELECT supplier, category, rgs FROM invoices WHERE client_id = ? AND {column} = ? COLLATE NOCASE "
+                "AND rgs IS NOT NULL ORDER BY date DESC LIMIT 1",
+                (client_id, value),
+            )
+            if row:
+                return dict(row, matched=column)
+        return None
+
+
+class IngestJobRepository(Repository):
+    """Upload jobs of nova.jobs; the uploaded bytes are not read back"""
+
+    json_columns = ("result",)
+
+    columns = "id, kind, batch, filename, status, result, error, created, started, finished"
+
+    def recent(self, client_id, limit=5):
+        return self._fetch_all(
+            f"SELECT {self.columns} FROM ingest_jobs WHERE client_id = ? ORDER BY id DESC LIMIT ?", (client_id, limit)
+        )
+
+    def latest_batch(self, client_id):
+        return self._scalar(
+            "SELECT batch FROM ingest_jobs WHERE client_id = ? ORDER BY id DESC LIMIT 1", (client_id,), default=None
+        )
+
+    def batch(self, batch):
+        """Jobs of one upload, in upload order"""
+        return self._fetch_all(f"SELECT {self.columns} FROM ingest_jobs WHERE batch = ? ORDER BY id", (batch,))
+
+    def batch_counts(self, batch):
+        return self._counts("SELECT status, COUNT(*) FROM ingest_jobs WHERE batch = ? GROUP BY status", (batch,))
+
+    def pending(self, client_id):
+        return self._scalar(
+            "SELECT COUNT(*) FROM ingest_jobs WHERE client_id = ? AND status IN ('queued', 'running')", (client_id,)
+        )
+
+
+class BankRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def accounts(self, client_id):
+        """Bank accounts keyed by account key, in display order"""
+        rows = self._fetch_all("SELECT * FROM bank_accounts WHERE client_id = ? ORDER BY position", (client_id,))
+        return {row["key"]: row for row in rows}
+
+    def open_mutations(self, client_id):
+        return self._fetch_all("SELECT * FROM bank_mutations WHERE client_id = ? ORDER BY datum DESC", (client_id,))
+
+
+class CrmRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def deals(self, client_id):
+        return self._fetch_all("SELECT * FROM crm_deals WHERE client_id = ? ORDER BY id", (client_id,))
+
+    def stage_totals(self, client_id):
+        return self._counts(
+            "SELECT stage, COALESCE(SUM(amount), 0) FROM crm_deals WHERE client_id = ? GROUP BY stage", (client_id,)
+        )
+
+    @cached("crm_deals")
+    def pipeline_summary(self, client_id):
+        """Pipeline value per stage plus the probability-weighted total"""
+        return {
+            "stage_totals": self.stage_totals(client_id),
+            "weighted_value": self._scalar(
+                "SELECT SUM(amount * probability / 100.0) FROM crm_deals WHERE client_id = ?", (client_id,)
+            ),
+        }
+
+
+class PurchaseRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def orders(self, client_id):
+        return self._fetch_all("SELECT * FROM purchase_orders WHERE client_id = ? ORDER BY id", (client_id,))
+
+    def status_counts(self, client_id):
+        return self._counts(
+            "SELECT status, COUNT(*) FROM purchase_orders WHERE client_id = ? GROUP BY status", (client_id,)
+        )
+
+    def matching_periods(self, client_id):
+        """Periods with invoice lines to match, latest first"""
+        return [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT i.period FROM invoice_lines l JOIN invoices i ON i.client_id = l.client_id "
+            "AND i.id = l.invoice_id WHERE l.client_id = ? ORDER BY i.period DESC",
+            (client_id,),
+        )]
+
+    @cached("invoices", "invoice_lines", "purchase_orders", "purchase_order_lines", "goods_receipts")
+    def three_way_match(self, client_id, period=None, price_tolerance=PRICE_TOLERANCE,
+                        quantity_tolerance=QUANTITY_TOLERANCE):
+        """Three-way match of the invoice lines of ``period`` (None for all)
+
+        Returns {"counts", "invoices", "flagged_lines"}: invoices per status, every
+        invoice and the lines that did not match. Lines of earlier periods take part
+        in the run because they already used up ordered and received quantities,
+        but only ``period`` is reported.
+        """
+        sql = (
+            "SELECT l.invoice_id, l.line, i.supplier, i.odoo_po AS po_id, l.po_line, l.product, l.quantity, "
+            "l.unit_price, i.date, i.period FROM invoice_lines l "
+            "JOIN invoices i ON i.client_id = l.client_id AND i.id = l.invoice_id WHERE l.client_id = ?"
+        )
+        params = (client_id,)
+        if period:
+            sql += " AND i.period <= ?"
+            params += (period,)
+        invoice_lines = self.conn.execute(sql, params).fetchall()
+        po_lines = self.conn.execute(
+            "SELECT l.po_id, l.line, o.supplier, l.product, l.quantity, l.unit_price FROM purchase_order_lines l "
+            "JOIN purchase_orders o ON o.client_id = l.client_id AND o.id = l.po_id WHERE l.client_id = ?",
+            (client_id,),
+        ).fetchall()
+        receipts = self.conn.execute(
+            "SELECT po_id, po_line, SUM(quantity) FROM goods_receipts WHERE client_id = ? GROUP BY po_id, po_line",
+            (client_id,),
+        ).fetchall()
+        lines, invoices = match_lines(invoice_lines, po_lines, receipts, price_tolerance, quantity_tolerance)
+        if period:
+            lines, invoices = lines[lines["period"] == period], invoices[invoices["period"] == period]
+        return {"counts": status_counts(invoices), "invoices": _records(invoices),
+                "flagged_lines": _records(lines[lines["status"] != "match"])}
+
+
+class EmployeeRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def list(self, client_id):
+        return self._fetch_all("SELECT * FROM employees WHERE client_id = ? ORDER BY position", (client_id,))
+
+    def totals(self, client_id):
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(fte), 0), COALESCE(SUM(salary), 0) FROM employees WHERE client_id = ?",
+            (client_id,),
+        ).fetchone()
+        return {"count": row[0], "total_fte": row[1], "total_salary_costs": row[2]}
+
+
+class RgsRepository(Repository):
+
+    def statement(self, client_id, period, statement):
+        """RGS lines of one statement ('wv', 'activa', 'passiva') keyed by code"""
+        rows = self._fetch_all(
+            "SELECT code, name, amount, category FROM rgs_lines "
+            "WHERE client_id = ? AND period = ? AND statement = ? ORDER BY position",
+            (client_id, period, statement),
+        )
+        return {row.pop("code"): row for row in rows}
+
+
+class BtwRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def periods(self, client_id):
+        return self._fetch_all("SELECT * FROM btw_periods WHERE client_id = ? ORDER BY position", (client_id,))
+
+
+class SyncRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def modules(self, client_id):
+        return self._fetch_all("SELECT * FROM sync_modules WHERE client_id = ? ORDER BY position", (client_id,))
+
+    def connection(self, client_id):
+        """Odoo connection settings for a client, if configured"""
+        return self._fetch_one(
+            "SELECT url, database, username, api_key FROM odoo_connections WHERE client_id = ?", (client_id,)
+        )
+
+    @cached("odoo_records")
+    def record_counts(self, client_id):
+        return self._counts(
+            "SELECT model, COUNT(*) FROM odoo_records WHERE client_id = ? AND deleted = 0 AND active = 1 GROUP BY model",
+            (client_id,),
+        )
+
+
+class ClosingRepository(Repository):
+    hidden_columns = ("client_id", "position")
+
+    def periods(self, client_id):
+        """Closing periods keyed by period code, in display order"""
+        rows = self._fetch_all("SELECT * FROM closing_periods WHERE client_id = ? ORDER BY position", (client_id,))
+        return {row["period"]: row for row in rows}
+
+    def checklist(self, client_id, checklist, period, statuses=None):
+        """Checklist items of one period, optionally limited to a set of statuses"""
+        sql = "SELECT * FROM checklist_items WHERE client_id = ? AND checklist = ? AND period = ?"
+        params = [client_id, checklist, period]
+        if statuses:
+            sql += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params += list(statuses)
+        return self._fetch_all(sql + " ORDER BY position", params)
+
+    @cached("checklist_items")
+    def checklist_counts(self, client_id, checklist, period):
+        return self._counts(
+            "SELECT status, COUNT(*) FROM checklist_items "
+            "WHERE client_id = ? AND checklist = ? AND period = ? GROUP BY status",
+            (client_id, checklist, period),
+        )
+
+    def issues(self, client_id, period):
+        return self._fetch_all(
+            "SELECT * FROM closing_issues WHERE client_id = ? AND period = ? ORDER BY id", (client_id, period)
+        )
+
+    def history(self, client_id):
+        return self._fetch_all(
+            "SELECT * FROM closing_history WHERE client_id = ? ORDER BY period DESC", (client_id,)
+        )
+
+
+class AnnualStatementRepository(Repository):
+    json_columns = ("data",)
+
+    def years(self, client_id):
+        return [row[0] for row in self.conn.execute(
+            "SELECT boekjaar FROM annual_statements WHERE client_id = ? ORDER BY boekjaar DESC", (client_id,)
+        )]
+
+    def get(self, client_id, boekjaar):
+        row = self._fetch_one(
+            "SELECT data FROM annual_statements WHERE client_id = ? AND boekjaar = ?", (client_id, boekjaar)
+        )
+        return row["data"] if row else None
+
+
+class DocumentRepository(Repository):
+    """Nested report documents (cashflow, vpb, budget, ...) per client and period"""
+
+    json_columns = ("data",)
+
+    def get(self, client_id, kind, period="", default=None):
+        row = self._fetch_one(
+            "SELECT data FROM documents WHERE client_id = ? AND kind = ? AND period = ?", (client_id, kind, period)
+        )
+        return row["data"] if row else default
+
+    @cached("documents")
+    def asset_totals(self, client_id):
+        """Acquisition value, accumulated depreciation and book value of the fixed assets"""
+        activa = (self.get(client_id, "investeringen") or {}).get("activa", [])
+        return {
+            "aanschaf": sum(a["aanschaf"] for a in activa),
+            "afschrijving_cum": sum(a["afschrijving_cum"] for a in activa),
+            "boekwaarde": sum(a["boekwaarde"] for a in activa),
+        }
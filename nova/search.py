@@ -0,0 +1,113 @@
+"""Typeahead search over the client portfolio
+
+The index is built once per process from the clients table and rebuilt when its
+data version changes. Every word of name, contact, KvK, BTW and sector goes into
+a sorted token list, so a prefix lookup is two bisects; a trigram index catches
+typos ("jansn" finds "Jansen") when prefixes do not give enough hits.
+"""
+
+import heapq
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+from nova.db import FIRM_SCOPE, data_versions, get_connection, get_db_path
+
+SEARCH_FIELDS = ("name", "contact", "kvk", "btw", "sector")
+# Minimum share of the query's trigrams a client must contain to count as a fuzzy match
+MIN_SIMILARITY = 0.4
+
+
+def normalize(text):
+    """Lowercase, strip accents and turn punctuation into spaces"""
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode().lower()
+    return "".join(ch if ch.isalnum() else " " for ch in text)
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ClientSearchIndex:
+    """Prefix and trigram index over (id, name, contact, kvk, btw, sector) rows"""
+
+    def __init__(self, rows):
+        self.clients = [dict(row) for row in rows]
+        tokens, grams = [], {}
+        for position, client in enumerate(self.clients):
+            words = set()
+            for field in SEARCH_FIELDS:
+                words.update(normalize(client.get(field)).split())
+            for word in words:
+                tokens.append((word, position))
+                for gram in trigrams(word):
+                    grams.setdefault(gram, []).append(position)
+        tokens.sort()
+        self._names = [normalize(client["name"]) for client in self.clients]
+        # Alphabetical rank per position, the tie-breaker between equal scores
+        self._rank = {position: rank for rank, position in
+                      enumerate(sorted(range(len(self.clients)), key=lambda p: self._names[p]))}
+        self._words = [word for word, _ in tokens]
+        self._positions = [position for _, position in tokens]
+        self._grams = grams
+
+    def __len__(self):
+        return len(self.clients)
+
+    def _prefix(self, prefix):
+        """Positions of the clients with a word starting with ``prefix``"""
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + "\uffff", start)
+        return set(self._positions[start:end])
+
+    def _fuzzy(self, word):
+        """Similarity per client: share of the word's trigrams found in any of its words"""
+        query = trigrams(word)
+        hits = Counter()
+        for gram in query:
+            hits.update(set(self._grams.get(gram, ())))
+        return {position: count / len(query) for position, count in hits.items()
+                if count / len(query) >= MIN_SIMILARITY}
+
+    def search(self, query, limit=8):
+        """Best matching clients: every query word as a prefix first, then fuzzy matches"""
+        words = normalize(query).split()
+        if not words:
+            return []
+        scores = {}
+        matches = set.intersection(*(self._prefix(word) for word in words))
+        for position in matches:
+            # Name prefix hits rank above hits on contact, KvK, BTW or sector
+            scores[position] = 3 if self._names[position].startswith(words[0]) else 2
+        if len(scores) < limit:
+            fuzzy = [self._fuzzy(word) for word in words]
+            for position in set.intersection(*(set(f) for f in fuzzy)):
+                scores.setdefault(position, sum(f[position] for f in fuzzy) / len(fuzzy))
+        ranked = heapq.nsmallest(limit, scores, key=lambda p: (-scores[p], self._rank[p]))
+        return [self.clients[position] for position in ranked]
+
+
+_index = None
+_index_key = None
+_index_lock = threading.Lock()
+
+
+def client_index():
+    """Process-wide index, rebuilt when the clients table has changed"""
+    global _index, _index_key
+    conn = get_connection()
+    key = (str(get_db_path()), data_versions(conn, FIRM_SCOPE, ("clients",)))
+    if _index is not None and _index_key == key:
+        return _index
+    with _index_lock:
+        if _index is None or _index_key != key:
+            columns = ", ".join(("id",) + SEARCH_FIELDS)
+            _index = ClientSearchIndex(conn.execute(f"SELECT {columns} FROM clients"))
+            _index_key = key
+        return _index
+
+
+def search_clients(query, limit=8):
+    return client_index().search(query, limit)
@@ -0,0 +1,1284 @@
+"""Demo dataset used to seed an empty NOVA database"""
+
+
+# ============================================
+# DEMO DATA - KANTOOR (FIRM) LEVEL
+# ============================================
+
+TEAM_MEMBERS = [
+    {"name": "Lisa van der Berg", "role": "Managing Partner", "clients": 8, "workload": 85, "avatar": "👩‍💼"},
+    {"name": "Mark de Vries", "role": "Senior Accountant", "clients": 12, "workload": 92, "avatar": "👨‍💼"},
+    {"name": "Sophie Jansen", "role": "Accountant", "clients": 10, "workload": 78, "avatar": "👩‍💻"},
+    {"name": "Thomas Bakker", "role": "Junior Accountant", "clients": 8, "workload": 65, "avatar": "👨‍💻"},
+    {"name": "Emma de Groot", "role": "Fiscalist", "clients": 7, "workload": 88, "avatar": "👩‍⚖️"},
+]
+
+# Demo clients for the firm
+DEMO_CLIENTS = [
+    {
+        "id": "CL001",
+        "name": "Vermeer Bouw B.V.",
+        "contact": "Jan Vermeer",
+        "kvk": "12345678",
+        "btw": "NL123456789B01",
+        "sector": "Bouw & Constructie",
+        "omzet_ytd": 612500,
+        "omzet_prev": 545200,
+        "winst_ytd": 89400,
+        "openstaand": 142000,
+        "status": "green",
+        "accountant": "Mark de Vries",
+        "alerts": [],
+        "last_activity": "2 uur geleden"
+    },
+    {
+        "id": "CL002",
+        "name": "TechStart B.V.",
+        "contact": "Jessica de Vries",
+        "kvk": "23456789",
+        "btw": "NL234567890B01",
+        "sector": "IT & Software",
+        "omzet_ytd": 890000,
+        "omzet_prev": 720000,
+        "winst_ytd": 156000,
+        "openstaand": 45000,
+        "status": "green",
+        "accountant": "Sophie Jansen",
+        "alerts": [],
+        "last_activity": "1 dag geleden"
+    },
+    {
+        "id": "CL003",
+        "name": "Restaurant De Gouden Lepel",
+        "contact": "Ahmed El-Amrani",
+        "kvk": "34567890",
+        "btw": "NL345678901B01",
+        "sector": "Horeca",
+        "omzet_ytd": 425000,
+        "omzet_prev": 480000,
+        "winst_ytd": 28500,
+        "openstaand": 67500,
+        "status": "yellow",
+        "accountant": "Lisa van der Berg",
+        "alerts": ["BTW deadline nadert", "Margedruk door stijgende kosten"],
+        "last_activity": "3 uur geleden"
+    },
+    {
+        "id": "CL004",
+        "name": "Logistics Plus B.V.",
+        "contact": "Robert Smit",
+        "kvk": "45678901",
+        "btw": "NL456789012B01",
+        "sector": "Transport & Logistiek",
+        "omzet_ytd": 1250000,
+        "omzet_prev": 1180000,
+        "winst_ytd": 125000,
+        "openstaand": 312000,
+        "status": "yellow",
+        "accountant": "Mark de Vries",
+        "alerts": ["Hoge debiteurenstand"],
+        "last_activity": "5 uur geleden"
+    },
+    {
+        "id": "CL005",
+        "name": "Retail Mode B.V.",
+        "contact": "Nina Petrova",
+        "kvk": "56789012",
+        "btw": "NL567890123B01",
+        "sector": "Retail",
+        "omzet_ytd": 320000,
+        "omzet_prev": 450000,
+        "winst_ytd": -45000,
+        "openstaand": 89000,
+        "status": "red",
+        "accountant": "Emma de Groot",
+        "alerts": ["Negatief resultaat", "Liquiditeitsprobleem dreigt", "Urgent gesprek nodig"],
+        "last_activity": "30 min geleden"
+    },
+    {
+        "id": "CL006",
+        "name": "Gezondheidscentrum Oost",
+        "contact": "Dr. Karin van Dijk",
+        "kvk": "67890123",
+        "btw": "NL678901234B01",
+        "sector": "Zorg",
+        "omzet_ytd": 780000,
+        "omzet_prev": 720000,
+        "winst_ytd": 98000,
+        "openstaand": 23000,
+        "status": "green",
+        "accountant": "Thomas Bakker",
+        "alerts": [],
+        "last_activity": "1 dag geleden"
+    },
+    {
+        "id": "CL007",
+        "name": "Bakkerij Het Zoete Leven",
+        "contact": "Peter Willems",
+        "kvk": "78901234",
+        "btw": "NL789012345B01",
+        "sector": "Food & Beverage",
+        "omzet_ytd": 285000,
+        "omzet_prev": 260000,
+        "winst_ytd": 42000,
+        "openstaand": 12500,
+        "status": "green",
+        "accountant": "Sophie Jansen",
+        "alerts": [],
+        "last_activity": "2 dagen geleden"
+    },
+    {
+        "id": "CL008",
+        "name": "Architectenbureau Modern",
+        "contact": "Isabelle Dubois",
+        "kvk": "89012345",
+        "btw": "NL890123456B01",
+        "sector": "Zakelijke Diensten",
+        "omzet_ytd": 520000,
+        "omzet_prev": 485000,
+        "winst_ytd": 112000,
+        "openstaand": 78000,
+        "status": "green",
+        "accountant": "Lisa van der Berg",
+        "alerts": [],
+        "last_activity": "4 uur geleden"
+    },
+]
+
+# ============================================
+# DEMO DATA - KLANT (CLIENT) LEVEL
+# ============================================
+
+# Demo Invoices (client-level) with bank details for payment integration
+DEMO_INVOICES = [
+    {"id": "F2024-001", "supplier": "Bouwmaterialen Jansen B.V.", "amount": 4750.00, "vat": 997.50, "date": "2024-01-15", "due_date": "2024-02-15", "status": "verwerkt", "payment_status": "betaald", "category": "Inkoop materialen", "rgs": "WIkworGro", "odoo_po": "PO2024-042", "iban": "NL91ABNA0417164300", "bic": "ABNANL2A"},
+    {"id": "F2024-002", "supplier": "Transport De Vries", "amount": 1250.00, "vat": 262.50, "date": "2024-01-16", "due_date": "2024-02-16", "status": "verwerkt", "payment_status": "betaald", "category": "Transport", "rgs": "WKprUitTra", "odoo_po": "PO2024-038", "iban": "NL20INGB0001234567", "bic": "INGBNL2A"},
+    {"id": "F2024-003", "supplier": "Energie Direct", "amount": 892.50, "vat": 187.43, "date": "2024-01-17", "due_date": "2024-02-17", "status": "verwerkt", "payment_status": "betaald", "category": "Energie", "rgs": "WBehHuiEne", "odoo_po": None, "iban": "NL44RABO0123456789", "bic": "RABONL2U"},
+    {"id": "F2024-004", "supplier": "Kraan & Hijswerk Utrecht", "amount": 3200.00, "vat": 672.00, "date": "2024-01-18", "due_date": "2024-02-18", "status": "wacht op review", "payment_status": "openstaand", "category": "Ingehuurde diensten", "rgs": "WKprUitInh", "odoo_po": "PO2024-045", "iban": "NL77ABNA0574908765", "bic": "ABNANL2A"},
+    {"id": "F2024-005", "supplier": "Sanitair Groothandel NL", "amount": 2180.00, "vat": 457.80, "date": "2024-01-19", "due_date": "2024-02-19", "status": "nieuw", "payment_status": "openstaand", "category": "Inkoop materialen", "rgs": "WIkworGro", "odoo_po": "PO2024-047", "iban": "NL21INGB0987654321", "bic": "INGBNL2A"},
+    {"id": "F2024-006", "supplier": "Verzekeringen Centraal", "amount": 1450.00, "vat": 0.00, "date": "2024-01-20", "due_date": "2024-02-20", "status": "nieuw", "payment_status": "openstaand", "category": "Verzekeringen", "rgs": "WBehVerBed", "odoo_po": None, "iban": "NL03RABO0345678901", "bic": "RABONL2U"},
+    {"id": "F2024-007", "supplier": "ICT Solutions Partner", "amount": 599.00, "vat": 125.79, "date": "2024-01-21", "due_date": "2024-02-21", "status": "nieuw", "payment_status": "openstaand", "category": "Automatisering", "rgs": "WBehAutSof", "odoo_po": None, "iban": "NL96ABNA0123789456", "bic": "ABNANL2A"},
+    {"id": "F2024-008", "supplier": "Houthandel Rotterdam", "amount": 6420.00, "vat": 1348.20, "date": "2024-01-22", "due_date": "2024-02-22", "status": "nieuw", "payment_status": "openstaand", "category": "Inkoop materialen", "rgs": "WIkworGro", "odoo_po": "PO2024-051", "iban": "NL83INGB0567891234", "bic": "INGBNL2A"},
+]
+
+# Bank accounts for payment integration
+BANK_ACCOUNTS = {
+    "main": {"name": "Hoofdrekening", "bank": "ING", "iban": "NL69INGB0123456789", "balance": 87500.00, "type": "Zakelijke rekening"},
+    "savings": {"name": "Spaarrekening", "bank": "ABN AMRO", "iban": "NL51ABNA0987654321", "balance": 150000.00, "type": "Zakelijke spaarrekening"},
+    "credit": {"name": "Kredietlijn", "bank": "Rabobank", "iban": "NL36RABO0246813579", "balance": -15000.00, "limit": 100000.00, "type": "Zakelijk krediet"},
+}
+
+# Odoo CRM Pipeline Data
+ODOO_CRM_PIPELINE = [
+    {"id": "CRM-001", "name": "Nieuwbouw Villa Wassenaar", "client": "Fam. Bakker", "stage": "Onderhandeling", "amount": 285000, "probability": 75, "expected_close": "2024-02-15", "contact": "M. Bakker", "email": "m.bakker@email.nl", "phone": "+31 6 12345678", "notes": "Wachten op bouwvergunning"},
+    {"id": "CRM-002", "name": "Renovatie Kantoorpand Utrecht", "client": "TechStart B.V.", "stage": "Voorstel", "amount": 125000, "probability": 50, "expected_close": "2024-03-01", "contact": "J. de Vries", "email": "j.devries@techstart.nl", "phone": "+31 6 23456789", "notes": "Concurrent offerte bij Bouwgroep X"},
+    {"id": "CRM-003", "name": "Uitbouw Woning Hilversum", "client": "Fam. Jansen", "stage": "Onderhandeling", "amount": 68000, "probability": 80, "expected_close": "2024-02-28", "contact": "P. Jansen", "email": "pjansen@gmail.com", "phone": "+31 6 34567890", "notes": "Akkoord op prijs, contract deze week"},
+    {"id": "CRM-004", "name": "Bedrijfshal Nieuwegein", "client": "Logistics Plus", "stage": "Kwalificatie", "amount": 420000, "probability": 25, "expected_close": "2024-05-15", "contact": "R. Smit", "email": "r.smit@logisticsplus.nl", "phone": "+31 6 45678901", "notes": "Eerste gesprek positief, site visit gepland"},
+    {"id": "CRM-005", "name": "Verbouwing Restaurant Amsterdam", "client": "Eet & Geniet B.V.", "stage": "Voorstel", "amount": 95000, "probability": 60, "expected_close": "2024-03-15", "contact": "A. Hendriks", "email": "a.hendriks@eetengeniet.nl", "phone": "+31 6 56789012", "notes": "Offerte verstuurd, follow-up volgende week"},
+    {"id": "CRM-006", "name": "Dakrenovatie Appartementencomplex", "client": "VvE Parkzicht", "stage": "Lead", "amount": 180000, "probability": 15, "expected_close": "2024-06-01", "contact": "K. Visser", "email": "vve.parkzicht@gmail.com", "phone": "+31 6 67890123", "notes": "Eerste contact via website"},
+    {"id": "CRM-007", "name": "Aanbouw Praktijkruimte Amersfoort", "client": "Huisartsenpraktijk Centrum", "stage": "Gewonnen", "amount": 78000, "probability": 100, "expected_close": "2024-01-20", "contact": "Dr. M. Kok", "email": "m.kok@hapcentrum.nl", "phone": "+31 6 78901234", "notes": "Contract getekend!"},
+    {"id": "CRM-008", "name": "Showroom Verbouwing Breda", "client": "AutoMax B.V.", "stage": "Kwalificatie", "amount": 210000, "probability": 30, "expected_close": "2024-04-15", "contact": "T. van Dam", "email": "t.vandam@automax.nl", "phone": "+31 6 89012345", "notes": "Budget bevestigd, wachten op specificaties"},
+]
+
+# Odoo Purchase Orders
+ODOO_PURCHASE_ORDERS = [
+    {"id": "PO2024-042", "supplier": "Bouwmaterialen Jansen B.V.", "amount": 4750.00, "status": "Geleverd", "date": "2024-01-10", "project": "CRM-007"},
+    {"id": "PO2024-038", "supplier": "Transport De Vries", "amount": 1250.00, "status": "Geleverd", "date": "2024-01-12", "project": "CRM-007"},
+    {"id": "PO2024-045", "supplier": "Kraan & Hijswerk Utrecht", "amount": 3200.00, "status": "Gepland", "date": "2024-01-25", "project": "CRM-001"},
+    {"id": "PO2024-047", "supplier": "Sanitair Groothandel NL", "amount": 2180.00, "status": "Besteld", "date": "2024-01-18", "project": "CRM-003"},
+    {"id": "PO2024-051", "supplier": "Houthandel Rotterdam", "amount": 6420.00, "status": "Besteld", "date": "2024-01-20", "project": "CRM-001"},
+]
+
+# Ordered lines, goods receipts and invoice lines for 3-way matching
+ODOO_PURCHASE_ORDER_LINES = [
+    {"po_id": "PO2024-042", "line": 1, "product": "Cement CEM III 25 kg", "quantity": 100, "unit_price": 12.50},
+    {"po_id": "PO2024-042", "line": 2, "product": "Metselzand (m³)", "quantity": 40, "unit_price": 50.00},
+    {"po_id": "PO2024-042", "line": 3, "product": "Kalkzandsteen", "quantity": 1500, "unit_price": 1.00},
+    {"po_id": "PO2024-038", "line": 1, "product": "Transport bouwmaterialen (uur)", "quantity": 25, "unit_price": 50.00},
+    {"po_id": "PO2024-045", "line": 1, "product": "Kraanhuur 40 ton (uur)", "quantity": 16, "unit_price": 200.00},
+    {"po_id": "PO2024-047", "line": 1, "product": "Toiletunit hangend", "quantity": 10, "unit_price": 180.00},
+    {"po_id": "PO2024-047", "line": 2, "product": "Fontein wastafel", "quantity": 10, "unit_price": 38.00},
+    {"po_id": "PO2024-051", "line": 1, "product": "Vuren balk 71x171", "quantity": 300, "unit_price": 21.40},
+]
+
+ODOO_GOODS_RECEIPTS = [
+    {"id": "WH/IN/00012", "po_id": "PO2024-042", "po_line": 1, "quantity": 100, "date": "2024-01-12"},
+    {"id": "WH/IN/00012", "po_id": "PO2024-042", "po_line": 2, "quantity": 40, "date": "2024-01-12"},
+    {"id": "WH/IN/00012", "po_id": "PO2024-042", "po_line": 3, "quantity": 1500, "date": "2024-01-12"},
+    {"id": "WH/IN/00013", "po_id": "PO2024-038", "po_line": 1, "quantity": 25, "date": "2024-01-12"},
+    {"id": "WH/IN/00015", "po_id": "PO2024-047", "po_line": 1, "quantity": 10, "date": "2024-01-19"},
+    {"id": "WH/IN/00015", "po_id": "PO2024-047", "po_line": 2, "quantity": 6, "date": "2024-01-19"},
+]
+
+DEMO_INVOICE_LINES = [
+    {"invoice_id": "F2024-001", "line": 1, "po_line": 1, "product": "Cement CEM III 25 kg", "quantity": 100, "unit_price": 12.50},
+    {"invoice_id": "F2024-001", "line": 2, "po_line": 2, "product": "Metselzand (m³)", "quantity": 40, "unit_price": 50.00},
+    {"invoice_id": "F2024-001", "line": 3, "po_line": 3, "product": "Kalkzandsteen", "quantity": 1500, "unit_price": 1.00},
+    {"invoice_id": "F2024-002", "line": 1, "po_line": 1, "product": "Transport bouwmaterialen (uur)", "quantity": 25, "unit_price": 50.00},
+    {"invoice_id": "F2024-004", "line": 1, "po_line": 1, "product": "Kraanhuur 40 ton (uur)", "quantity": 16, "unit_price": 200.00},
+    {"invoice_id": "F2024-005", "line": 1, "po_line": 1, "product": "Toiletunit hangend", "quantity": 10, "unit_price": 180.00},
+    {"invoice_id": "F2024-005", "line": 2, "po_line": 2, "product": "Fontein wastafel", "quantity": 10, "unit_price": 38.00},
+    {"invoice_id": "F2024-008", "line": 1, "po_line": None, "product": "Vuren balk 71x171", "quantity": 250, "unit_price": 21.40},
+    {"invoice_id": "F2024-008", "line": 2, "po_line": None, "product": "Bezorgkosten", "quantity": 1, "unit_price": 1070.00},
+]
+
+# Odoo HR Data
+ODOO_HR = {
+    "employees": [
+        {"name": "Jan Vermeer", "role": "Directeur", "salary": 7500, "fte": 1.0},
+        {"name": "Karin de Boer", "role": "Projectleider", "salary": 5200, "fte": 1.0},
+        {"name": "Pieter Bakker", "role": "Voorman", "salary": 4500, "fte": 1.0},
+        {"name": "Sander Visser", "role": "Timmerman", "salary": 3800, "fte": 1.0},
+        {"name": "Ahmed El-Ahmadi", "role": "Metselaar", "salary": 3600, "fte": 1.0},
+        {"name": "Tomasz Kowalski", "role": "Metselaar", "salary": 3600, "fte": 1.0},
+        {"name": "Erik Jansen", "role": "Elektricien", "salary": 4000, "fte": 0.8},
+        {"name": "Mohammed Al-Rashid", "role": "Loodgieter", "salary": 3900, "fte": 1.0},
+    ],
+    "total_fte": 7.8,
+    "total_salary_costs": 36100,
+    "wkr_budget": 10830,  # 3% van loonsom
+    "wkr_used": 7250,
+}
+
+# RGS Mapping voor W&V
+RGS_WV = {
+    "WOmzNet": {"name": "Netto-omzet", "amount": 612500, "category": "Omzet"},
+    "WOmzOov": {"name": "Overige opbrengsten", "amount": 8500, "category": "Omzet"},
+    "WIkworGro": {"name": "Grond- en hulpstoffen", "amount": -185000, "category": "Kostprijs"},
+    "WIkworUitworInh": {"name": "Uitbesteed werk", "amount": -95000, "category": "Kostprijs"},
+    "WPersLonSal": {"name": "Lonen en salarissen", "amount": -180000, "category": "Personeelskosten"},
+    "WPersSocLas": {"name": "Sociale lasten", "amount": -42000, "category": "Personeelskosten"},
+    "WPersPenLas": {"name": "Pensioenlasten", "amount": -18000, "category": "Personeelskosten"},
+    "WBehHuiHur": {"name": "Huur bedrijfspand", "amount": -36000, "category": "Huisvesting"},
+    "WBehHuiEne": {"name": "Energie", "amount": -8500, "category": "Huisvesting"},
+    "WBehVerBed": {"name": "Bedrijfsverzekeringen", "amount": -12000, "category": "Overig"},
+    "WBehAutAfsTrm": {"name": "Afschrijving transportmiddelen", "amount": -15000, "category": "Afschrijvingen"},
+    "WBehAutAfsMac": {"name": "Afschrijving machines", "amount": -8500, "category": "Afschrijvingen"},
+    "WFinRenRba": {"name": "Rentelasten bankschuld", "amount": -4200, "category": "Financieel"},
+}
+
+# RGS Mapping voor Balans
+RGS_BALANS = {
+    "activa": {
+        "BIvaMatTer": {"name": "Terreinen", "amount": 125000},
+        "BIvaMatBeg": {"name": "Bedrijfsgebouwen", "amount": 285000},
+        "BIvaMatMae": {"name": "Machines en installaties", "amount": 95000},
+        "BIvaMatTrm": {"name": "Transportmiddelen", "amount": 68000},
+        "BVrdVor": {"name": "Voorraden grondstoffen", "amount": 42000},
+        "BVorDebHad": {"name": "Debiteuren", "amount": 142000},
+        "BLimBan": {"name": "Bankrekeningen", "amount": 89000},
+        "BLimKas": {"name": "Kas", "amount": 2500},
+    },
+    "passiva": {
+        "BEivGok": {"name": "Gestort kapitaal", "amount": 100000},
+        "BEivOvr": {"name": "Overige reserves", "amount": 285000},
+        "BEivWin": {"name": "Onverdeeld resultaat", "amount": 89400},
+        "BLasLls": {"name": "Langlopende schulden", "amount": 180000},
+        "BSchCreHan": {"name": "Crediteuren", "amount": 78000},
+        "BSchBelBtw": {"name": "BTW schuld", "amount": 45000},
+        "BSchBelLhe": {"name": "Loonheffing", "amount": 18000},
+        "BSchOvrOvs": {"name": "Overige schulden", "amount": 53100},
+    }
+}
+
+# BTW/ICP Data
+BTW_DATA = {
+    "periodes": [
+        {"periode": "Q4 2024", "status": "Open", "deadline": "2025-01-31", "btw_verschuldigd": 45000, "btw_voorbelasting": 28750, "btw_af_te_dragen": 16250, "icp_leveringen": 12500, "icp_verwervingen": 8200},
+        {"periode": "Q3 2024", "status": "Ingediend", "deadline": "2024-10-31", "btw_verschuldigd": 52000, "btw_voorbelasting": 31200, "btw_af_te_dragen": 20800, "icp_leveringen": 15800, "icp_verwervingen": 6500},
+        {"periode": "Q2 2024", "status": "Betaald", "deadline": "2024-07-31", "btw_verschuldigd": 48500, "btw_voorbelasting": 29100, "btw_af_te_dragen": 19400, "icp_leveringen": 9200, "icp_verwervingen": 11000},
+        {"periode": "Q1 2024", "status": "Betaald", "deadline": "2024-04-30", "btw_verschuldigd": 41200, "btw_voorbelasting": 24720, "btw_af_te_dragen": 16480, "icp_leveringen": 7500, "icp_verwervingen": 5800},
+    ],
+    "icp_relaties": [
+        {"land": "🇩🇪 Duitsland", "btw_nr": "DE123456789", "bedrijf": "Bauhaus GmbH", "leveringen": 8500, "verwervingen": 4200},
+        {"land": "🇧🇪 België", "btw_nr": "BE0123456789", "bedrijf": "Bouwmaterialen BVBA", "leveringen": 3000, "verwervingen": 2500},
+        {"land": "🇫🇷 Frankrijk", "btw_nr": "FR12345678901", "bedrijf": "Construction SARL", "leveringen": 1000, "verwervingen": 1500},
+    ]
+}
+
+# Odoo Boekhouding Sync Data
+ODOO_SYNC_STATUS = {
+    "modules": [
+        {"naam": "Bankrekeningen", "status": "warning", "laatste_sync": "2 uur geleden", "details": "ING synchronisatie mislukt", "items_pending": 3},
+        {"naam": "Verkoopfacturen", "status": "ok", "laatste_sync": "15 min geleden", "details": "Volledig gesynchroniseerd", "items_pending": 0},
+        {"naam": "Inkoopfacturen", "status": "ok", "laatste_sync": "15 min geleden", "details": "Volledig gesynchroniseerd", "items_pending": 0},
+        {"naam": "Grootboek", "status": "ok", "laatste_sync": "15 min geleden", "details": "Alle mutaties verwerkt", "items_pending": 0},
+        {"naam": "BTW Module", "status": "ok", "laatste_sync": "1 dag geleden", "details": "Q4 aangifte in voorbereiding", "items_pending": 1},
+        {"naam": "Salarisadministratie", "status": "ok", "laatste_sync": "3 dagen geleden", "details": "December loonrun verwerkt", "items_pending": 0},
+    ],
+    "ai_booking_stats": {
+        "totaal_mutaties": 1247,
+        "automatisch_geboekt": 1089,
+        "handmatig_nodig": 158,
+        "success_rate": 87.3
+    }
+}
+
+# Openstaande bankmutaties (AI kon niet boeken)
+OPEN_BANK_MUTATIONS = [
+    {"id": "BM-001", "datum": "2025-01-28", "bank": "ING", "bedrag": 2450.00, "omschrijving": "SEPA OVERBOEKING - Ref: INV-2024-0892", "reden": "Geen matchende factuur gevonden", "suggestie": "Mogelijk betaling klant Janssen BV (factuur ontbreekt)"},
+    {"id": "BM-002", "datum": "2025-01-27", "bank": "ING", "bedrag": -875.50, "omschrijving": "IDEAL BETALING - Webshop Order #4521", "reden": "Onbekende grootboekrekening", "suggestie": "Boeken op 8400 - Kantoorkosten?"},
+    {"id": "BM-003", "datum": "2025-01-26", "bank": "ABN AMRO", "bedrag": -15000.00, "omschrijving": "Aflossing lening ABN", "reden": "Lening niet gekoppeld in Odoo", "suggestie": "Koppel lening #LN-2022-001 in Odoo"},
+    {"id": "BM-004", "datum": "2025-01-25", "bank": "ING", "bedrag": 125.00, "omschrijving": "Terugboeking PIN transactie", "reden": "Oorspronkelijke transactie niet gevonden", "suggestie": "Handmatig onderzoeken"},
+    {"id": "BM-005", "datum": "2025-01-24", "bank": "ING", "bedrag": -3200.00, "omschrijving": "Automatische incasso Belastingdienst", "reden": "Meerdere belastingsoorten mogelijk", "suggestie": "BTW of Loonheffing? Check beschikking"},
+]
+
+# Investeringen & Financiering Data
+INVESTERINGEN_DATA = {
+    "activa": [
+        {"categorie": "Terreinen", "rgs": "BIvaMatTer", "aanschaf": 125000, "afschrijving_cum": 0, "boekwaarde": 125000, "methode": "Geen (grond)", "restwaarde": 125000, "levensduur": None},
+        {"categorie": "Bedrijfsgebouwen", "rgs": "BIvaMatBeg", "aanschaf": 450000, "afschrijving_cum": 165000, "boekwaarde": 285000, "methode": "Lineair", "restwaarde": 100000, "levensduur": 30},
+        {"categorie": "Machines & installaties", "rgs": "BIvaMatMae", "aanschaf": 180000, "afschrijving_cum": 85000, "boekwaarde": 95000, "methode": "Lineair", "restwaarde": 10000, "levensduur": 10},
+        {"categorie": "Transportmiddelen", "rgs": "BIvaMatTrm", "aanschaf": 125000, "afschrijving_cum": 57000, "boekwaarde": 68000, "methode": "Lineair", "restwaarde": 15000, "levensduur": 5},
+        {"categorie": "Inventaris", "rgs": "BIvaMatInv", "aanschaf": 45000, "afschrijving_cum": 32000, "boekwaarde": 13000, "methode": "Lineair", "restwaarde": 0, "levensduur": 5},
+        {"categorie": "ICT Hardware", "rgs": "BIvaMatIct", "aanschaf": 28000, "afschrijving_cum": 19000, "boekwaarde": 9000, "methode": "Lineair", "restwaarde": 0, "levensduur": 3},
+    ],
+    "afschrijvingen_jaar": [
+        {"categorie": "Bedrijfsgebouwen", "2022": 11667, "2023": 11667, "2024": 11667, "2025_budget": 11667},
+        {"categorie": "Machines & installaties", "2022": 17000, "2023": 17000, "2024": 17000, "2025_budget": 17000},
+        {"categorie": "Transportmiddelen", "2022": 22000, "2023": 22000, "2024": 22000, "2025_budget": 22000},
+        {"categorie": "Inventaris", "2022": 9000, "2023": 9000, "2024": 9000, "2025_budget": 5000},
+        {"categorie": "ICT Hardware", "2022": 9333, "2023": 9333, "2024": 9333, "2025_budget": 0},
+    ],
+    "geplande_investeringen": [
+        {"omschrijving": "Nieuwe bedrijfswagen", "bedrag": 45000, "datum": "Q2 2025", "status": "Goedgekeurd"},
+        {"omschrijving": "Server upgrade", "bedrag": 12000, "datum": "Q1 2025", "status": "In bestelling"},
+        {"omschrijving": "Productielijn uitbreiding", "bedrag": 85000, "datum": "Q3 2025", "status": "In overweging"},
+    ]
+}
+
+FINANCIERING_DATA = {
+    "leningen_ontvangen": [
+        {"id": "LN-2022-001", "verstrekker": "ABN AMRO Bank", "type": "Hypothecaire lening", "hoofdsom": 350000, "openstaand": 280000, "rente": 3.2, "aflossing_maand": 2500, "einddatum": "2037-06-01", "onderpand": "Bedrijfspand"},
+        {"id": "LN-2023-001", "verstrekker": "Rabobank", "type": "Bedrijfskrediet", "hoofdsom": 75000, "openstaand": 52000, "rente": 4.8, "aflossing_maand": 1800, "einddatum": "2026-12-01", "onderpand": "Geen"},
+        {"id": "LN-2024-001", "verstrekker": "Qredits", "type": "Investeringskrediet", "hoofdsom": 25000, "openstaand": 22500, "rente": 5.5, "aflossing_maand": 850, "einddatum": "2027-03-01", "onderpand": "Geen"},
+    ],
+    "leningen_verstrekt": [
+        {"id": "LV-2023-001", "debiteur": "Dochter BV", "type": "Rekening-courant", "hoofdsom": 50000, "openstaand": 35000, "rente": 2.0, "aflossing_maand": 1500, "einddatum": "2025-12-01"},
+    ],
+    "kredietfaciliteiten": [
+        {"bank": "ING", "type": "Rekening-courant krediet", "limiet": 100000, "benut": 15000, "beschikbaar": 85000},
+        {"bank": "ABN AMRO", "type": "Garantiekrediet", "limiet": 50000, "benut": 12000, "beschikbaar": 38000},
+    ],
+    "aflossingsschema_2025": [
+        {"maand": "Jan", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Feb", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Mar", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Apr", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Mei", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Jun", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Jul", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Aug", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Sep", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Okt", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Nov", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+        {"maand": "Dec", "abn_hypo": 2500, "rabo_krediet": 1800, "qredits": 850, "totaal": 5150},
+    ]
+}
+
+# Cashflow Forecasting Data
+CASHFLOW_DATA = {
+    "current_cash": 87500,
+    "credit_available": 50000,
+    "credit_used": 12000,
+    
+    # Bekende inkomsten (uit openstaande facturen, CRM pipeline, etc.)
+    "expected_inflows": [
+        {"maand": "Feb", "bron": "Factuur #2024-089 (Gemeente)", "bedrag": 24200, "kans": 95, "categorie": "Debiteuren"},
+        {"maand": "Feb", "bron": "Project Amstelveen", "bedrag": 35000, "kans": 90, "categorie": "Projecten"},
+        {"maand": "Mrt", "bron": "Factuur #2024-091", "bedrag": 8500, "kans": 100, "categorie": "Debiteuren"},
+        {"maand": "Mrt", "bron": "CRM: Villa Wassenaar (aanbetaling)", "bedrag": 45000, "kans": 75, "categorie": "CRM Pipeline"},
+        {"maand": "Apr", "bron": "Terugkerend: Onderhoud contracts", "bedrag": 12000, "kans": 100, "categorie": "Recurring"},
+        {"maand": "Mei", "bron": "CRM: Kantoor Schiphol", "bedrag": 28000, "kans": 40, "categorie": "CRM Pipeline"},
+    ],
+    
+    # Bekende uitgaven
+    "expected_outflows": [
+        {"maand": "Feb", "bron": "Salarissen", "bedrag": 28500, "categorie": "Personeel", "recurring": True},
+        {"maand": "Feb", "bron": "BTW Q4 afdracht", "bedrag": 18750, "categorie": "Belastingen", "recurring": False},
+        {"maand": "Feb", "bron": "Huur & utilities", "bedrag": 4200, "categorie": "Huisvesting", "recurring": True},
+        {"maand": "Feb", "bron": "Crediteuren (leveranciers)", "bedrag": 15600, "categorie": "Inkoop", "recurring": False},
+        {"maand": "Mrt", "bron": "Salarissen", "bedrag": 28500, "categorie": "Personeel", "recurring": True},
+        {"maand": "Mrt", "bron": "Huur & utilities", "bedrag": 4200, "categorie": "Huisvesting", "recurring": True},
+        {"maand": "Mrt", "bron": "Voorlopige aanslag Vpb", "bedrag": 8500, "categorie": "Belastingen", "recurring": False},
+        {"maand": "Mrt", "bron": "Leaseauto's", "bedrag": 3200, "categorie": "Vervoer", "recurring": True},
+        {"maand": "Apr", "bron": "Salarissen", "bedrag": 28500, "categorie": "Personeel", "recurring": True},
+        {"maand": "Apr", "bron": "BTW Q1 afdracht", "bedrag": 14200, "categorie": "Belastingen", "recurring": False},
+        {"maand": "Apr", "bron": "Huur & utilities", "bedrag": 4200, "categorie": "Huisvesting", "recurring": True},
+        {"maand": "Mei", "bron": "Salarissen", "bedrag": 28500, "categorie": "Personeel", "recurring": True},
+        {"maand": "Mei", "bron": "Huur & utilities", "bedrag": 4200, "categorie": "Huisvesting", "recurring": True},
+        {"maand": "Jun", "bron": "Salarissen", "bedrag": 28500, "categorie": "Personeel", "recurring": True},
+        {"maand": "Jun", "bron": "Aflossing bedrijfskrediet", "bedrag": 5000, "categorie": "Financiering", "recurring": True},
+    ],
+    
+    # Maandelijks saldo prognose
+    "monthly_forecast": [
+        {"maand": "Jan", "begin_saldo": 87500, "inkomsten": 0, "uitgaven": 0, "eind_saldo": 87500, "type": "actueel"},
+        {"maand": "Feb", "begin_saldo": 87500, "inkomsten": 59200, "uitgaven": 67050, "eind_saldo": 79650, "type": "forecast"},
+        {"maand": "Mrt", "begin_saldo": 79650, "inkomsten": 53500, "uitgaven": 44400, "eind_saldo": 88750, "type": "forecast"},
+        {"maand": "Apr", "begin_saldo": 88750, "inkomsten": 12000, "uitgaven": 46900, "eind_saldo": 53850, "type": "forecast"},
+        {"maand": "Mei", "begin_saldo": 53850, "inkomsten": 28000, "uitgaven": 32700, "eind_saldo": 49150, "type": "forecast"},
+        {"maand": "Jun", "begin_saldo": 49150, "inkomsten": 45000, "uitgaven": 33500, "eind_saldo": 60650, "type": "forecast"},
+    ],
+    
+    # Minimum cash buffer
+    "min_buffer": 30000,
+    "warning_buffer": 50000,
+}
+
+# Vennootschapsbelasting Data
+VPB_DATA = {
+    "boekjaar": "2024",
+    "fiscale_winst": 89400,
+    "berekening": {
+        "winst_voor_vpb": 89400,
+        "kleinschaligheidsinvesteringsaftrek": 5200,
+        "overige_fiscale_correcties": -2100,
+        "belastbare_winst": 82100,
+        "vpb_schijf_1": 15599,  # 82100 * 19%
+        "vpb_totaal": 15599
+    },
+    "voorlopige_aanslagen": [
+        {"jaar": "2024", "bedrag": 14000, "status": "Betaald", "betaaldatum": "2024-06-15"},
+        {"jaar": "2024", "bedrag": 14000, "status": "Open", "betaaldatum": "2025-02-28"},
+    ],
+    "deadlines": [
+        {"omschrijving": "Aangifte Vpb 2024", "deadline": "2025-06-01", "status": "Nog in te dienen"},
+        {"omschrijving": "Betaling voorlopige aanslag 2024", "deadline": "2025-02-28", "status": "Open"},
+        {"omschrijving": "Definitieve aanslag 2023", "deadline": "Ontvangen", "status": "Akkoord"},
+    ]
+}
+
+# ============================================
+# MONTHLY CLOSING DATA (MIRA Agent)
+# ============================================
+
+# Closing periods configuration
+CLOSING_PERIODS = {
+    "2025-01": {"name": "Januari 2025", "status": "open", "deadline": "2025-02-15", "type": "monthly"},
+    "2024-12": {"name": "December 2024", "status": "closed", "deadline": "2025-01-15", "type": "monthly"},
+    "2024-Q4": {"name": "Q4 2024", "status": "closed", "deadline": "2025-01-31", "type": "quarterly"},
+    "2024-11": {"name": "November 2024", "status": "closed", "deadline": "2024-12-15", "type": "monthly"},
+    "2024-10": {"name": "Oktober 2024", "status": "closed", "deadline": "2024-11-15", "type": "monthly"},
+    "2024-Q3": {"name": "Q3 2024", "status": "closed", "deadline": "2024-10-31", "type": "quarterly"},
+}
+
+# Monthly closing checklist template
+CLOSING_CHECKLIST = [
+    {
+        "id": "CHK-001",
+        "category": "Bankreconciliatie",
+        "task": "Bankmutaties volledig geboekt",
+        "description": "Controleer of alle bankmutaties zijn geïmporteerd en geboekt in Odoo",
+        "status": "completed",
+        "responsible_agent": "ARIA",
+        "odoo_module": "account.bank.statement",
+        "automated": True,
+        "completion_date": "2025-01-28",
+        "notes": "Automatisch geverifieerd door ARIA - 100% gematcht"
+    },
+    {
+        "id": "CHK-002",
+        "category": "Bankreconciliatie",
+        "task": "Banksaldo afgestemd met grootboek",
+        "description": "Eindsaldo bank = saldo grootboekrekening bank",
+        "status": "completed",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.move",
+        "automated": True,
+        "completion_date": "2025-01-28",
+        "notes": "Saldo ING: € 87.500 - Verschil: € 0"
+    },
+    {
+        "id": "CHK-003",
+        "category": "Inkoopfacturen",
+        "task": "Alle inkoopfacturen geboekt",
+        "description": "Controleer dat alle ontvangen facturen zijn ingevoerd",
+        "status": "attention",
+        "responsible_agent": "ARIA",
+        "odoo_module": "account.move",
+        "automated": True,
+        "completion_date": None,
+        "notes": "4 facturen wachten nog op boeking - doorsturen naar ARIA"
+    },
+    {
+        "id": "CHK-004",
+        "category": "Inkoopfacturen",
+        "task": "Inkoopfacturen afgestemd met PO's",
+        "description": "3-way matching: PO, ontvangst, factuur",
+        "status": "completed",
+        "responsible_agent": "ARIA",
+        "odoo_module": "purchase.order",
+        "automated": True,
+        "completion_date": "2025-01-29",
+        "notes": "5 van 5 PO's gematcht"
+    },
+    {
+        "id": "CHK-005",
+        "category": "Verkoopfacturen",
+        "task": "Omzet volledig gefactureerd",
+        "description": "Alle leveringen/diensten zijn gefactureerd",
+        "status": "completed",
+        "responsible_agent": "ARIA",
+        "odoo_module": "sale.order",
+        "automated": True,
+        "completion_date": "2025-01-30",
+        "notes": "Omzet januari: € 612.500"
+    },
+    {
+        "id": "CHK-006",
+        "category": "Verkoopfacturen",
+        "task": "Debiteuren ouderdom geanalyseerd",
+        "description": "Controleer openstaande debiteuren op ouderdom",
+        "status": "attention",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.aged.receivable",
+        "automated": True,
+        "completion_date": None,
+        "notes": "3 facturen > 60 dagen - Escalatie nodig"
+    },
+    {
+        "id": "CHK-007",
+        "category": "Voorraad",
+        "task": "Voorraadwaardering gecontroleerd",
+        "description": "Voorraad gewaardeerd tegen correcte kostprijs",
+        "status": "completed",
+        "responsible_agent": "NOVA",
+        "odoo_module": "stock.valuation",
+        "automated": True,
+        "completion_date": "2025-01-30",
+        "notes": "Voorraadwaarde: € 45.000"
+    },
+    {
+        "id": "CHK-008",
+        "category": "Personeel",
+        "task": "Salarisverwerking compleet",
+        "description": "Lonen geboekt incl. sociale lasten en pensioenen",
+        "status": "completed",
+        "responsible_agent": "SAGE",
+        "odoo_module": "hr.payslip",
+        "automated": False,
+        "completion_date": "2025-01-27",
+        "notes": "Totale loonkosten: € 36.100"
+    },
+    {
+        "id": "CHK-009",
+        "category": "Personeel",
+        "task": "WKR-ruimte gecontroleerd",
+        "description": "Werkkostenregeling binnen vrije ruimte",
+        "status": "completed",
+        "responsible_agent": "SAGE",
+        "odoo_module": "hr.expense",
+        "automated": True,
+        "completion_date": "2025-01-27",
+        "notes": "WKR: 62% benut van € 6.498"
+    },
+    {
+        "id": "CHK-010",
+        "category": "Afschrijvingen",
+        "task": "Afschrijvingen geboekt",
+        "description": "Maandelijkse afschrijvingen op vaste activa",
+        "status": "pending",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.asset",
+        "automated": True,
+        "completion_date": None,
+        "notes": "Wacht op goedkeuring - € 2.900 te boeken"
+    },
+    {
+        "id": "CHK-011",
+        "category": "Overlopende posten",
+        "task": "Vooruitbetaalde kosten verwerkt",
+        "description": "Periodieke verdeling van vooruitbetaalde kosten",
+        "status": "pending",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.move",
+        "automated": False,
+        "completion_date": None,
+        "notes": "Verzekeringen en abonnementen toerekenen"
+    },
+    {
+        "id": "CHK-012",
+        "category": "BTW",
+        "task": "BTW-aangifte voorbereid",
+        "description": "Concept BTW-aangifte gegenereerd en gecontroleerd",
+        "status": "completed",
+        "responsible_agent": "SAGE",
+        "odoo_module": "account.tax.report",
+        "automated": True,
+        "completion_date": "2025-01-30",
+        "notes": "BTW te betalen: € 45.000"
+    },
+    {
+        "id": "CHK-013",
+        "category": "Afsluiting",
+        "task": "Intercompany afgestemd",
+        "description": "Controleer intercompany balansen indien van toepassing",
+        "status": "not_applicable",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.move",
+        "automated": False,
+        "completion_date": None,
+        "notes": "N.v.t. - geen intercompany relaties"
+    },
+    {
+        "id": "CHK-014",
+        "category": "Afsluiting",
+        "task": "Budgetvarianties geanalyseerd",
+        "description": "Significante afwijkingen t.o.v. budget verklaard",
+        "status": "in_progress",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.budget",
+        "automated": True,
+        "completion_date": None,
+        "notes": "2 significante varianties gedetecteerd - analyse lopend"
+    },
+    {
+        "id": "CHK-015",
+        "category": "Afsluiting",
+        "task": "Periode afgesloten in Odoo",
+        "description": "Periode vergrendelen voor nieuwe boekingen",
+        "status": "blocked",
+        "responsible_agent": "MIRA",
+        "odoo_module": "account.period",
+        "automated": False,
+        "completion_date": None,
+        "notes": "Wacht op voltooiing van alle taken"
+    }
+]
+
+# Budget vs Actual data for variance analysis
+BUDGET_VS_ACTUAL = {
+    "period": "Januari 2025",
+    "categories": [
+        {
+            "category": "Omzet",
+            "rgs_code": "WOmzNet",
+            "budget": 580000,
+            "actual": 612500,
+            "variance": 32500,
+            "variance_pct": 5.6,
+            "status": "favorable",
+            "explanation": "Hogere vraag naar nieuwbouwprojecten",
+            "action_required": False
+        },
+        {
+            "category": "Kostprijs omzet",
+            "rgs_code": "WKprOmz",
+            "budget": -320000,
+            "actual": -345000,
+            "variance": -25000,
+            "variance_pct": 7.8,
+            "status": "unfavorable",
+            "explanation": "Gestegen materiaalprijzen door leveringsproblemen",
+            "action_required": True,
+            "action": "Heronderhandeling leverancierscontracten - doorsturen naar inkoop"
+        },
+        {
+            "category": "Personeelskosten",
+            "rgs_code": "WPerLon",
+            "budget": -36000,
+            "actual": -36100,
+            "variance": -100,
+            "variance_pct": 0.3,
+            "status": "on_track",
+            "explanation": "Binnen marge",
+            "action_required": False
+        },
+        {
+            "category": "Huisvestingskosten",
+            "rgs_code": "WBehHui",
+            "budget": -8500,
+            "actual": -8750,
+            "variance": -250,
+            "variance_pct": 2.9,
+            "status": "on_track",
+            "explanation": "Hogere energiekosten door koude maand",
+            "action_required": False
+        },
+        {
+            "category": "Autokosten",
+            "rgs_code": "WBehAut",
+            "budget": -4200,
+            "actual": -3950,
+            "variance": 250,
+            "variance_pct": -6.0,
+            "status": "favorable",
+            "explanation": "Minder kilometers door efficiëntere planning",
+            "action_required": False
+        },
+        {
+            "category": "Afschrijvingen",
+            "rgs_code": "WAfsMat",
+            "budget": -2900,
+            "actual": -2900,
+            "variance": 0,
+            "variance_pct": 0.0,
+            "status": "on_track",
+            "explanation": "Conform planning",
+            "action_required": False
+        },
+        {
+            "category": "Overige bedrijfskosten",
+            "rgs_code": "WBehOvr",
+            "budget": -12000,
+            "actual": -14200,
+            "variance": -2200,
+            "variance_pct": 18.3,
+            "status": "unfavorable",
+            "explanation": "Onverwachte IT-kosten en consultancy",
+            "action_required": True,
+            "action": "Analyse IT-uitgaven - eventueel aanpassen jaarbudget"
+        },
+        {
+            "category": "Financiële lasten",
+            "rgs_code": "WFinLas",
+            "budget": -3200,
+            "actual": -3100,
+            "variance": 100,
+            "variance_pct": -3.1,
+            "status": "favorable",
+            "explanation": "Lagere rente door aflossing",
+            "action_required": False
+        }
+    ],
+    "summary": {
+        "budget_result": 193200,
+        "actual_result": 198500,
+        "total_variance": 5300,
+        "total_variance_pct": 2.7,
+        "status": "favorable"
+    }
+}
+
+# Issues requiring attention from other agents
+CLOSING_ISSUES = [
+    {
+        "id": "ISS-001",
+        "type": "booking_required",
+        "severity": "warning",
+        "title": "4 inkoopfacturen wachten op boeking",
+        "description": "Facturen ontvangen maar nog niet verwerkt in Odoo",
+        "amount": 12849.00,
+        "route_to_agent": "ARIA",
+        "status": "open",
+        "created_date": "2025-01-28",
+        "action": "Facturen laten verwerken door ARIA"
+    },
+    {
+        "id": "ISS-002",
+        "type": "variance_alert",
+        "severity": "attention",
+        "title": "Kostprijs omzet 7.8% boven budget",
+        "description": "Materiaalprijzen significant hoger dan gepland",
+        "amount": -25000,
+        "route_to_agent": "SAGE",
+        "status": "under_review",
+        "created_date": "2025-01-30",
+        "action": "Fiscale impact beoordelen en advies leverancierscontracten"
+    },
+    {
+        "id": "ISS-003",
+        "type": "overdue_receivables",
+        "severity": "warning",
+        "title": "3 debiteuren > 60 dagen openstaand",
+        "description": "Openstaande facturen vereisen incasso-actie",
+        "amount": 28500,
+        "route_to_agent": "ALEX",
+        "status": "open",
+        "created_date": "2025-01-29",
+        "action": "Klantcontact opnemen via ALEX"
+    },
+    {
+        "id": "ISS-004",
+        "type": "approval_required",
+        "severity": "info",
+        "title": "Afschrijvingen wachten op goedkeuring",
+        "description": "Maandelijkse afschrijvingen klaar voor boeking",
+        "amount": 2900,
+        "route_to_agent": None,
+        "status": "pending_approval",
+        "created_date": "2025-01-30",
+        "action": "Goedkeuren door accountant"
+    }
+]
+
+# Historical closing data for trends
+CLOSING_HISTORY = [
+    {"period": "2024-12", "name": "December 2024", "result": 185000, "budget": 180000, "variance_pct": 2.8, "days_to_close": 12, "issues_found": 3},
+    {"period": "2024-11", "name": "November 2024", "result": 172000, "budget": 175000, "variance_pct": -1.7, "days_to_close": 10, "issues_found": 2},
+    {"period": "2024-10", "name": "Oktober 2024", "result": 168000, "budget": 170000, "variance_pct": -1.2, "days_to_close": 11, "issues_found": 4},
+    {"period": "2024-09", "name": "September 2024", "result": 195000, "budget": 185000, "variance_pct": 5.4, "days_to_close": 9, "issues_found": 1},
+    {"period": "2024-08", "name": "Augustus 2024", "result": 142000, "budget": 145000, "variance_pct": -2.1, "days_to_close": 14, "issues_found": 5},
+    {"period": "2024-07", "name": "Juli 2024", "result": 138000, "budget": 140000, "variance_pct": -1.4, "days_to_close": 13, "issues_found": 2},
+]
+
+# ============================================
+# ANNUAL STATEMENT DATA (VERA Agent) - Jaarrekening
+# ============================================
+
+# Demo annual statement data
+ANNUAL_STATEMENTS = {
+    "2024": {
+        "boekjaar": "2024",
+        "status": "review_accountant",
+        "company_size": "klein",
+        "created_date": "2025-01-15",
+        "deadline_deponering": "2025-12-31",  # Normally within 12 months after year end
+        "deadline_vaststelling": "2025-06-30",  # Normally within 6 months after year end
+        "current_reviewer": "Mark de Vries",
+        "approval_history": [
+            {"stage": "concept", "date": "2025-01-15", "user": "VERA", "action": "Concept opgesteld", "notes": "Automatisch gegenereerd op basis van grootboekgegevens"},
+            {"stage": "review_accountant", "date": "2025-01-20", "user": "Mark de Vries", "action": "In review genomen", "notes": "Start controle jaarrekening"}
+        ],
+        "components": {
+            "balans": {"status": "concept", "last_updated": "2025-01-15"},
+            "wv_rekening": {"status": "concept", "last_updated": "2025-01-15"},
+            "toelichting": {"status": "concept", "last_updated": "2025-01-15"},
+            "bestuursverslag": {"status": "niet_vereist", "last_updated": None},
+            "accountantsverklaring": {"status": "niet_vereist", "last_updated": None},
+            "overige_gegevens": {"status": "concept", "last_updated": "2025-01-15"}
+        },
+        "financials": {
+            "balanstotaal": 848500,
+            "netto_omzet": 612500,
+            "resultaat": 89400,
+            "eigen_vermogen": 474400,
+            "werknemers": 8
+        },
+        "issues": [
+            {"id": "JR-001", "type": "aandachtspunt", "severity": "warning", "title": "Voorziening dubieuze debiteuren", "description": "Beoordeel of voorziening toereikend is gezien 3 facturen > 60 dagen", "status": "open"},
+            {"id": "JR-002", "type": "verificatie", "severity": "info", "title": "Afschrijvingsmethode machines", "description": "Bevestig dat lineaire afschrijving nog steeds passend is", "status": "open"},
+        ],
+        "kvk_submission": None
+    },
+    "2023": {
+        "boekjaar": "2023",
+        "status": "afgerond",
+        "company_size": "klein",
+        "created_date": "2024-01-20",
+        "deadline_deponering": "2024-12-31",
+        "deadline_vaststelling": "2024-06-30",
+        "current_reviewer": None,
+        "approval_history": [
+            {"stage": "concept", "date": "2024-01-20", "user": "VERA", "action": "Concept opgesteld", "notes": "Automatisch gegenereerd"},
+            {"stage": "review_accountant", "date": "2024-02-15", "user": "Mark de Vries", "action": "Goedgekeurd", "notes": "Geen materiële bevindingen"},
+            {"stage": "review_bestuur", "date": "2024-03-01", "user": "Jan Vermeer", "action": "Ondertekend", "notes": ""},
+            {"stage": "vaststelling_ava", "date": "2024-04-15", "user": "AVA", "action": "Vastgesteld", "notes": "Unaniem goedgekeurd"},
+            {"stage": "deponering", "date": "2024-04-20", "user": "VERA", "action": "Gedeponeerd", "notes": "SBR indiening succesvol"}
+        ],
+        "components": {
+            "balans": {"status": "definitief", "last_updated": "2024-04-15"},
+            "wv_rekening": {"status": "definitief", "last_updated": "2024-04-15"},
+            "toelichting": {"status": "definitief", "last_updated": "2024-04-15"},
+            "bestuursverslag": {"status": "niet_vereist", "last_updated": None},
+            "accountantsverklaring": {"status": "niet_vereist", "last_updated": None},
+            "overige_gegevens": {"status": "definitief", "last_updated": "2024-04-15"}
+        },
+        "financials": {
+            "balanstotaal": 795000,
+            "netto_omzet": 545200,
+            "resultaat": 72500,
+            "eigen_vermogen": 385000,
+            "werknemers": 7
+        },
+        "issues": [],
+        "kvk_submission": {
+            "submission_date": "2024-04-20",
+            "kvk_nummer": "12345678",
+            "sbr_reference": "SBR-2024-001234567",
+            "status": "geaccepteerd",
+            "confirmation_date": "2024-04-21"
+        }
+    }
+}
+
+# Annual statement checklist
+ANNUAL_STATEMENT_CHECKLIST = [
+    {
+        "id": "JRC-001",
+        "category": "Voorbereiding",
+        "task": "Proefbalans afstemmen",
+        "description": "Controleer dat de proefbalans sluitend is en alle periodes zijn afgesloten",
+        "status": "completed",
+        "responsible_agent": "MIRA",
+        "automated": True,
+        "completion_date": "2025-01-10"
+    },
+    {
+        "id": "JRC-002",
+        "category": "Voorbereiding",
+        "task": "Intercompany afstemmen",
+        "description": "Stem intercompany vorderingen/schulden af (indien van toepassing)",
+        "status": "not_applicable",
+        "responsible_agent": "MIRA",
+        "automated": True,
+        "completion_date": None
+    },
+    {
+        "id": "JRC-003",
+        "category": "Activa",
+        "task": "Vaste activa controle",
+        "description": "Verifieer boekwaarden, afschrijvingen en eventuele bijzondere waardeverminderingen",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-12"
+    },
+    {
+        "id": "JRC-004",
+        "category": "Activa",
+        "task": "Voorraadwaardering",
+        "description": "Controleer voorraadwaardering tegen kostprijs of lagere marktwaarde",
+        "status": "completed",
+        "responsible_agent": "NOVA",
+        "automated": True,
+        "completion_date": "2025-01-12"
+    },
+    {
+        "id": "JRC-005",
+        "category": "Activa",
+        "task": "Debiteuren analyse",
+        "description": "Beoordeel inbaarheid en bepaal voorziening dubieuze debiteuren",
+        "status": "attention",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": None,
+        "notes": "3 facturen > 60 dagen - voorziening evalueren"
+    },
+    {
+        "id": "JRC-006",
+        "category": "Passiva",
+        "task": "Eigen vermogen mutaties",
+        "description": "Verwerk resultaatbestemming vorig boekjaar en dividenduitkeringen",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-13"
+    },
+    {
+        "id": "JRC-007",
+        "category": "Passiva",
+        "task": "Voorzieningen beoordelen",
+        "description": "Controleer of voorzieningen toereikend en niet te hoog zijn",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": False,
+        "completion_date": "2025-01-14"
+    },
+    {
+        "id": "JRC-008",
+        "category": "Passiva",
+        "task": "Langlopende schulden",
+        "description": "Verifieer saldi met leningovereenkomsten en splits kort/langlopend",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-14"
+    },
+    {
+        "id": "JRC-009",
+        "category": "Resultaat",
+        "task": "Omzet verantwoording",
+        "description": "Controleer omzetverantwoording volgens RJ 270",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-15"
+    },
+    {
+        "id": "JRC-010",
+        "category": "Resultaat",
+        "task": "Kosten cut-off",
+        "description": "Verifieer dat kosten in juiste periode zijn verantwoord",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-15"
+    },
+    {
+        "id": "JRC-011",
+        "category": "Fiscaal",
+        "task": "Belastingpositie",
+        "description": "Bereken acute belastingschuld en latente belastingen",
+        "status": "in_progress",
+        "responsible_agent": "SAGE",
+        "automated": False,
+        "completion_date": None,
+        "notes": "Wacht op definitieve Vpb-berekening"
+    },
+    {
+        "id": "JRC-012",
+        "category": "Toelichting",
+        "task": "Grondslagen opstellen",
+        "description": "Stel waarderingsgrondslagen op conform RJ/BW2",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-15"
+    },
+    {
+        "id": "JRC-013",
+        "category": "Toelichting",
+        "task": "Niet uit balans blijkende verplichtingen",
+        "description": "Inventariseer en beschrijf off-balance verplichtingen",
+        "status": "pending",
+        "responsible_agent": "VERA",
+        "automated": False,
+        "completion_date": None
+    },
+    {
+        "id": "JRC-014",
+        "category": "Toelichting",
+        "task": "Gebeurtenissen na balansdatum",
+        "description": "Beoordeel gebeurtenissen na balansdatum op impact",
+        "status": "pending",
+        "responsible_agent": "VERA",
+        "automated": False,
+        "completion_date": None
+    },
+    {
+        "id": "JRC-015",
+        "category": "Afsluiting",
+        "task": "Jaarrekening genereren",
+        "description": "Genereer concept jaarrekening in juiste format",
+        "status": "completed",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": "2025-01-15"
+    },
+    {
+        "id": "JRC-016",
+        "category": "Afsluiting",
+        "task": "SBR validatie",
+        "description": "Valideer jaarrekening tegen SBR taxonomie",
+        "status": "pending",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": None
+    },
+    {
+        "id": "JRC-017",
+        "category": "Goedkeuring",
+        "task": "Accountantsreview",
+        "description": "Review door accountant en opstellen werkdocumenten",
+        "status": "in_progress",
+        "responsible_agent": None,
+        "automated": False,
+        "completion_date": None,
+        "notes": "In behandeling bij Mark de Vries"
+    },
+    {
+        "id": "JRC-018",
+        "category": "Goedkeuring",
+        "task": "Bestuursondertekening",
+        "description": "Ondertekening door alle bestuurders",
+        "status": "blocked",
+        "responsible_agent": None,
+        "automated": False,
+        "completion_date": None,
+        "notes": "Wacht op accountantsreview"
+    },
+    {
+        "id": "JRC-019",
+        "category": "Goedkeuring",
+        "task": "AVA vaststelling",
+        "description": "Vaststelling door Algemene Vergadering van Aandeelhouders",
+        "status": "blocked",
+        "responsible_agent": None,
+        "automated": False,
+        "completion_date": None,
+        "notes": "Wacht op bestuursondertekening"
+    },
+    {
+        "id": "JRC-020",
+        "category": "Publicatie",
+        "task": "KvK deponering",
+        "description": "Deponering bij Kamer van Koophandel via SBR",
+        "status": "blocked",
+        "responsible_agent": "VERA",
+        "automated": True,
+        "completion_date": None,
+        "notes": "Wacht op AVA vaststelling"
+    }
+]
+
+# Balance sheet structure for annual statement
+ANNUAL_BALANS = {
+    "activa": {
+        "vaste_activa": {
+            "name": "Vaste activa",
+            "items": [
+                {"rgs": "BIvaMatTer", "name": "Terreinen", "amount": 125000},
+                {"rgs": "BIvaMatBeg", "name": "Bedrijfsgebouwen", "amount": 285000},
+                {"rgs": "BIvaMatMae", "name": "Machines en installaties", "amount": 95000},
+                {"rgs": "BIvaMatTrm", "name": "Transportmiddelen", "amount": 68000}
+            ],
+            "subtotal": 573000
+        },
+        "vlottende_activa": {
+            "name": "Vlottende activa",
+            "items": [
+                {"rgs": "BVrdVor", "name": "Voorraden", "amount": 42000},
+                {"rgs": "BVorDebHad", "name": "Vorderingen op handelsdebiteuren", "amount": 142000},
+                {"rgs": "BVorOvr", "name": "Overige vorderingen", "amount": 3000},
+                {"rgs": "BLimBan", "name": "Liquide middelen", "amount": 88500}
+            ],
+            "subtotal": 275500
+        }
+    },
+    "passiva": {
+        "eigen_vermogen": {
+            "name": "Eigen vermogen",
+            "items": [
+                {"rgs": "BEivGok", "name": "Gestort kapitaal", "amount": 100000},
+                {"rgs": "BEivOvr", "name": "Overige reserves", "amount": 285000},
+                {"rgs": "BEivWin", "name": "Onverdeeld resultaat boekjaar", "amount": 89400}
+            ],
+            "subtotal": 474400
+        },
+        "langlopende_schulden": {
+            "name": "Langlopende schulden",
+            "items": [
+                {"rgs": "BLasLls", "name": "Schulden aan kredietinstellingen", "amount": 180000}
+            ],
+            "subtotal": 180000
+        },
+        "kortlopende_schulden": {
+            "name": "Kortlopende schulden",
+            "items": [
+                {"rgs": "BSchCreHan", "name": "Crediteuren", "amount": 78000},
+                {"rgs": "BSchBelBtw", "name": "Omzetbelasting", "amount": 45000},
+                {"rgs": "BSchBelLhe", "name": "Loonheffing", "amount": 18000},
+                {"rgs": "BSchOvrOvs", "name": "Overige schulden", "amount": 53100}
+            ],
+            "subtotal": 194100
+        }
+    },
+    "totaal_activa": 848500,
+    "totaal_passiva": 848500
+}
+
+# Profit and Loss for annual statement
+ANNUAL_WV = {
+    "netto_omzet": {"name": "Netto-omzet", "rgs": "WOmzNet", "amount": 612500},
+    "overige_opbrengsten": {"name": "Overige bedrijfsopbrengsten", "rgs": "WOmzOov", "amount": 8500},
+    "totaal_opbrengsten": 621000,
+    "kosten": {
+        "items": [
+            {"rgs": "WIkworGro", "name": "Grond- en hulpstoffen", "amount": -185000},
+            {"rgs": "WIkworUitworInh", "name": "Uitbesteed werk", "amount": -95000},
+            {"rgs": "WPersLonSal", "name": "Lonen en salarissen", "amount": -180000},
+            {"rgs": "WPersSocLas", "name": "Sociale lasten", "amount": -42000},
+            {"rgs": "WPersPenLas", "name": "Pensioenlasten", "amount": -18000},
+            {"rgs": "WBehHuiHur", "name": "Huisvestingskosten", "amount": -44500},
+            {"rgs": "WBehOvr", "name": "Overige bedrijfskosten", "amount": -42400}
+        ],
+        "subtotal": -606900
+    },
+    "afschrijvingen": {
+        "items": [
+            {"rgs": "WBehAutAfsTrm", "name": "Afschrijvingen materiële vaste activa", "amount": -23500}
+        ],
+        "subtotal": -23500
+    },
+    "bedrijfsresultaat": -9400,
+    "financiele_baten_lasten": {
+        "items": [
+            {"rgs": "WFinRenRba", "name": "Rentelasten", "amount": -4200},
+            {"rgs": "WFinRenOba", "name": "Rentebaten", "amount": 700}
+        ],
+        "subtotal": -3500
+    },
+    "resultaat_voor_belasting": 102800,
+    "belastingen": {"name": "Vennootschapsbelasting", "rgs": "WBelBel", "amount": -13400},
+    "resultaat_na_belasting": 89400
+}
+
+
+# ============================================
+# SEEDING
+# ============================================
+
+def _client_rows(client_id, rows, **extra):
+    """Attach the owning client and a stable position to template rows"""
+    return [{"client_id": client_id, **extra, **row, "position": i} for i, row in enumerate(rows)]
+
+
+def client_template(client_id):
+    """Client-level demo rows for one client, as (table, rows) pairs"""
+    invoices = [{**inv, "period": inv["date"][:7]} for inv in DEMO_INVOICES]
+    yield "invoices", [{"client_id": client_id, **inv} for inv in invoices]
+    accounts = [{"key": key, "limit": None, **acc} for key, acc in BANK_ACCOUNTS.items()]
+    yield "bank_accounts", _client_rows(client_id, accounts)
+    yield "bank_mutations", [{"client_id": client_id, **m} for m in OPEN_BANK_MUTATIONS]
+    yield "crm_deals", [{"client_id": client_id, **deal} for deal in ODOO_CRM_PIPELINE]
+    yield "purchase_orders", [{"client_id": client_id, **po} for po in ODOO_PURCHASE_ORDERS]
+    yield "purchase_order_lines", [{"client_id": client_id, **line} for line in ODOO_PURCHASE_ORDER_LINES]
+    yield "goods_receipts", [{"client_id": client_id, **receipt} for receipt in ODOO_GOODS_RECEIPTS]
+    yield "invoice_lines", [{"client_id": client_id, **line} for line in DEMO_INVOICE_LINES]
+    yield "employees", _client_rows(client_id, ODOO_HR["employees"])
+
+    boekjaar = VPB_DATA["boekjaar"]
+    rgs = [{"statement": "wv", "code": code, **line} for code, line in RGS_WV.items()]
+    for side in ("activa", "passiva"):
+        rgs += [{"statement": side, "code": code, "category": None, **line}
+                for code, line in RGS_BALANS[side].items()]
+    yield "rgs_lines", _client_rows(client_id, rgs, period=boekjaar)
+
+    yield "btw_periods", _client_rows(client_id, BTW_DATA["periodes"])
+    yield "sync_modules", _client_rows(client_id, ODOO_SYNC_STATUS["modules"])
+
+    closing_periods = [{"period": key, **period} for key, period in CLOSING_PERIODS.items()]
+    yield "closing_periods", _client_rows(client_id, closing_periods)
+    checklist_defaults = {"odoo_module": None, "notes": None}
+    for period in CLOSING_PERIODS:
+        items = [{**checklist_defaults, **item} for item in CLOSING_CHECKLIST]
+        yield "checklist_items", _client_rows(client_id, items, checklist="closing", period=period)
+        yield "closing_issues", [{"client_id": client_id, "period": period, **issue} for issue in CLOSING_ISSUES]
+    yield "closing_history", [{"client_id": client_id, **h} for h in CLOSING_HISTORY]
+
+    yield "annual_statements", [{"client_id": client_id, "boekjaar": year, "status": s["status"],
+                                 "company_size": s["company_size"], "data": s}
+                                for year, s in ANNUAL_STATEMENTS.items()]
+    for year in ANNUAL_STATEMENTS:
+        items = [{**checklist_defaults, **item} for item in ANNUAL_STATEMENT_CHECKLIST]
+        yield "checklist_items", _client_rows(client_id, items, checklist="annual", period=year)
+
+    # FTE and salary totals are aggregated from the employees table
+    hr_summary = {"wkr_budget": ODOO_HR["wkr_budget"], "wkr_used": ODOO_HR["wkr_used"]}
+    documents = [
+        ("hr", "", hr_summary),
+        ("icp_relaties", "", BTW_DATA["icp_relaties"]),
+        ("ai_booking_stats", "", ODOO_SYNC_STATUS["ai_booking_stats"]),
+        ("investeringen", "", INVESTERINGEN_DATA),
+        ("financiering", "", FINANCIERING_DATA),
+        ("cashflow", "", CASHFLOW_DATA),
+        ("vpb", boekjaar, VPB_DATA),
+    ]
+    documents += [("budget_vs_actual", period, BUDGET_VS_ACTUAL) for period in CLOSING_PERIODS]
+    documents += [("annual_balans", year, ANNUAL_BALANS) for year in ANNUAL_STATEMENTS]
+    documents += [("annual_wv", year, ANNUAL_WV) for year in ANNUAL_STATEMENTS]
+    yield "documents", [{"client_id": client_id, "kind": kind, "period": period, "data": data}
+                        for kind, period, data in documents]
+
+
+def seed_client(conn, client_id):
+    """Load the client-level demo template for one client"""
+    from nova.db import insert_rows
+
+    for table, rows in client_template(client_id):
+        insert_rows(conn, table, rows)
+
+
+def seed_demo_data(conn):
+    """Populate an empty database with the demo firm and its clients"""
+    from nova.db import insert_rows
+
+    insert_rows(conn, "team_members", [{**m, "position": i} for i, m in enumerate(TEAM_MEMBERS)])
+    insert_rows(conn, "clients", DEMO_CLIENTS)
+    for client in DEMO_CLIENTS:
+        seed_client(conn, client["id"])
+    # Firm alerts come from the rules in nova.alerts
+    from nova.alerts import evaluate_due
+    evaluate_due(conn, limit=None)
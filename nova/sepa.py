@@ -0,0 +1,131 @@
+"""SEPA credit transfer batches (pain.001.001.03) for outstanding purchase invoices
+
+``payment_batch()`` turns the selected invoices into payments: the creditor
+IBANs are checked together with ``ibans_valid`` and invoices that cannot be paid
+(invalid IBAN, nothing to pay, no name) are returned separately with the reason. Each
+payment gets an execution date; ``pain001()`` writes one payment information
+block per date and yields the XML transaction by transaction, so a run of
+thousands of creditors is never held as a document tree. Only the totals in the
+headers are computed up front.
+
+Texts are reduced to the SEPA character set (Latin letters without accents,
+digits and ``/ - ? : ( ) . , ' +``) and cut to the maximum length of the field.
+"""
+
+import re
+import unicodedata
+from datetime import datetime
+from itertools import groupby
+from xml.sax.saxutils import escape
+
+from nova.identifiers import iban_valid, ibans_valid, normalize_iban
+
+NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:pain.001.001.03"
+NAME_LENGTH = 70
+ID_LENGTH = 35
+REMITTANCE_LENGTH = 140
+
+_NOT_SEPA = re.compile(r"[^A-Za-z0-9/\-?:().,'+ ]+")
+_BIC = re.compile(r"[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?")
+
+
+def sepa_text(value, length):
+    """Text in the SEPA character set, at most ``length`` characters"""
+    text = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode()
+    text = _NOT_SEPA.sub(" ", text.replace("&", "+"))
+    return " ".join(text.split())[:length].strip()
+
+
+def _amount(cents):
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def payment_batch(invoices, execution_date, on_due_date=False):
+    """(payments, rejected) for invoice dicts (id, supplier, amount, vat, iban, bic, due_date)
+
+    Payments are executed on ``execution_date`` (ISO date), or with ``on_due_date``
+    on the due date of the invoice when that is later. Rejected invoices come
+    back as (invoice, reason).
+    """
+    invoices = list(invoices)
+    valid = ibans_valid(inv.get("iban") for inv in invoices)
+    payments, rejected = [], []
+    for inv, iban_ok in zip(invoices, valid):
+        cents = round(((inv.get("amount") or 0) + (inv.get("vat") or 0)) * 100)
+        if not iban_ok:
+            rejected.append((inv, "ongeldige IBAN"))
+            continue
+        if cents <= 0:
+            rejected.append((inv, "geen bedrag te betalen"))
+            continue
+        name = sepa_text(inv.get("supplier"), NAME_LENGTH)
+        if not name:
+            rejected.append((inv, "geen naam van de leverancier"))
+            continue
+        bic = (inv.get("bic") or "").replace(" ", "").upper()
+        date = max(execution_date, inv.get("due_date") or "") if on_due_date else execution_date
+        payments.append({
+            "end_to_end_id": sepa_text(inv["id"], ID_LENGTH) or "NOTPROVIDED",
+            "name": name,
+            "iban": normalize_iban(inv["iban"]),
+            "bic": bic if _BIC.fullmatch(bic) else None,
+            "cents": cents,
+            "execution_date": date,
+            "remittance": sepa_text(inv["id"], REMITTANCE_LENGTH),
+        })
+    payments.sort(key=lambda payment: payment["execution_date"])
+    return payments, rejected
+
+
+def _agent(bic):
+    if bic:
+        return f"<FinInstnId><BIC>{bic}</BIC></FinInstnId>"
+    return "<FinInstnId><Othr><Id>NOTPROVIDED</Id></Othr></FinInstnId>"
+
+
+def _transaction(payment):
+    agent = f"<CdtrAgt>{_agent(payment['bic'])}</CdtrAgt>" if payment["bic"] else ""
+    return (
+        f"<CdtTrfTxInf><PmtId><EndToEndId>{escape(payment['end_to_end_id'])}</EndToEndId></PmtId>"
+        f"<Amt><InstdAmt Ccy=\"EUR\">{_amount(payment['cents'])}</InstdAmt></Amt>{agent}"
+        f"<Cdtr><Nm>{escape(payment['name'])}</Nm></Cdtr>"
+        f"<CdtrAcct><Id><IBAN>{payment['iban']}</IBAN></Id></CdtrAcct>"
+        f"<RmtInf><Ustrd>{escape(payment['remittance'])}</Ustrd></RmtInf></CdtTrfTxInf>\n"
+    )
+
+
+def pain001(debtor, payments, message_id, created=None):
+    """Yield the pain.001.001.03 document in UTF-8 chunks
+
+    ``debtor`` holds the account holder's name, iban and optional bic;
+    ``payments`` come from ``payment_batch``, sorted by execution date.
+    """
+    if not iban_valid(debtor["iban"]):
+        raise ValueError(f"ongeldige IBAN van de betaalrekening: {debtor['iban']}")
+    created = created or datetime.now()
+    message_id = sepa_text(message_id, ID_LENGTH)
+    name = escape(sepa_text(debtor["name"], NAME_LENGTH))
+    iban = normalize_iban(debtor["iban"])
+    bic = (debtor.get("bic") or "").replace(" ", "").upper()
+    debtor_agent = _agent(bic if _BIC.fullmatch(bic) else None)
+    total = sum(payment["cents"] for payment in payments)
+    yield (
+        f"<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<Document xmlns=\"{NAMESPACE}\"><CstmrCdtTrfInitn>\n"
+        f"<GrpHdr><MsgId>{escape(message_id)}</MsgId><CreDtTm>{created.isoformat(timespec='seconds')}</CreDtTm>"
+        f"<NbOfTxs>{len(payments)}</NbOfTxs><CtrlSum>{_amount(total)}</CtrlSum>"
+        f"<InitgPty><Nm>{name}</Nm></InitgPty></GrpHdr>\n"
+    ).encode()
+    for number, (date, group) in enumerate(groupby(payments, key=lambda payment: payment["execution_date"]), start=1):
+        group = list(group)
+        yield (
+            f"<PmtInf><PmtInfId>{escape(message_id[:ID_LENGTH - 4])}-{number:03d}</PmtInfId><PmtMtd>TRF</PmtMtd>"
+            f"<BtchBookg>true</BtchBookg><NbOfTxs>{len(group)}</NbOfTxs>"
+            f"<CtrlSum>{_amount(sum(payment['cents'] for payment in group))}</CtrlSum>"
+            f"<PmtTpInf><SvcLvl><Cd>SEPA</Cd></SvcLvl></PmtTpInf><ReqdExctnDt>{date}</ReqdExctnDt>"
+            f"<Dbtr><Nm>{name}</Nm></Dbtr><DbtrAcct><Id><IBAN>{iban}</IBAN></Id></DbtrAcct>"
+            f"<DbtrAgt>{debtor_agent}</DbtrAgt><ChrgBr>SLEV</ChrgBr>\n"
+        ).encode()
+        for payment in group:
+            yield _transaction(payment).encode()
+        yield b"</PmtInf>\n"
+    yield b"</CstmrCdtTrfInitn></Document>\n"
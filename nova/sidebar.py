@@ -0,0 +1,216 @@
+"""Sidebar: branding, portal switch, client selection and view navigation"""
+
+import streamlit as st
+
+from nova import profiling
+from nova.data import clients_repo, get_client_by_id
+from nova.search import search_clients
+
+# Matches shown under the sidebar client search
+CLIENT_SEARCH_RESULTS = 6
+
+
+def nav_button(label, view, key_prefix, current_view):
+    """Create a navigation button with active state indicator"""
+    is_active = current_view == view
+    if is_active:
+        st.markdown(f"""
+        <div style="background: linear-gradient(90deg, #14b8a6, #0d9488); color: white; padding: 10px 16px;
+             border-radius: 8px; margin: 4px 0; font-weight: 600; display: flex; align-items: center; gap: 8px;
+             box-shadow: 0 4px 12px rgba(20,184,166,0.3);">
+            <span style="width: 6px; height: 6px; background: white; border-radius: 50%;"></span>
+            {label}
+        </div>
+        """, unsafe_allow_html=True)
+        return False
+    else:
+        return st.button(label, key=f"{key_prefix}_{view}", use_container_width=True)
+
+
+def render():
+    """Render the sidebar for the active portal"""
+    with st.sidebar:
+        # FID Finance logo with brand colors
+        st.markdown("""
+    <div style="text-align: center; padding: 20px 0;">
+        <div style="display: inline-block; position: relative;">
+            <!-- FID Finance Diamond Logo -->
+            <svg width="60" height="60" viewBox="0 0 100 100" style="margin-bottom: 8px;">
+                <!-- Navy Blue F-shape (top-left) -->
+                <polygon points="50,5 95,50 50,50 50,35 65,35 65,50 50,50 5,50 50,5" fill="#2C3E50"/>
+                <!-- Gold Checkmark (bottom-right) -->
+                <polygon points="50,50 95,50 50,95 35,80 50,65 50,50" fill="#F1C40F"/>
+                <polygon points="50,65 35,80 50,95 65,80 50,65" fill="#F1C40F"/>
+            </svg>
+            <h1 style="color: #2C3E50; font-size: 28px; margin: 0; font-weight: 700; letter-spacing: -0.5px;">
+                FID <span style="color: #F1C40F;">Finance</span>
+            </h1>
+            <div style="position: absolute; top: -4px; right: -12px; width: 8px; height: 8px;
+                        background: #10b981; border-radius: 50%; animation: pulse 2s infinite;"></div>
+        </div>
+        <p style="color: #64748b; font-size: 11px; margin: 8px 0 0 0; letter-spacing: 2px; text-transform: uppercase;">Financial Intelligence Dashboard</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+        # Portal Toggle with enhanced styling
+        st.markdown("""
+    <p style="color: #94a3b8; font-size: 11px; font-weight: 600; letter-spacing: 1px; margin-bottom: 8px;">
+        PORTAL
+    </p>
+    """, unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🏢 Kantoor", key="portal_kantoor", use_container_width=True,
+                         type="primary" if st.session_state.portal_mode == 'kantoor' else "secondary"):
+                st.session_state.portal_mode = 'kantoor'
+                st.session_state.current_view = 'dashboard'
+                st.session_state.selected_client = None
+                st.rerun()
+        with col2:
+            if st.button("👤 Klant", key="portal_klant", use_container_width=True,
+                         type="primary" if st.session_state.portal_mode == 'klant' else "secondary"):
+                st.session_state.portal_mode = 'klant'
+                st.session_state.current_view = 'dashboard'
+                st.rerun()
+
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+        # Different navigation based on portal mode
+        if st.session_state.portal_mode == 'kantoor':
+            # KANTOOR PORTAL NAVIGATION
+            st.markdown("""
+        <p style="color: #94a3b8; font-size: 11px; font-weight: 600; letter-spacing: 1px; margin-bottom: 12px;">
+            MISSION CONTROL
+        </p>
+        """, unsafe_allow_html=True)
+
+            kantoor_nav = {
+                "🎯 Overzicht": "dashboard",
+                "👥 Klantenportfolio": "clients",
+                "📋 Teamworkload": "team",
+                "🚨 Alerts & Acties": "alerts",
+                "🤖 AI Agents Overzicht": "agents",
+            }
+
+            for label, view in kantoor_nav.items():
+                if nav_button(label, view, "knav", st.session_state.current_view):
+                    st.session_state.current_view = view
+                    st.rerun()
+
+            # Quick client lookup with enhanced styling
+            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            st.markdown("""
+        <p style="color: #94a3b8; font-size: 11px; font-weight: 600; letter-spacing: 1px; margin-bottom: 8px;">
+            🔍 KLANT ZOEKEN
+        </p>
+        """, unsafe_allow_html=True)
+            query = st.text_input("Zoek klant", key="client_search", label_visibility="collapsed",
+                                  placeholder="Naam, contact, KvK, BTW of sector")
+            for client in search_clients(query, limit=CLIENT_SEARCH_RESULTS):
+                if st.button(f"📂 {client['name']}", key=f"search_{client['id']}", help=client['sector'],
+                             use_container_width=True):
+                    st.session_state.selected_client = client['id']
+                    st.session_state.portal_mode = 'klant'
+                    st.session_state.current_view = 'dashboard'
+                    st.rerun()
+
+        else:
+            # KLANT PORTAL NAVIGATION
+            # Show selected client info with enhanced card
+            if st.session_state.selected_client:
+                client = get_client_by_id(st.session_state.selected_client)
+            else:
+                client = clients_repo.first()
+                st.session_state.selected_client = client['id']
+
+            status_color = {"green": "#10b981", "yellow": "#f59e0b", "red": "#ef4444"}.get(client.get('status', 'green'), "#10b981")
+            st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #f8fafc, #f1f5f9); padding: 18px; border-radius: 14px;
+                    margin-bottom: 20px; border-left: 4px solid {status_color};
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.05);">
+            <p style="color: #94a3b8; font-size: 10px; margin: 0; text-transform: uppercase; letter-spacing: 1px; font-weight: 600;">
+                ACTIEVE KLANT
+            </p>
+            <p style="color: #0f172a; font-weight: 700; margin: 6px 0 4px 0; font-size: 15px;">{client['name']}</p>
+            <p style="color: #64748b; font-size: 12px; margin: 0; display: flex; align-items: center; gap: 6px;">
+                <span style="width: 6px; height: 6px; background: {status_color}; border-radius: 50%;"></span>
+                {client['contact']}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+            # Back to kantoor button
+            if st.button("← Terug naar Kantoor", key="back_to_kantoor", use_container_width=True):
+                st.session_state.portal_mode = 'kantoor'
+                st.session_state.current_view = 'dashboard'
+                st.rerun()
+
+            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+            # Client navigation with section header
+            st.markdown("""
+        <p style="color: #94a3b8; font-size: 11px; font-weight: 600; letter-spacing: 1px; margin-bottom: 12px;">
+            NAVIGATIE
+        </p>
+        """, unsafe_allow_html=True)
+
+            nav_options = {
+                "🎯 Dashboard": "dashboard",
+                "📄 Facturen": "invoices",
+                "💳 Betalingen": "payments",
+                "📊 Winst & Verlies": "pnl",
+                "⚖️ Balans": "balance",
+                "🏗️ Investeringen": "investments",
+                "🤖 AI Agents": "agents",
+                "💬 Chat met ALEX": "chat",
+                "📈 Cashflow & Forecasting": "forecast"
+            }
+
+            for label, view in nav_options.items():
+                if nav_button(label, view, "cnav", st.session_state.current_view):
+                    st.session_state.current_view = view
+                    st.rerun()
+
+            # Odoo section with enhanced badge
+            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            st.markdown("""<span class="odoo-badge">ODOO INTEGRATIE</span>""", unsafe_allow_html=True)
+            st.markdown("")
+
+            odoo_options = {
+                "📚 Boekhouding": "odoo_accounting",
+                "📅 Periodeafsluiting": "monthly_closing",
+                "🎯 CRM Pipeline": "crm",
+                "📦 Inkoop (PO's)": "purchase",
+                "👥 HR & Personeel": "hr",
+            }
+
+            for label, view in odoo_options.items():
+                if nav_button(label, view, "onav", st.session_state.current_view):
+                    st.session_state.current_view = view
+                    st.rerun()
+
+            # Fiscaal section
+            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            st.markdown("""
+        <p style="color: #94a3b8; font-size: 11px; font-weight: 600; letter-spacing: 1px; margin-bottom: 12px;">
+            📋 FISCAAL
+        </p>
+        """, unsafe_allow_html=True)
+
+            fiscaal_options = {
+                "🧾 BTW & ICP": "btw",
+                "🏛️ Vennootschapsbelasting": "vpb",
+                "📑 Jaarrekening": "annual_statement",
+            }
+
+            for label, view in fiscaal_options.items():
+                if nav_button(label, view, "fnav", st.session_state.current_view):
+                    st.session_state.current_view = view
+                    st.rerun()
+
+        # Profiling toggle; NOVA_PROFILE=1 switches it on for every session
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        st.toggle("⏱️ Profiling", key="profiling", disabled=profiling.env_enabled(),
+                  help="Toon onderaan de pagina waar de rendertijd aan besteed wordt")
@@ -0,0 +1,450 @@
+"""Deterministic synthetic firm data for scale testing
+
+Produces clients, invoices, purchase orders with their lines, receipts and
+invoice lines, CRM deals, bank mutations, checklists, annual statements and
+journal lines with the same shape as the demo data in
+``nova.seed``, at any size. Volume per client follows a Zipf distribution over
+the clients ranked by revenue, so a handful of large clients own most of the
+invoices and ledger lines, as in a real practice. The same seed always gives
+the same database.
+
+    python -m nova.synthetic --db data/scale.sqlite3 --clients 5000 --invoices 2000000 --journal-lines 10000000
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from nova.alerts import refresh_alerts
+from nova.db import connect, init_db, insert_rows
+from nova.reference import ANNUAL_STATEMENT_WORKFLOW, COMPANY_SIZE_THRESHOLDS
+from nova.seed import (
+    ANNUAL_STATEMENTS, ANNUAL_STATEMENT_CHECKLIST, CLOSING_CHECKLIST, CLOSING_PERIODS, ODOO_CRM_PIPELINE,
+    OPEN_BANK_MUTATIONS, RGS_WV, TEAM_MEMBERS, client_template,
+)
+
+# Tables filled by the generator; everything else comes from the demo template
+GENERATED_TABLES = {"invoices", "bank_mutations", "crm_deals", "checklist_items", "annual_statements",
+                    "purchase_orders", "purchase_order_lines", "goods_receipts", "invoice_lines"}
+
+BATCH_ROWS = 50000
+
+BANKS = {"ABNA": "ABNANL2A", "INGB": "INGBNL2A", "RABO": "RABONL2U", "TRIO": "TRIONL2U", "SNSB": "SNSBNL2A",
+         "KNAB": "KNABNL2H"}
+
+SECTORS = {
+    "Bouw & Constructie": ["Bouw", "Installatietechniek", "Aannemersbedrijf", "Renovatie"],
+    "IT & Software": ["Software", "Digital", "Cloud Services", "IT Consultancy"],
+    "Horeca": ["Restaurant", "Brasserie", "Eetcafé", "Hotel"],
+    "Transport & Logistiek": ["Transport", "Logistics", "Koeriers", "Expeditie"],
+    "Retail": ["Mode", "Woonwinkel", "Fietsen", "Electronica"],
+    "Zorg": ["Fysiotherapie", "Tandartspraktijk", "Zorggroep", "Thuiszorg"],
+    "Food & Beverage": ["Bakkerij", "Koffiebranderij", "Brouwerij", "Catering"],
+    "Zakelijke Diensten": ["Consultancy", "Advies", "Marketing", "Recruitment"],
+}
+SECTOR_WEIGHTS = [18, 14, 12, 10, 14, 9, 8, 15]
+NAME_STEMS = ["Vermeer", "De Gouden Lepel", "Van Dijk", "Bakker", "Noord", "Delta", "Zuidkust", "Hollandia",
+              "Oranje", "Polder", "Van Leeuwen", "Rijnmond", "Kempen", "Brabant", "Veluwe", "Amstel", "Groen",
+              "De Vries", "Mulder", "Visser", "Smit", "Meijer", "De Boer", "Jansen", "Peters", "Hendriks"]
+LEGAL_FORMS = ["B.V.", "B.V.", "B.V.", "V.O.F.", "Holding B.V.", ""]
+FIRST_NAMES = ["Jan", "Ahmed", "Sanne", "Pieter", "Fatima", "Kees", "Lotte", "Mehmet", "Anouk", "Daan", "Priya",
+               "Ruud", "Iris", "Bram", "Yara"]
+# Initial client flags; nova.alerts replaces them with the messages of the rules that fire
+ALERTS = {
+    "yellow": ["BTW deadline nadert", "Hoge debiteurenstand", "Margedruk door stijgende kosten",
+               "Budgetoverschrijding personeelskosten"],
+    "red": ["Negatief resultaat", "Liquiditeitsprobleem dreigt", "Urgent gesprek nodig", "Kredietlimiet bereikt"],
+}
+LAST_ACTIVITY = ["30 min geleden", "1 uur geleden", "2 uur geleden", "5 uur geleden", "1 dag geleden",
+                 "2 dagen geleden", "1 week geleden"]
+
+# Expense categories: (category, RGS code, typical amount, VAT rate)
+CATEGORIES = [
+    ("Inkoop materialen", "WIkworGro", 2500, 0.21),
+    ("Ingehuurde diensten", "WIkworUitworInh", 3000, 0.21),
+    ("Transport", "WKprUitTra", 900, 0.21),
+    ("Energie", "WBehHuiEne", 700, 0.21),
+    ("Huur", "WBehHuiHur", 3000, 0.0),
+    ("Verzekeringen", "WBehVerBed", 1200, 0.0),
+    ("Automatisering", "WBehAutSof", 450, 0.21),
+    ("Kantoorkosten", "WBehKanKan", 150, 0.21),
+    ("Representatie", "WBehAlgRep", 250, 0.09),
+]
+CATEGORY_WEIGHTS = [30, 12, 10, 6, 3, 3, 10, 18, 8]
+SUPPLIER_SUFFIXES = ["Groothandel", "Partners", "Direct", "Services", "Nederland", "Centraal", "& Zn."]
+
+CRM_STAGES = {"Lead": 15, "Kwalificatie": 30, "Voorstel": 55, "Onderhandeling": 75, "Gewonnen": 100}
+CHECKLIST_STATUSES = ["completed", "pending", "in_progress", "attention", "blocked", "not_applicable"]
+CHECKLIST_WEIGHTS = [60, 14, 8, 8, 5, 5]
+
+BOEKJAAR_START = date(2024, 1, 1)
+BOEKJAAR_DAYS = 366
+TODAY = date(2025, 1, 31)
+
+
+def zipf_weights(n, skew):
+    return [1 / (rank ** skew) for rank in range(1, n + 1)]
+
+
+def allocate(total, weights):
+    """Split ``total`` over ``weights`` into integers that add up exactly"""
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    for i in range(total - sum(counts)):
+        counts[i % len(counts)] += 1
+    return counts
+
+
+def nl_iban(rng):
+    """Random Dutch IBAN with valid mod-97 check digits, and the BIC of its bank"""
+    bank = rng.choice(list(BANKS))
+    account = f"{rng.randrange(10 ** 10):010d}"
+    digits = "".join(str(int(c, 36)) for c in bank + account + "NL00")
+    return f"NL{98 - int(digits) % 97:02d}{bank}{account}", BANKS[bank]
+
+
+def _rng(seed, *parts):
+    """Independent generator per client/table, so output does not depend on generation order"""
+    return random.Random(":".join(str(p) for p in (seed, *parts)))
+
+
+def _company_size(omzet, balanstotaal, werknemers):
+    """Smallest size class of which at least 2 of the 3 criteria are met"""
+    for key in ("micro", "klein", "middelgroot"):
+        limits = COMPANY_SIZE_THRESHOLDS[key]
+        met = (balanstotaal <= limits["balanstotaal_max"], omzet <= limits["netto_omzet_max"],
+               werknemers <= limits["werknemers_max"])
+        if sum(met) >= 2:
+            return key
+    return "groot"
+
+
+# ============================================
+# FIRM LEVEL
+# ============================================
+
+def make_clients(count, seed):
+    """Client rows in the DEMO_CLIENTS shape, ordered by id"""
+    rng = _rng(seed, "clients")
+    width = max(3, len(str(count)))
+    accountants = [m["name"] for m in TEAM_MEMBERS]
+    accountant_weights = [m["clients"] for m in TEAM_MEMBERS]
+    names, clients = set(), []
+    for n in range(1, count + 1):
+        sector = rng.choices(list(SECTORS), SECTOR_WEIGHTS)[0]
+        name = f"{rng.choice(NAME_STEMS)} {rng.choice(SECTORS[sector])} {rng.choice(LEGAL_FORMS)}".strip()
+        if name in names:
+            name = f"{name} ({n})"
+        names.add(name)
+        status = rng.choices(["green", "yellow", "red"], [70, 22, 8])[0]
+        omzet = round(math.exp(rng.gauss(13.3, 1.0)), -2)
+        margin = rng.uniform(-0.15, -0.01) if status == "red" else rng.uniform(0.02, 0.2)
+        clients.append({
+            "id": f"CL{n:0{width}d}",
+            "name": name,
+            "contact": f"{rng.choice(FIRST_NAMES)} {rng.choice(NAME_STEMS).split()[-1]}",
+            "kvk": f"{rng.randrange(10 ** 7, 10 ** 8)}",
+            "btw": f"NL{rng.randrange(10 ** 8, 10 ** 9)}B01",
+            "sector": sector,
+            "omzet_ytd": omzet,
+            "omzet_prev": round(omzet * rng.uniform(0.75, 1.2), -2),
+            "winst_ytd": round(omzet * margin, -2),
+            "openstaand": round(omzet * rng.uniform(0.03, 0.25), -2),
+            "status": status,
+            "accountant": rng.choices(accountants, accountant_weights)[0],
+            "alerts": rng.sample(ALERTS[status], rng.randint(1, 3)) if status != "green" else [],
+            "last_activity": rng.choice(LAST_ACTIVITY),
+        })
+    return clients
+
+
+def make_suppliers(count, seed):
+    """Shared supplier catalogue; suppliers early in the list are the popular ones"""
+    rng = _rng(seed, "suppliers")
+    suppliers = []
+    for n in range(count):
+        category = rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0]
+        iban, bic = nl_iban(rng)
+        name = f"{rng.choice(NAME_STEMS)} {category[0].split()[-1].capitalize()} {rng.choice(SUPPLIER_SUFFIXES)}"
+        suppliers.append({"name": f"{name} B.V.", "category": category, "iban": iban, "bic": bic})
+    return suppliers
+
+
+# ============================================
+# CLIENT LEVEL
+# ============================================
+
+def make_invoices(client_id, count, suppliers, supplier_weights, seed):
+    """Purchase invoices in the DEMO_INVOICES shape; recent ones are still open"""
+    rng = _rng(seed, client_id, "invoices")
+    picked = rng.choices(range(len(suppliers)), supplier_weights, k=count)
+    days = sorted(rng.randrange(BOEKJAAR_DAYS + 31) for _ in range(count))
+    for n, (s, day) in enumerate(zip(picked, days), start=1):
+        supplier = suppliers[s]
+        category, rgs, typical, vat_rate = supplier["category"]
+        amount = round(typical * math.exp(rng.gauss(0, 0.8)), 2)
+        issued = BOEKJAAR_START + timedelta(days=day)
+        due = issued + timedelta(days=30)
+        age = (TODAY - issued).days
+        if age > 45 or rng.random() < 0.6 * age / 45:
+            status, payment = "verwerkt", "betaald" if due < TODAY or rng.random() < 0.5 else "openstaand"
+        else:
+            status, payment = rng.choices(["nieuw", "wacht op review", "verwerkt"], [5, 2, 3])[0], "openstaand"
+        yield {
+            "client_id": client_id, "id": f"F{issued.year}-{n:06d}", "supplier": supplier["name"],
+            "amount": amount, "vat": round(amount * vat_rate, 2), "date": issued.isoformat(),
+            "due_date": due.isoformat(), "period": issued.isoformat()[:7], "status": status,
+            "payment_status": payment, "category": category, "rgs": rgs,
+            "odoo_po": f"PO{issued.year}-{rng.randrange(1, 10000):04d}" if rng.random() < 0.4 else None,
+            "iban": supplier["iban"], "bic": supplier["bic"],
+        }
+
+
+def _with_po(invoices, into):
+    """Pass invoices through, keeping those with a PO number for make_purchases()"""
+    for invoice in invoices:
+        if invoice["odoo_po"]:
+            into.append(invoice)
+        yield invoice
+
+
+def make_purchases(client_id, invoices, seed):
+    """Purchase orders, PO lines, goods receipts and invoice lines behind invoices with a PO number
+
+    The first invoice with a PO number bills that order; later invoices reusing the
+    number have no lines. Most invoices bill what was ordered and received, a few
+    bill another price, bill before delivery or bill a short delivery in full.
+    Returns (table, rows) pairs like ``client_template``.
+    """
+    rng = _rng(seed, client_id, "purchases")
+    orders, po_lines, receipts, invoice_lines = [], [], [], []
+    seen = set()
+    for invoice in invoices:
+        po_id = invoice["odoo_po"]
+        if po_id in seen:
+            continue
+        seen.add(po_id)
+        ordered_on = date.fromisoformat(invoice["date"]) - timedelta(days=rng.randint(3, 30))
+        delivered = rng.random() < 0.9
+        receipt = {"client_id": client_id, "id": f"WH/IN/{len(orders) + 1:05d}", "po_id": po_id,
+                   "date": (ordered_on + timedelta(days=rng.randint(1, 10))).isoformat()}
+        count = rng.choice((1, 1, 2, 3))
+        total, complete = 0.0, delivered
+        for line in range(1, count + 1):
+            quantity = rng.randint(1, 50)
+            unit_price = max(0.01, round(invoice["amount"] / count / quantity, 2))
+            product = f"{invoice['category']} {line}"
+            total += quantity * unit_price
+            po_lines.append({"client_id": client_id, "po_id": po_id, "line": line, "product": product,
+                             "quantity": quantity, "unit_price": unit_price})
+            if rng.random() < 0.03:
+                unit_price = round(unit_price * rng.uniform(1.03, 1.15), 2)
+            invoice_lines.append({"client_id": client_id, "invoice_id": invoice["id"], "line": line, "po_line": line,
+                                  "product": product, "quantity": quantity, "unit_price": unit_price})
+            if delivered:
+                received = quantity if rng.random() < 0.93 else rng.randint(0, quantity - 1)
+                complete = complete and received == quantity
+                if received:
+                    receipts.append({**receipt, "po_line": line, "quantity": received})
+        orders.append({"client_id": client_id, "id": po_id, "supplier": invoice["supplier"], "amount": round(total, 2),
+                       "status": "Geleverd" if complete else "Besteld", "date": ordered_on.isoformat(),
+                       "project": None})
+    yield "purchase_orders", orders
+    yield "purchase_order_lines", po_lines
+    yield "goods_receipts", receipts
+    yield "invoice_lines", invoice_lines
+
+
+def make_crm_deals(client_id, count, seed):
+    rng = _rng(seed, client_id, "crm")
+    templates = ODOO_CRM_PIPELINE
+    for n in range(1, count + 1):
+        template = rng.choice(templates)
+        stage = rng.choices(list(CRM_STAGES), [30, 25, 20, 15, 10])[0]
+        yield {**template, "client_id": client_id, "id": f"CRM-{n:05d}", "stage": stage,
+               "amount": round(math.exp(rng.gauss(11.5, 1.1)), -3), "probability": CRM_STAGES[stage],
+               "expected_close": (TODAY + timedelta(days=rng.randint(-30, 180))).isoformat()}
+
+
+def make_bank_mutations(client_id, count, seed):
+    rng = _rng(seed, client_id, "bank_mutations")
+    for n in range(1, count + 1):
+        template = rng.choice(OPEN_BANK_MUTATIONS)
+        amount = round(math.exp(rng.gauss(7, 1.3)), 2) * (1 if rng.random() < 0.35 else -1)
+        yield {**template, "client_id": client_id, "id": f"BM-{n:05d}", "bedrag": amount,
+               "datum": (TODAY - timedelta(days=rng.randrange(60))).isoformat()}
+
+
+def make_checklists(client_id, seed):
+    """Closing and annual checklists with a realistic mix of statuses"""
+    rng = _rng(seed, client_id, "checklists")
+    defaults = {"odoo_module": None, "notes": None, "completion_date": None}
+    lists = [("closing", period, CLOSING_CHECKLIST, info["status"] == "closed")
+             for period, info in CLOSING_PERIODS.items()]
+    lists += [("annual", year, ANNUAL_STATEMENT_CHECKLIST, ANNUAL_STATEMENTS[year]["status"] == "afgerond")
+              for year in ANNUAL_STATEMENTS]
+    for checklist, period, items, done in lists:
+        for position, item in enumerate(items):
+            status = "completed" if done else rng.choices(CHECKLIST_STATUSES, CHECKLIST_WEIGHTS)[0]
+            yield {**defaults, **item, "client_id": client_id, "checklist": checklist, "period": period,
+                   "status": status, "position": position,
+                   "completion_date": item.get("completion_date") if status == "completed" else None}
+
+
+def make_annual_statements(client, seed):
+    rng = _rng(seed, client["id"], "annual")
+    stages = [stage["id"] for stage in ANNUAL_STATEMENT_WORKFLOW["stages"]]
+    for year, template in ANNUAL_STATEMENTS.items():
+        omzet = client["omzet_ytd"] if year == "2024" else client["omzet_prev"]
+        werknemers = max(1, int(omzet / rng.uniform(80000, 160000)))
+        balanstotaal = round(omzet * rng.uniform(0.6, 1.6), -2)
+        financials = {"balanstotaal": balanstotaal, "netto_omzet": omzet,
+                      "resultaat": round(omzet * rng.uniform(-0.05, 0.18), -2),
+                      "eigen_vermogen": round(balanstotaal * rng.uniform(0.2, 0.6), -2), "werknemers": werknemers}
+        status = "afgerond" if year != "2024" else rng.choice(stages[:-1])
+        size = _company_size(omzet, balanstotaal, werknemers)
+        data = {**template, "status": status, "company_size": size, "financials": financials,
+                "kvk_submission": template["kvk_submission"] if status == "afgerond" else None}
+        yield {"client_id": client["id"], "boekjaar": year, "status": status, "company_size": size, "data": data}
+
+
+def make_journal_lines(client_id, count, seed):
+    """Balanced entries (purchase, sales, bank, memorial) until at least ``count`` lines exist
+
+    Entries are never cut short, so a client may get up to two lines more than asked.
+    """
+    rng = _rng(seed, client_id, "journal")
+    expense_codes = [code for code in RGS_WV if not code.startswith("WOmz")]
+    n = entry = 0
+    while n < count:
+        entry += 1
+        day = BOEKJAAR_START + timedelta(days=rng.randrange(BOEKJAAR_DAYS))
+        stamp, period = day.isoformat(), day.isoformat()[:7]
+        amount = round(math.exp(rng.gauss(7, 1.2)), 2)
+        journal = rng.choices(["INK", "VRK", "BNK", "MEM"], [45, 25, 25, 5])[0]
+        if journal == "INK":
+            vat = round(amount * 0.21, 2)
+            postings = [(rng.choice(expense_codes), amount, 0), ("BSchBelBtw", vat, 0), ("BSchCreHan", 0, amount + vat)]
+        elif journal == "VRK":
+            vat = round(amount * 0.21, 2)
+            postings = [("BVorDebHad", amount + vat, 0), ("WOmzNet", 0, amount), ("BSchBelBtw", 0, vat)]
+        elif journal == "BNK":
+            counter = rng.choice(["BSchCreHan", "BVorDebHad"])
+            postings = [(counter, amount, 0), ("BLimBan", 0, amount)] if counter == "BSchCreHan" else \
+                [("BLimBan", amount, 0), (counter, 0, amount)]
+        else:
+            postings = [("WPersLonSal", amount, 0), ("BSchBelLhe", 0, amount)]
+        move = f"{journal}/{day.year}/{entry:07d}"
+        for rgs, debit, credit in postings:
+            n += 1
+            yield (client_id, n, move, journal, stamp, period, rgs, f"{journal} {period}", debit, credit)
+
+
+# ============================================
+# DATABASE
+# ============================================
+
+JOURNAL_COLUMNS = ("client_id", "id", "move", "journal", "date", "period", "rgs", "description", "debit", "credit")
+
+
+def _insert_batched(conn, table, rows):
+    batch, total = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_ROWS:
+            total += insert_rows(conn, table, batch)
+            batch = []
+    return total + insert_rows(conn, table, batch)
+
+
+def _insert_tuples(conn, table, columns, rows):
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+    total = 0
+    while True:
+        batch = [row for _, row in zip(range(BATCH_ROWS), rows)]
+        if not batch:
+            return total
+        conn.executemany(sql, batch)
+        total += len(batch)
+
+
+def generate(path, clients=5000, invoices=2000000, journal_lines=10000000, seed=42, skew=1.1, log=None):
+    """Fill an empty database at ``path``; returns row counts per table"""
+    init_db(path, seed=False)
+    conn = connect(path)
+    if conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0]:
+        conn.close()
+        raise ValueError(f"{path} already contains clients; generate into an empty database")
+    conn.execute("PRAGMA synchronous=OFF")
+    counts = dict.fromkeys(["clients", "firm_alerts", *sorted(GENERATED_TABLES), "journal_lines"], 0)
+    started = time.perf_counter()
+
+    client_rows = make_clients(clients, seed)
+    # Volume follows revenue: the biggest client gets Zipf rank 1
+    ranked = sorted(range(clients), key=lambda i: -client_rows[i]["omzet_ytd"])
+    weights = [0.0] * clients
+    for rank_weight, i in zip(zipf_weights(clients, skew), ranked):
+        weights[i] = rank_weight
+    invoice_counts = allocate(invoices, weights)
+    journal_counts = allocate(journal_lines, weights)
+    suppliers = make_suppliers(max(50, clients * 4), seed)
+    supplier_weights = zipf_weights(len(suppliers), skew)
+
+    with conn:
+        insert_rows(conn, "team_members", [{**m, "position": i} for i, m in enumerate(TEAM_MEMBERS)])
+        counts["clients"] = insert_rows(conn, "clients", client_rows)
+
+    for i, client in enumerate(client_rows):
+        client_id, volume = client["id"], invoice_counts[i]
+        with conn:
+            for table, rows in client_template(client_id):
+                if table not in GENERATED_TABLES:
+                    insert_rows(conn, table, rows)
+            with_po = []
+            counts["invoices"] += _insert_batched(
+                conn, "invoices", _with_po(make_invoices(client_id, volume, suppliers, supplier_weights, seed), with_po))
+            for table, rows in make_purchases(client_id, with_po, seed):
+                counts[table] += _insert_batched(conn, table, rows)
+            counts["crm_deals"] += insert_rows(conn, "crm_deals", make_crm_deals(client_id, 3 + volume // 150, seed))
+            counts["bank_mutations"] += insert_rows(
+                conn, "bank_mutations", make_bank_mutations(client_id, 1 + volume // 300, seed))
+            counts["checklist_items"] += insert_rows(conn, "checklist_items", make_checklists(client_id, seed))
+            counts["annual_statements"] += insert_rows(conn, "annual_statements", make_annual_statements(client, seed))
+            counts["journal_lines"] += _insert_tuples(
+                conn, "journal_lines", JOURNAL_COLUMNS, make_journal_lines(client_id, journal_counts[i], seed))
+        if log and (i + 1) % max(1, clients // 20) == 0:
+            log(f"{i + 1}/{clients} clients, {counts['invoices']:,} invoices, "
+                f"{counts['journal_lines']:,} journal lines ({time.perf_counter() - started:.0f}s)")
+    # Every inserted client is queued; evaluate the alert rules for all of them now
+    refresh_alerts(conn, limit=None)
+    counts["firm_alerts"] = conn.execute("SELECT COUNT(*) FROM firm_alerts").fetchone()[0]
+    conn.execute("ANALYZE")
+    conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic NOVA database for scale testing")
+    parser.add_argument("--db", required=True, help="path of the (new) SQLite database")
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--invoices", type=int, default=2000000)
+    parser.add_argument("--journal-lines", type=int, default=10000000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of the per-client volume")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    try:
+        counts = generate(args.db, args.clients, args.invoices, args.journal_lines, args.seed, args.skew,
+                          log=lambda message: print(message, file=sys.stderr))
+    except ValueError as exc:
+        parser.error(str(exc))
+    for table, count in counts.items():
+        print(f"{table:18} {count:>12,}")
+    print(f"done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Shared page chrome: stylesheet and small rendering helpers used by every view"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from nova.profiling import CATEGORIES
+
+ASSETS = Path(__file__).parent / "assets"
+STYLESHEET = ASSETS / "style.css"
+FONTS = ASSETS / "fonts"
+# Streamlit serves <app dir>/static at app/static/ when server.enableStaticServing is on
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL = "app/static"
+
+# Self-hosted font files (family, weight range, style); a file that is not in
+# nova/assets/fonts is skipped and the stack falls back to Streamlit's bundled Source Sans
+FONT_FILES = {
+    "InterVariable.woff2": ("Inter", "100 900", "normal"),
+    "InterVariable-Italic.woff2": ("Inter", "100 900", "italic"),
+}
+
+
+def font_faces(base="../fonts"):
+    """@font-face rules for the font files that are present; ``base`` is relative to the published stylesheet"""
+    rules = []
+    for filename, (family, weight, style) in FONT_FILES.items():
+        if (FONTS / filename).exists():
+            rules.append(
+                f"@font-face {{ font-family: '{family}'; src: url('{base}/{filename}') format('woff2'); "
+                f"font-weight: {weight}; font-style: {style}; font-display: swap; }}\n"
+            )
+    return "".join(rules)
+
+
+@lru_cache(maxsize=None)
+def load_css(font_base="../fonts"):
+    """Stylesheet contents, read from disk once per process"""
+    return font_faces(font_base) + STYLESHEET.read_text(encoding="utf-8")
+
+
+def _write_once(path, data):
+    """Write ``data`` unless the file already has it; atomic so other processes never see a partial file"""
+    if path.exists() and path.stat().st_size == len(data):
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=None)
+def publish_css():
+    """Copy the stylesheet and fonts under static/ with a content hash in the name; returns the URL
+
+    The name changes whenever the CSS does, so browsers can cache the file for good. Older
+    versions are removed.
+    """
+    css = load_css().encode("utf-8")
+    name = f"style.{hashlib.sha256(css).hexdigest()[:12]}.css"
+    for filename in FONT_FILES:
+        if (FONTS / filename).exists():
+            _write_once(STATIC_DIR / "fonts" / filename, (FONTS / filename).read_bytes())
+    _write_once(STATIC_DIR / "css" / name, css)
+    for old in (STATIC_DIR / "css").glob("style.*.css"):
+        if old.name != name:
+            old.unlink(missing_ok=True)
+    return f"{STATIC_URL}/css/{name}"
+
+
+@lru_cache(maxsize=None)
+def static_css_served():
+    """Whether the static route sends .css as text/css
+
+    Until Streamlit's Tornado server was replaced, app/static/ sent every extension outside a
+    short allowlist as text/plain with nosniff, and browsers refuse such a stylesheet.
+    """
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        # The Starlette server derives the type from the extension
+        return True
+    return ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+def inject_css():
+    """Reference the published stylesheet; falls back to inlining it when static serving is off or unusable"""
+    if not st.get_option("server.enableStaticServing"):
+        st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+    elif static_css_served():
+        st.markdown(f"<style>@import url('{publish_css()}');</style>", unsafe_allow_html=True)
+    else:
+        # Fonts are not subject to nosniff, so they still come from the static route
+        publish_css()
+        st.markdown(f"<style>\n{load_css(f'{STATIC_URL}/fonts')}</style>", unsafe_allow_html=True)
+
+
+def format_currency(amount):
+    """Format number as Dutch currency"""
+    if amount >= 0:
+        return f"€ {amount:,.0f}".replace(",", ".")
+    else:
+        return f"€ {amount:,.0f}".replace(",", ".")
+
+
+def format_latency(seconds):
+    """Latency as ms or s; a dash without measurements"""
+    if seconds is None:
+        return "—"
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    return f"{seconds:.1f} s".replace(".", ",")
+
+
+def render_kpi_card(label, value, delta=None, icon=None, color="#14b8a6", trend=None):
+    """Render an enhanced KPI card with icon and trend indicator"""
+    delta_html = ""
+    if delta:
+        trend_color = "#10b981" if trend == "up" else "#ef4444" if trend == "down" else "#64748b"
+        trend_icon = "↑" if trend == "up" else "↓" if trend == "down" else "→"
+        delta_html = f'<p style="color: {trend_color}; font-size: 13px; margin: 8px 0 0 0; font-weight: 600;">{trend_icon} {delta}</p>'
+
+    icon_html = f'<span style="font-size: 24px; margin-bottom: 8px; display: block;">{icon}</span>' if icon else ""
+
+    st.markdown(f"""
+    <div class="metric-card" style="border-top: 3px solid {color};">
+        {icon_html}
+        <p class="metric-label">{label}</p>
+        <p class="metric-value">{value}</p>
+        {delta_html}
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_section_header(title, subtitle=None):
+    """Render a consistent section header"""
+    subtitle_html = f'<p style="color: #64748b; font-size: 14px; margin: 4px 0 0 0;">{subtitle}</p>' if subtitle else ""
+    st.markdown(f"""
+    <div style="margin-bottom: 20px;">
+        <h3 style="color: #0f172a; margin: 0; font-weight: 600;">{title}</h3>
+        {subtitle_html}
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_empty_state(icon, title, description, action_label=None, action_key=None):
+    """Render an empty state placeholder"""
+    st.markdown(f"""
+    <div class="empty-state">
+        <div class="empty-state-icon">{icon}</div>
+        <p class="empty-state-title">{title}</p>
+        <p class="empty-state-desc">{description}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    if action_label and action_key:
+        col1, col2, col3 = st.columns([1, 1, 1])
+        with col2:
+            return st.button(action_label, key=action_key, use_container_width=True)
+    return False
+
+
+def render_breadcrumb(items):
+    """Render navigation breadcrumbs"""
+    breadcrumb_html = '<div class="breadcrumb">'
+    for i, item in enumerate(items):
+        if i > 0:
+            breadcrumb_html += '<span class="breadcrumb-separator">›</span>'
+        if i == len(items) - 1:
+            breadcrumb_html += f'<span class="breadcrumb-item active">{item}</span>'
+        else:
+            breadcrumb_html += f'<span class="breadcrumb-item">{item}</span>'
+    breadcrumb_html += '</div>'
+    st.markdown(breadcrumb_html, unsafe_allow_html=True)
+
+
+def render_profile_panel(profile):
+    """Breakdown of the script run that just finished"""
+    summary = profile.summary()
+    with st.expander(f"⏱️ Profiling: {profile.label} in {profile.total * 1000:,.0f} ms", expanded=True):
+        cols = st.columns(4)
+        parts = [
+            (CATEGORIES["data"], summary["data"]),
+            (CATEGORIES["render"], summary["render"]),
+            ("HTML opbouw en logica", summary["other"]),
+            ("Totaal script", [profile.total, len(profile.records)]),
+        ]
+        for col, (label, (seconds, calls)) in zip(cols, parts):
+            with col:
+                st.metric(label, f"{seconds * 1000:,.1f} ms", f"{calls} calls" if calls else None,
+                          delta_color="off")
+        st.dataframe(
+            pd.DataFrame(
+                [{"Categorie": category, "Naam": name, "Tijd (ms)": round(seconds * 1000, 2), "Aanroepen": calls}
+                 for category, name, seconds, calls in profile.slowest()]
+            ),
+            hide_index=True, use_container_width=True,
+        )
@@ -0,0 +1,55 @@
+"""View registry; a view module is imported the first time it is shown
+
+Each module exposes ``render()`` (kantoor) or ``render(current_client)`` (klant).
+Imported modules stay in ``sys.modules``, so later reruns only pay for the view
+that is actually on screen instead of executing every page of the portal.
+"""
+
+import importlib
+
+from nova.profiling import span
+
+VIEWS = {
+    "kantoor": {
+        "dashboard": "nova.views.kantoor.dashboard",
+        "clients": "nova.views.kantoor.clients",
+        "team": "nova.views.kantoor.team",
+        "alerts": "nova.views.kantoor.alerts",
+        "agents": "nova.views.kantoor.agents",
+    },
+    "klant": {
+        "dashboard": "nova.views.klant.dashboard",
+        "invoices": "nova.views.klant.invoices",
+        "payments": "nova.views.klant.payments",
+        "pnl": "nova.views.klant.pnl",
+        "balance": "nova.views.klant.balance",
+        "agents": "nova.views.klant.agents",
+        "chat": "nova.views.klant.chat",
+        "forecast": "nova.views.klant.forecast",
+        "crm": "nova.views.klant.crm",
+        "purchase": "nova.views.klant.purchase",
+        "hr": "nova.views.klant.hr",
+        "btw": "nova.views.klant.btw",
+        "vpb": "nova.views.klant.vpb",
+        "odoo_accounting": "nova.views.klant.odoo_accounting",
+        "monthly_closing": "nova.views.klant.monthly_closing",
+        "investments": "nova.views.klant.investments",
+        "annual_statement": "nova.views.klant.annual_statement",
+    },
+}
+
+
+def load_view(portal_mode, view):
+    """Module of a view, imported on first use; unknown views return None"""
+    module_path = VIEWS.get(portal_mode, {}).get(view)
+    if module_path is None:
+        return None
+    return importlib.import_module(module_path)
+
+
+def render_view(portal_mode, view, **context):
+    """Render the selected view; an unknown view leaves the page empty, as before"""
+    with span("view", f"{portal_mode}/{view}"):
+        module = load_view(portal_mode, view)
+        if module is not None:
+            module.render(**context)
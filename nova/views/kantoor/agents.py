@@ -0,0 +1,88 @@
+"""Kantoor portal: AI agents overzicht op kantoorniveau"""
+
+import pandas as pd
+import streamlit as st
+
+from nova.metrics import metrics
+from nova.reference import reference_data
+from nova.ui import format_latency
+
+
+def _percentage(value):
+    return f"{value * 100:.1f}%".replace(".", ",")
+
+
+def render():
+    ai_agents = reference_data()["ai_agents"]
+    # AI AGENTS OVERZICHT (KANTOOR LEVEL)
+    st.title("🤖 AI Agents - Kantoor Overzicht")
+    st.markdown("Alle AI-agents actief over het hele klantenportfolio")
+
+    stats = {name: {window: metrics.summary(name, window) for window in ("minute", "hour", "day")}
+             for name in ai_agents}
+    actions = {}
+    for (name, action), count in sorted(metrics.actions().items(), key=lambda item: -item[1]):
+        actions.setdefault(name, []).append(f"{action} ({count})")
+    hour_count = sum(s["hour"]["count"] for s in stats.values())
+    hour_errors = sum(s["hour"]["errors"] for s in stats.values())
+    # The agent that spent the largest share of the last hour working holds the rest up first
+    busiest = max(stats, key=lambda name: (stats[name]["hour"]["busy"], stats[name]["hour"]["p95"] or 0))
+
+    # Summary stats
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Totaal Verwerkt (24 uur)", sum(s["day"]["count"] for s in stats.values()))
+    with col2:
+        st.metric("Foutpercentage (uur)", _percentage(hour_errors / hour_count) if hour_count else "—")
+    with col3:
+        active = sum(1 for s in stats.values() if s["hour"]["count"])
+        st.metric("Actieve Agents (uur)", f"{active} / {len(ai_agents)}")
+    with col4:
+        if hour_count:
+            st.metric("Bottleneck", busiest, f"{_percentage(stats[busiest]['hour']['busy'])} bezet",
+                      delta_color="off")
+        else:
+            st.metric("Bottleneck", "—")
+
+    st.markdown("---")
+
+    for name, agent in ai_agents.items():
+        day, hour = stats[name]["day"], stats[name]["hour"]
+        errors = f"{_percentage(day['error_rate'])} fouten" if day["count"] else "geen acties"
+        st.markdown(f"""
+            <div class="agent-card agent-{name.lower()}">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <h3 style="margin: 0; color: {agent['color']};">{name}</h3>
+                        <p style="color: #64748b; margin: 4px 0;">{agent['full_name']}</p>
+                        <p style="margin: 4px 0;">{agent['description']}</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <p style="font-size: 28px; font-weight: 700; margin: 0;">{day['count']}</p>
+                        <p style="color: #64748b; font-size: 12px;">verwerkt (24 uur) · p95 {format_latency(hour['p95'])}</p>
+                        <p style="color: {'#ef4444' if day['errors'] else '#10b981'}; font-weight: 600;">{errors}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("### 📈 Doorvoer en latency")
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Agent": name,
+                "Laatste minuut": s["minute"]["count"],
+                "Laatste uur": s["hour"]["count"],
+                "Laatste 24 uur": s["day"]["count"],
+                "p50 (uur)": format_latency(s["hour"]["p50"]),
+                "p95 (uur)": format_latency(s["hour"]["p95"]),
+                "p99 (uur)": format_latency(s["hour"]["p99"]),
+                "Fouten (uur)": _percentage(s["hour"]["error_rate"]),
+                "Bezet (uur)": _percentage(s["hour"]["busy"]),
+                "Acties sinds start": ", ".join(actions.get(name, [])) or "—",
+            }
+            for name, s in stats.items()
+        ]),
+        hide_index=True, use_container_width=True,
+    )
+    st.caption("Gemeten in dit serverproces sinds de laatste herstart; latency per bucket van ca. 25%")
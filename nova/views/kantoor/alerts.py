@@ -0,0 +1,126 @@
+"""Kantoor portal: Alerts & acties"""
+
+import streamlit as st
+
+from nova.data import alerts_repo
+
+
+def render():
+    # ALERTS & ACTIES - Enhanced Design
+    st.markdown("""
+        <div style="margin-bottom: 24px;">
+            <h1 style="color: #0f172a; margin: 0; display: flex; align-items: center; gap: 12px;">
+                <span style="font-size: 32px;">🚨</span> Alerts & Acties
+            </h1>
+            <p style="color: #64748b; font-size: 15px; margin: 8px 0 0 0;">
+                Overzicht van alle meldingen die uw aandacht vereisen
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Alert summary with enhanced cards
+    alert_counts = alerts_repo.counts()
+    urgent = alert_counts['urgent']
+    warning = alert_counts['warning']
+    info = alert_counts['info']
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(f"""
+            <div class="metric-card" style="border-left: 5px solid #ef4444; background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);">
+                <p class="metric-label" style="color: #dc2626;">URGENT</p>
+                <p class="metric-value" style="color: #dc2626;">{urgent}</p>
+                <p style="color: #64748b; font-size: 12px; margin-top: 8px;">Direct actie vereist</p>
+            </div>
+            """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+            <div class="metric-card" style="border-left: 5px solid #f59e0b; background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%);">
+                <p class="metric-label" style="color: #d97706;">ATTENTIE</p>
+                <p class="metric-value" style="color: #d97706;">{warning}</p>
+                <p style="color: #64748b; font-size: 12px; margin-top: 8px;">Binnen 5 dagen oplossen</p>
+            </div>
+            """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+            <div class="metric-card" style="border-left: 5px solid #3b82f6; background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);">
+                <p class="metric-label" style="color: #2563eb;">INFORMATIEF</p>
+                <p class="metric-value" style="color: #2563eb;">{info}</p>
+                <p style="color: #64748b; font-size: 12px; margin-top: 8px;">Ter kennisname</p>
+            </div>
+            """, unsafe_allow_html=True)
+    with col4:
+        st.markdown(f"""
+            <div class="metric-card" style="border-left: 5px solid #10b981;">
+                <p class="metric-label">TOTAAL ACTIEF</p>
+                <p class="metric-value">{alert_counts['total']}</p>
+                <p style="color: #64748b; font-size: 12px; margin-top: 8px;">Meldingen</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Filter tabs
+    alert_filter = st.radio("Filter", ["Alle", "🔴 Urgent", "🟡 Attentie", "🔵 Info"], horizontal=True, label_visibility="collapsed")
+
+    alert_type = {"🔴 Urgent": "urgent", "🟡 Attentie": "warning", "🔵 Info": "info"}.get(alert_filter)
+    filtered_alerts = alerts_repo.list(alert_type=alert_type)
+
+    st.markdown(f"<p style='color: #64748b; margin: 16px 0;'>Toont {len(filtered_alerts)} van {alert_counts['total']} meldingen</p>", unsafe_allow_html=True)
+
+    # Enhanced Alert list
+    for alert in filtered_alerts:
+        if alert['type'] == 'urgent':
+            alert_class = "alert-card-red"
+            icon = "🔴"
+            priority_badge = '<span class="alert-badge-urgent">URGENT</span>'
+            action_text = "Direct actie vereist"
+            icon_bg = "#fee2e2"
+        elif alert['type'] == 'warning':
+            alert_class = "alert-card"
+            icon = "⚠️"
+            priority_badge = '<span class="alert-badge-warning">ATTENTIE</span>'
+            action_text = "Actie binnen 5 dagen"
+            icon_bg = "#fef3c7"
+        else:
+            alert_class = "alert-card-info"
+            icon = "ℹ️"
+            priority_badge = '<span class="alert-badge-info">INFO</span>'
+            action_text = "Ter kennisname"
+            icon_bg = "#dbeafe"
+
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            st.markdown(f"""
+                <div class="{alert_class}">
+                    <div style="display: flex; gap: 16px; align-items: flex-start;">
+                        <div style="min-width: 48px; height: 48px; background: {icon_bg}; border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 22px;">
+                            {icon}
+                        </div>
+                        <div style="flex: 1;">
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start; flex-wrap: wrap; gap: 8px;">
+                                <div>
+                                    <strong style="color: #0f172a; font-size: 16px;">{alert['client']}</strong>
+                                    <span style="margin-left: 12px;">{priority_badge}</span>
+                                </div>
+                                <small style="color: #94a3b8; display: flex; align-items: center; gap: 4px; font-size: 12px;">
+                                    🕐 {alert['time']}
+                                </small>
+                            </div>
+                            <p style="color: #475569; margin: 10px 0; font-size: 15px; line-height: 1.5;">{alert['message']}</p>
+                            <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 12px; padding-top: 12px; border-top: 1px solid rgba(0,0,0,0.06);">
+                                <span style="color: #64748b; font-size: 12px; font-style: italic;">⏱️ {action_text}</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        with col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            # Go to the client's dashboard
+            if alert['client_id']:
+                if st.button("Bekijk Klant →", key=f"alert_{alert['id']}", use_container_width=True, type="primary"):
+                    st.session_state.selected_client = alert['client_id']
+                    st.session_state.portal_mode = 'klant'
+                    st.session_state.current_view = 'dashboard'
+                    st.rerun()
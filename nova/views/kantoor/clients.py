@@ -0,0 +1,90 @@
+"""Kantoor portal: Klantenportfolio"""
+
+import math
+
+import streamlit as st
+
+from nova.data import clients_repo
+from nova.ui import format_currency
+
+
+# Sort options of the portfolio grid: label -> (column, descending)
+SORT_OPTIONS = {
+    "Omzet YTD (hoog-laag)": ("omzet_ytd", True),
+    "Winst YTD (hoog-laag)": ("winst_ytd", True),
+    "Openstaand (hoog-laag)": ("openstaand", True),
+    "Naam (A-Z)": ("name", False),
+}
+PAGE_SIZES = [12, 24, 48, 96]
+
+
+def render():
+    # KLANTENPORTFOLIO
+    st.title("👥 Klantenportfolio")
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        status_filter = st.selectbox("Status", ["Alle", "Gezond", "Aandacht nodig", "Kritiek"])
+    with col2:
+        sector_filter = st.selectbox("Sector", ["Alle"] + clients_repo.distinct('sector'))
+    with col3:
+        accountant_filter = st.selectbox("Accountant", ["Alle"] + clients_repo.distinct('accountant'))
+
+    # Filter, sort and page in SQL; only the visible page is fetched and rendered
+    status_map = {"Gezond": "green", "Aandacht nodig": "yellow", "Kritiek": "red"}
+    filters = {
+        "status": status_map.get(status_filter),
+        "sector": sector_filter if sector_filter != "Alle" else None,
+        "accountant": accountant_filter if accountant_filter != "Alle" else None,
+    }
+    total = clients_repo.count(**filters)
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        order_by, descending = SORT_OPTIONS[st.selectbox("Sorteren op", list(SORT_OPTIONS))]
+    with col2:
+        page_size = st.selectbox("Per pagina", PAGE_SIZES)
+    pages = max(1, math.ceil(total / page_size))
+    with col3:
+        # No key: the widget resets to page 1 whenever the number of pages changes
+        page = st.number_input("Pagina", min_value=1, max_value=pages, value=1, step=1)
+
+    page_clients = clients_repo.list(**filters, order_by=order_by, descending=descending,
+                                     limit=page_size, offset=(page - 1) * page_size)
+
+    first = (page - 1) * page_size + 1 if total else 0
+    st.markdown(f"**{total} klanten gevonden** &nbsp;•&nbsp; {first}-{first + len(page_clients) - 1 if total else 0} "
+                f"getoond (pagina {page} van {pages})")
+    st.markdown("---")
+
+    # Client cards
+    for client in page_clients:
+        status_class = f"client-status-{client['status']}"
+        alert_html = ""
+        if client['alerts']:
+            alert_html = f"<br><span style='color: #f59e0b; font-size: 12px;'>⚠️ {len(client['alerts'])} alert(s)</span>"
+
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"""
+                <div class="client-card {status_class}">
+                    <div style="display: flex; justify-content: space-between; align-items: start;">
+                        <div>
+                            <h3 style="margin: 0 0 8px 0;">{client['name']}</h3>
+                            <p style="color: #64748b; margin: 0;">{client['contact']} | {client['sector']}</p>
+                            <p style="color: #64748b; font-size: 12px; margin: 4px 0 0 0;">Accountant: {client['accountant']}{alert_html}</p>
+                        </div>
+                        <div style="text-align: right;">
+                            <p style="font-size: 24px; font-weight: 700; margin: 0; color: #0f172a;">{format_currency(client['omzet_ytd'])}</p>
+                            <p style="color: #64748b; font-size: 12px; margin: 0;">Omzet YTD</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        with col2:
+            if st.button("Bekijk →", key=f"view_{client['id']}", use_container_width=True):
+                st.session_state.selected_client = client['id']
+                st.session_state.portal_mode = 'klant'
+                st.session_state.current_view = 'dashboard'
+                st.rerun()
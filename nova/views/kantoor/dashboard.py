@@ -0,0 +1,249 @@
+"""Kantoor portal: Kantoor dashboard (mission control)"""
+
+from datetime import datetime
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nova.reference import reference_data
+from nova.data import clients_repo, alerts_repo
+from nova.ui import format_currency, render_kpi_card, render_section_header
+
+
+# Number of clients listed on the kantoor dashboard
+DASHBOARD_CLIENT_ROWS = 25
+
+
+def render():
+    firm_info = reference_data()["firm_info"]
+    # KANTOOR DASHBOARD - MISSION CONTROL
+    st.markdown("""
+        <div style="margin-bottom: 24px;">
+            <h1 style="color: #0f172a; margin: 0; display: flex; align-items: center; gap: 12px;">
+                <span style="font-size: 32px;">🏢</span> Mission Control
+            </h1>
+            <p style="color: #64748b; font-size: 15px; margin: 8px 0 0 0;">
+                <strong>{}</strong> &nbsp;•&nbsp; {}
+            </p>
+        </div>
+        """.format(firm_info['name'], datetime.now().strftime('%d %B %Y')), unsafe_allow_html=True)
+
+    # Firm-wide KPIs with enhanced cards
+    render_section_header("📊 Kantoor KPI's", "Real-time overzicht van uw kantoorprestaties")
+    portfolio = clients_repo.totals()
+    alert_counts = alerts_repo.counts()
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        render_kpi_card("Actieve Klanten", "45", "+3 dit kwartaal", "👥", "#3b82f6", "up")
+    with col2:
+        total_omzet = portfolio['omzet_ytd']
+        render_kpi_card("Totale Omzet Portfolio", format_currency(total_omzet), "+8.2% vs vorig jaar", "💰", "#10b981", "up")
+    with col3:
+        render_kpi_card("Openstaande Facturen", format_currency(portfolio['openstaand']), None, "📄", "#f59e0b")
+    with col4:
+        render_kpi_card("Declarabiliteit", "78%", "+5% vs vorige maand", "⏱️", "#8b5cf6", "up")
+    with col5:
+        render_kpi_card("AI Verwerkingen", "246", "Vandaag verwerkt", "🤖", "#14b8a6")
+
+    st.markdown("---")
+
+    # Two columns: Alerts and Quick Overview
+    col_left, col_right = st.columns([1, 1])
+
+    with col_left:
+        # Enhanced Alert Section Header
+        st.markdown(f"""
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 16px;">
+                <div>
+                    <h3 style="margin: 0; color: #0f172a; font-size: 18px;">🚨 Actieve Alerts</h3>
+                    <p style="color: #64748b; font-size: 13px; margin: 4px 0 0 0;">{alert_counts['total']} actieve meldingen vereisen uw aandacht</p>
+                </div>
+                <div style="display: flex; gap: 8px;">
+                    <span class="alert-badge-urgent">{alert_counts['urgent']} Urgent</span>
+                    <span class="alert-badge-warning">{alert_counts['warning']} Attentie</span>
+                    <span class="alert-badge-info">{alert_counts['info']} Info</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        for alert in alerts_repo.list(limit=4):
+            if alert['type'] == 'urgent':
+                alert_class = "alert-card-red"
+                icon = "🔴"
+                priority_badge = '<span class="alert-badge-urgent">URGENT</span>'
+                action_text = "Direct actie vereist"
+                icon_bg = "#fee2e2"
+            elif alert['type'] == 'warning':
+                alert_class = "alert-card"
+                icon = "⚠️"
+                priority_badge = '<span class="alert-badge-warning">ATTENTIE</span>'
+                action_text = "Actie binnen 5 dagen"
+                icon_bg = "#fef3c7"
+            else:
+                alert_class = "alert-card-info"
+                icon = "ℹ️"
+                priority_badge = '<span class="alert-badge-info">INFO</span>'
+                action_text = "Ter kennisname"
+                icon_bg = "#dbeafe"
+
+            st.markdown(f"""
+                <div class="{alert_class}">
+                    <div style="display: flex; gap: 16px; align-items: flex-start;">
+                        <div style="min-width: 44px; height: 44px; background: {icon_bg}; border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 20px;">
+                            {icon}
+                        </div>
+                        <div style="flex: 1;">
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start; flex-wrap: wrap; gap: 8px;">
+                                <div>
+                                    <strong style="color: #0f172a; font-size: 15px;">{alert['client']}</strong>
+                                    <span style="margin-left: 10px;">{priority_badge}</span>
+                                </div>
+                                <small style="color: #94a3b8; display: flex; align-items: center; gap: 4px; font-size: 12px;">
+                                    🕐 {alert['time']}
+                                </small>
+                            </div>
+                            <p style="color: #475569; margin: 8px 0; font-size: 14px; line-height: 1.5;">{alert['message']}</p>
+                            <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 12px;">
+                                <span style="color: #64748b; font-size: 12px; font-style: italic;">{action_text}</span>
+                                <a href="#" style="color: #14b8a6; font-size: 13px; font-weight: 600; text-decoration: none;">Bekijk details →</a>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with col_right:
+        render_section_header("📈 Portfolio Gezondheid", "Klantstatus verdeling")
+        # Status distribution
+        status_counts = clients_repo.status_counts()
+        green = status_counts['green']
+        yellow = status_counts['yellow']
+        red = status_counts['red']
+        total = green + yellow + red
+
+        fig = go.Figure(data=[go.Pie(
+            labels=['Gezond', 'Aandacht nodig', 'Kritiek'],
+            values=[green, yellow, red],
+            hole=0.65,
+            marker_colors=['#10b981', '#f59e0b', '#ef4444'],
+            textinfo='percent+value',
+            textposition='outside',
+            textfont=dict(size=12, color='#475569'),
+            hovertemplate='<b>%{label}</b><br>%{value} klanten<br>%{percent}<extra></extra>',
+            pull=[0, 0, 0.05]  # Slightly pull out critical segment
+        )])
+        fig.update_layout(
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=-0.15,
+                xanchor="center",
+                x=0.5,
+                font=dict(size=12, color='#475569')
+            ),
+            margin=dict(t=30, b=30, l=20, r=20),
+            height=280,
+            annotations=[dict(
+                text=f'<b>{total}</b><br><span style="font-size:12px">klanten</span>',
+                x=0.5, y=0.5,
+                font=dict(size=24, color='#0f172a'),
+                showarrow=False
+            )]
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Quick stats below chart
+        st.markdown(f"""
+            <div style="display: flex; justify-content: space-around; padding: 12px; background: #f8fafc; border-radius: 8px; margin-top: -10px;">
+                <div style="text-align: center;">
+                    <span style="color: #10b981; font-weight: 700; font-size: 18px;">{green}</span>
+                    <p style="color: #64748b; font-size: 11px; margin: 0;">Gezond</p>
+                </div>
+                <div style="text-align: center;">
+                    <span style="color: #f59e0b; font-weight: 700; font-size: 18px;">{yellow}</span>
+                    <p style="color: #64748b; font-size: 11px; margin: 0;">Attentie</p>
+                </div>
+                <div style="text-align: center;">
+                    <span style="color: #ef4444; font-weight: 700; font-size: 18px;">{red}</span>
+                    <p style="color: #64748b; font-size: 11px; margin: 0;">Kritiek</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+    # Client Overview Table with enhanced styling
+    render_section_header("👥 Klanten Overzicht", f"{portfolio['count']} actieve klanten in uw portfolio")
+
+    # Table header
+    st.markdown("""
+        <div style="display: grid; grid-template-columns: 3fr 2fr 2fr 2fr 2fr 1fr; gap: 16px; padding: 12px 16px;
+                    background: #f8fafc; border-radius: 10px 10px 0 0; margin-bottom: 4px;">
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Klant</span>
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Omzet YTD</span>
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Resultaat</span>
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Openstaand</span>
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Verantw.</span>
+            <span style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;"></span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    for i, client in enumerate(clients_repo.list(limit=DASHBOARD_CLIENT_ROWS)):
+        status_color = {"green": "#10b981", "yellow": "#f59e0b", "red": "#ef4444"}[client['status']]
+        growth = ((client['omzet_ytd'] / client['omzet_prev']) - 1) * 100 if client['omzet_prev'] > 0 else 0
+        growth_str = f"+{growth:.1f}%" if growth >= 0 else f"{growth:.1f}%"
+        growth_color = "#10b981" if growth >= 0 else "#ef4444"
+        growth_icon = "↑" if growth >= 0 else "↓"
+        result_color = "#10b981" if client['winst_ytd'] >= 0 else "#ef4444"
+        alert_indicator = f'<span style="color: #f59e0b; margin-left: 6px;" title="{len(client["alerts"])} alert(s)">⚠️</span>' if client['alerts'] else ""
+        row_bg = "#ffffff" if i % 2 == 0 else "#fafbfc"
+
+        col1, col2, col3, col4, col5, col6 = st.columns([3, 2, 2, 2, 2, 1])
+
+        with col1:
+            st.markdown(f"""
+                <div style="display: flex; align-items: center; gap: 12px; background: {row_bg}; padding: 8px 0;">
+                    <div style="width: 10px; height: 10px; border-radius: 50%; background: {status_color};
+                                box-shadow: 0 0 0 3px {status_color}22;"></div>
+                    <div>
+                        <strong style="color: #0f172a;">{client['name']}</strong>{alert_indicator}<br>
+                        <small style="color: #64748b; font-size: 12px;">{client['sector']}</small>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"""
+                <div style="background: {row_bg}; padding: 8px 0;">
+                    <strong style="color: #0f172a;">{format_currency(client['omzet_ytd'])}</strong><br>
+                    <small style='color: {growth_color}; font-weight: 600;'>{growth_icon} {growth_str}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        with col3:
+            st.markdown(f"""
+                <div style="background: {row_bg}; padding: 8px 0;">
+                    <strong style="color: {result_color};">{format_currency(client['winst_ytd'])}</strong><br>
+                    <small style='color: #94a3b8;'>Resultaat</small>
+                </div>
+                """, unsafe_allow_html=True)
+        with col4:
+            st.markdown(f"""
+                <div style="background: {row_bg}; padding: 8px 0;">
+                    <strong style="color: #0f172a;">{format_currency(client['openstaand'])}</strong><br>
+                    <small style='color: #94a3b8;'>Openstaand</small>
+                </div>
+                """, unsafe_allow_html=True)
+        with col5:
+            st.markdown(f"""
+                <div style="background: {row_bg}; padding: 8px 0;">
+                    <strong style="color: #0f172a;">{client['accountant'].split()[0]}</strong><br>
+                    <small style='color: #94a3b8;'>{client['last_activity']}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        with col6:
+            if st.button("→", key=f"goto_{client['id']}", help=f"Bekijk {client['name']}"):
+                st.session_state.selected_client = client['id']
+                st.session_state.portal_mode = 'klant'
+                st.session_state.current_view = 'dashboard'
+                st.rerun()
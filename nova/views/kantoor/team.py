@@ -0,0 +1,122 @@
+"""Kantoor portal: Team workload"""
+
+from collections import Counter
+
+import pandas as pd
+import streamlit as st
+
+from nova import planner
+from nova.reference import reference_data
+from nova.data import clients_repo, team_repo
+
+
+def render():
+    firm_info = reference_data()["firm_info"]
+    # TEAM WORKLOAD
+    st.title("📋 Team Workload")
+    team_members = team_repo.list()
+    st.markdown(f"**{firm_info['name']}** | {len(team_members)} teamleden")
+
+    # Workload follows from the estimated hours of the assigned clients (see nova.planner)
+    workload = planner.workload()
+    hours, current = workload['hours'], workload['current']
+    capacity = planner.team_capacity(team_members)
+    member_loads = planner.loads(hours, current, capacity)
+    client_counts = Counter(current.values())
+    for member in team_members:
+        member['clients'] = client_counts.get(member['name'], 0)
+        member['hours'] = member_loads[member['name']]
+        member['capacity'] = capacity[member['name']]
+        member['workload'] = round(100 * member['hours'] / member['capacity'])
+
+    st.markdown("---")
+
+    for member in team_members:
+        workload_color = "#10b981" if member['workload'] < 80 else "#f59e0b" if member['workload'] < 90 else "#ef4444"
+
+        col1, col2, col3, col4 = st.columns([2, 1, 3, 1])
+
+        with col1:
+            st.markdown(f"""
+                <div style="display: flex; align-items: center; gap: 12px;">
+                    <span style="font-size: 32px;">{member['avatar']}</span>
+                    <div>
+                        <strong>{member['name']}</strong><br>
+                        <small style="color: #64748b;">{member['role']}</small>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with col2:
+            st.metric("Klanten", member['clients'])
+
+        with col3:
+            st.progress(min(member['workload'], 100) / 100)
+            st.markdown(f"<small style='color: {workload_color};'>{member['workload']}% bezetting "
+                        f"({member['hours']:.0f} van {member['capacity']} uur per maand)</small>", unsafe_allow_html=True)
+
+        with col4:
+            if member['workload'] >= 90:
+                st.warning("Overbelast")
+            elif member['workload'] >= 80:
+                st.info("Druk")
+            else:
+                st.success("OK")
+
+        st.markdown("---")
+
+    # Team stats
+    st.markdown("### 📊 Team Statistieken")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        total_capacity = sum(capacity.values())
+        st.metric("Gemiddelde Bezetting", f"{100 * sum(member_loads.values()) / total_capacity:.0f}%" if total_capacity else "-")
+    with col2:
+        st.metric("Totaal Klanten", len(current))
+    with col3:
+        st.metric("Teamleden Overbelast", sum(member['workload'] >= 90 for member in team_members))
+
+    st.markdown("---")
+
+    # Rebalancing proposal
+    st.markdown("### ⚖️ Herverdeling")
+    st.caption("Grootste klanten eerst, elk naar het minst bezette teamlid; klanten blijven bij hun accountant "
+               "zolang die niet boven het teamgemiddelde uitkomt.")
+    if st.button("Bereken evenwichtige verdeling", key="team_plan_button"):
+        st.session_state.team_plan = planner.plan(hours, capacity, current)
+
+    proposal = st.session_state.get('team_plan')
+    if proposal is not None:
+        moves = {client_id: member for client_id, member in proposal.items() if current.get(client_id) != member}
+        planned = planner.loads(hours, proposal, capacity)
+        st.dataframe(pd.DataFrame([
+            {"Teamlid": name, "Uren nu": round(member_loads[name]), "Uren na herverdeling": round(planned[name]),
+             "Bezetting na herverdeling": f"{100 * planned[name] / capacity[name]:.0f}%"}
+            for name in capacity
+        ]), use_container_width=True, hide_index=True)
+        if moves:
+            st.markdown(f"**{len(moves)} klanten wisselen van accountant**")
+            st.dataframe(pd.DataFrame([
+                {"Klant": client_id, "Van": current.get(client_id), "Naar": member, "Uren per maand": round(hours[client_id], 1)}
+                for client_id, member in sorted(moves.items(), key=lambda m: -hours[m[0]])
+            ]), use_container_width=True, hide_index=True)
+            if st.button("✅ Voorstel toepassen", key="team_plan_apply"):
+                clients_repo.assign(moves)
+                del st.session_state.team_plan
+                st.rerun()
+        else:
+            st.success("De huidige verdeling is al in balans")
+
+    # Suggestion for a new client
+    with st.expander("➕ Nieuwe klant inplannen"):
+        col1, col2 = st.columns(2)
+        with col1:
+            invoices_per_year = st.number_input("Facturen per jaar", min_value=0, value=500, step=50)
+        with col2:
+            stage = st.selectbox("Stadium jaarrekening", list(planner.REMAINING_STAGE_HOURS))
+        needed = planner.BASE_HOURS + invoices_per_year * planner.INVOICE_HOURS + planner.REMAINING_STAGE_HOURS[stage]
+        member, utilisation = planner.suggest(needed, member_loads, capacity)
+        if member is None:
+            st.warning(f"Geschat {needed:.0f} uur per maand, maar geen teamlid heeft capaciteit")
+        else:
+            st.info(f"Geschat {needed:.0f} uur per maand → **{member}** ({100 * utilisation:.0f}% bezetting daarna)")
@@ -0,0 +1,36 @@
+"""Klant portal: AI agents van de klant"""
+
+import streamlit as st
+
+from nova.metrics import metrics
+from nova.reference import reference_data
+from nova.ui import format_latency
+
+
+def render(current_client):
+    ai_agents = reference_data()["ai_agents"]
+    st.title("🤖 AI Agents")
+    st.markdown(f"**{current_client['name']}** | Jouw digitale financiële team")
+
+    for name, agent in ai_agents.items():
+        day, hour = metrics.summary(name, "day"), metrics.summary(name, "hour")
+        status, status_class = ("Actief", "status-active") if hour["count"] else ("Stand-by", "status-active status-idle")
+        st.markdown(f"""
+            <div class="agent-card agent-{name.lower()}">
+                <div style="display: flex; justify-content: space-between; align-items: start;">
+                    <div>
+                        <h3 style="margin: 0; color: {agent['color']};">{name}</h3>
+                        <p style="color: #64748b; font-size: 12px; margin: 4px 0;">{agent['full_name']}</p>
+                        <p style="margin: 8px 0 0 0;"><strong>{agent['role']}</strong></p>
+                        <p style="color: #64748b;">{agent['description']}</p>
+                        <p style="color: #714B67; font-size: 12px;"><span class="odoo-badge">Odoo: {agent['odoo_link']}</span></p>
+                    </div>
+                    <div style="text-align: right;">
+                        <span class="{status_class}">{status}</span>
+                        <p style="margin: 12px 0 0 0; font-size: 24px; font-weight: 700;">{day['count']}</p>
+                        <p style="color: #64748b; font-size: 12px;">verwerkt (24 uur)</p>
+                        <p style="color: #10b981; font-weight: 500;">p95 {format_latency(hour['p95'])}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
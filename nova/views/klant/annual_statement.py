@@ -0,0 +1,912 @@
+"""Klant portal: Jaarrekening (VERA)"""
+
+import streamlit as st
+
+from nova.reference import reference_data
+from nova.data import closing_repo, annual_repo, documents_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    reference = reference_data()
+    ai_agents = reference["ai_agents"]
+    company_size_thresholds = reference["company_size_thresholds"]
+    annual_statement_workflow = reference["annual_statement_workflow"]
+    kvk_submission_statuses = reference["kvk_submission_statuses"]
+    client_id = current_client['id']
+
+    # ANNUAL STATEMENT - VERA Agent View (Jaarrekening)
+    st.markdown("""
+        <div style="margin-bottom: 24px;">
+            <h1 style="color: #0f172a; margin: 0; display: flex; align-items: center; gap: 12px;">
+                <span style="font-size: 32px;">📑</span> Jaarrekening
+            </h1>
+            <p style="color: #64748b; font-size: 15px; margin: 8px 0 0 0;">
+                <strong>{}</strong> &nbsp;•&nbsp; Beheerd door <span style="color: #7c3aed; font-weight: 600;">VERA</span>
+            </p>
+        </div>
+        """.format(current_client['name']), unsafe_allow_html=True)
+
+    # Year selector
+    st.markdown("### 📆 Selecteer Boekjaar")
+    col1, col2, col3 = st.columns([2, 2, 2])
+
+    with col1:
+        available_years = annual_repo.years(client_id)
+        selected_year = st.selectbox("Boekjaar", available_years, key="annual_statement_year")
+
+    current_statement = annual_repo.get(client_id, selected_year)
+    annual_balans = documents_repo.get(client_id, 'annual_balans', selected_year)
+    annual_wv = documents_repo.get(client_id, 'annual_wv', selected_year)
+
+    # Determine company size and requirements
+    company_size_key = current_statement.get("company_size", "klein")
+    company_size_info = company_size_thresholds.get(company_size_key, company_size_thresholds["klein"])
+
+    with col2:
+        st.markdown(f"""
+            <div style="padding-top: 25px;">
+                <span style="background: #7c3aed; color: white; padding: 6px 16px; border-radius: 20px; font-weight: 600;">
+                    {company_size_info['name']}
+                </span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Find current workflow stage
+    current_stage_id = current_statement.get("status", "concept")
+    current_stage_info = None
+    current_stage_index = 0
+    for idx, stage in enumerate(annual_statement_workflow["stages"]):
+        if stage["id"] == current_stage_id:
+            current_stage_info = stage
+            current_stage_index = idx
+            break
+
+    with col3:
+        stage_colors = {
+            "concept": "#64748b",
+            "review_accountant": "#f59e0b",
+            "review_bestuur": "#3b82f6",
+            "vaststelling_ava": "#8b5cf6",
+            "deponering": "#06b6d4",
+            "afgerond": "#10b981"
+        }
+        stage_color = stage_colors.get(current_stage_id, "#64748b")
+        st.markdown(f"""
+            <div style="padding-top: 25px;">
+                <span style="background: {stage_color}; color: white; padding: 6px 16px; border-radius: 20px; font-weight: 600;">
+                    {current_stage_info['name'] if current_stage_info else 'Onbekend'}
+                </span>
+                <span style="color: #64748b; margin-left: 12px; font-size: 13px;">
+                    Deadline: {current_statement.get('deadline_vaststelling', 'N/A')}
+                </span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Workflow Progress Indicator
+    st.markdown("### 🔄 Goedkeuringsproces")
+
+    workflow_cols = st.columns(6)
+    for idx, stage in enumerate(annual_statement_workflow["stages"]):
+        with workflow_cols[idx]:
+            if idx < current_stage_index:
+                # Completed
+                icon = "✅"
+                bg_color = "#dcfce7"
+                border_color = "#10b981"
+                text_color = "#166534"
+            elif idx == current_stage_index:
+                # Current
+                icon = "🔄"
+                bg_color = "#fef3c7"
+                border_color = "#f59e0b"
+                text_color = "#92400e"
+            else:
+                # Pending
+                icon = "⏳"
+                bg_color = "#f1f5f9"
+                border_color = "#94a3b8"
+                text_color = "#64748b"
+
+            st.markdown(f"""
+                <div style="text-align: center; padding: 12px; background: {bg_color}; border-radius: 12px; border: 2px solid {border_color};">
+                    <span style="font-size: 24px;">{icon}</span>
+                    <p style="color: {text_color}; font-size: 11px; margin: 8px 0 0 0; font-weight: 600;">{stage['name']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Summary KPIs
+    financials = current_statement.get("financials", {})
+    jr_counts = closing_repo.checklist_counts(client_id, 'annual', selected_year)
+    completed_tasks = jr_counts.get("completed", 0)
+    attention_tasks = jr_counts.get("attention", 0)
+    pending_tasks = jr_counts.get("pending", 0) + jr_counts.get("in_progress", 0)
+    blocked_tasks = jr_counts.get("blocked", 0)
+    total_tasks = sum(jr_counts.values()) - jr_counts.get("not_applicable", 0)
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #7c3aed; text-align: center;">
+                <p class="metric-label">BALANSTOTAAL</p>
+                <p class="metric-value" style="color: #7c3aed; font-size: 22px;">{format_currency(financials.get('balanstotaal', 0))}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #10b981; text-align: center;">
+                <p class="metric-label">NETTO-OMZET</p>
+                <p class="metric-value" style="color: #10b981; font-size: 22px;">{format_currency(financials.get('netto_omzet', 0))}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col3:
+        result_color = "#10b981" if financials.get('resultaat', 0) >= 0 else "#ef4444"
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid {result_color}; text-align: center;">
+                <p class="metric-label">RESULTAAT</p>
+                <p class="metric-value" style="color: {result_color}; font-size: 22px;">{format_currency(financials.get('resultaat', 0))}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #3b82f6; text-align: center;">
+                <p class="metric-label">EIGEN VERMOGEN</p>
+                <p class="metric-value" style="color: #3b82f6; font-size: 22px;">{format_currency(financials.get('eigen_vermogen', 0))}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col5:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #06b6d4; text-align: center;">
+                <p class="metric-label">VOORTGANG</p>
+                <p class="metric-value" style="color: #06b6d4; font-size: 22px;">{int(completed_tasks/total_tasks*100) if total_tasks > 0 else 0}%</p>
+                <p style="color: #64748b; font-size: 12px;">{completed_tasks}/{total_tasks} taken</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Main tabs
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📊 Overzicht", "📋 Checklist", "📈 Balans", "💰 W&V", "✅ Goedkeuring", "📤 KvK Indiening"])
+
+    with tab1:
+        st.markdown("### 📊 Jaarrekening Overzicht")
+
+        # Company size info card
+        st.markdown(f"""
+            <div class="agent-card" style="border-left-color: #7c3aed; background: linear-gradient(to right, rgba(124,58,237,0.05), white);">
+                <div style="display: flex; gap: 16px; align-items: flex-start;">
+                    <div style="min-width: 48px; height: 48px; background: rgba(124,58,237,0.1); border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 24px;">
+                        🏢
+                    </div>
+                    <div style="flex: 1;">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div>
+                                <strong style="color: #7c3aed; font-size: 16px;">Classificatie: {company_size_info['name']}</strong>
+                                <p style="color: #475569; margin: 8px 0; font-size: 14px;">{company_size_info['description']}</p>
+                            </div>
+                        </div>
+                        <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin-top: 12px; padding-top: 12px; border-top: 1px solid rgba(0,0,0,0.06);">
+                            <div>
+                                <small style="color: #94a3b8;">Balanstotaal grens</small><br>
+                                <strong>≤ {format_currency(company_size_info['balanstotaal_max']) if company_size_info['balanstotaal_max'] else 'Geen'}</strong>
+                            </div>
+                            <div>
+                                <small style="color: #94a3b8;">Netto-omzet grens</small><br>
+                                <strong>≤ {format_currency(company_size_info['netto_omzet_max']) if company_size_info['netto_omzet_max'] else 'Geen'}</strong>
+                            </div>
+                            <div>
+                                <small style="color: #94a3b8;">Werknemers grens</small><br>
+                                <strong>≤ {company_size_info['werknemers_max'] if company_size_info['werknemers_max'] else 'Geen'}</strong>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Requirements based on company size
+        st.markdown("#### 📋 Vereisten op basis van bedrijfsgrootte")
+
+        requirements = company_size_info['requirements']
+        req_cols = st.columns(3)
+
+        with req_cols[0]:
+            st.markdown(f"""
+                <div class="metric-card" style="min-height: 140px;">
+                    <p class="metric-label">BALANS</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['balans']}</p>
+                    <p class="metric-label" style="margin-top: 16px;">W&V REKENING</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['wv_rekening']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with req_cols[1]:
+            st.markdown(f"""
+                <div class="metric-card" style="min-height: 140px;">
+                    <p class="metric-label">BESTUURSVERSLAG</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['bestuursverslag']}</p>
+                    <p class="metric-label" style="margin-top: 16px;">ACCOUNTANTSVERKLARING</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['accountantsverklaring']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with req_cols[2]:
+            st.markdown(f"""
+                <div class="metric-card" style="min-height: 140px;">
+                    <p class="metric-label">PUBLICATIE</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['publicatie']}</p>
+                    <p class="metric-label" style="margin-top: 16px;">SBR TAXONOMIE</p>
+                    <p style="color: #0f172a; font-weight: 600; font-size: 16px;">{requirements['sbr_taxonomy']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Components status
+        st.markdown("---")
+        st.markdown("#### 📂 Onderdelen Jaarrekening")
+
+        components = current_statement.get("components", {})
+        component_labels = {
+            "balans": "Balans",
+            "wv_rekening": "Winst- en verliesrekening",
+            "toelichting": "Toelichting",
+            "bestuursverslag": "Bestuursverslag",
+            "accountantsverklaring": "Accountantsverklaring",
+            "overige_gegevens": "Overige gegevens"
+        }
+
+        comp_cols = st.columns(3)
+        for idx, (key, label) in enumerate(component_labels.items()):
+            with comp_cols[idx % 3]:
+                comp_data = components.get(key, {"status": "pending", "last_updated": None})
+                status = comp_data.get("status", "pending")
+
+                if status == "definitief":
+                    status_color = "#10b981"
+                    status_text = "Definitief"
+                    status_icon = "✅"
+                elif status == "concept":
+                    status_color = "#f59e0b"
+                    status_text = "Concept"
+                    status_icon = "📝"
+                elif status == "niet_vereist":
+                    status_color = "#94a3b8"
+                    status_text = "Niet vereist"
+                    status_icon = "➖"
+                else:
+                    status_color = "#64748b"
+                    status_text = "In afwachting"
+                    status_icon = "⏳"
+
+                st.markdown(f"""
+                    <div class="invoice-row" style="border-left: 4px solid {status_color};">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <span style="font-size: 16px; margin-right: 8px;">{status_icon}</span>
+                                <strong>{label}</strong>
+                            </div>
+                            <span style="background: {status_color}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 11px;">{status_text}</span>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+        # Issues
+        issues = current_statement.get("issues", [])
+        if issues:
+            st.markdown("---")
+            st.markdown("#### ⚠️ Aandachtspunten")
+
+            for issue in issues:
+                severity_color = "#f59e0b" if issue.get("severity") == "warning" else "#3b82f6"
+                st.markdown(f"""
+                    <div class="alert-card" style="border-left: 5px solid {severity_color};">
+                        <div style="display: flex; gap: 12px; align-items: flex-start;">
+                            <span style="font-size: 18px;">⚠️</span>
+                            <div>
+                                <strong>{issue['title']}</strong>
+                                <p style="color: #475569; margin: 4px 0 0 0; font-size: 14px;">{issue['description']}</p>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown("### 📋 Jaarrekening Checklist")
+        st.markdown("*Taken worden automatisch gemonitord door VERA en doorgestuurd naar de juiste agent*")
+
+        # Filter
+        filter_col1, filter_col2 = st.columns([1, 3])
+        with filter_col1:
+            jr_status_filter = st.selectbox("Filter", ["Alle", "Voltooid", "Aandacht nodig", "In afwachting", "Geblokkeerd"], key="jr_checklist_filter")
+
+        # Group by category
+        jr_categories = {}
+        for item in closing_repo.checklist(client_id, 'annual', selected_year):
+            cat = item["category"]
+            if cat not in jr_categories:
+                jr_categories[cat] = []
+            jr_categories[cat].append(item)
+
+        for category, items in jr_categories.items():
+            # Filter items
+            if jr_status_filter == "Voltooid":
+                filtered_items = [i for i in items if i["status"] == "completed"]
+            elif jr_status_filter == "Aandacht nodig":
+                filtered_items = [i for i in items if i["status"] == "attention"]
+            elif jr_status_filter == "In afwachting":
+                filtered_items = [i for i in items if i["status"] in ["pending", "in_progress"]]
+            elif jr_status_filter == "Geblokkeerd":
+                filtered_items = [i for i in items if i["status"] == "blocked"]
+            else:
+                filtered_items = items
+
+            if not filtered_items:
+                continue
+
+            st.markdown(f"#### {category}")
+
+            for item in filtered_items:
+                # Status styling
+                if item["status"] == "completed":
+                    status_icon = "✅"
+                    status_bg = "#dcfce7"
+                    status_border = "#10b981"
+                    status_text = "Voltooid"
+                elif item["status"] == "attention":
+                    status_icon = "⚠️"
+                    status_bg = "#fef3c7"
+                    status_border = "#f59e0b"
+                    status_text = "Aandacht nodig"
+                elif item["status"] == "in_progress":
+                    status_icon = "🔄"
+                    status_bg = "#dbeafe"
+                    status_border = "#3b82f6"
+                    status_text = "In behandeling"
+                elif item["status"] == "pending":
+                    status_icon = "⏳"
+                    status_bg = "#f1f5f9"
+                    status_border = "#64748b"
+                    status_text = "In afwachting"
+                elif item["status"] == "blocked":
+                    status_icon = "🚫"
+                    status_bg = "#fee2e2"
+                    status_border = "#ef4444"
+                    status_text = "Geblokkeerd"
+                else:
+                    status_icon = "➖"
+                    status_bg = "#f1f5f9"
+                    status_border = "#94a3b8"
+                    status_text = "N.v.t."
+
+                agent_color = ai_agents.get(item.get("responsible_agent", ""), {}).get("color", "#64748b")
+                agent_name = item.get("responsible_agent", "Handmatig") or "Handmatig"
+                automated_badge = '<span style="background: #dbeafe; color: #1e40af; padding: 2px 8px; border-radius: 10px; font-size: 10px; margin-left: 8px;">AUTO</span>' if item.get("automated") else ""
+
+                completion_html = ""
+                if item.get("completion_date"):
+                    completion_html = f'<span style="color: #64748b; font-size: 11px;">Voltooid: {item.get("completion_date")}</span>'
+
+                notes_html = ""
+                if item.get("notes"):
+                    notes_html = f'<p style="color: #475569; font-size: 12px; margin: 8px 0 0 0; font-style: italic;">💬 {item.get("notes")}</p>'
+
+                st.markdown(f"""
+                    <div class="invoice-row" style="border-left: 4px solid {status_border}; background: {status_bg};">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div style="flex: 1;">
+                                <div style="display: flex; align-items: center; gap: 12px;">
+                                    <span style="font-size: 18px;">{status_icon}</span>
+                                    <div>
+                                        <strong style="color: #0f172a;">{item["task"]}</strong>{automated_badge}
+                                        <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">{item["description"]}</p>
+                                    </div>
+                                </div>
+                                <div style="margin-top: 8px; display: flex; gap: 16px; align-items: center;">
+                                    <span style="color: {agent_color}; font-weight: 600; font-size: 12px;">Agent: {agent_name}</span>
+                                    {completion_html}
+                                </div>
+                                {notes_html}
+                            </div>
+                            <div style="text-align: right; min-width: 120px;">
+                                <span style="background: {status_border}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 11px; font-weight: 600;">{status_text}</span>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown("")
+
+    with tab3:
+        st.markdown("### 📈 Balans per 31 december " + selected_year)
+
+        # Balans totals
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### Activa")
+
+            # Vaste activa
+            st.markdown("""
+                <div class="rgs-header">Vaste activa</div>
+                """, unsafe_allow_html=True)
+
+            for item in annual_balans["activa"]["vaste_activa"]["items"]:
+                st.markdown(f"""
+                    <div class="rgs-row">
+                        <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                        <span style="font-weight: 600;">{format_currency(item['amount'])}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                    <span>Subtotaal vaste activa</span>
+                    <span>{format_currency(annual_balans["activa"]["vaste_activa"]["subtotal"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            # Vlottende activa
+            st.markdown("""
+                <div class="rgs-header">Vlottende activa</div>
+                """, unsafe_allow_html=True)
+
+            for item in annual_balans["activa"]["vlottende_activa"]["items"]:
+                st.markdown(f"""
+                    <div class="rgs-row">
+                        <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                        <span style="font-weight: 600;">{format_currency(item['amount'])}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                    <span>Subtotaal vlottende activa</span>
+                    <span>{format_currency(annual_balans["activa"]["vlottende_activa"]["subtotal"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row rgs-total" style="margin-top: 16px;">
+                    <span>TOTAAL ACTIVA</span>
+                    <span>{format_currency(annual_balans["totaal_activa"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown("#### Passiva")
+
+            # Eigen vermogen
+            st.markdown("""
+                <div class="rgs-header">Eigen vermogen</div>
+                """, unsafe_allow_html=True)
+
+            for item in annual_balans["passiva"]["eigen_vermogen"]["items"]:
+                st.markdown(f"""
+                    <div class="rgs-row">
+                        <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                        <span style="font-weight: 600;">{format_currency(item['amount'])}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                    <span>Subtotaal eigen vermogen</span>
+                    <span>{format_currency(annual_balans["passiva"]["eigen_vermogen"]["subtotal"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            # Langlopende schulden
+            st.markdown("""
+                <div class="rgs-header">Langlopende schulden</div>
+                """, unsafe_allow_html=True)
+
+            for item in annual_balans["passiva"]["langlopende_schulden"]["items"]:
+                st.markdown(f"""
+                    <div class="rgs-row">
+                        <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                        <span style="font-weight: 600;">{format_currency(item['amount'])}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                    <span>Subtotaal langlopende schulden</span>
+                    <span>{format_currency(annual_balans["passiva"]["langlopende_schulden"]["subtotal"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            # Kortlopende schulden
+            st.markdown("""
+                <div class="rgs-header">Kortlopende schulden</div>
+                """, unsafe_allow_html=True)
+
+            for item in annual_balans["passiva"]["kortlopende_schulden"]["items"]:
+                st.markdown(f"""
+                    <div class="rgs-row">
+                        <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                        <span style="font-weight: 600;">{format_currency(item['amount'])}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                    <span>Subtotaal kortlopende schulden</span>
+                    <span>{format_currency(annual_balans["passiva"]["kortlopende_schulden"]["subtotal"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+                <div class="rgs-row rgs-total" style="margin-top: 16px;">
+                    <span>TOTAAL PASSIVA</span>
+                    <span>{format_currency(annual_balans["totaal_passiva"])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Balance check
+        balance_check = annual_balans["totaal_activa"] == annual_balans["totaal_passiva"]
+        check_color = "#10b981" if balance_check else "#ef4444"
+        check_icon = "✅" if balance_check else "❌"
+
+        st.markdown(f"""
+            <div style="text-align: center; margin-top: 24px; padding: 16px; background: {'#dcfce7' if balance_check else '#fee2e2'}; border-radius: 12px;">
+                <span style="font-size: 24px;">{check_icon}</span>
+                <p style="color: {check_color}; font-weight: 600; margin: 8px 0 0 0;">
+                    {'Balans is sluitend' if balance_check else 'Balans is NIET sluitend - controleer de boekingen'}
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with tab4:
+        st.markdown("### 💰 Winst- en Verliesrekening " + selected_year)
+
+        # W&V Statement
+        st.markdown("""
+            <div class="rgs-header">Bedrijfsopbrengsten</div>
+            """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+            <div class="rgs-row">
+                <span>{annual_wv['netto_omzet']['name']} <small style="color: #94a3b8;">({annual_wv['netto_omzet']['rgs']})</small></span>
+                <span style="font-weight: 600;">{format_currency(annual_wv['netto_omzet']['amount'])}</span>
+            </div>
+            <div class="rgs-row">
+                <span>{annual_wv['overige_opbrengsten']['name']} <small style="color: #94a3b8;">({annual_wv['overige_opbrengsten']['rgs']})</small></span>
+                <span style="font-weight: 600;">{format_currency(annual_wv['overige_opbrengsten']['amount'])}</span>
+            </div>
+            <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                <span>Totaal bedrijfsopbrengsten</span>
+                <span>{format_currency(annual_wv['totaal_opbrengsten'])}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        st.markdown("""
+            <div class="rgs-header">Bedrijfskosten</div>
+            """, unsafe_allow_html=True)
+
+        for item in annual_wv['kosten']['items']:
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                    <span style="font-weight: 600; color: #ef4444;">{format_currency(item['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+            <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                <span>Totaal bedrijfskosten</span>
+                <span style="color: #ef4444;">{format_currency(annual_wv['kosten']['subtotal'])}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        st.markdown("""
+            <div class="rgs-header">Afschrijvingen</div>
+            """, unsafe_allow_html=True)
+
+        for item in annual_wv['afschrijvingen']['items']:
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                    <span style="font-weight: 600; color: #ef4444;">{format_currency(item['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        st.markdown("""
+            <div class="rgs-header">Financiële baten en lasten</div>
+            """, unsafe_allow_html=True)
+
+        for item in annual_wv['financiele_baten_lasten']['items']:
+            color = "#ef4444" if item['amount'] < 0 else "#10b981"
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{item['name']} <small style="color: #94a3b8;">({item['rgs']})</small></span>
+                    <span style="font-weight: 600; color: {color};">{format_currency(item['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Results
+        st.markdown(f"""
+            <div class="rgs-row" style="background: #f8fafc; font-weight: 600; font-size: 16px;">
+                <span>Resultaat voor belastingen</span>
+                <span>{format_currency(annual_wv['resultaat_voor_belasting'])}</span>
+            </div>
+            <div class="rgs-row">
+                <span>{annual_wv['belastingen']['name']} <small style="color: #94a3b8;">({annual_wv['belastingen']['rgs']})</small></span>
+                <span style="font-weight: 600; color: #ef4444;">{format_currency(annual_wv['belastingen']['amount'])}</span>
+            </div>
+            <div class="rgs-row rgs-total" style="font-size: 18px;">
+                <span>RESULTAAT NA BELASTINGEN</span>
+                <span style="color: {'#10b981' if annual_wv['resultaat_na_belasting'] >= 0 else '#ef4444'};">{format_currency(annual_wv['resultaat_na_belasting'])}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with tab5:
+        st.markdown("### ✅ Goedkeuringsproces")
+        st.markdown("*Volg hier de status van het goedkeuringsproces door de verschillende stakeholders*")
+
+        # Current stage highlight
+        st.markdown(f"""
+            <div class="agent-card" style="border-left-color: #7c3aed; background: linear-gradient(to right, rgba(124,58,237,0.05), white);">
+                <div style="display: flex; gap: 16px; align-items: flex-start;">
+                    <div style="min-width: 48px; height: 48px; background: rgba(124,58,237,0.1); border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 24px;">
+                        🔄
+                    </div>
+                    <div>
+                        <strong style="color: #7c3aed; font-size: 16px;">Huidige fase: {current_stage_info['name'] if current_stage_info else 'Onbekend'}</strong>
+                        <p style="color: #475569; margin: 8px 0; font-size: 14px;">{current_stage_info['description'] if current_stage_info else ''}</p>
+                        <p style="color: #64748b; font-size: 13px; margin: 0;">
+                            Verantwoordelijk: <strong>{current_stage_info['responsible'] if current_stage_info else 'N/A'}</strong>
+                            {f" | Huidige reviewer: <strong>{current_statement.get('current_reviewer', 'N/A')}</strong>" if current_statement.get('current_reviewer') else ""}
+                        </p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Approval history timeline
+        st.markdown("#### 📜 Goedkeuringshistorie")
+
+        approval_history = current_statement.get("approval_history", [])
+
+        if approval_history:
+            for idx, entry in enumerate(approval_history):
+                is_last = idx == len(approval_history) - 1
+                line_style = "border-left: 2px solid #e2e8f0; margin-left: 20px; padding-left: 20px;" if not is_last else "margin-left: 20px; padding-left: 20px;"
+
+                st.markdown(f"""
+                    <div style="{line_style} padding-bottom: 16px;">
+                        <div style="display: flex; gap: 12px; align-items: flex-start; margin-left: -31px;">
+                            <div style="min-width: 20px; height: 20px; background: #10b981; border-radius: 50%; border: 3px solid white; box-shadow: 0 0 0 2px #10b981;"></div>
+                            <div>
+                                <div style="display: flex; gap: 8px; align-items: center;">
+                                    <strong style="color: #0f172a;">{entry['action']}</strong>
+                                    <span style="background: #f1f5f9; padding: 2px 8px; border-radius: 8px; font-size: 11px; color: #64748b;">{entry['stage']}</span>
+                                </div>
+                                <p style="color: #64748b; font-size: 13px; margin: 4px 0 0 0;">
+                                    Door: <strong>{entry['user']}</strong> &nbsp;•&nbsp; {entry['date']}
+                                </p>
+                                {f'<p style="color: #475569; font-size: 13px; margin: 4px 0 0 0; font-style: italic;">"{entry["notes"]}"</p>' if entry.get('notes') else ''}
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.info("Nog geen goedkeuringshistorie beschikbaar.")
+
+        st.markdown("---")
+
+        # Approval actions (only show if in appropriate stage)
+        if current_stage_id not in ["afgerond"]:
+            st.markdown("#### 🎯 Acties")
+
+            action_cols = st.columns(3)
+
+            with action_cols[0]:
+                if current_stage_id == "review_accountant":
+                    if st.button("✅ Goedkeuren als Accountant", key="approve_accountant", use_container_width=True, type="primary"):
+                        st.success("✅ Jaarrekening goedgekeurd! Doorgestuurd naar bestuur voor ondertekening.")
+                elif current_stage_id == "review_bestuur":
+                    if st.button("✍️ Ondertekenen als Bestuur", key="sign_board", use_container_width=True, type="primary"):
+                        st.success("✅ Jaarrekening ondertekend! Doorgestuurd naar AVA voor vaststelling.")
+                elif current_stage_id == "vaststelling_ava":
+                    if st.button("🗳️ Vaststellen door AVA", key="approve_ava", use_container_width=True, type="primary"):
+                        st.success("✅ Jaarrekening vastgesteld! Klaar voor deponering bij KvK.")
+
+            with action_cols[1]:
+                if current_stage_id in ["review_accountant", "review_bestuur"]:
+                    if st.button("↩️ Terugsturen voor Correctie", key="return_correction", use_container_width=True):
+                        st.warning("⚠️ Jaarrekening teruggestuurd voor correcties.")
+
+            with action_cols[2]:
+                if st.button("💬 Opmerking Toevoegen", key="add_comment", use_container_width=True):
+                    st.info("💬 Commentaar functie geopend...")
+
+    with tab6:
+        st.markdown("### 📤 KvK Indiening (SBR)")
+        st.markdown("*Dien de vastgestelde jaarrekening in bij de Kamer van Koophandel via Standard Business Reporting*")
+
+        kvk_submission = current_statement.get("kvk_submission")
+
+        if kvk_submission:
+            # Submission exists
+            submission_status = kvk_submission.get("status", "unknown")
+            status_info = kvk_submission_statuses.get(submission_status, {"label": "Onbekend", "color": "#64748b", "icon": "❓"})
+
+            st.markdown(f"""
+                <div class="agent-card" style="border-left-color: {status_info['color']}; background: linear-gradient(to right, rgba(124,58,237,0.05), white);">
+                    <div style="display: flex; gap: 16px; align-items: flex-start;">
+                        <div style="min-width: 48px; height: 48px; background: rgba(124,58,237,0.1); border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 24px;">
+                            {status_info['icon']}
+                        </div>
+                        <div style="flex: 1;">
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                                <div>
+                                    <strong style="color: #0f172a; font-size: 16px;">KvK Indiening - {status_info['label']}</strong>
+                                    <p style="color: #475569; margin: 8px 0; font-size: 14px;">
+                                        SBR Referentie: <code>{kvk_submission.get('sbr_reference', 'N/A')}</code>
+                                    </p>
+                                </div>
+                                <span style="background: {status_info['color']}; color: white; padding: 6px 16px; border-radius: 20px; font-weight: 600;">
+                                    {status_info['label']}
+                                </span>
+                            </div>
+                            <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin-top: 12px; padding-top: 12px; border-top: 1px solid rgba(0,0,0,0.06);">
+                                <div>
+                                    <small style="color: #94a3b8;">KvK Nummer</small><br>
+                                    <strong>{kvk_submission.get('kvk_nummer', 'N/A')}</strong>
+                                </div>
+                                <div>
+                                    <small style="color: #94a3b8;">Datum Indiening</small><br>
+                                    <strong>{kvk_submission.get('submission_date', 'N/A')}</strong>
+                                </div>
+                                <div>
+                                    <small style="color: #94a3b8;">Datum Bevestiging</small><br>
+                                    <strong>{kvk_submission.get('confirmation_date', 'N/A')}</strong>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        else:
+            # No submission yet
+            can_submit = current_stage_id in ["deponering", "vaststelling_ava"]
+
+            st.markdown(f"""
+                <div class="metric-card" style="border-top: 4px solid {'#7c3aed' if can_submit else '#94a3b8'};">
+                    <div style="text-align: center; padding: 20px;">
+                        <span style="font-size: 48px;">📤</span>
+                        <h3 style="color: #0f172a; margin: 16px 0 8px 0;">KvK Indiening</h3>
+                        <p style="color: #64748b; margin-bottom: 20px;">
+                            {'De jaarrekening is klaar om te worden ingediend bij de Kamer van Koophandel.' if can_submit else 'De jaarrekening moet eerst worden vastgesteld voordat deze kan worden ingediend.'}
+                        </p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # SBR Validation
+        st.markdown("#### 🔍 SBR Validatie")
+
+        validation_checks = [
+            {"check": "Taxonomie versie (NT16)", "status": "passed", "detail": "Correct format"},
+            {"check": "Verplichte velden balans", "status": "passed", "detail": "Alle velden ingevuld"},
+            {"check": "Verplichte velden W&V", "status": "passed", "detail": "Alle velden ingevuld"},
+            {"check": "KvK nummer validatie", "status": "passed", "detail": "12345678 is geldig"},
+            {"check": "Digitale handtekening", "status": "warning" if current_stage_id != "afgerond" else "passed", "detail": "Wacht op bestuursondertekening" if current_stage_id != "afgerond" else "Ondertekend"},
+            {"check": "Bestandsgrootte", "status": "passed", "detail": "< 10MB limiet"},
+        ]
+
+        for check in validation_checks:
+            if check["status"] == "passed":
+                icon = "✅"
+                color = "#10b981"
+            elif check["status"] == "warning":
+                icon = "⚠️"
+                color = "#f59e0b"
+            else:
+                icon = "❌"
+                color = "#ef4444"
+
+            st.markdown(f"""
+                <div class="rgs-row" style="border-left: 3px solid {color};">
+                    <div style="display: flex; gap: 12px; align-items: center;">
+                        <span>{icon}</span>
+                        <span><strong>{check['check']}</strong></span>
+                    </div>
+                    <span style="color: #64748b; font-size: 13px;">{check['detail']}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Submission actions
+        st.markdown("#### 🎯 Acties")
+
+        submission_cols = st.columns(4)
+
+        with submission_cols[0]:
+            if st.button("🔄 Valideer SBR", key="validate_sbr", use_container_width=True):
+                st.success("✅ SBR validatie geslaagd!")
+
+        with submission_cols[1]:
+            if st.button("👁️ Preview PDF", key="preview_pdf", use_container_width=True):
+                st.info("📄 PDF preview wordt gegenereerd...")
+
+        with submission_cols[2]:
+            submit_disabled = current_stage_id not in ["deponering", "vaststelling_ava"] or kvk_submission is not None
+            if st.button("📤 Indienen bij KvK", key="submit_kvk", use_container_width=True, type="primary", disabled=submit_disabled):
+                st.success("✅ Jaarrekening succesvol ingediend bij KvK! SBR referentie: SBR-2025-001234567")
+
+        with submission_cols[3]:
+            if st.button("📥 Download XBRL", key="download_xbrl", use_container_width=True):
+                st.info("📥 XBRL bestand wordt gedownload...")
+
+        # Deadlines reminder
+        st.markdown("---")
+        st.markdown("#### ⏰ Belangrijke Deadlines")
+
+        deadline_cols = st.columns(2)
+
+        with deadline_cols[0]:
+            vaststelling_deadline = current_statement.get("deadline_vaststelling", "N/A")
+            st.markdown(f"""
+                <div class="alert-card" style="border-left: 5px solid #f59e0b;">
+                    <div style="display: flex; gap: 12px; align-items: center;">
+                        <span style="font-size: 24px;">📅</span>
+                        <div>
+                            <strong>Deadline Vaststelling AVA</strong>
+                            <p style="color: #475569; margin: 4px 0 0 0; font-size: 18px; font-weight: 600;">{vaststelling_deadline}</p>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 12px;">Binnen 6 maanden na einde boekjaar (verlengbaar tot 11 maanden)</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with deadline_cols[1]:
+            deponering_deadline = current_statement.get("deadline_deponering", "N/A")
+            st.markdown(f"""
+                <div class="alert-card" style="border-left: 5px solid #7c3aed;">
+                    <div style="display: flex; gap: 12px; align-items: center;">
+                        <span style="font-size: 24px;">🏛️</span>
+                        <div>
+                            <strong>Deadline Deponering KvK</strong>
+                            <p style="color: #475569; margin: 4px 0 0 0; font-size: 18px; font-weight: 600;">{deponering_deadline}</p>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 12px;">Binnen 8 dagen na vaststelling (max 12 maanden na einde boekjaar)</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # VERA insight
+        st.markdown(f"""
+            <div class="agent-card" style="border-left-color: #7c3aed; background: linear-gradient(to right, rgba(124,58,237,0.05), white); margin-top: 24px;">
+                <strong style="color: #7c3aed;">💡 VERA - Jaarrekening Inzicht</strong>
+                <p style="margin: 8px 0 0 0;">Op basis van de huidige classificatie als '{company_size_info['name']}' is een verkorte balans publicatie toegestaan.
+                Dit beperkt de informatieverplichting naar derden en beschermt concurrentiegevoelige gegevens.</p>
+                <p style="color: #64748b; margin-top: 8px;">Let op: Bij groei kunnen volgend jaar andere publicatie-eisen gelden. Monitor de grenswaardes.</p>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,58 @@
+"""Klant portal: Balans"""
+
+import streamlit as st
+
+from nova.reference import CURRENT_BOEKJAAR
+from nova.data import rgs_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    st.title("⚖️ Balans")
+    st.markdown(f"**{current_client['name']}** | Per 31 januari 2024")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### ACTIVA")
+        st.markdown('<div class="rgs-header">Omschrijving</div>', unsafe_allow_html=True)
+
+        total_activa = 0
+        for code, data in rgs_repo.statement(client_id, CURRENT_BOEKJAAR, 'activa').items():
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{data['name']} <small style="color: #94a3b8;">({code})</small></span>
+                    <span style="float: right;">{format_currency(data['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            total_activa += data['amount']
+
+        st.markdown(f"""
+            <div class="rgs-row rgs-total" style="background: #0f172a; color: white;">
+                <span>TOTAAL ACTIVA</span>
+                <span style="float: right;">{format_currency(total_activa)}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("### PASSIVA")
+        st.markdown('<div class="rgs-header">Omschrijving</div>', unsafe_allow_html=True)
+
+        total_passiva = 0
+        for code, data in rgs_repo.statement(client_id, CURRENT_BOEKJAAR, 'passiva').items():
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{data['name']} <small style="color: #94a3b8;">({code})</small></span>
+                    <span style="float: right;">{format_currency(data['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            total_passiva += data['amount']
+
+        st.markdown(f"""
+            <div class="rgs-row rgs-total" style="background: #0f172a; color: white;">
+                <span>TOTAAL PASSIVA</span>
+                <span style="float: right;">{format_currency(total_passiva)}</span>
+            </div>
+            """, unsafe_allow_html=True)
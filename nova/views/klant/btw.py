@@ -0,0 +1,116 @@
+"""Klant portal: BTW aangiftes"""
+
+import streamlit as st
+import pandas as pd
+
+from nova.data import btw_repo, documents_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    btw_data = {"periodes": btw_repo.periods(client_id),
+                "icp_relaties": documents_repo.get(client_id, 'icp_relaties', default=[])}
+    st.title("🧾 BTW & ICP Aangifte")
+    st.markdown(f"**{current_client['name']}** | Omzetbelasting & Intracommunautaire Prestaties")
+
+    # Deadline alert
+    days_until_deadline = 5  # Demo: Q4 deadline nadert
+    if days_until_deadline <= 7:
+        st.markdown(f"""
+            <div class="alert-card">
+                <strong>⚠️ BTW Deadline Alert</strong><br>
+                <span>Q4 2024 aangifte dient uiterlijk <strong>31 januari 2025</strong> ingediend te worden ({days_until_deadline} dagen)</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Current period overview
+    st.markdown("### 📊 Huidig Kwartaal (Q4 2024)")
+    current_btw = btw_data["periodes"][0]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("BTW Verschuldigd", format_currency(current_btw["btw_verschuldigd"]))
+    with col2:
+        st.metric("BTW Voorbelasting", format_currency(current_btw["btw_voorbelasting"]))
+    with col3:
+        st.metric("Af te dragen", format_currency(current_btw["btw_af_te_dragen"]), 
+                 delta=f"-{format_currency(current_btw['btw_voorbelasting'])}", delta_color="off")
+    with col4:
+        st.metric("Status", current_btw["status"])
+
+    # SAGE insight
+    st.markdown(f"""
+        <div class="agent-card agent-sage">
+            <strong style="color: #f59e0b;">💡 SAGE - BTW Analyse</strong>
+            <p style="margin: 8px 0 0 0;">De voorbelasting ratio is <strong>{(current_btw['btw_voorbelasting']/current_btw['btw_verschuldigd']*100):.1f}%</strong> - dit ligt binnen normale marges voor de bouwsector.</p>
+            <p style="color: #64748b;">Let op: ICP-leveringen naar Duitsland (€8.500) vereisen correcte vermelding in de ICP-opgave.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # BTW History
+    st.markdown("### 📅 BTW Overzicht per Periode")
+    btw_df = pd.DataFrame(btw_data["periodes"])
+    btw_df["btw_verschuldigd"] = btw_df["btw_verschuldigd"].apply(format_currency)
+    btw_df["btw_voorbelasting"] = btw_df["btw_voorbelasting"].apply(format_currency)
+    btw_df["btw_af_te_dragen"] = btw_df["btw_af_te_dragen"].apply(format_currency)
+    btw_df.columns = ["Periode", "Status", "Deadline", "Verschuldigd", "Voorbelasting", "Af te dragen", "ICP Lev.", "ICP Verw."]
+    st.dataframe(btw_df, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+
+    # ICP Overview
+    st.markdown("### 🇪🇺 ICP-Opgave (Intracommunautaire Prestaties)")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**ICP Leveringen (verkopen naar EU)**")
+        for rel in btw_data["icp_relaties"]:
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between;">
+                        <div>
+                            <strong>{rel['land']}</strong><br>
+                            <span style="color: #64748b;">{rel['bedrijf']}</span><br>
+                            <small style="color: #94a3b8;">{rel['btw_nr']}</small>
+                        </div>
+                        <div style="text-align: right;">
+                            <span style="font-size: 18px; font-weight: 700;">{format_currency(rel['leveringen'])}</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("**ICP Verwervingen (inkopen uit EU)**")
+        for rel in btw_data["icp_relaties"]:
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between;">
+                        <div>
+                            <strong>{rel['land']}</strong><br>
+                            <span style="color: #64748b;">{rel['bedrijf']}</span><br>
+                            <small style="color: #94a3b8;">{rel['btw_nr']}</small>
+                        </div>
+                        <div style="text-align: right;">
+                            <span style="font-size: 18px; font-weight: 700;">{format_currency(rel['verwervingen'])}</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    # Action buttons
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("📤 Concept aangifte genereren", key="btw_concept", use_container_width=True):
+            st.success("✅ Concept BTW-aangifte Q4 2024 gegenereerd")
+    with col2:
+        if st.button("📋 ICP-opgave voorbereiden", key="icp_prepare", use_container_width=True):
+            st.success("✅ ICP-opgave Q4 2024 voorbereid")
+    with col3:
+        if st.button("📧 Ter goedkeuring naar klant", key="btw_approve", use_container_width=True):
+            st.info("📧 E-mail verzonden naar Jan Vermeer")
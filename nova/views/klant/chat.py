@@ -0,0 +1,67 @@
+"""Klant portal: Chat met ALEX"""
+
+import streamlit as st
+
+from nova.metrics import track
+from nova.ui import format_currency
+
+
+def render(current_client):
+    st.title("💬 Chat met ALEX")
+    st.markdown(f"**{current_client['name']}** | Uw persoonlijke financieel adviseur")
+
+    # Chat interface
+    chat_container = st.container()
+
+    # Welcome message
+    with chat_container:
+        st.markdown("""
+            <div style="background: #f1f5f9; padding: 16px; border-radius: 12px; margin-bottom: 16px;">
+                <strong style="color: #ec4899;">🤖 ALEX</strong>
+                <p style="margin: 8px 0 0 0;">Goedemiddag! Ik ben ALEX, uw AI-adviseur. Ik kan u helpen met vragen over uw financiën, facturen, belastingen en meer. Wat kan ik voor u doen?</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Show chat history
+        for msg in st.session_state.chat_history:
+            if msg['role'] == 'user':
+                st.markdown(f"""
+                    <div style="background: #14b8a6; color: white; padding: 16px; border-radius: 12px; margin: 8px 0; margin-left: 20%;">
+                        <p style="margin: 0;">{msg['content']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                    <div style="background: #f1f5f9; padding: 16px; border-radius: 12px; margin: 8px 0; margin-right: 20%;">
+                        <strong style="color: #ec4899;">🤖 ALEX</strong>
+                        <p style="margin: 8px 0 0 0;">{msg['content']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+    # Input
+    user_input = st.chat_input("Stel een vraag...")
+
+    if user_input:
+        st.session_state.chat_history.append({"role": "user", "content": user_input})
+
+        # Simulated responses
+        responses = {
+            "btw": "Op basis van uw huidige administratie is uw BTW-positie voor Q1 2024: € 45.000 te betalen. De deadline voor de aangifte is 28 februari. Wilt u dat ik de conceptaangifte voor u genereer?",
+            "factuur": "Er staan momenteel 4 nieuwe facturen klaar voor verwerking. De grootste is van Houthandel Rotterdam (€ 6.420). Wilt u dat ik deze facturen automatisch laat verwerken door ARIA?",
+            "winst": f"Uw netto resultaat YTD is {format_currency(current_client['winst_ytd'])}. Dit is een verbetering van 12% ten opzichte van dezelfde periode vorig jaar. De belangrijkste drivers zijn hogere omzet en betere kostbeheersing.",
+            "default": "Ik begrijp uw vraag. Laat me even kijken in uw gegevens... Op basis van uw financiële situatie kan ik u het volgende adviseren. Wilt u meer specifieke informatie over een bepaald onderwerp?"
+        }
+
+        # Simple keyword matching for demo
+        with track("ALEX", "vraag"):
+            response = responses['default']
+            lower_input = user_input.lower()
+            if 'btw' in lower_input:
+                response = responses['btw']
+            elif 'factuur' in lower_input or 'facturen' in lower_input:
+                response = responses['factuur']
+            elif 'winst' in lower_input or 'resultaat' in lower_input:
+                response = responses['winst']
+
+        st.session_state.chat_history.append({"role": "assistant", "content": response})
+        st.rerun()
@@ -0,0 +1,65 @@
+"""Klant portal: CRM pipeline"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nova.data import crm_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    crm_pipeline = crm_repo.deals(client_id)
+    st.title("🎯 CRM Pipeline")
+    st.markdown(f"**{current_client['name']}** | Odoo CRM Integratie")
+
+    # Pipeline funnel
+    st.markdown("### 📊 Pipeline Funnel")
+
+    pipeline_summary = crm_repo.pipeline_summary(client_id)
+    stages = ['Lead', 'Kwalificatie', 'Voorstel', 'Onderhandeling', 'Gewonnen']
+    stage_values = [pipeline_summary['stage_totals'].get(stage, 0) for stage in stages]
+
+    fig = go.Figure(go.Funnel(
+        y=stages,
+        x=stage_values,
+        textinfo="value+percent initial",
+        texttemplate="€%{value:,.0f}<br>%{percentInitial:.0%}",
+        marker=dict(color=['#f1f5f9', '#f3e8ff', '#dbeafe', '#fef3c7', '#dcfce7'])
+    ))
+    fig.update_layout(margin=dict(t=20, b=20), height=300)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # LUNA insight
+    weighted_value = pipeline_summary['weighted_value']
+    st.markdown(f"""
+        <div class="agent-card agent-luna">
+            <strong style="color: #3b82f6;">🔮 LUNA Pipeline Analyse</strong>
+            <p style="margin: 8px 0 0 0;">Gewogen pipeline waarde: <strong>{format_currency(weighted_value)}</strong></p>
+            <p>Top prioriteit: <strong>Nieuwbouw Villa Wassenaar</strong> - 75% kans, sluit naar verwachting 15 februari</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Deal list
+    st.markdown("### 📋 Actieve Deals")
+    for deal in crm_pipeline:
+        stage_colors = {
+            'Lead': '#f1f5f9', 'Kwalificatie': '#f3e8ff', 
+            'Voorstel': '#dbeafe', 'Onderhandeling': '#fef3c7', 'Gewonnen': '#dcfce7'
+        }
+        st.markdown(f"""
+            <div class="invoice-row">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{deal['name']}</strong>
+                        <p style="color: #64748b; margin: 4px 0;">{deal['client']} | {deal['contact']}</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="background: {stage_colors[deal['stage']]}; padding: 4px 12px; border-radius: 20px; font-size: 12px;">{deal['stage']}</span>
+                        <p style="font-size: 20px; font-weight: 700; margin: 8px 0 0 0;">{format_currency(deal['amount'])}</p>
+                        <p style="color: #64748b; font-size: 12px;">{deal['probability']}% kans</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,170 @@
+"""Klant portal: Klant dashboard"""
+
+from datetime import datetime
+
+import streamlit as st
+import plotly.express as px
+
+from nova.ui import format_currency, render_kpi_card, render_section_header, render_breadcrumb
+
+
+def render(current_client):
+    # Breadcrumb navigation
+    render_breadcrumb([current_client['name'], "Dashboard"])
+
+    # Enhanced page header
+    st.markdown(f"""
+        <div style="margin-bottom: 28px;">
+            <h1 style="color: #0f172a; margin: 0; display: flex; align-items: center; gap: 12px;">
+                <span style="font-size: 32px;">🎯</span> Mijn Financiële Cockpit
+            </h1>
+            <p style="color: #64748b; font-size: 15px; margin: 8px 0 0 0;">
+                Welkom terug, <strong>{current_client['contact']}</strong> &nbsp;•&nbsp; {datetime.now().strftime('%d %B %Y')}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # KPI Cards with enhanced styling
+    yoy_growth = ((current_client['omzet_ytd']/current_client['omzet_prev'])-1)*100 if current_client['omzet_prev'] > 0 else 0
+    marge = (current_client['winst_ytd'] / current_client['omzet_ytd'] * 100) if current_client['omzet_ytd'] > 0 else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        render_kpi_card(
+            "Omzet YTD",
+            format_currency(current_client['omzet_ytd']),
+            f"+{yoy_growth:.1f}% vs vorig jaar",
+            "💰", "#10b981", "up" if yoy_growth >= 0 else "down"
+        )
+
+    with col2:
+        render_kpi_card(
+            "Winstmarge",
+            f"{marge:.1f}%",
+            "+2.1pp vs vorig kwartaal",
+            "📊", "#8b5cf6", "up"
+        )
+
+    with col3:
+        render_kpi_card(
+            "Openstaande Facturen",
+            format_currency(current_client['openstaand']),
+            "-€23.500 deze week",
+            "📄", "#f59e0b", "down"
+        )
+
+    with col4:
+        render_kpi_card(
+            "Cashflow (30d)",
+            "€ 89.200",
+            "Gezonde positie",
+            "💵", "#14b8a6", "up"
+        )
+
+    # Charts row with improved styling
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+
+    with col1:
+        render_section_header("📈 Omzet Verloop", "Maandelijkse omzetontwikkeling")
+        months = ['Jan', 'Feb', 'Mrt', 'Apr', 'Mei', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dec']
+        omzet_data = [45000, 52000, 48000, 61000, 55000, 58000, 62000, 59000, 67000, 71000, 68000, 66000]
+
+        fig = px.line(x=months, y=omzet_data, markers=True)
+        fig.update_traces(
+            line_color='#14b8a6',
+            line_width=3,
+            marker=dict(size=8, color='#14b8a6', line=dict(width=2, color='white')),
+            fill='tozeroy',
+            fillcolor='rgba(20, 184, 166, 0.1)',
+            hovertemplate='<b>%{x}</b><br>Omzet: €%{y:,.0f}<extra></extra>'
+        )
+        fig.update_layout(
+            xaxis_title="", yaxis_title="",
+            margin=dict(t=20, b=20, l=10, r=10),
+            height=260,
+            yaxis=dict(gridcolor='#f1f5f9', tickformat='€,.0f'),
+            xaxis=dict(gridcolor='#f1f5f9'),
+            plot_bgcolor='white',
+            hovermode='x unified'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        render_section_header("💰 Kosten Verdeling", "Breakdown per categorie")
+        kosten_data = {
+            'Categorie': ['Personeel', 'Materialen', 'Huisvesting', 'Overig'],
+            'Bedrag': [240000, 185000, 44500, 53300]
+        }
+        total_kosten = sum(kosten_data['Bedrag'])
+        fig = px.pie(kosten_data, values='Bedrag', names='Categorie', hole=0.6)
+        fig.update_traces(
+            marker_colors=['#14b8a6', '#8b5cf6', '#f59e0b', '#94a3b8'],
+            textinfo='percent',
+            textposition='outside',
+            textfont=dict(size=12),
+            hovertemplate='<b>%{label}</b><br>€%{value:,.0f}<br>%{percent}<extra></extra>'
+        )
+        fig.update_layout(
+            margin=dict(t=20, b=20, l=10, r=10),
+            height=260,
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5),
+            annotations=[dict(
+                text=f'<b>€{total_kosten/1000:.0f}K</b><br><span style="font-size:10px">totaal</span>',
+                x=0.5, y=0.5, font=dict(size=16, color='#0f172a'), showarrow=False
+            )]
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # AI Insights with enhanced styling
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    render_section_header("🤖 AI Inzichten", "Gepersonaliseerde aanbevelingen van uw AI-team")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+            <div class="agent-card agent-sage" style="min-height: 140px;">
+                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 10px;">
+                    <span style="font-size: 24px;">💡</span>
+                    <div>
+                        <strong style="color: #f59e0b;">SAGE</strong>
+                        <span style="background: #fef3c7; color: #92400e; padding: 2px 8px; border-radius: 10px; font-size: 10px; margin-left: 6px;">Fiscaal</span>
+                    </div>
+                </div>
+                <p style="margin: 0; color: #475569; font-size: 14px; line-height: 1.5;">Overweeg de energie-investeringsaftrek (EIA) voor uw nieuwe machines.</p>
+                <p style="margin: 8px 0 0 0; color: #10b981; font-weight: 600; font-size: 14px;">Potentiële besparing: €12.500</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+            <div class="agent-card agent-luna" style="min-height: 140px;">
+                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 10px;">
+                    <span style="font-size: 24px;">📊</span>
+                    <div>
+                        <strong style="color: #3b82f6;">LUNA</strong>
+                        <span style="background: #dbeafe; color: #1e40af; padding: 2px 8px; border-radius: 10px; font-size: 10px; margin-left: 6px;">Forecast</span>
+                    </div>
+                </div>
+                <p style="margin: 0; color: #475569; font-size: 14px; line-height: 1.5;">Op basis van huidige trend: Q1 omzet verwacht</p>
+                <p style="margin: 8px 0 0 0; color: #0f172a; font-weight: 700; font-size: 18px;">€185.000 <span style="color: #10b981; font-size: 14px;">↑ +8% YoY</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+            <div class="agent-card agent-aria" style="min-height: 140px;">
+                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 10px;">
+                    <span style="font-size: 24px;">📄</span>
+                    <div>
+                        <strong style="color: #14b8a6;">ARIA</strong>
+                        <span style="background: #ccfbf1; color: #0d9488; padding: 2px 8px; border-radius: 10px; font-size: 10px; margin-left: 6px;">Facturen</span>
+                    </div>
+                </div>
+                <p style="margin: 0; color: #475569; font-size: 14px; line-height: 1.5;">4 nieuwe facturen automatisch verwerkt</p>
+                <p style="margin: 8px 0 0 0; color: #f59e0b; font-weight: 600; font-size: 14px;">⚠️ 1 wacht op uw goedkeuring</p>
+            </div>
+            """, unsafe_allow_html=True)
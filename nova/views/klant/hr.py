@@ -0,0 +1,51 @@
+"""Klant portal: HR & salarisadministratie"""
+
+import streamlit as st
+
+from nova.data import employees_repo, documents_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    odoo_hr = {**documents_repo.get(client_id, 'hr', default={}), **employees_repo.totals(client_id),
+               "employees": employees_repo.list(client_id)}
+    st.title("👥 HR & Personeel")
+    st.markdown(f"**{current_client['name']}** | Odoo HR Integratie")
+
+    # HR Overview
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Medewerkers", len(odoo_hr['employees']))
+    with col2:
+        st.metric("FTE", odoo_hr['total_fte'])
+    with col3:
+        st.metric("Loonkosten/maand", format_currency(odoo_hr['total_salary_costs']))
+    with col4:
+        wkr_pct = (odoo_hr['wkr_used'] / odoo_hr['wkr_budget']) * 100
+        st.metric("WKR Benut", f"{wkr_pct:.0f}%")
+
+    # SAGE insight
+    st.markdown(f"""
+        <div class="agent-card agent-sage">
+            <strong style="color: #f59e0b;">💡 SAGE - WKR Advies</strong>
+            <p style="margin: 8px 0 0 0;">WKR Budget: {format_currency(odoo_hr['wkr_budget'])} | Benut: {format_currency(odoo_hr['wkr_used'])} | Ruimte: {format_currency(odoo_hr['wkr_budget'] - odoo_hr['wkr_used'])}</p>
+            <p style="color: #64748b;">Tip: Overweeg kerstpakketten of een personeelsuitje om het resterende budget optimaal te benutten.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Employee list
+    st.markdown("### 👥 Personeelsoverzicht")
+    for emp in odoo_hr['employees']:
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            st.markdown(f"**{emp['name']}**")
+            st.markdown(f"<small style='color: #64748b;'>{emp['role']}</small>", unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"{format_currency(emp['salary'])}/maand")
+        with col3:
+            st.markdown(f"{emp['fte']} FTE")
+        st.markdown("---")
@@ -0,0 +1,274 @@
+"""Klant portal: Investeringen & financiering"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nova.data import documents_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    investeringen_data = documents_repo.get(client_id, 'investeringen')
+    financiering_data = documents_repo.get(client_id, 'financiering')
+    st.title("🏗️ Investeringen & Financiering")
+    st.markdown(f"**{current_client['name']}** | Kapitaalgoederen en leningen overzicht")
+
+    tab1, tab2, tab3 = st.tabs(["💼 Vaste Activa", "📉 Afschrijvingen", "🏦 Financiering"])
+
+    with tab1:
+        st.markdown("### 💼 Vaste Activa Overzicht")
+
+        # Summary metrics
+        asset_totals = documents_repo.asset_totals(client_id)
+        total_aanschaf = asset_totals['aanschaf']
+        total_afschr = asset_totals['afschrijving_cum']
+        total_boekwaarde = asset_totals['boekwaarde']
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Totaal Aanschafwaarde", format_currency(total_aanschaf))
+        with col2:
+            st.metric("Cumulatieve Afschrijving", format_currency(total_afschr))
+        with col3:
+            st.metric("Totale Boekwaarde", format_currency(total_boekwaarde))
+
+        st.markdown("---")
+
+        # Activa table
+        st.markdown("**Kapitaalgoederen per categorie**")
+
+        for actief in investeringen_data['activa']:
+            afschr_pct = (actief['afschrijving_cum'] / actief['aanschaf'] * 100) if actief['aanschaf'] > 0 else 0
+
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div style="flex: 1;">
+                            <strong>{actief['categorie']}</strong>
+                            <span style="color: #94a3b8; font-size: 12px; margin-left: 8px;">({actief['rgs']})</span>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">
+                                {actief['methode']} | Levensduur: {actief['levensduur'] or 'n.v.t.'} jaar | Restwaarde: {format_currency(actief['restwaarde'])}
+                            </p>
+                        </div>
+                        <div style="text-align: right; min-width: 300px;">
+                            <div style="display: flex; justify-content: space-between; gap: 20px;">
+                                <div>
+                                    <small style="color: #94a3b8;">Aanschaf</small><br>
+                                    <span>{format_currency(actief['aanschaf'])}</span>
+                                </div>
+                                <div>
+                                    <small style="color: #94a3b8;">Afgeschr.</small><br>
+                                    <span style="color: #ef4444;">-{format_currency(actief['afschrijving_cum'])}</span>
+                                </div>
+                                <div>
+                                    <small style="color: #94a3b8;">Boekwaarde</small><br>
+                                    <strong>{format_currency(actief['boekwaarde'])}</strong>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Planned investments
+        st.markdown("### 📅 Geplande Investeringen")
+        for inv in investeringen_data['geplande_investeringen']:
+            status_color = "#dcfce7" if inv['status'] == "Goedgekeurd" else "#fef3c7" if inv['status'] == "In bestelling" else "#e2e8f0"
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <strong>{inv['omschrijving']}</strong>
+                            <p style="color: #64748b; margin: 4px 0 0 0;">Planning: {inv['datum']}</p>
+                        </div>
+                        <div style="display: flex; align-items: center; gap: 16px;">
+                            <span style="background: {status_color}; padding: 4px 12px; border-radius: 20px; font-size: 12px;">{inv['status']}</span>
+                            <strong style="font-size: 18px;">{format_currency(inv['bedrag'])}</strong>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown("### 📉 Afschrijvingsschema")
+
+        # Yearly depreciation chart
+        years = ['2022', '2023', '2024', '2025 (budget)']
+        categories = [a['categorie'] for a in investeringen_data['afschrijvingen_jaar']]
+
+        fig = go.Figure()
+        for afschr in investeringen_data['afschrijvingen_jaar']:
+            fig.add_trace(go.Bar(
+                name=afschr['categorie'],
+                x=years,
+                y=[afschr['2022'], afschr['2023'], afschr['2024'], afschr['2025_budget']]
+            ))
+
+        fig.update_layout(
+            barmode='stack',
+            title="Afschrijvingen per jaar per categorie",
+            yaxis_title="Bedrag (€)",
+            legend=dict(orientation="h", yanchor="bottom", y=-0.3),
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Depreciation table
+        st.markdown("**Jaarlijkse afschrijvingslasten**")
+
+        total_2024 = sum(a['2024'] for a in investeringen_data['afschrijvingen_jaar'])
+        total_2025 = sum(a['2025_budget'] for a in investeringen_data['afschrijvingen_jaar'])
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Afschrijving 2024", format_currency(total_2024))
+        with col2:
+            delta = total_2025 - total_2024
+            st.metric("Budget 2025", format_currency(total_2025), delta=format_currency(delta) if delta != 0 else None)
+
+        # SAGE insight
+        st.markdown(f"""
+            <div class="agent-card agent-sage">
+                <strong style="color: #f59e0b;">💡 SAGE - Investeringsadvies</strong>
+                <p style="margin: 8px 0 0 0;">De afschrijvingslasten dalen in 2025 doordat de ICT Hardware volledig is afgeschreven.</p>
+                <p style="color: #64748b;">Let op: bij de geplande investering in bedrijfswagen (€45.000) komt er circa €7.500/jaar afschrijving bij. Dit beïnvloedt ook de KIA-berekening voor de Vpb.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with tab3:
+        st.markdown("### 🏦 Financiering Overzicht")
+
+        # Summary
+        total_schuld = sum(l['openstaand'] for l in financiering_data['leningen_ontvangen'])
+        total_uitstaand = sum(l['openstaand'] for l in financiering_data['leningen_verstrekt'])
+        total_krediet_beschikbaar = sum(k['beschikbaar'] for k in financiering_data['kredietfaciliteiten'])
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Totale Schuld", format_currency(total_schuld), delta="leningen ontvangen", delta_color="off")
+        with col2:
+            st.metric("Uitstaande Leningen", format_currency(total_uitstaand), delta="verstrekt aan derden", delta_color="off")
+        with col3:
+            st.metric("Beschikbaar Krediet", format_currency(total_krediet_beschikbaar))
+
+        st.markdown("---")
+
+        # Loans received
+        st.markdown("**📥 Ontvangen Leningen**")
+        for lening in financiering_data['leningen_ontvangen']:
+            progress = 1 - (lening['openstaand'] / lening['hoofdsom'])
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                        <div style="flex: 1;">
+                            <strong>{lening['verstrekker']}</strong>
+                            <span style="background: #e2e8f0; padding: 2px 8px; border-radius: 8px; font-size: 11px; margin-left: 8px;">{lening['type']}</span>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">
+                                Rente: {lening['rente']}% | Aflossing: {format_currency(lening['aflossing_maand'])}/mnd | Einddatum: {lening['einddatum']}
+                            </p>
+                            <p style="color: #94a3b8; margin: 2px 0 0 0; font-size: 12px;">
+                                Onderpand: {lening['onderpand']}
+                            </p>
+                        </div>
+                        <div style="text-align: right; min-width: 180px;">
+                            <p style="color: #94a3b8; margin: 0;">Openstaand</p>
+                            <strong style="font-size: 20px; color: #ef4444;">{format_currency(lening['openstaand'])}</strong>
+                            <p style="color: #64748b; font-size: 12px; margin: 4px 0 0 0;">van {format_currency(lening['hoofdsom'])}</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Loans given
+        st.markdown("**📤 Verstrekte Leningen**")
+        for lening in financiering_data['leningen_verstrekt']:
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <strong>{lening['debiteur']}</strong>
+                            <span style="background: #dbeafe; padding: 2px 8px; border-radius: 8px; font-size: 11px; margin-left: 8px;">{lening['type']}</span>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">
+                                Rente: {lening['rente']}% | Aflossing: {format_currency(lening['aflossing_maand'])}/mnd
+                            </p>
+                        </div>
+                        <div style="text-align: right;">
+                            <strong style="font-size: 18px; color: #10b981;">{format_currency(lening['openstaand'])}</strong>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Credit facilities
+        st.markdown("**💳 Kredietfaciliteiten**")
+        for krediet in financiering_data['kredietfaciliteiten']:
+            benut_pct = (krediet['benut'] / krediet['limiet']) * 100
+            bar_color = "#10b981" if benut_pct < 50 else "#f59e0b" if benut_pct < 80 else "#ef4444"
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div style="flex: 1;">
+                            <strong>{krediet['bank']} - {krediet['type']}</strong>
+                            <div style="background: #e2e8f0; border-radius: 4px; height: 8px; margin-top: 8px; width: 200px;">
+                                <div style="background: {bar_color}; border-radius: 4px; height: 8px; width: {benut_pct}%;"></div>
+                            </div>
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 12px;">
+                                {benut_pct:.0f}% benut
+                            </p>
+                        </div>
+                        <div style="text-align: right;">
+                            <p style="color: #94a3b8; margin: 0; font-size: 12px;">Beschikbaar</p>
+                            <strong style="font-size: 18px; color: #10b981;">{format_currency(krediet['beschikbaar'])}</strong>
+                            <p style="color: #64748b; font-size: 12px; margin: 0;">van {format_currency(krediet['limiet'])}</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Monthly repayment schedule chart
+        st.markdown("### 📅 Aflossingsschema 2025")
+
+        months = [a['maand'] for a in financiering_data['aflossingsschema_2025']]
+
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='ABN Hypotheek', x=months, y=[a['abn_hypo'] for a in financiering_data['aflossingsschema_2025']], marker_color='#3b82f6'))
+        fig.add_trace(go.Bar(name='Rabo Krediet', x=months, y=[a['rabo_krediet'] for a in financiering_data['aflossingsschema_2025']], marker_color='#f59e0b'))
+        fig.add_trace(go.Bar(name='Qredits', x=months, y=[a['qredits'] for a in financiering_data['aflossingsschema_2025']], marker_color='#10b981'))
+
+        fig.update_layout(
+            barmode='stack',
+            title="Maandelijkse aflossingsverplichtingen",
+            yaxis_title="Bedrag (€)",
+            legend=dict(orientation="h", yanchor="bottom", y=-0.3),
+            height=350
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Annual summary
+        total_aflossing_jaar = sum(a['totaal'] for a in financiering_data['aflossingsschema_2025'])
+        total_rente_jaar = (280000 * 0.032) + (52000 * 0.048) + (22500 * 0.055)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Totale Aflossing 2025", format_currency(total_aflossing_jaar))
+        with col2:
+            st.metric("Geschatte Rentelast 2025", format_currency(total_rente_jaar))
+
+        # SAGE insight
+        st.markdown(f"""
+            <div class="agent-card agent-sage">
+                <strong style="color: #f59e0b;">💡 SAGE - Financieringsadvies</strong>
+                <p style="margin: 8px 0 0 0;">Het Rabobank bedrijfskrediet loopt eind 2026 af. Overweeg tijdig herfinanciering als de kredietbehoefte blijft bestaan.</p>
+                <p style="color: #64748b;">De huidige schuldgraad (Debt/Equity ratio) is gezond. Er is ruimte voor aanvullende financiering indien nodig voor de geplande investeringen.</p>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,259 @@
+"""Klant portal: Factuurverwerking (ARIA)"""
+
+import math
+
+import pandas as pd
+import streamlit as st
+
+from nova.data import ingest_jobs_repo, invoices_repo
+from nova.jobs import PENDING_STATUSES, submit
+
+# Seconds between status checks while uploads are being processed
+POLL_SECONDS = 1.0
+
+STATUS_LABELS = {
+    "queued": "⏳ In wachtrij",
+    "running": "🤖 Wordt geanalyseerd",
+    "done": "✅ Nieuw",
+    "duplicate": "♻️ Duplicaat",
+    "failed": "❌ Mislukt",
+}
+
+
+# (status, tab label) of the invoice list
+INVOICE_STATUSES = [("nieuw", "🆕 Nieuw"), ("wacht op review", "⏳ Review"), ("verwerkt", "✅ Verwerkt")]
+PAGE_SIZES = [50, 100, 250]
+
+
+def _euro(amount):
+    return f"€ {amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+# (field, label) as shown for an analysed upload
+FIELD_LABELS = [
+    ("supplier", "Leverancier"),
+    ("invoice_number", "Factuurnummer"),
+    ("date", "Factuurdatum"),
+    ("due_date", "Vervaldatum"),
+    ("amount", "Bedrag excl. BTW"),
+    ("vat", "BTW"),
+    ("total", "Totaal"),
+    ("iban", "IBAN"),
+    ("btw_number", "BTW-nummer"),
+    ("kvk", "KvK"),
+    ("rgs", "RGS Code"),
+]
+AMOUNT_FIELDS = ("amount", "vat", "total")
+# Fields below this confidence are flagged for review
+REVIEW_CONFIDENCE = 0.8
+
+
+def _field_line(result, name, label):
+    fields = result["fields"]
+    value = fields.get(name)
+    if value is None:
+        return f"- **{label}:** —"
+    if name in AMOUNT_FIELDS:
+        value = _euro(value)
+    elif name == "rgs" and fields.get("rgs_name"):
+        value = f"{value} ({fields['rgs_name']})"
+    # Results from before per-field scores carry only the overall one
+    confidence = result.get("field_confidence", {}).get(name, result["confidence"])
+    flag = " ⚠️" if confidence < REVIEW_CONFIDENCE else ""
+    return f"- **{label}:** {value} · {confidence:.0%}{flag}"
+
+
+def _duplicate_note(result):
+    """Short description of the earlier invoices this upload may duplicate, or None"""
+    duplicates = result.get("duplicates") or []
+    if not duplicates:
+        return None
+    return "; ".join(f"{d['label']} ({d['reason']})" for d in duplicates)
+
+
+def _job_details(job, expanded):
+    result = job["result"]
+    confidence = result["confidence"]
+    duplicates = _duplicate_note(result)
+    title = f"⚠️ {job['filename']}: mogelijk dubbele factuur" if duplicates else f"✅ {job['filename']} geanalyseerd"
+    with st.expander(title, expanded=expanded):
+        if duplicates:
+            st.warning(f"⚠️ Mogelijk al eerder ontvangen: {duplicates}. Controleer dit voordat de factuur wordt "
+                       "geboekt, om dubbele betalingen te voorkomen.")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Gedetecteerde gegevens:**")
+            st.markdown("\n".join(_field_line(result, name, label) for name, label in FIELD_LABELS))
+        with col2:
+            st.markdown("**Vertrouwensscore:**")
+            st.progress(confidence)
+            level = "Hoge" if confidence >= 0.9 else "Matige" if confidence >= 0.6 else "Lage"
+            st.markdown(f"{confidence:.0%} - {level} betrouwbaarheid")
+            if result.get("note"):
+                st.info(f"ℹ️ {result['note']}")
+
+            confirmed = not duplicates or st.checkbox(
+                "Gecontroleerd: geen dubbele factuur", key=f"ingest_not_duplicate_{job['id']}"
+            )
+            if st.button("✅ Goedkeuren en verwerken", key=f"ingest_approve_{job['id']}", type="primary",
+                         disabled=not confirmed):
+                st.success("Factuur verwerkt en geboekt!")
+
+
+def _batch_summary(batch, counts):
+    """Progress, new/duplicate/failed totals and a row per file of a multi-file upload"""
+    total = sum(counts.values())
+    pending = sum(counts.get(status, 0) for status in PENDING_STATUSES)
+    st.progress((total - pending) / total, text=f"{total - pending} van {total} bestanden verwerkt")
+    cols = st.columns(4)
+    for col, (label, count) in zip(cols, [
+        ("✅ Nieuw", counts.get("done", 0)),
+        ("♻️ Duplicaat", counts.get("duplicate", 0)),
+        ("❌ Mislukt", counts.get("failed", 0)),
+        ("⏳ In behandeling", pending),
+    ]):
+        with col:
+            st.metric(label, count)
+    jobs = ingest_jobs_repo.batch(batch)
+    flagged = sum(1 for job in jobs if job["result"] and _duplicate_note(job["result"]))
+    if flagged:
+        st.warning(f"⚠️ {flagged} factuur/facturen lijken op eerder ontvangen facturen; controleer ze voor het boeken")
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Bestand": job["filename"],
+                "Status": STATUS_LABELS[job["status"]],
+                "Leverancier": job["result"]["fields"]["supplier"] if job["result"] else None,
+                "Bedrag": job["result"]["fields"]["amount"] if job["result"] else None,
+                "Zekerheid": job["result"]["confidence"] * 100 if job["result"] else None,
+                "Dubbel": _duplicate_note(job["result"]) if job["result"] else None,
+                "Opmerking": job["error"] or (job["result"] or {}).get("note"),
+            }
+            for job in jobs
+        ]),
+        hide_index=True, use_container_width=True,
+        column_config={
+            "Bedrag": st.column_config.NumberColumn(format="€ %.2f"),
+            "Zekerheid": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f%%"),
+        },
+    )
+
+
+def _ingest_panel(client_id, polling):
+    """Status and detected fields of the latest upload; reruns on its own while any file is pending"""
+    if polling and not ingest_jobs_repo.pending(client_id):
+        # Everything finished: one full rerun stops the polling
+        st.rerun()
+
+    batch = ingest_jobs_repo.latest_batch(client_id)
+    counts = ingest_jobs_repo.batch_counts(batch) if batch else {}
+    if sum(counts.values()) > 1:
+        _batch_summary(batch, counts)
+        return
+
+    for position, job in enumerate(ingest_jobs_repo.recent(client_id)):
+        if job["status"] in PENDING_STATUSES:
+            st.info(f"🤖 ARIA analyseert {job['filename']}..." if job["status"] == "running"
+                    else f"⏳ {job['filename']} staat in de wachtrij")
+        elif job["status"] == "failed":
+            st.error(f"❌ {job['filename']}: analyse mislukt ({job['error']})")
+        elif job["status"] == "duplicate":
+            st.warning(f"♻️ {job['filename']} is al eerder geüpload ({job['error']})")
+        else:
+            _job_details(job, expanded=position == 0)
+
+
+def _reset_page():
+    st.session_state.invoice_page = 1
+
+
+def _invoice_details(inv):
+    st.markdown(f"#### 🔎 {inv['id']} · {inv['supplier']}")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"- **Bedrag excl. BTW:** {_euro(inv['amount'])}\n- **BTW:** {_euro(inv['vat'])}\n"
+                    f"- **Totaal:** {_euro(inv['amount'] + inv['vat'])}")
+    with col2:
+        st.markdown(f"- **Factuurdatum:** {inv['date']}\n- **Vervaldatum:** {inv['due_date']}\n"
+                    f"- **Betaling:** {inv['payment_status']}")
+    with col3:
+        st.markdown(f"- **Categorie:** {inv['category']}\n- **RGS Code:** {inv['rgs']}\n"
+                    f"- **Odoo PO:** {inv['odoo_po'] or '—'}")
+
+
+def _invoice_list(client_id):
+    """Status selector with counts, one page of invoices as a selectable grid and the selected invoice"""
+    # The query runs before the widgets are drawn, so their current values come from session state
+    status = st.session_state.get("invoice_status", INVOICE_STATUSES[0][0])
+    page_size = st.session_state.get("invoice_page_size", PAGE_SIZES[0])
+    page = st.session_state.get("invoice_page", 1)
+    result = invoices_repo.status_page(client_id, status, page_size, (page - 1) * page_size)
+    counts = result["counts"]
+    pages = max(1, math.ceil(counts.get(status, 0) / page_size))
+    if page > pages:
+        # The selected status shrank since the last run
+        st.session_state.invoice_page = page = pages
+        result = invoices_repo.status_page(client_id, status, page_size, (page - 1) * page_size)
+
+    labels = dict(INVOICE_STATUSES)
+    col1, col2, col3 = st.columns([4, 1, 1])
+    with col1:
+        st.radio("Status", list(labels), key="invoice_status", horizontal=True, label_visibility="collapsed",
+                 format_func=lambda s: f"{labels[s]} ({counts.get(s, 0)})", on_change=_reset_page)
+    with col2:
+        st.selectbox("Per pagina", PAGE_SIZES, key="invoice_page_size", on_change=_reset_page)
+    with col3:
+        st.number_input("Pagina", min_value=1, max_value=pages, step=1, key="invoice_page")
+
+    invoices = result["invoices"]
+    event = st.dataframe(
+        pd.DataFrame([
+            {
+                "Factuur": inv["id"],
+                "Leverancier": inv["supplier"],
+                "Bedrag": inv["amount"],
+                "Datum": inv["date"],
+                "Vervaldatum": inv["due_date"],
+                "Categorie": inv["category"],
+                "Betaling": inv["payment_status"],
+            }
+            for inv in invoices
+        ], columns=["Factuur", "Leverancier", "Bedrag", "Datum", "Vervaldatum", "Categorie", "Betaling"]),
+        hide_index=True, use_container_width=True, on_select="rerun", selection_mode="single-row",
+        key=f"invoice_grid_{status}_{page}_{page_size}",
+        column_config={"Bedrag": st.column_config.NumberColumn(format="€ %.2f")},
+    )
+    st.caption(f"Pagina {page} van {pages} · selecteer een regel voor de details")
+    rows = event.selection.rows
+    st.session_state.selected_invoice = invoices[rows[0]] if rows and rows[0] < len(invoices) else None
+    if st.session_state.selected_invoice:
+        _invoice_details(st.session_state.selected_invoice)
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    st.title("📄 Factuurverwerking")
+    st.markdown(f"**{current_client['name']}** | Powered by ARIA")
+
+    # Upload section: extraction runs in the nova.jobs workers, the panel below polls for the result
+    st.markdown("### 📤 Facturen Uploaden")
+    uploaded_files = st.file_uploader(
+        "Sleep facturen of een ZIP-archief hierheen of klik om te uploaden",
+        type=['pdf', 'jpg', 'jpeg', 'png', 'zip'], accept_multiple_files=True,
+    )
+
+    new_files = [f for f in uploaded_files or [] if f.file_id not in st.session_state.ingested_uploads]
+    if new_files:
+        with st.spinner(f"📥 {len(new_files)} bestand(en) opslaan..."):
+            submit(client_id, "invoice", new_files)
+        st.session_state.ingested_uploads.extend(f.file_id for f in new_files)
+
+    polling = ingest_jobs_repo.pending(client_id) > 0
+    st.fragment(run_every=POLL_SECONDS if polling else None)(_ingest_panel)(client_id, polling)
+
+    st.markdown("---")
+
+    # Invoice list: one grid per status, counts and visible page from a single query
+    st.markdown("### 📋 Factuuroverzicht")
+    _invoice_list(client_id)
@@ -0,0 +1,558 @@
+"""Klant portal: Periodeafsluiting (MIRA)"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nova.reference import reference_data
+from nova.data import closing_repo, documents_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    ai_agents = reference_data()["ai_agents"]
+    client_id = current_client['id']
+
+    closing_periods = closing_repo.periods(client_id)
+    closing_history = closing_repo.history(client_id)
+    # MONTHLY CLOSING - MIRA Agent View
+    st.markdown("""
+        <div style="margin-bottom: 24px;">
+            <h1 style="color: #0f172a; margin: 0; display: flex; align-items: center; gap: 12px;">
+                <span style="font-size: 32px;">📅</span> Periodeafsluiting
+            </h1>
+            <p style="color: #64748b; font-size: 15px; margin: 8px 0 0 0;">
+                <strong>{}</strong> &nbsp;•&nbsp; Beheerd door <span style="color: #06b6d4; font-weight: 600;">MIRA</span>
+            </p>
+        </div>
+        """.format(current_client['name']), unsafe_allow_html=True)
+
+    # Period selector
+    st.markdown("### 📆 Selecteer Periode")
+    col1, col2, col3 = st.columns([2, 2, 2])
+
+    with col1:
+        period_type = st.radio("Type", ["Maandelijks", "Kwartaal"], horizontal=True, key="closing_period_type")
+
+    available_periods = [p for p in closing_periods.items() if (period_type == "Maandelijks" and closing_periods[p[0]]["type"] == "monthly") or (period_type == "Kwartaal" and closing_periods[p[0]]["type"] == "quarterly")]
+    period_names = [p[1]["name"] for p in available_periods]
+
+    with col2:
+        selected_period_name = st.selectbox("Periode", period_names, key="selected_period")
+
+    # Find the selected period
+    selected_period_key = None
+    for key, data in closing_periods.items():
+        if data["name"] == selected_period_name:
+            selected_period_key = key
+            break
+
+    selected_period = closing_periods.get(selected_period_key, list(closing_periods.values())[0])
+    selected_period_key = selected_period["period"]
+    budget_vs_actual = documents_repo.get(client_id, 'budget_vs_actual', selected_period_key)
+    closing_issues = closing_repo.issues(client_id, selected_period_key)
+
+    with col3:
+        status_color = "#10b981" if selected_period["status"] == "closed" else "#f59e0b"
+        status_text = "Afgesloten" if selected_period["status"] == "closed" else "Open"
+        st.markdown(f"""
+            <div style="padding-top: 25px;">
+                <span style="background: {status_color}; color: white; padding: 6px 16px; border-radius: 20px; font-weight: 600;">
+                    {status_text}
+                </span>
+                <span style="color: #64748b; margin-left: 12px; font-size: 13px;">Deadline: {selected_period["deadline"]}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Summary KPIs for current period
+    checklist_counts = closing_repo.checklist_counts(client_id, 'closing', selected_period_key)
+    completed = checklist_counts.get("completed", 0)
+    attention = checklist_counts.get("attention", 0)
+    pending = checklist_counts.get("pending", 0) + checklist_counts.get("in_progress", 0)
+    blocked = checklist_counts.get("blocked", 0)
+    total_tasks = sum(checklist_counts.values()) - checklist_counts.get("not_applicable", 0)
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #06b6d4; text-align: center;">
+                <p class="metric-label">VOORTGANG</p>
+                <p class="metric-value" style="color: #06b6d4;">{int(completed/total_tasks*100)}%</p>
+                <p style="color: #64748b; font-size: 12px;">{completed}/{total_tasks} taken</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #10b981; text-align: center;">
+                <p class="metric-label">VOLTOOID</p>
+                <p class="metric-value" style="color: #10b981;">{completed}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #f59e0b; text-align: center;">
+                <p class="metric-label">AANDACHT</p>
+                <p class="metric-value" style="color: #f59e0b;">{attention}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #3b82f6; text-align: center;">
+                <p class="metric-label">IN AFWACHTING</p>
+                <p class="metric-value" style="color: #3b82f6;">{pending}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col5:
+        st.markdown(f"""
+            <div class="metric-card" style="border-top: 4px solid #ef4444; text-align: center;">
+                <p class="metric-label">GEBLOKKEERD</p>
+                <p class="metric-value" style="color: #ef4444;">{blocked}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Tabs for different sections
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Checklist", "📊 Budget vs Realisatie", "⚠️ Actiepunten", "📈 Historisch"])
+
+    with tab1:
+        st.markdown("### 📋 Afsluitingschecklist")
+        st.markdown("*Taken worden automatisch gemonitord door MIRA en doorgestuurd naar de juiste agent*")
+
+        # Filter
+        filter_col1, filter_col2 = st.columns([1, 3])
+        with filter_col1:
+            status_filter = st.selectbox("Filter", ["Alle", "Voltooid", "Aandacht nodig", "In afwachting", "Geblokkeerd"], key="checklist_filter")
+
+        # Group by category
+        categories = {}
+        for item in closing_repo.checklist(client_id, 'closing', selected_period_key):
+            cat = item["category"]
+            if cat not in categories:
+                categories[cat] = []
+            categories[cat].append(item)
+
+        for category, items in categories.items():
+            # Filter items
+            if status_filter == "Voltooid":
+                filtered_items = [i for i in items if i["status"] == "completed"]
+            elif status_filter == "Aandacht nodig":
+                filtered_items = [i for i in items if i["status"] == "attention"]
+            elif status_filter == "In afwachting":
+                filtered_items = [i for i in items if i["status"] in ["pending", "in_progress"]]
+            elif status_filter == "Geblokkeerd":
+                filtered_items = [i for i in items if i["status"] == "blocked"]
+            else:
+                filtered_items = items
+
+            if not filtered_items:
+                continue
+
+            st.markdown(f"#### {category}")
+
+            for item in filtered_items:
+                # Status styling
+                if item["status"] == "completed":
+                    status_icon = "✅"
+                    status_bg = "#dcfce7"
+                    status_border = "#10b981"
+                    status_text = "Voltooid"
+                elif item["status"] == "attention":
+                    status_icon = "⚠️"
+                    status_bg = "#fef3c7"
+                    status_border = "#f59e0b"
+                    status_text = "Aandacht nodig"
+                elif item["status"] == "in_progress":
+                    status_icon = "🔄"
+                    status_bg = "#dbeafe"
+                    status_border = "#3b82f6"
+                    status_text = "In behandeling"
+                elif item["status"] == "pending":
+                    status_icon = "⏳"
+                    status_bg = "#f1f5f9"
+                    status_border = "#64748b"
+                    status_text = "In afwachting"
+                elif item["status"] == "blocked":
+                    status_icon = "🚫"
+                    status_bg = "#fee2e2"
+                    status_border = "#ef4444"
+                    status_text = "Geblokkeerd"
+                else:
+                    status_icon = "➖"
+                    status_bg = "#f1f5f9"
+                    status_border = "#94a3b8"
+                    status_text = "N.v.t."
+
+                agent_color = ai_agents.get(item["responsible_agent"], {}).get("color", "#64748b")
+                automated_badge = '<span style="background: #dbeafe; color: #1e40af; padding: 2px 8px; border-radius: 10px; font-size: 10px; margin-left: 8px;">AUTO</span>' if item["automated"] else ""
+
+                completion_html = ""
+                if item["completion_date"]:
+                    completion_html = f'<span style="color: #64748b; font-size: 11px;">Voltooid: {item["completion_date"]}</span>'
+
+                notes_html = ""
+                if item["notes"]:
+                    notes_html = f'<p style="color: #475569; font-size: 12px; margin: 8px 0 0 0; font-style: italic;">💬 {item["notes"]}</p>'
+
+                st.markdown(f"""
+                    <div class="invoice-row" style="border-left: 4px solid {status_border}; background: {status_bg};">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div style="flex: 1;">
+                                <div style="display: flex; align-items: center; gap: 12px;">
+                                    <span style="font-size: 18px;">{status_icon}</span>
+                                    <div>
+                                        <strong style="color: #0f172a;">{item["task"]}</strong>{automated_badge}
+                                        <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">{item["description"]}</p>
+                                    </div>
+                                </div>
+                                <div style="margin-top: 8px; display: flex; gap: 16px; align-items: center;">
+                                    <span style="color: {agent_color}; font-weight: 600; font-size: 12px;">Agent: {item["responsible_agent"]}</span>
+                                    <span class="odoo-badge" style="font-size: 10px;">{item["odoo_module"]}</span>
+                                    {completion_html}
+                                </div>
+                                {notes_html}
+                            </div>
+                            <div style="text-align: right; min-width: 120px;">
+                                <span style="background: {status_border}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 11px; font-weight: 600;">{status_text}</span>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown("")
+
+    with tab2:
+        st.markdown("### 📊 Budget vs Realisatie - " + budget_vs_actual["period"])
+        st.markdown("*MIRA analyseert automatisch significante afwijkingen en signaleert actie-items*")
+
+        # Summary cards
+        summary = budget_vs_actual["summary"]
+        summary_color = "#10b981" if summary["status"] == "favorable" else "#ef4444"
+        variance_icon = "↑" if summary["total_variance"] > 0 else "↓"
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Budget Resultaat", format_currency(summary["budget_result"]))
+        with col2:
+            st.metric("Werkelijk Resultaat", format_currency(summary["actual_result"]))
+        with col3:
+            st.metric("Variantie", format_currency(summary["total_variance"]), delta=f"{summary['total_variance_pct']}%")
+        with col4:
+            st.markdown(f"""
+                <div class="metric-card" style="border-top: 4px solid {summary_color}; text-align: center;">
+                    <p class="metric-label">STATUS</p>
+                    <p class="metric-value" style="color: {summary_color}; font-size: 24px;">
+                        {"Gunstig" if summary["status"] == "favorable" else "Ongunstig"}
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Variance chart
+        st.markdown("#### 📈 Variantie per Categorie")
+
+        categories_chart = [c["category"] for c in budget_vs_actual["categories"]]
+        variances = [c["variance"] for c in budget_vs_actual["categories"]]
+        colors = ["#10b981" if v >= 0 else "#ef4444" for v in variances]
+
+        fig = go.Figure(data=[
+            go.Bar(
+                x=categories_chart,
+                y=variances,
+                marker_color=colors,
+                text=[f"€{v:,.0f}" for v in variances],
+                textposition='outside'
+            )
+        ])
+        fig.update_layout(
+            title="",
+            xaxis_title="",
+            yaxis_title="Variantie (€)",
+            height=350,
+            margin=dict(t=20, b=80),
+            xaxis_tickangle=-45
+        )
+        fig.add_hline(y=0, line_dash="solid", line_color="#64748b", line_width=1)
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.markdown("---")
+
+        # Detail table
+        st.markdown("#### 📋 Detail per Categorie")
+
+        # Header
+        st.markdown("""
+            <div style="display: grid; grid-template-columns: 3fr 2fr 2fr 2fr 2fr 3fr; gap: 12px; padding: 12px 16px;
+                        background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%); border-radius: 10px 10px 0 0; color: white;">
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Categorie</span>
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase; text-align: right;">Budget</span>
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase; text-align: right;">Realisatie</span>
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase; text-align: right;">Variantie</span>
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase; text-align: center;">Status</span>
+                <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Toelichting</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+        for cat in budget_vs_actual["categories"]:
+            if cat["status"] == "favorable":
+                status_color = "#10b981"
+                status_text = "Gunstig"
+            elif cat["status"] == "unfavorable":
+                status_color = "#ef4444"
+                status_text = "Ongunstig"
+            else:
+                status_color = "#64748b"
+                status_text = "Op schema"
+
+            variance_display = format_currency(cat["variance"])
+            variance_pct = f"({cat['variance_pct']:+.1f}%)"
+            action_badge = '<span style="background: #fee2e2; color: #dc2626; padding: 2px 8px; border-radius: 8px; font-size: 10px; margin-left: 4px;">ACTIE</span>' if cat.get("action_required") else ""
+
+            st.markdown(f"""
+                <div class="rgs-row" style="display: grid; grid-template-columns: 3fr 2fr 2fr 2fr 2fr 3fr; gap: 12px; align-items: center;">
+                    <span><strong>{cat["category"]}</strong><br><small style="color: #94a3b8;">{cat["rgs_code"]}</small></span>
+                    <span style="text-align: right;">{format_currency(cat["budget"])}</span>
+                    <span style="text-align: right;">{format_currency(cat["actual"])}</span>
+                    <span style="text-align: right; color: {status_color}; font-weight: 600;">{variance_display}<br><small>{variance_pct}</small></span>
+                    <span style="text-align: center;"><span style="background: {status_color}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 11px;">{status_text}</span></span>
+                    <span style="font-size: 12px; color: #475569;">{cat["explanation"]}{action_badge}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Total row
+        st.markdown(f"""
+            <div class="rgs-row rgs-total" style="display: grid; grid-template-columns: 3fr 2fr 2fr 2fr 2fr 3fr; gap: 12px; align-items: center; background: #0f172a; color: white; border-radius: 0 0 10px 10px;">
+                <span><strong>NETTO RESULTAAT</strong></span>
+                <span style="text-align: right; font-weight: 700;">{format_currency(summary["budget_result"])}</span>
+                <span style="text-align: right; font-weight: 700;">{format_currency(summary["actual_result"])}</span>
+                <span style="text-align: right; font-weight: 700; color: {"#10b981" if summary["total_variance"] >= 0 else "#ef4444"};">{format_currency(summary["total_variance"])}<br><small>({summary["total_variance_pct"]:+.1f}%)</small></span>
+                <span></span>
+                <span></span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with tab3:
+        st.markdown("### ⚠️ Actiepunten - Doorverwijzing naar Agents")
+        st.markdown("*MIRA identificeert problemen en routeert deze naar de juiste agent voor actie*")
+        st.markdown("")
+
+        # MIRA insight card
+        st.markdown(f"""
+            <div class="agent-card agent-mira">
+                <div style="display: flex; gap: 16px; align-items: flex-start;">
+                    <div style="min-width: 48px; height: 48px; background: rgba(6,182,212,0.2); border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 24px;">
+                        🔍
+                    </div>
+                    <div>
+                        <strong style="color: #06b6d4;">MIRA - Analyse Samenvatting</strong>
+                        <p style="margin: 8px 0;">Er zijn <strong>{len(closing_issues)} actiepunten</strong> geïdentificeerd voor deze periode.
+                        MIRA kan deze zelf niet oplossen omdat de boekingshandelingen door andere agents uitgevoerd moeten worden.</p>
+                        <p style="color: #64748b; font-size: 13px; margin: 0;">
+                            De issues zijn automatisch gecategoriseerd en doorverwezen naar de verantwoordelijke agents.
+                        </p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("")
+
+        for issue in closing_issues:
+            if issue["severity"] == "warning":
+                severity_color = "#f59e0b"
+                severity_bg = "#fef3c7"
+                severity_icon = "⚠️"
+            elif issue["severity"] == "attention":
+                severity_color = "#3b82f6"
+                severity_bg = "#dbeafe"
+                severity_icon = "🔔"
+            else:
+                severity_color = "#64748b"
+                severity_bg = "#f1f5f9"
+                severity_icon = "ℹ️"
+
+            agent_info = ai_agents.get(issue["route_to_agent"], {})
+            agent_color = agent_info.get("color", "#64748b")
+            agent_name = issue["route_to_agent"] if issue["route_to_agent"] else "Handmatig"
+
+            status_badge = ""
+            if issue["status"] == "open":
+                status_badge = '<span style="background: #fee2e2; color: #dc2626; padding: 3px 10px; border-radius: 12px; font-size: 11px; font-weight: 600;">OPEN</span>'
+            elif issue["status"] == "under_review":
+                status_badge = '<span style="background: #dbeafe; color: #1e40af; padding: 3px 10px; border-radius: 12px; font-size: 11px; font-weight: 600;">IN REVIEW</span>'
+            elif issue["status"] == "pending_approval":
+                status_badge = '<span style="background: #fef3c7; color: #92400e; padding: 3px 10px; border-radius: 12px; font-size: 11px; font-weight: 600;">WACHT OP GOEDKEURING</span>'
+
+            st.markdown(f"""
+                <div class="alert-card" style="border-left: 5px solid {severity_color}; background: linear-gradient(135deg, {severity_bg} 0%, white 100%);">
+                    <div style="display: flex; gap: 16px; align-items: flex-start;">
+                        <div style="min-width: 40px; height: 40px; background: {severity_bg}; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 20px;">
+                            {severity_icon}
+                        </div>
+                        <div style="flex: 1;">
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start; flex-wrap: wrap; gap: 8px;">
+                                <div>
+                                    <strong style="color: #0f172a; font-size: 15px;">{issue["title"]}</strong>
+                                    {status_badge}
+                                </div>
+                                <div style="text-align: right;">
+                                    <span style="font-size: 18px; font-weight: 700; color: {severity_color};">{format_currency(abs(issue["amount"]))}</span>
+                                </div>
+                            </div>
+                            <p style="color: #475569; margin: 8px 0; font-size: 14px;">{issue["description"]}</p>
+                            <div style="display: flex; gap: 16px; align-items: center; margin-top: 12px; padding-top: 12px; border-top: 1px solid rgba(0,0,0,0.06);">
+                                <span style="color: {agent_color}; font-weight: 600; font-size: 13px; display: flex; align-items: center; gap: 6px;">
+                                    <span style="width: 8px; height: 8px; background: {agent_color}; border-radius: 50%;"></span>
+                                    Doorverwezen naar: {agent_name}
+                                </span>
+                                <span style="color: #64748b; font-size: 12px;">|</span>
+                                <span style="color: #64748b; font-size: 12px;">📅 {issue["created_date"]}</span>
+                            </div>
+                            <p style="color: #0f172a; font-size: 13px; margin: 8px 0 0 0; font-weight: 500;">
+                                ➡️ Actie: {issue["action"]}
+                            </p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Action buttons
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("🔄 Ververs Status", key="refresh_issues", use_container_width=True):
+                st.success("✅ Status bijgewerkt vanuit Odoo")
+        with col2:
+            if st.button("📧 Stuur Samenvatting naar Team", key="send_summary", use_container_width=True):
+                st.success("📧 Samenvatting verzonden")
+        with col3:
+            if st.button("📋 Exporteer naar Excel", key="export_issues", use_container_width=True):
+                st.success("📄 Excel gedownload")
+
+    with tab4:
+        st.markdown("### 📈 Historisch Overzicht")
+        st.markdown("*Trend analyse van afgelopen periodes*")
+
+        # Summary metrics
+        avg_days = sum(h["days_to_close"] for h in closing_history) / len(closing_history)
+        avg_variance = sum(h["variance_pct"] for h in closing_history) / len(closing_history)
+        total_issues = sum(h["issues_found"] for h in closing_history)
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Gem. Dagen tot Afsluiting", f"{avg_days:.1f}")
+        with col2:
+            st.metric("Gem. Budget Variantie", f"{avg_variance:+.1f}%")
+        with col3:
+            st.metric("Totaal Issues (6 mnd)", total_issues)
+        with col4:
+            st.metric("Periodes Geanalyseerd", len(closing_history))
+
+        st.markdown("---")
+
+        # Results trend chart
+        st.markdown("#### 📊 Resultaat vs Budget - Trend")
+
+        periods = [h["name"] for h in closing_history]
+        actuals = [h["result"] for h in closing_history]
+        budgets = [h["budget"] for h in closing_history]
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=periods, y=actuals, name='Realisatie', line=dict(color='#06b6d4', width=3), mode='lines+markers'))
+        fig.add_trace(go.Scatter(x=periods, y=budgets, name='Budget', line=dict(color='#64748b', width=2, dash='dash'), mode='lines+markers'))
+        fig.update_layout(
+            title="",
+            xaxis_title="",
+            yaxis_title="Resultaat (€)",
+            height=350,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02),
+            margin=dict(t=40, b=40)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Variance trend
+        st.markdown("#### 📉 Variantie % - Trend")
+
+        variances_hist = [h["variance_pct"] for h in closing_history]
+        colors_hist = ["#10b981" if v >= 0 else "#ef4444" for v in variances_hist]
+
+        fig2 = go.Figure(data=[
+            go.Bar(x=periods, y=variances_hist, marker_color=colors_hist, text=[f"{v:+.1f}%" for v in variances_hist], textposition='outside')
+        ])
+        fig2.update_layout(
+            title="",
+            xaxis_title="",
+            yaxis_title="Variantie %",
+            height=300,
+            margin=dict(t=20, b=40)
+        )
+        fig2.add_hline(y=0, line_dash="solid", line_color="#64748b", line_width=1)
+        st.plotly_chart(fig2, use_container_width=True)
+
+        st.markdown("---")
+
+        # History table
+        st.markdown("#### 📋 Detail per Periode")
+
+        for hist in closing_history:
+            variance_color = "#10b981" if hist["variance_pct"] >= 0 else "#ef4444"
+            variance_icon = "↑" if hist["variance_pct"] >= 0 else "↓"
+
+            st.markdown(f"""
+                <div class="invoice-row">
+                    <div style="display: grid; grid-template-columns: 2fr 2fr 2fr 2fr 2fr 1fr; gap: 16px; align-items: center;">
+                        <div>
+                            <strong>{hist["name"]}</strong>
+                            <p style="color: #64748b; font-size: 12px; margin: 2px 0 0 0;">✅ Afgesloten</p>
+                        </div>
+                        <div style="text-align: right;">
+                            <small style="color: #94a3b8;">Resultaat</small><br>
+                            <strong>{format_currency(hist["result"])}</strong>
+                        </div>
+                        <div style="text-align: right;">
+                            <small style="color: #94a3b8;">Budget</small><br>
+                            <span>{format_currency(hist["budget"])}</span>
+                        </div>
+                        <div style="text-align: right;">
+                            <small style="color: #94a3b8;">Variantie</small><br>
+                            <span style="color: {variance_color}; font-weight: 600;">{variance_icon} {hist["variance_pct"]:+.1f}%</span>
+                        </div>
+                        <div style="text-align: right;">
+                            <small style="color: #94a3b8;">Dagen tot afsluiting</small><br>
+                            <span>{hist["days_to_close"]} dagen</span>
+                        </div>
+                        <div style="text-align: center;">
+                            <span style="background: #f1f5f9; padding: 4px 10px; border-radius: 12px; font-size: 12px;">
+                                {hist["issues_found"]} issues
+                            </span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    # Bottom action bar
+    st.markdown("---")
+    st.markdown("### 🎯 Acties")
+
+    action_cols = st.columns(4)
+    with action_cols[0]:
+        if st.button("🔄 Synchroniseer met Odoo", key="sync_closing", use_container_width=True, type="primary"):
+            st.success("✅ Data gesynchroniseerd met Odoo")
+    with action_cols[1]:
+        if st.button("📊 Genereer Rapport", key="gen_report", use_container_width=True):
+            st.success("📄 Periode rapport gegenereerd")
+    with action_cols[2]:
+        if st.button("✉️ Stuur naar Accountant", key="send_accountant", use_container_width=True):
+            st.success("📧 Verzonden naar accountant")
+    with action_cols[3]:
+        close_disabled = pending > 0 or attention > 0 or blocked > 0
+        if st.button("🔒 Sluit Periode Af", key="close_period", use_container_width=True, disabled=close_disabled):
+            st.success("✅ Periode succesvol afgesloten!")
+        if close_disabled:
+            st.caption("⚠️ Alle taken moeten voltooid zijn")
@@ -0,0 +1,171 @@
+"""Klant portal: Odoo boekhouding en synchronisatie"""
+
+import time
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nova.odoo import SYNC_MODELS, SyncEngine, get_client, settings_from_env
+from nova.data import bank_repo, sync_repo, documents_repo
+from nova.metrics import record
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    sync_status = {"modules": sync_repo.modules(client_id),
+                   "ai_booking_stats": documents_repo.get(client_id, 'ai_booking_stats')}
+    open_bank_mutations = bank_repo.open_mutations(client_id)
+    # Records of each module stored locally by the sync engine
+    stored_records = {SYNC_MODELS[model]["module"]: count
+                      for model, count in sync_repo.record_counts(client_id).items() if model in SYNC_MODELS}
+    st.title("📚 Odoo Boekhouding")
+    st.markdown(f"**{current_client['name']}** | Live synchronisatie met Odoo")
+
+    # Sync Status Overview
+    st.markdown("### 🔄 Synchronisatie Status")
+
+    col1, col2, col3, col4 = st.columns(4)
+    stats = sync_status["ai_booking_stats"]
+
+    with col1:
+        st.metric("Totaal Mutaties", f"{stats['totaal_mutaties']:,}")
+    with col2:
+        st.metric("Auto. Geboekt (AI)", f"{stats['automatisch_geboekt']:,}", delta=f"{stats['success_rate']}% success")
+    with col3:
+        st.metric("Handmatig Nodig", f"{stats['handmatig_nodig']}", delta="actie vereist", delta_color="inverse")
+    with col4:
+        ok_modules = len([m for m in sync_status["modules"] if m["status"] == "ok"])
+        total_modules = len(sync_status["modules"])
+        st.metric("Modules Online", f"{ok_modules}/{total_modules}")
+
+    st.markdown("---")
+
+    # Module Status
+    col_left, col_right = st.columns([1, 1])
+
+    with col_left:
+        st.markdown("### 📡 Module Status")
+        for mod in sync_status["modules"]:
+            if mod["status"] == "ok":
+                status_icon = "🟢"
+                status_bg = "#dcfce7"
+            elif mod["status"] == "warning":
+                status_icon = "🟡"
+                status_bg = "#fef3c7"
+            else:
+                status_icon = "🔴"
+                status_bg = "#fee2e2"
+
+            stored = f" • {stored_records[mod['naam']]:,} records in NOVA".replace(",", ".") if mod['naam'] in stored_records else ""
+            pending_badge = f"<span style='background: #fee2e2; color: #dc2626; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 8px;'>{mod['items_pending']} pending</span>" if mod['items_pending'] > 0 else ""
+
+            st.markdown(f"""
+                <div class="invoice-row" style="background: {status_bg};">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <strong>{status_icon} {mod['naam']}</strong>{pending_badge}
+                            <p style="color: #64748b; margin: 4px 0 0 0; font-size: 13px;">{mod['details']}{stored}</p>
+                        </div>
+                        <div style="text-align: right;">
+                            <small style="color: #94a3b8;">{mod['laatste_sync']}</small>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with col_right:
+        st.markdown("### 🤖 AI Booking Performance")
+
+        # Pie chart for AI vs Manual
+        fig = go.Figure(data=[go.Pie(
+            labels=['Automatisch (AI)', 'Handmatig nodig'],
+            values=[stats['automatisch_geboekt'], stats['handmatig_nodig']],
+            hole=0.6,
+            marker_colors=['#10b981', '#f59e0b']
+        )])
+        fig.update_layout(
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=-0.2),
+            margin=dict(t=20, b=40, l=20, r=20),
+            height=250,
+            annotations=[dict(text=f"{stats['success_rate']}%", x=0.5, y=0.5, font_size=24, showarrow=False)]
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.markdown("""
+            <div class="agent-card agent-aria">
+                <strong style="color: #3b82f6;">📊 ARIA - Boekings Analyse</strong>
+                <p style="margin: 8px 0 0 0;">87% van alle mutaties wordt automatisch verwerkt. De resterende 13% betreft voornamelijk:</p>
+                <ul style="margin: 4px 0; color: #64748b;">
+                    <li>Onbekende debiteuren/crediteuren (6%)</li>
+                    <li>Complexe aflettering (4%)</li>
+                    <li>Ontbrekende facturen (3%)</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Open Bank Mutations
+    st.markdown("### 🏦 Openstaande Bankmutaties")
+    st.markdown("*Mutaties die AI niet automatisch kon boeken - actie vereist*")
+
+    for mut in open_bank_mutations:
+        amount_color = "#10b981" if mut['bedrag'] > 0 else "#ef4444"
+        amount_prefix = "+" if mut['bedrag'] > 0 else ""
+
+        st.markdown(f"""
+            <div class="invoice-row">
+                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                    <div style="flex: 1;">
+                        <div style="display: flex; gap: 12px; align-items: center;">
+                            <strong>{mut['id']}</strong>
+                            <span style="background: #e2e8f0; padding: 2px 8px; border-radius: 8px; font-size: 11px;">{mut['bank']}</span>
+                            <small style="color: #94a3b8;">{mut['datum']}</small>
+                        </div>
+                        <p style="color: #0f172a; margin: 8px 0 4px 0;">{mut['omschrijving']}</p>
+                        <p style="color: #dc2626; font-size: 12px; margin: 0;">⚠️ {mut['reden']}</p>
+                        <p style="color: #10b981; font-size: 12px; margin: 4px 0 0 0;">💡 {mut['suggestie']}</p>
+                    </div>
+                    <div style="text-align: right; min-width: 120px;">
+                        <span style="font-size: 20px; font-weight: 700; color: {amount_color};">{amount_prefix}€ {abs(mut['bedrag']):,.2f}</span>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Action buttons
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🔄 Forceer sync alle modules", key="odoo_force_sync", use_container_width=True):
+            odoo_settings = sync_repo.connection(client_id) or settings_from_env()
+            if not odoo_settings:
+                st.warning("⚠️ Geen Odoo-verbinding ingesteld voor deze klant (NOVA_ODOO_URL)")
+            else:
+                started = time.perf_counter()
+                with st.spinner("🔄 Modules worden gesynchroniseerd met Odoo..."):
+                    sync_results = SyncEngine(get_client(**odoo_settings), sync_repo.conn).sync(client_id)
+                failed = [model for model, result in sync_results.items() if result["status"] != "ok"]
+                # The engine reports failures per module instead of raising; one failed module fails the action
+                record("MIRA", "odoo_sync", time.perf_counter() - started, ok=not failed)
+                synced = sum(result["records"] for result in sync_results.values())
+                if failed:
+                    outcome = ("error", f"❌ Synchronisatie mislukt voor: {', '.join(failed)}")
+                else:
+                    outcome = ("success", f"✅ {synced:,} records gesynchroniseerd uit {len(sync_results)} modules".replace(",", "."))
+                # The module list above was drawn before the sync; draw the page again with the new state
+                st.session_state.odoo_sync_outcome = outcome
+                st.rerun()
+        outcome = st.session_state.pop('odoo_sync_outcome', None)
+        if outcome and outcome[0] == "error":
+            st.error(outcome[1])
+        elif outcome:
+            st.success(outcome[1])
+    with col2:
+        if st.button("📋 Exporteer openstaande mutaties", key="odoo_export_mut", use_container_width=True):
+            st.success("✅ Excel export gedownload")
+    with col3:
+        if st.button("🔧 Naar Odoo Boekhouding", key="odoo_goto", use_container_width=True):
+            st.info("🔗 Opent Odoo in nieuw tabblad...")
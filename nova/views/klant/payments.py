@@ -0,0 +1,218 @@
+"""Klant portal: Betalingsplatform"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from nova.data import invoices_repo, bank_repo
+from nova.identifiers import iban_valid
+from nova.sepa import pain001, payment_batch
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    # INTEGRATED PAYMENT PLATFORM
+    st.title("💳 Betalingsplatform")
+    st.markdown(f"**{current_client['name']}** | Geïntegreerd bankieren")
+
+    # Bank account overview
+    st.markdown("### 🏦 Uw Bankrekeningen")
+    bank_accounts = bank_repo.accounts(client_id)
+    bank_cols = st.columns(3)
+
+    for idx, (key, account) in enumerate(bank_accounts.items()):
+        with bank_cols[idx]:
+            balance_color = "#10b981" if account['balance'] >= 0 else "#ef4444"
+            st.markdown(f"""
+                <div class="metric-card" style="border-left: 4px solid {balance_color};">
+                    <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                        <div>
+                            <p class="metric-label">{account['name']}</p>
+                            <p class="metric-value" style="color: {balance_color};">{format_currency(account['balance'])}</p>
+                            <p style="color: #64748b; font-size: 12px; margin-top: 8px;">
+                                🏛️ {account['bank']}<br>
+                                <span style="font-family: monospace; font-size: 11px;">{account['iban']}</span>
+                            </p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Outstanding invoices for payment
+    st.markdown("### 📋 Openstaande Facturen - Klaar voor Betaling")
+
+    outstanding_invoices = invoices_repo.list(client_id, payment_status='openstaand')
+    outstanding_summary = invoices_repo.outstanding_summary(client_id, datetime.now().strftime('%Y-%m-%d'))
+    total_outstanding = outstanding_summary['total']
+
+    # Summary metrics
+    metric_cols = st.columns(4)
+    with metric_cols[0]:
+        st.metric("Openstaande Facturen", outstanding_summary['count'])
+    with metric_cols[1]:
+        st.metric("Totaal Openstaand", format_currency(total_outstanding))
+    with metric_cols[2]:
+        overdue = outstanding_summary['overdue']
+        st.metric("Verlopen", overdue, delta="actie vereist" if overdue > 0 else None, delta_color="inverse")
+    with metric_cols[3]:
+        st.metric("Beschikbaar Saldo", format_currency(bank_accounts['main']['balance']))
+
+    st.markdown("")
+
+    # Initialize session state for selected payments
+    if 'selected_payments' not in st.session_state:
+        st.session_state.selected_payments = []
+
+    # Payment selection table header
+    st.markdown("""
+        <div style="display: grid; grid-template-columns: 40px 2fr 3fr 2fr 2fr 2fr 1.5fr; gap: 12px; padding: 12px 16px;
+                    background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%); border-radius: 10px 10px 0 0; color: white;">
+            <span style="font-size: 11px; font-weight: 600;">✓</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Factuur</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Leverancier</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Bedrag</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Vervaldatum</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">IBAN</span>
+            <span style="font-size: 11px; font-weight: 600; text-transform: uppercase;">Status</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Payment rows with checkboxes
+    for inv in outstanding_invoices:
+        total_amount = inv['amount'] + inv['vat']
+        is_overdue = inv['due_date'] < datetime.now().strftime('%Y-%m-%d')
+        status_badge = '<span style="background: #fee2e2; color: #dc2626; padding: 2px 8px; border-radius: 12px; font-size: 10px;">VERLOPEN</span>' if is_overdue else '<span style="background: #fef3c7; color: #92400e; padding: 2px 8px; border-radius: 12px; font-size: 10px;">OPEN</span>'
+        row_bg = "#fff5f5" if is_overdue else "#ffffff"
+
+        col1, col2, col3, col4, col5, col6, col7 = st.columns([0.5, 2, 3, 2, 2, 2, 1.5])
+
+        with col1:
+            selected = st.checkbox("", key=f"pay_{inv['id']}", label_visibility="collapsed")
+            if selected and inv['id'] not in st.session_state.selected_payments:
+                st.session_state.selected_payments.append(inv['id'])
+            elif not selected and inv['id'] in st.session_state.selected_payments:
+                st.session_state.selected_payments.remove(inv['id'])
+
+        with col2:
+            st.markdown(f"**{inv['id']}**")
+        with col3:
+            st.markdown(f"{inv['supplier']}")
+        with col4:
+            st.markdown(f"**{format_currency(total_amount)}**")
+        with col5:
+            st.markdown(f"{'🔴 ' if is_overdue else ''}{inv['due_date']}")
+        with col6:
+            st.markdown(f"<span style='font-family: monospace; font-size: 11px;'>{inv['iban'][:12]}...</span>", unsafe_allow_html=True)
+        with col7:
+            st.markdown(status_badge, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Payment action section
+    selected_count = len(st.session_state.selected_payments)
+    selected_total = sum(inv['amount'] + inv['vat'] for inv in outstanding_invoices if inv['id'] in st.session_state.selected_payments)
+
+    st.markdown("### 💸 Betaling Uitvoeren")
+
+    pay_cols = st.columns([2, 2, 1])
+
+    with pay_cols[0]:
+        st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); border: 1px solid #10b981;">
+                <p style="color: #166534; font-size: 12px; font-weight: 600; margin-bottom: 4px;">GESELECTEERD VOOR BETALING</p>
+                <p style="font-size: 28px; font-weight: 700; color: #166534; margin: 0;">{selected_count} facturen</p>
+                <p style="font-size: 18px; color: #166534; margin-top: 4px;">Totaal: {format_currency(selected_total)}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with pay_cols[1]:
+        source_key = st.selectbox(
+            "Betalen vanaf rekening",
+            options=list(bank_accounts),
+            format_func=lambda key: f"{bank_accounts[key]['name']} ({bank_accounts[key]['iban']}) - {format_currency(bank_accounts[key]['balance'])}",
+            key="payment_source"
+        )
+
+        payment_date = st.date_input("Betaaldatum", value=datetime.now(), key="payment_date")
+        on_due_date = st.checkbox("Niet vóór de vervaldatum betalen", key="payment_on_due_date",
+                                  help="Facturen met een latere vervaldatum worden op die datum uitgevoerd")
+
+    # SEPA batch: creditor IBANs are checked for the whole selection at once
+    selected_ids = set(st.session_state.selected_payments)
+    sepa_payments, sepa_rejected = payment_batch(
+        [inv for inv in outstanding_invoices if inv['id'] in selected_ids], payment_date.isoformat(), on_due_date
+    )
+    source = bank_accounts[source_key]
+    debtor = {"name": current_client['name'], "iban": source['iban'], "bic": source.get('bic')}
+    message_id = f"NOVA-{client_id}-{datetime.now():%Y%m%d%H%M%S}"
+
+    with pay_cols[2]:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🏦 Betaling Uitvoeren", type="primary", use_container_width=True, disabled=selected_count == 0):
+            st.success(f"✅ Betaalopdracht voor {selected_count} facturen ({format_currency(selected_total)}) is verzonden naar uw bank!")
+            st.balloons()
+            st.session_state.selected_payments = []
+
+        st.download_button(
+            "📥 SEPA Batch Downloaden",
+            # Generated only when the button is clicked
+            data=lambda: b"".join(pain001(debtor, sepa_payments, message_id)),
+            file_name=f"{message_id}.xml",
+            mime="application/xml",
+            on_click="ignore",
+            use_container_width=True,
+            disabled=not sepa_payments or not iban_valid(debtor['iban']),
+        )
+
+    if selected_count and not iban_valid(debtor['iban']):
+        st.error(f"⚠️ De IBAN van {source['name']} ({source['iban']}) is ongeldig; kies een andere rekening voor de SEPA batch")
+    if sepa_rejected:
+        listed = ", ".join(f"{inv['id']} ({reason})" for inv, reason in sepa_rejected[:10])
+        more = f" en {len(sepa_rejected) - 10} meer" if len(sepa_rejected) > 10 else ""
+        st.warning(f"⚠️ {len(sepa_rejected)} geselecteerde facturen worden niet in de SEPA batch opgenomen: {listed}{more}")
+
+    # Payment instructions / Bank integration info
+    st.markdown("---")
+    st.markdown("### 🔗 Bank Integratie Status")
+
+    integration_cols = st.columns(3)
+    with integration_cols[0]:
+        st.markdown("""
+            <div class="metric-card" style="border-left: 4px solid #10b981;">
+                <div style="display: flex; align-items: center; gap: 8px;">
+                    <span style="font-size: 24px;">🟢</span>
+                    <div>
+                        <strong>ING Business</strong>
+                        <p style="color: #64748b; font-size: 12px; margin: 0;">PSD2 Connected • Real-time</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    with integration_cols[1]:
+        st.markdown("""
+            <div class="metric-card" style="border-left: 4px solid #10b981;">
+                <div style="display: flex; align-items: center; gap: 8px;">
+                    <span style="font-size: 24px;">🟢</span>
+                    <div>
+                        <strong>ABN AMRO</strong>
+                        <p style="color: #64748b; font-size: 12px; margin: 0;">PSD2 Connected • Real-time</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    with integration_cols[2]:
+        st.markdown("""
+            <div class="metric-card" style="border-left: 4px solid #10b981;">
+                <div style="display: flex; align-items: center; gap: 8px;">
+                    <span style="font-size: 24px;">🟢</span>
+                    <div>
+                        <strong>Rabobank</strong>
+                        <p style="color: #64748b; font-size: 12px; margin: 0;">PSD2 Connected • Real-time</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,57 @@
+"""Klant portal: Winst & verlies"""
+
+import streamlit as st
+
+from nova.reference import CURRENT_BOEKJAAR
+from nova.data import rgs_repo
+from nova.ui import format_currency
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    st.title("📊 Winst & Verlies")
+    st.markdown(f"**{current_client['name']}** | Periode: Januari 2024 YTD")
+
+    # Create P&L statement
+    st.markdown("""
+        <div class="rgs-header">
+            <span>RGS Code</span>
+            <span style="float: right;">Bedrag</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    categories = {}
+    for code, data in rgs_repo.statement(client_id, CURRENT_BOEKJAAR, 'wv').items():
+        cat = data['category']
+        if cat not in categories:
+            categories[cat] = []
+        categories[cat].append((code, data))
+
+    total = 0
+    for category, items in categories.items():
+        st.markdown(f"**{category}**")
+        cat_total = 0
+        for code, data in items:
+            st.markdown(f"""
+                <div class="rgs-row">
+                    <span>{data['name']} <small style="color: #94a3b8;">({code})</small></span>
+                    <span style="float: right;">{format_currency(data['amount'])}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            cat_total += data['amount']
+        st.markdown(f"""
+            <div class="rgs-row" style="background: #f1f5f9; font-weight: 600;">
+                <span>Subtotaal {category}</span>
+                <span style="float: right;">{format_currency(cat_total)}</span>
+            </div>
+            """, unsafe_allow_html=True)
+        total += cat_total
+        st.markdown("")
+
+    st.markdown(f"""
+        <div class="rgs-row rgs-total" style="background: #0f172a; color: white; border-radius: 0 0 12px 12px;">
+            <span style="font-size: 18px;">NETTO RESULTAAT</span>
+            <span style="float: right; font-size: 18px;">{format_currency(total)}</span>
+        </div>
+        """, unsafe_allow_html=True)
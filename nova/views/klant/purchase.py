@@ -0,0 +1,122 @@
+"""Klant portal: Inkoop & purchase orders"""
+
+import pandas as pd
+import streamlit as st
+
+from nova.data import purchase_repo
+from nova.matching import PRICE_TOLERANCE, QUANTITY_TOLERANCE, STATUS_LABELS
+from nova.ui import format_currency
+
+STATUS_ORDER = {"exception": 0, "partial": 1, "match": 2}
+
+
+def _matching_panel(client_id):
+    """Match, partial and exception counts of one period with the invoices and lines that need attention"""
+    periods = purchase_repo.matching_periods(client_id)
+    if not periods:
+        st.info("Nog geen factuurregels om te matchen met inkooporders en ontvangsten.")
+        return
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        period = st.selectbox("Periode", periods + ["Alle perioden"], key="matching_period")
+    with col2:
+        price_tolerance = st.number_input("Prijstolerantie (%)", min_value=0.0, max_value=25.0,
+                                          value=PRICE_TOLERANCE * 100, step=0.5, key="matching_price_tolerance")
+    with col3:
+        quantity_tolerance = st.number_input("Aantaltolerantie (%)", min_value=0.0, max_value=25.0,
+                                             value=QUANTITY_TOLERANCE * 100, step=0.5,
+                                             key="matching_quantity_tolerance")
+    result = purchase_repo.three_way_match(
+        client_id, None if period == "Alle perioden" else period, price_tolerance / 100, quantity_tolerance / 100
+    )
+
+    counts = result["counts"]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Volledig gematcht", counts["match"])
+    with col2:
+        st.metric("Gedeeltelijk (wacht op ontvangst)", counts["partial"])
+    with col3:
+        st.metric("Uitzonderingen", counts["exception"])
+
+    invoices = sorted(result["invoices"], key=lambda inv: (STATUS_ORDER[inv["status"]], inv["date"] or ""))
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Factuur": inv["invoice_id"],
+                "Leverancier": inv["supplier"],
+                "PO": inv["po_id"],
+                "Datum": inv["date"],
+                "Regels": inv["lines"],
+                "Bedrag": inv["amount"],
+                "Status": STATUS_LABELS[inv["status"]],
+                "Bevindingen": inv["reasons"],
+            }
+            for inv in invoices
+        ]),
+        hide_index=True, use_container_width=True,
+        column_config={"Bedrag": st.column_config.NumberColumn(format="€ %.2f")},
+    )
+
+    open_lines = result["flagged_lines"]
+    if open_lines:
+        with st.expander(f"🔍 {len(open_lines)} factuurregel(s) met afwijkingen"):
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Factuur": line["invoice_id"],
+                        "Regel": line["line"],
+                        "Product": line["product"],
+                        "PO-regel": int(line["po_line"]) if line["po_line"] is not None else None,
+                        "Gefactureerd": line["quantity"],
+                        "Besteld": line["ordered"],
+                        "Ontvangen": line["received"],
+                        "Prijs": line["unit_price"],
+                        "PO-prijs": line["po_price"],
+                        "Afwijking": line["price_deviation"] * 100 if line["price_deviation"] is not None else None,
+                        "Bevinding": line["reason"],
+                    }
+                    for line in open_lines
+                ]),
+                hide_index=True, use_container_width=True,
+                column_config={
+                    "Prijs": st.column_config.NumberColumn(format="€ %.2f"),
+                    "PO-prijs": st.column_config.NumberColumn(format="€ %.2f"),
+                    "Afwijking": st.column_config.NumberColumn(format="%+.1f%%"),
+                },
+            )
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    purchase_orders = purchase_repo.orders(client_id)
+    st.title("📦 Inkoop & Purchase Orders")
+    st.markdown(f"**{current_client['name']}** | Odoo Purchase Integratie")
+
+    # 3-way matching overview
+    st.markdown("### ✅ 3-Way Matching Status")
+    _matching_panel(client_id)
+
+    st.markdown("---")
+
+    # PO List
+    st.markdown("### 📋 Purchase Orders")
+    for po in purchase_orders:
+        status_colors = {'Geleverd': '#dcfce7', 'Gepland': '#fef3c7', 'Besteld': '#dbeafe'}
+        st.markdown(f"""
+            <div class="invoice-row">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{po['id']}</strong>
+                        <p style="color: #64748b; margin: 4px 0;">{po['supplier']}</p>
+                        <p style="color: #94a3b8; font-size: 12px;">Project: {po['project']}</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="background: {status_colors[po['status']]}; padding: 4px 12px; border-radius: 20px; font-size: 12px;">{po['status']}</span>
+                        <p style="font-size: 18px; font-weight: 700; margin: 8px 0 0 0;">{format_currency(po['amount'])}</p>
+                        <p style="color: #64748b; font-size: 12px;">{po['date']}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,212 @@
+"""Klant portal: Vennootschapsbelasting"""
+
+import streamlit as st
+
+from nova.reference import CURRENT_BOEKJAAR, vpb_tarieven
+from nova.data import documents_repo
+from nova.ui import format_currency
+
+
+def _percentage(value):
+    return f"{value:g}".replace(".", ",") + "%"
+
+
+def _grens(value):
+    return f"€{value:,.0f}".replace(",", ".")
+
+
+def render(current_client):
+    client_id = current_client['id']
+
+    vpb_data = documents_repo.get(client_id, 'vpb', CURRENT_BOEKJAAR)
+    tarieven = vpb_tarieven(vpb_data['boekjaar'])
+    schijf_1, schijf_2 = tarieven['schijf_1'], tarieven['schijf_2']
+    st.title("🏛️ Vennootschapsbelasting")
+    st.markdown(f"**{current_client['name']}** | Vpb {vpb_data['boekjaar']}")
+
+    # Deadline overview
+    st.markdown("### 📅 Deadlines & Status")
+    for dl in vpb_data["deadlines"]:
+        status_color = "#dcfce7" if dl["status"] == "Akkoord" or dl["status"] == "Betaald" else "#fef3c7" if dl["status"] == "Open" else "#fee2e2"
+        st.markdown(f"""
+            <div class="invoice-row">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{dl['omschrijving']}</strong>
+                        <p style="color: #64748b; margin: 4px 0;">Deadline: {dl['deadline']}</p>
+                    </div>
+                    <span style="background: {status_color}; padding: 4px 12px; border-radius: 20px; font-size: 12px;">{dl['status']}</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Vpb Calculation
+    st.markdown("### 🧮 Vpb Berekening 2024 (Voorlopig)")
+
+    calc = vpb_data["berekening"]
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(f"""
+            <div class="metric-card">
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr style="border-bottom: 1px solid #e2e8f0;">
+                        <td style="padding: 12px 0;"><strong>Commerciële winst voor belasting</strong></td>
+                        <td style="text-align: right; padding: 12px 0;">{format_currency(calc['winst_voor_vpb'])}</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #e2e8f0;">
+                        <td style="padding: 12px 0; color: #10b981;">Kleinschaligheidsinvesteringsaftrek (KIA)</td>
+                        <td style="text-align: right; padding: 12px 0; color: #10b981;">- {format_currency(calc['kleinschaligheidsinvesteringsaftrek'])}</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #e2e8f0;">
+                        <td style="padding: 12px 0; color: #ef4444;">Overige fiscale correcties</td>
+                        <td style="text-align: right; padding: 12px 0; color: #ef4444;">+ {format_currency(abs(calc['overige_fiscale_correcties']))}</td>
+                    </tr>
+                    <tr style="background: #f8fafc;">
+                        <td style="padding: 12px 0;"><strong>Belastbare winst</strong></td>
+                        <td style="text-align: right; padding: 12px 0;"><strong>{format_currency(calc['belastbare_winst'])}</strong></td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 12px 0;">Vpb {_percentage(schijf_1['percentage'])} (tot {_grens(schijf_1['grens'])})</td>
+                        <td style="text-align: right; padding: 12px 0;">{format_currency(calc['vpb_schijf_1'])}</td>
+                    </tr>
+                    <tr style="background: #0f172a; color: white;">
+                        <td style="padding: 12px 0;"><strong>Totaal verschuldigde Vpb</strong></td>
+                        <td style="text-align: right; padding: 12px 0;"><strong>{format_currency(calc['vpb_totaal'])}</strong></td>
+                    </tr>
+                </table>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        # Effective tax rate
+        effective_rate = (calc['vpb_totaal'] / calc['winst_voor_vpb']) * 100
+        st.markdown(f"""
+            <div class="metric-card" style="text-align: center;">
+                <p class="metric-label">Effectieve belastingdruk</p>
+                <p class="metric-value">{effective_rate:.1f}%</p>
+                <p style="color: #64748b; font-size: 12px;">Nominaal tarief: {_percentage(schijf_1['percentage'])}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Tarieven info
+        st.markdown(f"""
+            <div class="metric-card">
+                <p class="metric-label">Vpb Tarieven {vpb_data['boekjaar']}</p>
+                <p><strong>{_percentage(schijf_1['percentage'])}</strong> tot {_grens(schijf_1['grens'])}</p>
+                <p><strong>{_percentage(schijf_2['percentage'])}</strong> boven {_grens(schijf_1['grens'])}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # SAGE insight
+    st.markdown(f"""
+        <div class="agent-card agent-sage">
+            <strong style="color: #f59e0b;">💡 SAGE - Fiscaal Advies</strong>
+            <p style="margin: 8px 0 0 0;">De KIA-aftrek van €5.200 is correct toegepast op basis van de investeringen in 2024.</p>
+            <p style="color: #64748b;">Overweeg om vóór jaareinde nog investeringen te doen - de drempel voor KIA (€2.800) is al bereikt, extra aftrek mogelijk tot €19.500 bij investeringen tot €387.580.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Voorlopige aanslagen
+    st.markdown("### 💳 Voorlopige Aanslagen")
+
+    col1, col2, col3 = st.columns(3)
+    total_va = sum(va['bedrag'] for va in vpb_data['voorlopige_aanslagen'])
+    paid_va = sum(va['bedrag'] for va in vpb_data['voorlopige_aanslagen'] if va['status'] == 'Betaald')
+
+    with col1:
+        st.metric("Totaal voorlopige aanslagen", format_currency(total_va))
+    with col2:
+        st.metric("Reeds betaald", format_currency(paid_va))
+    with col3:
+        expected_return = total_va - calc['vpb_totaal']
+        if expected_return > 0:
+            st.metric("Verwachte teruggave", format_currency(expected_return), delta="terug te ontvangen")
+        else:
+            st.metric("Nog te betalen", format_currency(abs(expected_return)), delta="bij te betalen", delta_color="inverse")
+
+    for va in vpb_data['voorlopige_aanslagen']:
+        status_color = "#dcfce7" if va["status"] == "Betaald" else "#fef3c7"
+        st.markdown(f"""
+            <div class="invoice-row">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>Voorlopige aanslag {va['jaar']}</strong>
+                        <p style="color: #64748b; margin: 4px 0;">Vervaldatum: {va['betaaldatum']}</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="background: {status_color}; padding: 4px 12px; border-radius: 20px; font-size: 12px;">{va['status']}</span>
+                        <p style="font-size: 18px; font-weight: 700; margin: 8px 0 0 0;">{format_currency(va['bedrag'])}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Call-to-Action Section for Fiscal Advisor
+    st.markdown("---")
+    st.markdown("### 📞 Fiscaal Advies Nodig?")
+
+    # Prominent CTA Card
+    st.markdown("""
+        <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); border-radius: 16px; padding: 28px; margin: 16px 0; box-shadow: 0 8px 32px rgba(245,158,11,0.3);">
+            <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 20px;">
+                <div style="flex: 1; min-width: 280px;">
+                    <h3 style="color: white; margin: 0 0 8px 0; font-size: 22px;">🏛️ Vraag over uw Vennootschapsbelasting?</h3>
+                    <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 15px;">
+                        Onze fiscalisten helpen u graag met optimalisatie, deadlines en strategische planning.
+                    </p>
+                    <p style="color: rgba(255,255,255,0.8); margin: 8px 0 0 0; font-size: 13px;">
+                        <strong>Emma de Groot</strong> - Fiscalist | Specialisatie: Vennootschapsbelasting & Investeringsaftrek
+                    </p>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    cta_cols = st.columns([1, 1, 1])
+    with cta_cols[0]:
+        if st.button("📞 Bel Direct: +31 20 123 4567", key="vpb_call", use_container_width=True, type="primary"):
+            st.info("📞 Verbinding wordt gemaakt met Emma de Groot...")
+    with cta_cols[1]:
+        if st.button("📅 Plan Afspraak met Fiscalist", key="vpb_schedule", use_container_width=True, type="primary"):
+            st.success("📅 Afspraakverzoek verzonden! U ontvangt binnen 24 uur een bevestiging.")
+    with cta_cols[2]:
+        if st.button("💬 Chat met Fiscaal Team", key="vpb_chat", use_container_width=True, type="primary"):
+            st.session_state.current_view = 'chat'
+            st.rerun()
+
+    # Quick question form
+    st.markdown("")
+    with st.expander("📝 Stel direct een vraag over uw Vpb", expanded=False):
+        question_type = st.selectbox(
+            "Onderwerp",
+            ["Selecteer een onderwerp...", "Investeringsaftrek (KIA/EIA/MIA)", "Voorlopige aanslag aanpassen",
+             "Verliesverrekening", "Tarieven & schijven", "Deadline uitstel aanvragen", "Anders"]
+        )
+        question_text = st.text_area("Uw vraag", placeholder="Beschrijf uw vraag of situatie...")
+        urgency = st.radio("Urgentie", ["Normaal (binnen 2 werkdagen)", "Urgent (binnen 24 uur)", "Spoed (vandaag)"], horizontal=True)
+
+        if st.button("📤 Vraag Versturen", key="vpb_question_submit", type="primary"):
+            if question_text:
+                st.success("✅ Uw vraag is verzonden naar het fiscaal team. U ontvangt binnen " +
+                          ("2 werkdagen" if "Normaal" in urgency else "24 uur" if "Urgent" in urgency else "enkele uren") + " een reactie.")
+            else:
+                st.warning("⚠️ Vul eerst uw vraag in")
+
+    st.markdown("---")
+
+    # Standard action buttons
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("📊 Vpb Prognose updaten", key="vpb_prognose", use_container_width=True):
+            st.success("✅ Vpb prognose 2024 geüpdatet")
+    with col2:
+        if st.button("📧 Fiscaal rapport naar klant", key="vpb_report", use_container_width=True):
+            st.info("📧 Rapport verzonden naar Jan Vermeer")
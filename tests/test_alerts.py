@@ -0,0 +1,32 @@
+import logging
+
+import pytest
+
+from nova import alerts
+
+
+class Stop(BaseException):
+    pass
+
+
+def test_refresh_loop_logs_failures_and_backs_off(monkeypatch, caplog):
+    outcomes = iter([RuntimeError("database is locked")] * 7 + [None, RuntimeError("again")])
+    sleeps = []
+
+    def refresh():
+        outcome = next(outcomes)
+        if outcome:
+            raise outcome
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 9:
+            raise Stop
+
+    monkeypatch.setattr(alerts, "refresh_alerts", refresh)
+    monkeypatch.setattr(alerts.time, "sleep", sleep)
+    with caplog.at_level(logging.ERROR, logger="nova.alerts"), pytest.raises(Stop):
+        alerts._refresh_loop(30)
+    assert sleeps == [30, 60, 120, 240, 480, 600, 600, 30, 30]
+    assert len(caplog.records) == 8
+    assert "database is locked" in caplog.records[0].exc_text
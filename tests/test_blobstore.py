@@ -0,0 +1,148 @@
+import hashlib
+import io
+import os
+import time
+
+import pytest
+
+from nova.blobstore import BlobStore, adopt_uploads, collect_garbage, default_root, legacy_root, register
+from nova.db import SCHEMA, connect
+
+PDF = b"%PDF-1.4 factuur F2024-009"
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    conn = connect()
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def add_job(conn, digest, path=None, client_id="CL001"):
+    with conn:
+        return conn.execute(
+            "INSERT INTO ingest_jobs (client_id, kind, filename, path, sha256, status, created) "
+            "VALUES (?, 'invoice', 'factuur.pdf', ?, ?, 'done', '2024-03-01T12:00:00')",
+            (client_id, path, digest),
+        ).lastrowid
+
+
+def age(conn, store, digest, seconds=7200):
+    """Pretend the file was written and released ``seconds`` ago"""
+    then = time.time() - seconds
+    os.utime(store.path(digest), (then, then))
+    with conn:
+        conn.execute("UPDATE blobs SET created = created - ?, released = released - ? WHERE sha256 = ?",
+                     (seconds, seconds, digest))
+
+
+def test_each_database_has_its_own_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    assert default_root() == tmp_path / "nova.blobs"
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "bench_1000.sqlite3"))
+    assert default_root() == tmp_path / "bench_1000.blobs"
+    assert legacy_root() == tmp_path / "blobs"
+
+
+def test_put_stores_content_once(tmp_path):
+    store = BlobStore(tmp_path / "store")
+    digest, size = store.put(io.BytesIO(PDF))
+    assert (digest, size) == (hashlib.sha256(PDF).hexdigest(), len(PDF))
+    assert store.path(digest) == tmp_path / "store" / digest[:2] / digest[2:4] / digest
+    assert store.put(io.BytesIO(PDF)) == (digest, size)
+    assert list(store.digests()) == [digest]
+    assert list((tmp_path / "store" / "tmp").iterdir()) == []
+    with store.open(digest) as mapped:
+        assert mapped[:8] == b"%PDF-1.4"
+
+
+def test_put_over_the_limit_leaves_nothing_behind(tmp_path):
+    store = BlobStore(tmp_path / "store")
+    with pytest.raises(ValueError):
+        store.put(io.BytesIO(b"x" * 100), max_bytes=10)
+    assert list(store.digests()) == []
+    assert list((tmp_path / "store" / "tmp").iterdir()) == []
+    with pytest.raises(ValueError):
+        store.path("../../etc/passwd")
+
+
+def test_jobs_count_references(conn, tmp_path):
+    store = BlobStore()
+    digest, size = store.put(io.BytesIO(PDF))
+    with conn:
+        register(conn, digest, size)
+    first, second = add_job(conn, digest), add_job(conn, digest, client_id="CL002")
+    assert tuple(conn.execute("SELECT refs, released FROM blobs").fetchone()) == (2, None)
+    with conn:
+        conn.execute("DELETE FROM ingest_jobs WHERE id = ?", (first,))
+    assert conn.execute("SELECT refs FROM blobs").fetchone()[0] == 1
+    with conn:
+        conn.execute("DELETE FROM ingest_jobs WHERE id = ?", (second,))
+    refs, released = conn.execute("SELECT refs, released FROM blobs").fetchone()
+    assert refs == 0 and released is not None
+
+
+def test_garbage_collection_waits_for_the_grace_period(conn):
+    store = BlobStore()
+    kept, _ = store.put(io.BytesIO(PDF))
+    dropped, size = store.put(io.BytesIO(b"%PDF-1.4 weggegooid"))
+    with conn:
+        register(conn, kept, len(PDF))
+        register(conn, dropped, size)
+    add_job(conn, kept)
+    with conn:
+        conn.execute("DELETE FROM ingest_jobs WHERE id = ?", (add_job(conn, dropped),))
+
+    assert collect_garbage(conn, store) == 0
+    age(conn, store, kept)
+    age(conn, store, dropped)
+    assert collect_garbage(conn, store) == 1
+    assert store.exists(kept) and not store.exists(dropped)
+    assert [row[0] for row in conn.execute("SELECT sha256 FROM blobs")] == [kept]
+
+
+def test_sweep_leaves_other_databases_alone(tmp_path, monkeypatch):
+    stores = {}
+    for name in ("nova", "bench"):
+        monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / f"{name}.sqlite3"))
+        conn = connect()
+        conn.executescript(SCHEMA)
+        store = BlobStore()
+        digest, size = store.put(io.BytesIO(PDF + name.encode()))
+        with conn:
+            register(conn, digest, size)
+        add_job(conn, digest)
+        stores[name] = (conn, store, digest)
+    conn, store, _ = stores["nova"]
+    unknown, _ = store.put(io.BytesIO(b"nooit geregistreerd"))
+    age(conn, store, unknown)
+    stale = store.root / "tmp" / "upload.part"
+    stale.write_bytes(b"half")
+    os.utime(stale, (time.time() - 7200,) * 2)
+
+    assert collect_garbage(conn, store, sweep=True) == 1
+    assert not store.exists(unknown) and not stale.exists()
+    for conn, store, digest in stores.values():
+        assert store.exists(digest)
+        conn.close()
+
+
+def test_files_of_the_shared_store_are_linked_not_moved(conn):
+    shared = BlobStore(legacy_root())
+    digest, _ = shared.put(io.BytesIO(PDF))
+    old_upload = legacy_root().parent / "uploads" / "factuur.pdf"
+    old_upload.parent.mkdir()
+    old_upload.write_bytes(b"%PDF-1.4 oude upload")
+    upload_digest = hashlib.sha256(old_upload.read_bytes()).hexdigest()
+    add_job(conn, digest, str(shared.path(digest)))
+    add_job(conn, upload_digest, str(old_upload))
+
+    store = BlobStore()
+    assert adopt_uploads(conn, store) == 2
+    assert store.exists(digest) and shared.exists(digest)
+    assert store.exists(upload_digest) and not old_upload.exists()
+    paths = {row[0] for row in conn.execute("SELECT path FROM ingest_jobs")}
+    assert paths == {str(store.path(digest)), str(store.path(upload_digest))}
+    assert conn.execute("SELECT size FROM blobs WHERE sha256 = ?", (digest,)).fetchone()[0] == len(PDF)
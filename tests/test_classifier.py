@@ -0,0 +1,108 @@
+import pytest
+
+from nova.classifier import RgsModel, features, magnitude, predict_rgs
+from nova.db import SCHEMA, connect, insert_rows
+from nova.identifiers import supplier_key
+
+ENERGY = ("Watt Energie B.V.", "NL91ABNA0417164300", 412.50)
+TRANSPORT = ("Snel Transport", "DE89370400440532013000", 95.00)
+
+
+def booking(seq, supplier, iban, amount, rgs, weight=1):
+    return (seq, supplier_key(supplier), iban, magnitude(amount), rgs, None, weight)
+
+
+def database(path):
+    conn = connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = database(tmp_path / "nova.sqlite3")
+    yield conn
+    conn.close()
+
+
+def test_features():
+    assert features("watt energie bv", "NL91ABNA0417164300", 2) == [
+        "s:watt energie bv", "w:watt", "w:energie", "i:NL91ABNA0417164300", "a:2",
+    ]
+    assert features(None) == []
+    assert (magnitude(0), magnitude(9.99), magnitude(-412.5), magnitude(1000)) == (None, 0, 2, 3)
+
+
+def test_learned_supplier_predicts_its_account():
+    model = RgsModel("CL001")
+    model.learn([booking(1, *ENERGY, "WBedHui"), booking(2, *ENERGY, "WBedHui"), booking(3, *TRANSPORT, "WBedVkk")])
+    assert model.seq == 3
+    best, posterior, support = model.score([features(supplier_key("Watt Energie"), None, 2),
+                                            features(supplier_key("Snel Transport"))])
+    names = list(model.classes)
+    assert [names[i] for i in best] == ["WBedHui", "WBedVkk"]
+    assert posterior[0] > 0.9
+    assert list(support) == [2, 1]
+
+
+def test_negative_weight_undoes_a_booking():
+    model = RgsModel("CL001")
+    model.learn([booking(1, *ENERGY, "WBedHui"), booking(2, *TRANSPORT, "WBedVkk")])
+    model.score([features(supplier_key("Snel Transport"))])
+    model.learn([booking(3, *TRANSPORT, "WBedVkk", weight=-1), booking(4, *TRANSPORT, "WBedAut")])
+    best, _, support = model.score([features(supplier_key("Snel Transport"))])
+    assert list(model.classes)[best[0]] == "WBedAut"
+    assert support[0] == 1
+
+
+def test_unknown_invoice_has_no_support():
+    model = RgsModel("CL001")
+    assert model.score([features(supplier_key("Snel Transport"))])[0][0] == -1
+    model.learn([booking(1, *ENERGY, "WBedHui")])
+    _, _, support = model.score([features(supplier_key("Bakkerij de Korenaar"))])
+    assert support[0] == 0
+
+
+def test_client_bookings_first_then_the_firm(conn):
+    insert_rows(conn, "invoices", [
+        {"client_id": "CL001", "id": "F1", "supplier": ENERGY[0], "iban": ENERGY[1], "amount": ENERGY[2],
+         "rgs": "WBedHui", "category": "Huisvesting"},
+        {"client_id": "CL002", "id": "F2", "supplier": TRANSPORT[0], "iban": TRANSPORT[1], "amount": TRANSPORT[2],
+         "rgs": "WBedVkk", "category": "Verkoopkosten"},
+    ])
+    energy, transport, unknown = predict_rgs(conn, "CL001", [
+        {"supplier": "Watt Energie", "iban": "nl91 abna 0417 1643 00", "amount": 380.0},
+        {"supplier": "Snel Transport B.V.", "amount": 120.0},
+        {"supplier": "Bakkerij de Korenaar"},
+    ])
+    assert (energy["rgs"], energy["category"]) == ("WBedHui", "Huisvesting")
+    assert transport["rgs"] == "WBedVkk"
+    assert unknown is None
+
+
+def test_changed_booking_is_relearned(conn):
+    insert_rows(conn, "invoices", [{"client_id": "CL001", "id": "F1", "supplier": TRANSPORT[0], "amount": 95.0,
+                                    "rgs": "WBedVkk"}])
+    assert predict_rgs(conn, "CL001", [{"supplier": TRANSPORT[0]}])[0]["rgs"] == "WBedVkk"
+    conn.execute("UPDATE invoices SET rgs = 'WBedAut' WHERE id = 'F1'")
+    conn.commit()
+    assert predict_rgs(conn, "CL001", [{"supplier": TRANSPORT[0]}])[0]["rgs"] == "WBedAut"
+    conn.execute("DELETE FROM invoices WHERE id = 'F1'")
+    conn.commit()
+    assert predict_rgs(conn, "CL001", [{"supplier": TRANSPORT[0]}]) == [None]
+
+
+def test_models_are_kept_per_database(tmp_path):
+    first, second = database(tmp_path / "nova.sqlite3"), database(tmp_path / "bench.sqlite3")
+    invoice = {"client_id": "CL001", "id": "F1", "supplier": TRANSPORT[0], "amount": 95.0}
+    insert_rows(first, "invoices", [{**invoice, "rgs": "WBedVkk"}])
+    first.commit()
+    assert predict_rgs(first, "CL001", [{"supplier": TRANSPORT[0]}])[0]["rgs"] == "WBedVkk"
+    assert predict_rgs(second, "CL001", [{"supplier": TRANSPORT[0]}]) == [None]
+    # The second log starts at seq 1 again; a model shared with the first would skip it
+    insert_rows(second, "invoices", [{**invoice, "rgs": "WBedAut"}])
+    second.commit()
+    assert predict_rgs(second, "CL001", [{"supplier": TRANSPORT[0]}])[0]["rgs"] == "WBedAut"
+    assert predict_rgs(first, "CL001", [{"supplier": TRANSPORT[0]}])[0]["rgs"] == "WBedVkk"
+    first.close()
+    second.close()
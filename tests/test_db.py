@@ -0,0 +1,75 @@
+import sqlite3
+
+from nova.db import connect, firm_summary, init_db
+
+# clients and firm_alerts as they were before the summary table and the alert rules existed
+PRE_SUMMARY_SCHEMA = """
+CREATE TABLE clients (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact TEXT,
+    kvk TEXT,
+    btw TEXT,
+    sector TEXT,
+    omzet_ytd REAL,
+    omzet_prev REAL,
+    winst_ytd REAL,
+    openstaand REAL,
+    status TEXT,
+    accountant TEXT,
+    alerts TEXT,
+    last_activity TEXT
+);
+CREATE TABLE firm_alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id TEXT,
+    type TEXT,
+    client TEXT,
+    message TEXT,
+    time TEXT
+);
+"""
+
+
+def expected_summary(conn):
+    summary = {"clients": conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0]}
+    summary["omzet_ytd"], summary["openstaand"] = conn.execute(
+        "SELECT COALESCE(SUM(omzet_ytd), 0), COALESCE(SUM(openstaand), 0) FROM clients"
+    ).fetchone()
+    summary.update(("status:" + status, count) for status, count in
+                   conn.execute("SELECT status, COUNT(*) FROM clients GROUP BY status"))
+    summary["alerts"] = conn.execute("SELECT COUNT(*) FROM firm_alerts").fetchone()[0]
+    summary.update(("alerts:" + type_, count) for type_, count in
+                   conn.execute("SELECT type, COUNT(*) FROM firm_alerts GROUP BY type"))
+    return summary
+
+
+def test_migrated_database_gets_a_consistent_summary(tmp_path):
+    path = tmp_path / "nova.sqlite3"
+    old = sqlite3.connect(path)
+    old.executescript(PRE_SUMMARY_SCHEMA)
+    old.executemany(
+        "INSERT INTO clients (id, name, omzet_ytd, winst_ytd, openstaand, status) VALUES (?, ?, ?, ?, ?, ?)",
+        [("CL001", "Bakkerij de Korenaar", 250000.0, -12000.0, 18000.0, "actief"),
+         ("CL002", "Jansen Bouw", 1200000.0, 85000.0, 0.0, "actief"),
+         ("CL003", "Studio Noord", 90000.0, 4000.0, 2500.0, "review")],
+    )
+    old.executemany(
+        "INSERT INTO firm_alerts (client_id, type, client, message, time) VALUES (?, ?, ?, ?, ?)",
+        [("CL001", "urgent", "Bakkerij de Korenaar", "Negatief resultaat", "2 uur geleden"),
+         ("CL002", "warning", "Jansen Bouw", "BTW-aangifte", "1 dag geleden"),
+         ("CL003", "info", "Studio Noord", "Jaarrekening", "3 dagen geleden")],
+    )
+    old.commit()
+    old.close()
+
+    init_db(path, seed=False)
+    conn = connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM firm_alerts WHERE rule IS NULL").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM firm_alerts WHERE client_id = 'CL001'").fetchone()[0] > 0
+        summary = firm_summary(conn)
+        assert {metric: value for metric, value in summary.items() if value} == expected_summary(conn)
+        assert summary["clients"] == 3
+    finally:
+        conn.close()
@@ -0,0 +1,59 @@
+import pytest
+
+from nova.db import SCHEMA, connect, insert_rows
+from nova.duplicates import MAX_DISTANCE, find_duplicates, index_upload, simhash
+
+INVOICE_TEXT = """Bouwmaterialen Jansen B.V. Industrieweg 12 3542 AD Utrecht
+Factuur Factuurnummer F2024-009 Factuurdatum 15-03-2024 Vervaldatum 14-04-2024
+Omschrijving Aantal Prijs Bedrag Cement 25 kg 40 8,50 340,00 Bakstenen rood 2000 0,45 900,00
+Zand gewassen 5 m3 32,00 160,00 Subtotaal 1.400,00 BTW 21% 294,00 Totaal te betalen 1.694,00
+IBAN NL91ABNA0417164300 BTW-nummer NL123456789B01 KvK 12345678
+Gelieve het totaalbedrag binnen 30 dagen over te maken onder vermelding van het factuurnummer"""
+
+OTHER_AMOUNTS = (INVOICE_TEXT.replace("F2024-009", "F2024-010").replace("1.400,00", "1.750,00")
+                 .replace("294,00", "367,50").replace("1.694,00", "2.117,50"))
+
+
+def distance(a, b):
+    return bin(simhash(a) ^ simhash(b)).count("1")
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(tmp_path / "nova.sqlite3")
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def test_stamped_copy_is_near_duplicate():
+    assert distance(INVOICE_TEXT, INVOICE_TEXT + " KOPIE") <= MAX_DISTANCE
+
+
+def test_other_amounts_are_not_near_duplicate():
+    assert distance(INVOICE_TEXT, OTHER_AMOUNTS) > MAX_DISTANCE
+
+
+def test_short_text_has_no_fingerprint():
+    assert simhash("Factuur") is None
+
+
+def test_booked_invoice_matches_on_normalized_supplier_and_number(conn):
+    insert_rows(conn, "invoices", [{"client_id": "CL001", "id": "F2024-009", "supplier": "Bouwmaterialen Jansen B.V.",
+                                    "amount": 1400.0, "vat": 294.0, "date": "2024-03-15"}])
+    fields = {"supplier": "BOUWMATERIALEN JANSEN", "invoice_number": "f 2024/009", "total": 99.0}
+    assert find_duplicates(conn, "CL001", fields) == [
+        {"source": "invoice", "ref": "F2024-009", "label": "factuur F2024-009",
+         "reason": "zelfde leverancier en factuurnummer"},
+    ]
+    assert find_duplicates(conn, "CL002", fields) == []
+
+
+def test_upload_matches_on_fingerprint_only_for_the_same_date(conn):
+    fields = {"supplier": "Jansen", "invoice_number": None, "date": "2024-03-15"}
+    index_upload(conn, "CL001", 1, fields, simhash(INVOICE_TEXT))
+    copy = simhash(INVOICE_TEXT + " KOPIE")
+    [found] = find_duplicates(conn, "CL001", {"date": "2024-03-15"}, copy)
+    assert (found["source"], found["ref"], found["reason"]) == ("upload", "1", "vrijwel identieke inhoud")
+    assert find_duplicates(conn, "CL001", {"date": "2024-04-15"}, copy) == []
+    assert find_duplicates(conn, "CL001", {"date": "2024-03-15"}, copy, exclude=("upload", "1")) == []
@@ -0,0 +1,102 @@
+import pytest
+
+from nova.extraction import ENGINE_VERSION, FIELDS, extract_invoice, extract_invoice_file, parse_amounts, parse_date
+from test_pdf import pdf, text
+
+INVOICE = text(
+    (50, 790, 18, "Bouwmaterialen Jansen B.V."),
+    (50, 772, 9, "Industrieweg 12, 3542 AD Utrecht"),
+    (50, 700, 10, "Aan:"),
+    (50, 686, 10, "Café De Jager"),
+    (50, 640, 10, "Factuurnummer: F2024-0117"),
+    (350, 640, 10, "Factuurdatum: 15-03-2024"),
+    (350, 626, 10, "Betalingstermijn: 30 dagen"),
+    (50, 560, 10, "Cement 25 kg"), (450, 560, 10, "1.000,00"),
+    (300, 500, 10, "Subtotaal"), (450, 500, 10, "1.000,00"),
+    (300, 486, 10, "BTW 21%"), (450, 486, 10, "210,00"),
+    (300, 472, 10, "Totaal te betalen"), (450, 472, 10, "1.210,00"),
+    (50, 420, 9, "IBAN: NL91 ABNA 0417 1643 00"),
+    (50, 406, 9, "BTW-nummer: NL123456782B01"), (300, 406, 9, "KvK: 12345678"),
+)
+
+
+def test_parse_amounts_and_dates():
+    assert parse_amounts("1.234,56 of 1,234.56 of 99,- en -12,50 bij 21% of 21,00 %") == [1234.56, 1234.56, 99.0, -12.5]
+    assert parse_amounts("factuur 2024 regel 3") == []
+    assert parse_date("Datum: 15-03-2024") == "2024-03-15"
+    assert parse_date("2024-03-15") == "2024-03-15"
+    assert parse_date("14 april 2024") == parse_date("14 apr. 2024") == "2024-04-14"
+    assert parse_date("31-02-2024, daarna 01/03/2024") == "2024-03-01"
+    assert parse_date("geen datum") is None
+
+
+def test_fields_of_a_text_invoice():
+    result = extract_invoice("factuur.pdf", pdf(INVOICE, compress=True))
+    assert (result["engine"], result["text_layer"], result["pages"]) == (ENGINE_VERSION, True, 1)
+    assert set(result["fields"]) == set(FIELDS)
+    assert {name: value for name, value in result["fields"].items() if value is not None} == {
+        "supplier": "Bouwmaterialen Jansen B.V.",
+        "invoice_number": "F2024-0117",
+        "date": "2024-03-15",
+        "due_date": "2024-04-14",
+        "amount": 1000.0,
+        "vat": 210.0,
+        "vat_rate": 21.0,
+        "total": 1210.0,
+        "iban": "NL91ABNA0417164300",
+        "btw_number": "NL123456782B01",
+        "kvk": "12345678",
+    }
+    confidence = result["field_confidence"]
+    # Subtotal, VAT and total add up, the IBAN is labelled and the due date follows from the payment term
+    assert confidence["amount"] == confidence["vat"] == confidence["total"] == 0.98
+    assert (confidence["iban"], confidence["due_date"]) == (0.98, 0.75)
+    assert result["confidence"] > 0.9
+    assert result["fingerprint"] is not None
+
+
+def test_totals_that_do_not_add_up_lower_the_confidence():
+    wrong = INVOICE.replace(b"(1.210,00)", b"(1.250,00)")
+    result = extract_invoice("factuur.pdf", pdf(wrong))
+    assert result["fields"]["total"] == 1250.0
+    assert result["field_confidence"]["total"] < 0.7
+
+
+def test_missing_total_follows_from_subtotal_and_vat():
+    lines = INVOICE.split(b"\n")
+    partial = b"\n".join(line for line in lines if b"Totaal te betalen" not in line and b"(1.210,00)" not in line)
+    result = extract_invoice("factuur.pdf", pdf(partial))
+    assert result["fields"]["total"] == 1210.0
+    assert result["field_confidence"]["total"] < result["field_confidence"]["amount"]
+
+
+def test_addressee_is_not_the_supplier():
+    # Without the addressee block the customer's name would win on its legal form
+    letterhead = text((50, 790, 16, "Drukkerij Visser"), (50, 700, 10, "Aan:"), (50, 686, 12, "Café De Jager B.V."),
+                      (50, 640, 10, "Factuurnummer: F-77"), (50, 626, 10, "Factuurdatum: 1 maart 2024"))
+    result = extract_invoice("factuur.pdf", pdf(letterhead))
+    assert result["fields"]["supplier"] == "Drukkerij Visser"
+    unlabelled = letterhead.replace(b"(Aan:)", b"(Contact)")
+    assert extract_invoice("factuur.pdf", pdf(unlabelled))["fields"]["supplier"] == "Café De Jager B.V."
+
+
+def test_documents_without_text_layer():
+    scan = extract_invoice("scan.pdf", pdf(b"q 595 0 0 842 0 0 cm 0 0 m 595 842 l S Q\n"))
+    assert (scan["text_layer"], scan["pages"], scan["confidence"]) == (False, 1, 0)
+    assert "scan" in scan["note"]
+    photo = extract_invoice("foto.jpg", b"\xff\xd8\xff\xe0 JFIF")
+    assert (photo["text_layer"], photo["pages"]) == (False, 0)
+    assert all(value is None for value in photo["fields"].values())
+
+
+def test_unreadable_files_are_rejected():
+    with pytest.raises(ValueError, match="leeg bestand"):
+        extract_invoice("leeg.pdf", b"")
+    with pytest.raises(ValueError, match="PDF niet leesbaar"):
+        extract_invoice("kapot.pdf", b"%PDF-1.4\nniets bruikbaars")
+
+
+def test_extract_from_a_stored_file(tmp_path):
+    path = tmp_path / "factuur.pdf"
+    path.write_bytes(pdf(INVOICE))
+    assert extract_invoice_file(str(path)) == extract_invoice("factuur.pdf", pdf(INVOICE))
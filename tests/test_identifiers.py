@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from nova.identifiers import iban_valid, ibans_valid
+
+VALID = [
+    "NL91ABNA0417164300",
+    "nl91 abna 0417 1643 00",
+    "GB82WEST12345698765432",
+    "DE89370400440532013000",
+    "BE68539007547034",
+    "FR1420041010050500013M02606",
+    "MT84MALT011000012345MTLCAST001S",  # Country without a known length
+]
+INVALID = [
+    "NL45INGB0123456789",  # Check digits
+    "NL91ABNA041716430",  # Length for NL
+    "NL91ABNA04171643001",
+    "BE68 5390 0754 7035",
+    "NL91-ABNA-0417-1643-00",
+    "NLXXABNA0417164300",
+    "91NLABNA0417164300",
+    "NL91ABNÄ0417164300",
+    "NL91",
+    "MT84MALT011000012345MTLCAST001S1234",  # Longer than 34
+    "",
+    None,
+]
+
+
+@pytest.mark.parametrize("value", VALID)
+def test_valid_iban(value):
+    assert iban_valid(value)
+
+
+@pytest.mark.parametrize("value", INVALID)
+def test_invalid_iban(value):
+    assert not iban_valid(value)
+
+
+def test_batch_check_agrees_with_single_check():
+    assert list(ibans_valid(VALID + INVALID)) == [True] * len(VALID) + [False] * len(INVALID)
+    assert ibans_valid([]).shape == (0,)
+
+
+def test_batch_check_agrees_on_mutations():
+    rng = random.Random(97)
+    values = []
+    for iban in VALID[:6]:
+        iban = iban.replace(" ", "").upper()
+        for _ in range(50):
+            chars = list(iban)
+            position = rng.randrange(len(chars))
+            chars[position] = rng.choice("0123456789ABCXYZ")
+            values.append("".join(chars))
+    assert list(ibans_valid(values)) == [iban_valid(value) for value in values]
@@ -0,0 +1,113 @@
+import io
+import os
+import threading
+import time
+
+import pytest
+
+from nova import jobs
+from nova.db import get_connection, insert_rows
+
+
+def _handler(path):
+    """Crashes its process for a file that starts with b"crash", takes a moment for the others"""
+    with open(path, "rb") as handle:
+        content = handle.read()
+    if content.startswith(b"crash"):
+        time.sleep(0.5)
+        os._exit(1)
+    time.sleep(1)
+    return {"content": content.decode()}
+
+
+def upload(name, content):
+    stream = io.BytesIO(content)
+    stream.name = name
+    return stream
+
+
+def wait_for(batch, timeout=60):
+    conn = get_connection()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        rows = conn.execute("SELECT filename, status, result, error FROM ingest_jobs WHERE batch = ? ORDER BY id",
+                            (batch,)).fetchall()
+        if all(row["status"] not in jobs.PENDING_STATUSES for row in rows):
+            return {row["filename"]: dict(row) for row in rows}
+        time.sleep(0.1)
+    raise TimeoutError(batch)
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    return get_connection()
+
+
+@pytest.fixture
+def worker_pools(database, monkeypatch):
+    monkeypatch.setattr(jobs, "JOB_WORKERS", 3)
+    monkeypatch.setitem(jobs.HANDLERS, "test", ("ARIA", "test", _handler, "test-1", None))
+    yield
+    for pool in (jobs._pool, jobs._processes):
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+    jobs._pool = jobs._processes = None
+
+
+def test_crash_fails_only_its_own_job(worker_pools):
+    batch = jobs.submit("CL001", "test", [upload("a.pdf", b"first"), upload("crash.pdf", b"crash"),
+                                          upload("b.pdf", b"second")])
+    results = wait_for(batch)
+    assert results["crash.pdf"]["status"] == "failed"
+    assert results["crash.pdf"]["error"] == "analyseproces afgebroken"
+    assert (results["a.pdf"]["status"], results["b.pdf"]["status"]) == ("done", "done")
+    assert '"content": "second"' in results["b.pdf"]["result"]
+
+    # The broken pool was replaced; later jobs run on a fresh one
+    results = wait_for(jobs.submit("CL001", "test", [upload("c.pdf", b"third")]))
+    assert results["c.pdf"]["status"] == "done"
+
+
+def test_pool_start_resumes_left_over_jobs_in_the_background(worker_pools, tmp_path, monkeypatch):
+    path = tmp_path / "left-over.pdf"
+    path.write_bytes(b"left over")
+    conn = get_connection()
+    with conn:
+        conn.execute("INSERT INTO ingest_jobs (client_id, kind, batch, filename, path, status, created) "
+                     "VALUES ('CL001', 'test', 'old', 'left-over.pdf', ?, 'running', '2024-01-01T00:00:00')",
+                     (str(path),))
+    adopted = threading.Event()
+
+    def slow_adopt(conn, store):
+        time.sleep(1)
+        adopted.set()
+
+    monkeypatch.setattr(jobs, "adopt_uploads", slow_adopt)
+    started = time.monotonic()
+    jobs.executor()
+    assert time.monotonic() - started < 0.5
+    assert wait_for("old")["left-over.pdf"]["status"] == "done"
+    assert adopted.is_set()
+
+
+def extracted(supplier, iban="NL91ABNA0417164300"):
+    fields = dict.fromkeys(("supplier", "invoice_number", "date", "amount", "vat", "total", "iban"))
+    fields.update(supplier=supplier, iban=iban, invoice_number="F-77", amount=100.0)
+    confidence = {"supplier": 0.6 if supplier else 0.0, "iban": 1.0, "invoice_number": 0.9, "amount": 0.9}
+    return {"fields": fields, "field_confidence": confidence, "confidence": 0.5}
+
+
+@pytest.mark.parametrize("supplier, expected, confidence", [
+    (None, "Bouwmaterialen Jansen B.V.", 0.95),
+    ("BOUWMATERIALEN JANSEN", "BOUWMATERIALEN JANSEN", 0.95),
+    ("Groothandel Jansen B.V.", "Groothandel Jansen B.V.", 0.6),
+])
+def test_booking_history_never_replaces_the_supplier_on_the_document(database, supplier, expected, confidence):
+    insert_rows(database, "invoices", [{"client_id": "CLX01", "id": "F-1", "supplier": "Bouwmaterialen Jansen B.V.",
+                                        "iban": "NL91ABNA0417164300", "amount": 80.0, "date": "2024-02-01",
+                                        "rgs": "WBedHui", "category": "Huisvesting"}])
+    database.commit()
+    result = jobs._complete_invoice(database, {"client_id": "CLX01", "id": 1}, extracted(supplier))
+    assert result["fields"]["supplier"] == expected
+    assert result["field_confidence"]["supplier"] == confidence
@@ -0,0 +1,91 @@
+import pytest
+
+from nova.matching import match_lines, status_counts
+
+PO_LINES = [
+    # po_id, line, supplier, product, quantity, unit_price
+    ("PO-1", 1, "Jansen B.V.", "Cement", 10, 8.50),
+    ("PO-1", 2, "Jansen B.V.", "Zand", 5, 32.00),
+    ("PO-2", 1, "De Vries", "Transport", 1, 250.00),
+    ("PO-3", 1, "De Vries", "Steigers", 10, 12.00),
+]
+RECEIPTS = [
+    # po_id, po_line, quantity
+    ("PO-1", 1, 6),
+    ("PO-1", 1, 4),
+    ("PO-1", 2, 5),
+    ("PO-3", 1, 4),
+]
+
+
+def line(invoice_id, line_no, po_id, po_line, quantity, unit_price, product=None, supplier="Jansen BV",
+         date="2024-03-01"):
+    return (invoice_id, line_no, supplier, po_id, po_line, product, quantity, unit_price, date, date[:7])
+
+
+def match(*lines, **tolerances):
+    lines, invoices = match_lines(lines, PO_LINES, RECEIPTS, **tolerances)
+    return lines.set_index(["invoice_id", "line"]), invoices.set_index("invoice_id")
+
+
+def test_matching_lines_on_normalized_supplier_and_po():
+    lines, invoices = match(line("F1", 1, "po 1", 1, 10, 8.50), line("F1", 2, "PO-1", None, 5, 32.00, product="zand"))
+    assert list(lines["status"]) == ["match", "match"]
+    assert invoices.loc["F1", "status"] == "match"
+    assert invoices.loc["F1", "amount"] == pytest.approx(245.0)
+
+
+def test_price_within_tolerance_matches():
+    lines, _ = match(line("F1", 1, "PO-1", 1, 10, 8.60))
+    assert lines.loc[("F1", 1), "status"] == "match"
+    lines, _ = match(line("F1", 1, "PO-1", 1, 10, 8.60), price_tolerance=0.0)
+    assert lines.loc[("F1", 1), "reason"] == "prijs wijkt af"
+
+
+def test_po_line_billed_twice_is_over_billed():
+    lines, invoices = match(line("F1", 1, "PO-1", 1, 10, 8.50, date="2024-03-01"),
+                            line("F2", 1, "PO-1", 1, 10, 8.50, date="2024-03-15"))
+    assert lines.loc[("F1", 1), "status"] == "match"
+    assert lines.loc[("F2", 1), "reason"] == "meer gefactureerd dan besteld"
+    assert invoices.loc["F2", "status"] == "exception"
+    assert status_counts(invoices) == {"match": 1, "partial": 0, "exception": 1}
+
+
+def test_quantity_tolerance_allows_over_billing():
+    lines, _ = match(line("F1", 1, "PO-1", 1, 11, 8.50))
+    assert lines.loc[("F1", 1), "reason"] == "meer gefactureerd dan besteld"
+    lines, _ = match(line("F1", 1, "PO-1", 1, 11, 8.50), quantity_tolerance=0.1)
+    assert lines.loc[("F1", 1), "status"] == "match"
+
+
+def test_goods_not_received_is_partial():
+    lines, invoices = match(line("F1", 1, "PO-2", 1, 1, 250.00, supplier="De Vries"))
+    assert lines.loc[("F1", 1), "reason"] == "nog niet ontvangen"
+    assert invoices.loc["F1", "status"] == "partial"
+
+
+def test_billing_ahead_of_receipts_is_partial():
+    lines, invoices = match(line("F1", 1, "PO-3", 1, 4, 12.00, supplier="De Vries"),
+                            line("F2", 1, "PO-3", 1, 2, 12.00, supplier="De Vries", date="2024-03-02"))
+    assert list(lines["status"]) == ["match", "partial"]
+    assert lines.loc[("F2", 1), "reason"] == "meer gefactureerd dan ontvangen"
+    assert invoices.loc["F2", "status"] == "partial"
+
+
+def test_exceptions_report_the_first_reason_and_the_worst_status():
+    lines, invoices = match(line("F1", 1, None, None, 1, 10.0),
+                            line("F1", 2, "PO-9", 1, 1, 10.0),
+                            line("F1", 3, "PO-2", 1, 1, 250.0),
+                            line("F1", 4, "PO-1", 3, 1, 10.0),
+                            line("F1", 5, "PO-1", 2, 5, 32.00))
+    assert list(lines["reason"]) == ["geen inkooporder", "inkooporder onbekend", "inkooporder van andere leverancier",
+                                     "regel niet op inkooporder", ""]
+    assert invoices.loc["F1", "status"] == "exception"
+    assert invoices.loc["F1", "reasons"] == ("geen inkooporder, inkooporder onbekend, "
+                                             "inkooporder van andere leverancier, regel niet op inkooporder")
+
+
+def test_empty_input():
+    lines, invoices = match_lines([], [], [])
+    assert lines.empty and invoices.empty
+    assert status_counts(invoices) == {"match": 0, "partial": 0, "exception": 0}
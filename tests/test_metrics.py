@@ -0,0 +1,99 @@
+import pytest
+
+from nova import metrics as metrics_module
+from nova.metrics import BUCKETS, MetricsStore, bucket_index, bucket_upper, percentile, track
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def store(clock):
+    return MetricsStore(clock)
+
+
+def test_buckets_are_logarithmic():
+    assert bucket_index(0) == bucket_index(0.001) == 0
+    assert bucket_upper(0) == 0.001
+    for seconds in (0.0015, 0.02, 0.7, 3.3, 45.0):
+        index = bucket_index(seconds)
+        # Ten buckets per decade: the bucket bound is at most 26% above the sample
+        assert bucket_upper(index - 1) < seconds <= bucket_upper(index) < seconds * 1.26
+    assert bucket_index(10 ** 6) == BUCKETS - 1
+
+
+def test_percentile_of_a_histogram():
+    histogram = [0] * BUCKETS
+    assert percentile(histogram, 0.5) is None
+    histogram[bucket_index(0.05)] = 90
+    histogram[bucket_index(2.0)] = 10
+    assert percentile(histogram, 0.5) == pytest.approx(bucket_upper(bucket_index(0.05)))
+    assert percentile(histogram, 0.9) == pytest.approx(bucket_upper(bucket_index(0.05)))
+    assert percentile(histogram, 0.95) == pytest.approx(bucket_upper(bucket_index(2.0)))
+
+
+def test_summary_counts_errors_and_latency(store):
+    for _ in range(18):
+        store.record("ARIA", "factuur", 0.2)
+    store.record("ARIA", "factuur", 5.0, ok=False)
+    store.record("ARIA", "bankregel", 5.0, ok=False)
+    summary = store.summary("ARIA", "minute")
+    assert (summary["count"], summary["errors"], summary["error_rate"]) == (20, 2, 0.1)
+    assert summary["per_minute"] == 20
+    assert summary["busy"] == pytest.approx((18 * 0.2 + 10) / 60)
+    assert summary["p50"] == pytest.approx(bucket_upper(bucket_index(0.2)))
+    assert summary["p99"] == pytest.approx(bucket_upper(bucket_index(5.0)))
+    assert store.actions() == {("ARIA", "factuur"): 19, ("ARIA", "bankregel"): 1}
+
+
+def test_unknown_agent_has_an_empty_summary(store):
+    summary = store.summary("NOVA", "day")
+    assert (summary["count"], summary["error_rate"], summary["busy"]) == (0, 0.0, 0.0)
+    assert summary["p50"] is None
+
+
+def test_samples_leave_their_window(store, clock):
+    store.record("ARIA", "factuur", 0.1)
+    clock.now += 59
+    store.record("ARIA", "factuur", 0.1)
+    assert store.summary("ARIA", "minute")["count"] == 2
+    clock.now += 2
+    assert store.summary("ARIA", "minute")["count"] == 1
+    assert store.summary("ARIA", "hour")["count"] == 2
+    clock.now += 3 * 3600
+    assert store.summary("ARIA", "hour")["count"] == 0
+    assert store.summary("ARIA", "day")["count"] == 2
+    clock.now += 24 * 3600
+    assert store.summary("ARIA", "day")["count"] == 0
+    # Totals since start are kept
+    assert store.actions() == {("ARIA", "factuur"): 2}
+
+
+def test_reused_slot_starts_empty(store, clock):
+    store.record("ARIA", "factuur", 0.1, ok=False)
+    # Exactly one ring round later the same minute slot comes round again
+    clock.now += 60
+    store.record("ARIA", "factuur", 0.1)
+    summary = store.summary("ARIA", "minute")
+    assert (summary["count"], summary["errors"]) == (1, 0)
+
+
+def test_track_records_the_block_and_errors(clock, monkeypatch):
+    store = MetricsStore(clock)
+    monkeypatch.setattr(metrics_module, "metrics", store)
+    with track("ARIA", "factuur"):
+        pass
+    with pytest.raises(ValueError), track("ARIA", "factuur"):
+        raise ValueError("onleesbaar")
+    summary = store.summary("ARIA", "minute")
+    assert (summary["count"], summary["errors"]) == (2, 1)
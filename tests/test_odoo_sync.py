@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+import pytest
+
+from nova.db import SCHEMA, connect
+from nova.odoo.client import OdooClient, get_client
+from nova.odoo.fake_server import FakeOdooServer, demo_records
+from nova.odoo.sync import SYNC_MODELS, SyncEngine
+
+RECORDS = 50
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(tmp_path / "nova.sqlite3")
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def server():
+    server = FakeOdooServer(demo_records(RECORDS))
+    # Every accepted TCP connection goes through process_request
+    server.connections = 0
+    process_request = server.httpd.process_request
+
+    def counting(request, client_address):
+        server.connections += 1
+        return process_request(request, client_address)
+
+    server.httpd.process_request = counting
+    with server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = OdooClient(server.url, "nova", "admin", "admin", page_size=20)
+    yield client
+    client.close()
+
+
+def stored(conn, model, odoo_id):
+    return conn.execute(
+        "SELECT write_date, active, deleted, data FROM odoo_records WHERE client_id = 'CL001' AND model = ? "
+        "AND odoo_id = ?", (model, odoo_id),
+    ).fetchone()
+
+
+def test_full_sync_stores_every_record(conn, server, client):
+    results = SyncEngine(client, conn).sync("CL001")
+    assert {model: (result["status"], result["records"], result["incremental"])
+            for model, result in results.items()} == {model: ("ok", RECORDS, False) for model in SYNC_MODELS}
+    counts = dict(conn.execute(
+        "SELECT model, COUNT(*) FROM odoo_records WHERE client_id = 'CL001' AND deleted = 0 GROUP BY model"
+    ).fetchall())
+    assert counts == {model: RECORDS for model in SYNC_MODELS}
+    for model in SYNC_MODELS:
+        last = max(server.records[model], key=lambda record: (record["write_date"], record["id"]))
+        state = conn.execute("SELECT watermark, watermark_id FROM sync_state WHERE client_id = 'CL001' AND model = ?",
+                             (model,)).fetchone()
+        assert tuple(state) == (last["write_date"], last["id"])
+    modules = dict(conn.execute("SELECT naam, details FROM sync_modules WHERE client_id = 'CL001'").fetchall())
+    assert modules["Grootboek"] == "50 gewijzigd, 0 verwijderd"
+
+
+def test_resume_fetches_only_records_changed_after_the_watermark(conn, server, client):
+    engine = SyncEngine(client, conn)
+    engine.sync("CL001")
+    server.update_record("account.move", 3, amount_total=999.0)
+    server.calls.clear()
+
+    results = engine.sync("CL001")
+    assert results["account.move"]["records"] == 1
+    assert results["account.move"]["incremental"]
+    assert all(results[model]["records"] == 0 for model in SYNC_MODELS if model != "account.move")
+    assert '"amount_total": 999.0' in stored(conn, "account.move", 3)["data"]
+    # One page from the watermark, not a re-read of the model
+    assert [model for service, method, model in server.calls].count("account.move") == 1
+
+
+def test_archived_record_is_kept_as_inactive(conn, server, client):
+    engine = SyncEngine(client, conn)
+    engine.sync("CL001")
+    server.update_record("crm.lead", 5, active=False)
+
+    results = engine.sync("CL001")
+    assert results["crm.lead"]["records"] == 1
+    row = stored(conn, "crm.lead", 5)
+    assert (row["active"], row["deleted"]) == (0, 0)
+
+
+def test_hard_delete_is_found_by_reconciliation(conn, server, client):
+    SyncEngine(client, conn).sync("CL001")
+    server.delete_record("purchase.order", 7)
+
+    # Within the reconcile interval the deletion stays unnoticed
+    results = SyncEngine(client, conn).sync("CL001")
+    assert results["purchase.order"]["deleted"] == 0
+    assert stored(conn, "purchase.order", 7)["deleted"] == 0
+
+    results = SyncEngine(client, conn, reconcile_interval=timedelta(0)).sync("CL001")
+    assert results["purchase.order"]["deleted"] == 1
+    assert stored(conn, "purchase.order", 7)["deleted"] == 1
+    details = conn.execute("SELECT details FROM sync_modules WHERE client_id = 'CL001' AND naam = 'Inkooporders'")
+    assert details.fetchone()[0] == "0 gewijzigd, 1 verwijderd"
+
+
+def test_requests_reuse_pooled_connections(conn, server, client):
+    engine = SyncEngine(client, conn)
+    engine.sync("CL001")
+    engine.sync("CL001")
+    # Three pages per model on the first run, one per model on the second, plus login and reconciliation
+    assert len(server.calls) > 20
+    assert server.connections <= engine.max_workers
+
+
+def test_shared_client_per_connection_settings(server):
+    first = get_client(server.url, "nova", "admin", "admin")
+    assert get_client(server.url, "nova", "admin", "admin") is first
+    assert get_client(server.url, "nova", "admin", "new-key") is not first
@@ -0,0 +1,124 @@
+import zlib
+
+import pytest
+
+from nova.pdf import PdfError, read_pages
+
+HELVETICA = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+
+
+def text(*items):
+    """Content stream showing each (x, y, size, string) in /F1"""
+    out = b""
+    for x, y, size, value in items:
+        value = value.encode("cp1252").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+        out += b"BT /F1 %d Tf %d %d Td (%s) Tj ET\n" % (size, x, y, value)
+    return out
+
+
+def pdf(*contents, compress=False, packed=False, font=HELVETICA):
+    """PDF with one A4 page per content stream and /F1 in the inherited resources, without cross-reference table
+
+    ``compress`` deflates the content streams, ``packed`` puts the dictionaries in a compressed object stream.
+    """
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: font}
+    kids = []
+    for content in contents:
+        num = max(objects) + 1
+        data = zlib.compress(content) if compress else content
+        objects[num] = (b"<< /Length %d%s >>\nstream\n" % (len(data), b" /Filter /FlateDecode" if compress else b"")
+                        + data + b"\nendstream")
+        objects[num + 1] = b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % num
+        kids.append(b"%d 0 R" % (num + 1))
+    objects[2] = (b"<< /Type /Pages /Kids [%s] /Count %d /MediaBox [0 0 595 842] "
+                  b"/Resources << /Font << /F1 3 0 R >> >> >>" % (b" ".join(kids), len(kids)))
+    if packed:
+        number, inside = max(objects) + 1, {num: value for num, value in objects.items() if b"stream" not in value}
+        header, body = b"", b""
+        for num, value in inside.items():
+            header += b"%d %d " % (num, len(body))
+            body += value + b"\n"
+            del objects[num]
+        data = zlib.compress(header + body)
+        objects[number] = (
+            b"<< /Type /ObjStm /N %d /First %d /Length %d /Filter /FlateDecode >>\nstream\n"
+            % (len(inside), len(header), len(data)) + data + b"\nendstream")
+    out = b"%PDF-1.5\n"
+    for num, value in sorted(objects.items()):
+        out += b"%d 0 obj\n" % num + value + b"\nendobj\n"
+    return out + b"trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+
+
+def texts(pages):
+    return [[cell.text for cell in line.cells] for page in pages for line in page.lines]
+
+
+LAYOUT = text((50, 700, 10, "Omschrijving"), (400, 700, 10, "Bedrag"),
+              (50, 680, 10, "Cement 25 kg"), (400, 680, 10, "412,50"),
+              (50, 760, 16, "Bouwmaterialen Jansen B.V."))
+
+
+def test_lines_top_to_bottom_cells_left_to_right():
+    (page,) = read_pages(pdf(LAYOUT))
+    assert (page.width, page.height) == (595, 842)
+    assert texts([page]) == [["Bouwmaterialen Jansen B.V."], ["Omschrijving", "Bedrag"], ["Cement 25 kg", "412,50"]]
+    amount = page.lines[2].cells[1]
+    # Helvetica without Widths: half an em per character
+    assert (amount.x0, amount.x1, amount.size) == (400, 430, 10)
+
+
+def test_compressed_and_packed_objects():
+    expected = texts(read_pages(pdf(LAYOUT)))
+    assert texts(read_pages(pdf(LAYOUT, compress=True))) == expected
+    assert texts(read_pages(pdf(LAYOUT, compress=True, packed=True))) == expected
+
+
+def test_runs_close_together_join_one_cell():
+    content = (b"BT /F1 10 Tf 50 700 Td [(Fac) -20 (tuur)] TJ ( 2024) Tj ET\n"
+               b"BT /F1 10 Tf 50 680 Td <4b764b> Tj 18 0 Td (12345678) Tj ET\n"
+               b"BT /F1 10 Tf 1 0 0 1 50 660 Tm (Regel) Tj 0 -14 Td (\\(volgende\\) \\351\\200) Tj ET\n")
+    assert texts(read_pages(pdf(content))) == [["Factuur 2024"], ["KvK 12345678"], ["Regel"], ["(volgende) é€"]]
+
+
+def test_pages_and_page_limit():
+    pages = read_pages(pdf(text((50, 700, 10, "Pagina 1")), text((50, 700, 10, "Pagina 2"))))
+    assert texts(pages) == [["Pagina 1"], ["Pagina 2"]]
+    assert len(read_pages(pdf(*[text((50, 700, 10, "x"))] * 3), max_pages=2)) == 2
+
+
+def test_composite_font_through_its_tounicode_cmap():
+    cmap = (b"begincmap\n1 begincodespacerange <0000> <FFFF> endcodespacerange\n"
+            b"2 beginbfchar <0001> <0046> <0002> <00E9> endbfchar\n"
+            b"1 beginbfrange <0010> <0012> <0041> endbfrange\nendcmap")
+    font = (b"<< /Type /Font /Subtype /Type0 /BaseFont /Subset /Encoding /Identity-H /ToUnicode 20 0 R "
+            b"/DescendantFonts [<< /Subtype /CIDFontType2 /DW 600 >>] >>\nendobj\n"
+            b"20 0 obj\n<< /Length %d >>\nstream\n" % len(cmap) + cmap + b"\nendstream")
+    content = b"BT /F1 10 Tf 50 700 Td <0001000200100011001200FF> Tj ET\n"
+    (page,) = read_pages(pdf(content, font=font))
+    assert texts([page]) == [["FéABC"]]
+    assert page.lines[0].cells[0].x1 == 50 + 6 * 6
+
+
+def test_page_without_text_layer_is_empty():
+    scan = b"q 595 0 0 842 0 0 cm 0 0 m 595 842 l S Q\nBI /W 1 /H 1 /BPC 8 /CS /G ID \x00\xff( EI\n"
+    (page,) = read_pages(pdf(scan))
+    assert page.lines == []
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"\x89PNG\r\n\x1a\n", "geen PDF-bestand"),
+    (b"%PDF-1.4\n1 0 obj\n<< /Filter /Standard >>\nendobj\ntrailer << /Encrypt 1 0 R /Root 2 0 R >>", "beveiligd"),
+    (b"%PDF-1.4\nniets bruikbaars", "documentstructuur ontbreekt"),
+])
+def test_unreadable_files(data, message):
+    with pytest.raises(PdfError, match=message):
+        read_pages(data)
+
+
+def test_damaged_file_keeps_what_is_readable():
+    data = pdf(LAYOUT, compress=True)
+    # Wrong stream length and a truncated end: the stream is found by its endstream and the trailer by scanning
+    damaged = data.replace(b"/Length ", b"/Length 9").split(b"trailer")[0]
+    assert texts(read_pages(damaged)) == texts(read_pages(data))
+    garbage = pdf(b"BT /F1 10 Tf 50 700 Td (ok) Tj ET\nBT /F9 10 Tf ] >> (kapot Tj 1 2 Td\n")
+    assert texts(read_pages(garbage))[0] == ["ok"]
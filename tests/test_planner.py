@@ -0,0 +1,88 @@
+import pytest
+
+from nova import planner
+from nova.db import SCHEMA, connect, insert_rows
+
+CAPACITY = {"Anna": 100, "Bram": 100, "Carla": 50}
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    conn = connect()
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def utilisation(hours, assignment, capacity):
+    member_loads = planner.loads(hours, assignment, capacity)
+    return {member: member_loads[member] / capacity[member] for member in capacity}
+
+
+def test_plan_balances_utilisation():
+    hours = {f"CL{i:03d}": float(h) for i, h in enumerate([40, 30, 25, 20, 20, 15, 10, 10, 5, 5, 5, 5])}
+    assignment = planner.plan(hours, CAPACITY)
+    assert set(assignment) == set(hours)
+    spread = utilisation(hours, assignment, CAPACITY)
+    assert max(spread.values()) - min(spread.values()) <= 0.1
+    # Biggest client first, to the first of the equally empty members
+    assert assignment["CL000"] == "Anna"
+
+
+def test_plan_keeps_clients_with_their_accountant():
+    hours = {"CL001": 20.0, "CL002": 20.0, "CL003": 10.0, "CL004": 2.0}
+    current = {"CL001": "Anna", "CL002": "Bram", "CL003": "Carla", "CL004": "Bram"}
+    assert planner.plan(hours, CAPACITY, current) == current
+    # Everything with Anna overloads her: only what fits near the average stays
+    overloaded = planner.plan(hours, CAPACITY, dict.fromkeys(hours, "Anna"))
+    assert overloaded["CL001"] == "Anna"
+    assert max(utilisation(hours, overloaded, CAPACITY).values()) <= 0.25
+
+
+def test_plan_without_capacity_is_empty():
+    hours = {"CL001": 10.0, "CL002": 5.0}
+    assert planner.plan(hours, {}) == {}
+    assert planner.plan(hours, {"Anna": 0}) == {}
+    assert set(planner.plan(hours, {"Anna": 0, "Bram": 100}, {"CL001": "Anna"}).values()) == {"Bram"}
+
+
+def test_suggest_picks_the_least_utilised_member():
+    member_loads = {"Anna": 90.0, "Bram": 40.0, "Carla": 10.0}
+    assert planner.suggest(10, member_loads, CAPACITY) == ("Carla", 0.4)
+    assert planner.suggest(10, member_loads, {"Anna": 100, "Bram": 100}) == ("Bram", 0.5)
+    assert planner.suggest(10, {}, {}) == (None, None)
+
+
+def test_loads_leave_out_unknown_members():
+    hours = {"CL001": 10.0, "CL002": 5.0, "CL003": 2.0}
+    assignment = {"CL001": "Anna", "CL002": "Anna", "CL003": "Oud-medewerker"}
+    assert planner.loads(hours, assignment, CAPACITY) == {"Anna": 15.0, "Bram": 0.0, "Carla": 0.0}
+
+
+def test_client_hours_from_the_database(conn):
+    insert_rows(conn, "clients", [{"id": "CL001", "name": "Jansen B.V.", "accountant": "Anna"},
+                                  {"id": "CL002", "name": "De Jager", "accountant": "Bram"}])
+    insert_rows(conn, "invoices", [{"client_id": "CL001", "id": f"F{i}", "amount": 10.0} for i in range(12)])
+    insert_rows(conn, "closing_periods", [{"client_id": "CL002", "period": "2024-03", "status": "open"},
+                                          {"client_id": "CL002", "period": "2024-02", "status": "afgesloten"}])
+    insert_rows(conn, "checklist_items", [
+        {"client_id": "CL002", "checklist": "closing", "period": period, "id": str(i), "status": status}
+        for i, (period, status) in enumerate([("2024-03", "pending"), ("2024-03", "pending"),
+                                              ("2024-03", "completed"), ("2024-02", "pending")])
+    ])
+    insert_rows(conn, "annual_statements", [{"client_id": "CL001", "boekjaar": "2023", "status": "review_bestuur"}])
+    conn.commit()
+
+    hours = planner.client_hours(conn)
+    remaining = planner.REMAINING_STAGE_HOURS["review_bestuur"]
+    assert hours["CL001"] == pytest.approx(planner.BASE_HOURS + 12 * planner.INVOICE_HOURS + remaining)
+    assert hours["CL002"] == pytest.approx(planner.BASE_HOURS + 2 * planner.CHECKLIST_ITEM_HOURS)
+    assert remaining == 4
+
+    first = planner.workload(conn)
+    assert planner.workload(conn) is first
+    assert first["current"] == {"CL001": "Anna", "CL002": "Bram"}
+    conn.execute("UPDATE clients SET accountant = 'Carla' WHERE id = 'CL002'")
+    conn.commit()
+    assert planner.workload(conn)["current"]["CL002"] == "Carla"
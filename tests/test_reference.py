@@ -0,0 +1,34 @@
+import pytest
+
+from nova.db import get_connection
+from nova.reference import CURRENT_BOEKJAAR, invalidate_reference, reference_data, rgs_name, vpb_tarieven
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    invalidate_reference()
+    yield get_connection()
+    invalidate_reference()
+
+
+def test_snapshot_is_shared_and_read_only(conn):
+    snapshot = reference_data()
+    assert reference_data() is snapshot
+    with pytest.raises(TypeError):
+        snapshot["ai_agents"]["ARIA"]["color"] = "#000000"
+
+
+def test_invalidation_reaches_the_lookups(conn):
+    assert rgs_name("WTestRek") is None
+    conn.execute("INSERT INTO rgs_lines (client_id, period, statement, code, name) "
+                 "VALUES ('CL001', '2024', 'wv', 'WTestRek', 'Testrekening')")
+    conn.commit()
+    assert rgs_name("WTestRek") is None
+    invalidate_reference()
+    assert rgs_name("WTestRek") == "Testrekening"
+
+
+def test_unknown_financial_year_gets_the_current_rates(conn):
+    assert vpb_tarieven("1999") == vpb_tarieven(CURRENT_BOEKJAAR)
+    assert vpb_tarieven(CURRENT_BOEKJAAR)["schijf_1"]["percentage"] == 19
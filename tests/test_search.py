@@ -0,0 +1,67 @@
+import pytest
+
+from nova.db import get_connection, insert_rows
+from nova.search import ClientSearchIndex, client_index, normalize, search_clients, trigrams
+
+CLIENTS = [
+    {"id": "CL001", "name": "Bouwbedrijf Jansen B.V.", "contact": "Peter de Vries", "kvk": "12345678",
+     "btw": "NL001234567B01", "sector": "Bouw"},
+    {"id": "CL002", "name": "Café De Jager", "contact": "Anna Jansen", "kvk": "23456789",
+     "btw": "NL002345678B01", "sector": "Horeca"},
+    {"id": "CL003", "name": "Jansen & Zonen Transport", "contact": "Karel Bos", "kvk": "34567890",
+     "btw": "NL003456789B01", "sector": "Transport"},
+    {"id": "CL004", "name": "Bakkerij Vermeulen", "contact": "Sanne Jager", "kvk": "45678901",
+     "btw": "NL004567890B01", "sector": "Food"},
+]
+
+
+def ids(clients):
+    return [client["id"] for client in clients]
+
+
+@pytest.fixture
+def index():
+    return ClientSearchIndex(CLIENTS)
+
+
+def test_normalize_and_trigrams():
+    assert normalize("Café De Jager-B.V.") == "cafe de jager b v "
+    assert trigrams("bos") == {"  b", " bo", "bos", "os "}
+
+
+def test_prefix_matches_rank_name_hits_first(index):
+    # CL003's name starts with Jansen; CL001 has it later in the name, CL002 as its contact
+    assert ids(index.search("jans", limit=3)) == ["CL003", "CL001", "CL002"]
+    # Equal scores follow the alphabetical order of the names
+    assert ids(index.search("jager", limit=2)) == ["CL004", "CL002"]
+
+
+def test_every_word_must_match(index):
+    assert ids(index.search("jansen trans", limit=1)) == ["CL003"]
+    assert ids(index.search("café jager", limit=1)) == ["CL002"]
+    assert ids(index.search("34567890", limit=1)) == ["CL003"]
+
+
+def test_fuzzy_matches_fill_up_after_the_prefix_hits(index):
+    assert ids(index.search("jans")) == ["CL003", "CL001", "CL002", "CL004"]
+    assert ids(index.search("vermeulan")) == ["CL004"]
+    assert ids(index.search("jansn")) == ["CL001", "CL002", "CL003"]
+    assert index.search("xyzzy") == []
+
+
+def test_empty_query(index):
+    assert index.search("  ") == []
+    assert index.search("!?") == []
+    assert len(index) == 4
+
+
+def test_index_follows_the_clients_table(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOVA_DB_PATH", str(tmp_path / "nova.sqlite3"))
+    conn = get_connection()
+    index = client_index()
+    assert client_index() is index
+    assert search_clients("Zwaluw") == []
+    insert_rows(conn, "clients", [{"id": "CL999", "name": "Zwaluw Installatietechniek", "status": "actief"}])
+    conn.commit()
+    assert client_index() is not index
+    assert ids(search_clients("zwaluw inst")) == ["CL999"]
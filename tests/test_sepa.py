@@ -0,0 +1,95 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+import pytest
+
+from nova.sepa import NAMESPACE, pain001, payment_batch, sepa_text
+
+NS = {"p": NAMESPACE}
+DEBTOR = {"name": "Bakkerij de Korenaar", "iban": "NL91ABNA0417164300", "bic": "ABNANL2A"}
+
+
+def invoice(id, amount, vat=0.0, iban="GB82 WEST 1234 5698 7654 32", due_date="2024-04-01", supplier="Jansen B.V.",
+            bic=None):
+    return {"id": id, "supplier": supplier, "amount": amount, "vat": vat, "iban": iban, "bic": bic,
+            "due_date": due_date}
+
+
+def parse(payments):
+    return ET.fromstring(b"".join(pain001(DEBTOR, payments, "NOVA-1", created=datetime(2024, 3, 1, 9, 30))))
+
+
+def test_sepa_text():
+    assert sepa_text("Café & Zoon <Brood>", 70) == "Cafe + Zoon Brood"
+    assert sepa_text("  Factuur   2024_001  ", 10) == "Factuur 20"
+    assert sepa_text(None, 70) == ""
+
+
+def test_unpayable_invoices_are_rejected_with_the_reason():
+    payments, rejected = payment_batch([
+        invoice("F1", 100.0, 21.0),
+        invoice("F2", 50.0, iban="NL45INGB0123456789"),
+        invoice("F3", 0.0),
+        invoice("F4", -20.0, iban="DE89370400440532013000"),
+        invoice("F5", 10.0, supplier="€€"),
+        invoice("F6", 10.0, iban=None),
+    ], "2024-03-04")
+    assert [(payment["end_to_end_id"], payment["cents"]) for payment in payments] == [("F1", 12100)]
+    assert payments[0]["iban"] == "GB82WEST12345698765432"
+    assert [(inv["id"], reason) for inv, reason in rejected] == [
+        ("F2", "ongeldige IBAN"),
+        ("F3", "geen bedrag te betalen"),
+        ("F4", "geen bedrag te betalen"),
+        ("F5", "geen naam van de leverancier"),
+        ("F6", "ongeldige IBAN"),
+    ]
+
+
+def test_execution_on_due_date_is_never_before_the_batch_date():
+    invoices = [invoice("F1", 10.0, due_date="2024-04-01"), invoice("F2", 20.0, due_date="2024-02-01"),
+                invoice("F3", 30.0, due_date=None)]
+    payments, _ = payment_batch(invoices, "2024-03-04")
+    assert {payment["execution_date"] for payment in payments} == {"2024-03-04"}
+    payments, _ = payment_batch(invoices, "2024-03-04", on_due_date=True)
+    assert [(payment["end_to_end_id"], payment["execution_date"]) for payment in payments] == [
+        ("F2", "2024-03-04"), ("F3", "2024-03-04"), ("F1", "2024-04-01"),
+    ]
+
+
+def test_document_has_one_payment_block_per_date_and_matching_totals():
+    payments, _ = payment_batch([
+        invoice("F1", 100.0, 21.0, due_date="2024-04-01", bic="WEST GB 22"),
+        invoice("F2", 0.1, 0.2, due_date="2024-02-01"),
+        invoice("F3", 1234.56, due_date="2024-04-01", supplier="Smit & Zonen"),
+    ], "2024-03-04", on_due_date=True)
+    document = parse(payments)
+    header = document.find("p:CstmrCdtTrfInitn/p:GrpHdr", NS)
+    assert header.findtext("p:MsgId", namespaces=NS) == "NOVA-1"
+    assert header.findtext("p:CreDtTm", namespaces=NS) == "2024-03-01T09:30:00"
+    assert header.findtext("p:NbOfTxs", namespaces=NS) == "3"
+    assert header.findtext("p:CtrlSum", namespaces=NS) == "1355.86"
+
+    blocks = document.findall("p:CstmrCdtTrfInitn/p:PmtInf", NS)
+    assert [block.findtext("p:ReqdExctnDt", namespaces=NS) for block in blocks] == ["2024-03-04", "2024-04-01"]
+    assert [block.findtext("p:PmtInfId", namespaces=NS) for block in blocks] == ["NOVA-1-001", "NOVA-1-002"]
+    assert [block.findtext("p:NbOfTxs", namespaces=NS) for block in blocks] == ["1", "2"]
+    assert [block.findtext("p:CtrlSum", namespaces=NS) for block in blocks] == ["0.30", "1355.56"]
+    assert blocks[0].findtext("p:DbtrAgt/p:FinInstnId/p:BIC", namespaces=NS) == "ABNANL2A"
+
+    first, second = blocks[1].findall("p:CdtTrfTxInf", NS)
+    assert first.findtext("p:Amt/p:InstdAmt", namespaces=NS) == "121.00"
+    assert first.findtext("p:CdtrAgt/p:FinInstnId/p:BIC", namespaces=NS) == "WESTGB22"
+    assert first.findtext("p:CdtrAcct/p:Id/p:IBAN", namespaces=NS) == "GB82WEST12345698765432"
+    assert second.findtext("p:Cdtr/p:Nm", namespaces=NS) == "Smit + Zonen"
+    assert second.find("p:CdtrAgt", NS) is None
+
+
+def test_empty_batch_is_a_valid_document():
+    document = parse([])
+    assert document.findtext("p:CstmrCdtTrfInitn/p:GrpHdr/p:NbOfTxs", namespaces=NS) == "0"
+    assert document.findall("p:CstmrCdtTrfInitn/p:PmtInf", NS) == []
+
+
+def test_invalid_debtor_iban_is_refused():
+    with pytest.raises(ValueError):
+        list(pain001({**DEBTOR, "iban": "NL45INGB0123456789"}, [], "NOVA-1"))